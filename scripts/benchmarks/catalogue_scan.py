@@ -0,0 +1,88 @@
+"""Benchmark catalogue discovery: `rglob` + path parsing + `stat` against the parallel `scan_catalogue`.
+
+`--latency` adds a delay to every directory listing to approximate a network file system.
+
+Usage:
+    python scripts/benchmarks/catalogue_scan.py --collections 20 --shards 50 --records 20 --latency 2
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import tempfile
+import time
+from pathlib import Path
+from typing import Any
+
+from workflow_catalogue.core.record_view import collection_id_from_path
+from workflow_catalogue.core.scan import scan_catalogue
+
+
+def make_catalogue(root: Path, n_collections: int, n_shards: int, n_records: int) -> Path:
+    """A catalogue sharded as `catalogue/{collection}/workflows/{shard}/{record}.json`."""
+    catalogue = root / "catalogue"
+    for c in range(n_collections):
+        collection = catalogue / f"collection-{c:03d}"
+        collection.mkdir(parents=True)
+        (collection / "catalog.json").write_text("{}", encoding="utf-8")
+        for s in range(n_shards):
+            shard = collection / "workflows" / f"shard-{s:03d}"
+            shard.mkdir(parents=True)
+            for r in range(n_records):
+                (shard / f"record-{r:03d}.json").write_text("{}", encoding="utf-8")
+    return catalogue
+
+
+def rglob_discovery(catalogue: Path) -> list[tuple[Path, str | None, int, int]]:
+    """The discovery previously done by the CLI, plus the `stat` a cache lookup needs."""
+    files = []
+    for path in sorted(catalogue.rglob("*.json")):
+        stat = path.stat()
+        files.append((path, collection_id_from_path(path), stat.st_mtime_ns, stat.st_size))
+    return files
+
+
+def with_latency(latency: float) -> None:
+    """Delays every `os.scandir` call by `latency` seconds."""
+    scandir = os.scandir
+
+    def slow_scandir(path: Any = ".") -> Any:
+        time.sleep(latency)
+        return scandir(path)
+
+    os.scandir = slow_scandir
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark catalogue discovery.")
+    parser.add_argument("--collections", type=int, default=20, help="Number of collections.")
+    parser.add_argument("--shards", type=int, default=50, help="Shard directories per collection.")
+    parser.add_argument("--records", type=int, default=20, help="Records per shard directory.")
+    parser.add_argument("--latency", type=float, default=0.0, help="Milliseconds added to every directory listing.")
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 8, 32], help="Scanner thread counts.")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        catalogue = make_catalogue(Path(tmp), args.collections, args.shards, args.records)
+        if args.latency:
+            with_latency(args.latency / 1000)
+
+        t0 = time.perf_counter()
+        expected = rglob_discovery(catalogue)
+        print(f"rglob + stat:            {time.perf_counter() - t0:6.2f} s, {len(expected)} files")
+
+        for workers in args.workers:
+            t0 = time.perf_counter()
+            first = None
+            found = []
+            for file in scan_catalogue(catalogue, workers=workers):
+                first = first or time.perf_counter() - t0
+                found.append((file.path, file.collection, file.mtime_ns, file.size))
+            elapsed = time.perf_counter() - t0
+            assert sorted(found) == expected
+            print(f"scan_catalogue ({workers:>2} threads): {elapsed:6.2f} s, first file after {first or 0:.3f} s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+"""Benchmark the columnar export: time and peak memory for growing catalogues of copied records.
+
+Usage:
+    python scripts/benchmarks/columnar_export.py --records 5000 20000 --format parquet
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+from workflow_catalogue.consts import directories
+from workflow_catalogue.core.columnar_export import DEFAULT_BATCH_SIZE, EXPORT_FORMATS, export_columnar
+
+
+def make_catalogue(root: Path, n_records: int) -> list[Path]:
+    """Copies of the catalogue records with new ids, written to `root/catalogue/benchmark/`."""
+    templates = [
+        json.loads(path.read_text(encoding="utf-8"))
+        for path in sorted(directories.CATALOGUE_DIR.rglob("*.json"))
+        if path.name != "catalog.json"
+    ]
+    directory = root / "catalogue" / "benchmark" / "workflows"
+    directory.mkdir(parents=True)
+    files = []
+    for i in range(n_records):
+        document = dict(templates[i % len(templates)], id=f"record-{i:06d}")
+        path = directory / f"{document['id']}.json"
+        path.write_text(json.dumps(document), encoding="utf-8")
+        files.append(path)
+    return files
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark the columnar export.")
+    parser.add_argument("--records", type=int, nargs="+", default=[5_000, 20_000], help="Catalogue sizes.")
+    parser.add_argument("--format", choices=EXPORT_FORMATS, default="parquet", help="Output format.")
+    parser.add_argument("--batch-size", type=int, default=DEFAULT_BATCH_SIZE, help="Records per batch.")
+    args = parser.parse_args()
+
+    for n_records in args.records:
+        with tempfile.TemporaryDirectory() as tmp:
+            files = make_catalogue(Path(tmp), n_records)
+            t0 = time.perf_counter()
+            result = export_columnar(files, Path(tmp) / "export", args.format, args.batch_size)
+            elapsed = time.perf_counter() - t0
+            # Measured in a second run, tracemalloc slows allocations down.
+            tracemalloc.start()
+            export_columnar(files, Path(tmp) / "export", args.format, args.batch_size)
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            size = sum(Path(path).stat().st_size for path in result.written)
+            print(
+                f"{n_records:>8} records: {elapsed:6.2f} s, {n_records / elapsed:8.0f} records/s, "
+                f"peak Python memory {peak / 1e6:6.1f} MB, output {size / 1e6:6.1f} MB"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+"""Benchmark validating a workflow record with a large coverage multipolygon: packed arrays against pydantic.
+
+Usage:
+    python scripts/benchmarks/geometry_validation.py --vertices 500000 --polygons 50
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import time
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+
+from workflow_catalogue.consts import directories
+from workflow_catalogue.core.validation import _validate_data
+from workflow_catalogue.schemas.workflow import EodhWorkflowRecord
+
+_WORKFLOW = directories.CATALOGUE_DIR / "eodh-workflows-notebooks" / "workflows" / "clip-workflow.json"
+
+
+def make_multipolygon(n_vertices: int, n_polygons: int, rng: np.random.Generator) -> dict[str, Any]:
+    """Counterclockwise star-shaped polygons around random centres, closed, `n_vertices` positions in total."""
+    per_polygon = max(4, n_vertices // n_polygons)
+    polygons = []
+    for _ in range(n_polygons):
+        centre = rng.uniform([-170, -80], [170, 80])
+        angles = np.linspace(0, 2 * np.pi, per_polygon - 1, endpoint=False)
+        radius = rng.uniform(0.5, 1.0, per_polygon - 1)
+        ring = np.column_stack([centre[0] + radius * np.cos(angles), centre[1] + radius * np.sin(angles)])
+        polygons.append([[*ring.tolist(), ring[0].tolist()]])
+    return {"type": "MultiPolygon", "coordinates": polygons}
+
+
+def measure(name: str, run: Callable[[], Any], repeat: int) -> None:
+    timings = []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        run()
+        timings.append(time.perf_counter() - t0)
+    print(f"{name:<28} {min(timings) * 1000:10.1f} ms")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark geometry validation.")
+    parser.add_argument("--vertices", type=int, default=500_000, help="Total number of positions.")
+    parser.add_argument("--polygons", type=int, default=50, help="Number of polygons.")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per method; the fastest is reported.")
+    args = parser.parse_args()
+
+    document = json.loads(_WORKFLOW.read_text(encoding="utf-8"))
+    document["geometry"] = make_multipolygon(args.vertices, args.polygons, np.random.default_rng(0))
+
+    path = Path(f"{document['id']}.json")
+    print(f"record: {len(json.dumps(document)) / 1e6:.1f} MB, {args.vertices} positions (parsing not timed)")
+    measure("packed arrays", lambda: _validate_data(path, document, []), args.repeat)
+    measure("pydantic", lambda: EodhWorkflowRecord.model_validate(document), args.repeat)
+
+
+if __name__ == "__main__":
+    main()
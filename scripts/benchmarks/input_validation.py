@@ -0,0 +1,72 @@
+"""Benchmark job input validation with cached, precompiled validators against compiling per job.
+
+Usage:
+    python scripts/benchmarks/input_validation.py --jobs 100000
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import time
+from collections.abc import Callable
+from typing import Any
+
+from workflow_catalogue.core.inputs import InputValidator, ValidatorCache
+from workflow_catalogue.utils.serialization import dumps, loads
+
+PARAMETERS: dict[str, Any] = {
+    "stac_item": {"label": "Item", "type": "raster", "description": "Item", "required": True},
+    "bbox": {"label": "AOI", "type": "bbox", "description": "AOI"},
+    "cloud_cover": {"label": "Cloud", "type": "number", "description": "Cloud", "min": 0, "max": 100},
+    "band": {"label": "Band", "type": "text", "description": "Band", "pattern": r"B\d{2}"},
+    "index": {"label": "Index", "type": "text", "description": "Index", "enum": ["ndvi", "evi", "ndwi"]},
+    "start": {"label": "Start", "type": "date", "description": "Start"},
+}
+
+
+def make_payloads(n_jobs: int) -> list[bytes]:
+    """Serialized job payloads, roughly one in ten invalid."""
+    rng = random.Random(0)
+    payloads = []
+    for i in range(n_jobs):
+        inputs = {
+            "stac_item": f"https://example.com/items/{i}.json",
+            "bbox": [-1.5, 50.0, 0.5, 51.0],
+            "cloud_cover": rng.randint(0, 110),
+            "band": f"B{rng.randint(1, 12):02d}",
+            "index": rng.choice(["ndvi", "evi", "ndwi"]),
+            "start": "2024-06-01T00:00:00Z",
+        }
+        payloads.append(dumps({"workflow": "bench-workflow", "inputs": inputs}))
+    return payloads
+
+
+def check_uncached(payloads: list[bytes]) -> int:
+    return sum(bool(InputValidator.compile(PARAMETERS).validate(loads(p)["inputs"])) for p in payloads)
+
+
+def check_cached(payloads: list[bytes]) -> int:
+    cache = ValidatorCache()
+    return sum(bool(cache.get("bench-workflow", "hash", PARAMETERS).validate(loads(p)["inputs"])) for p in payloads)
+
+
+def measure(name: str, check: Callable[[list[bytes]], int], payloads: list[bytes]) -> None:
+    t0 = time.perf_counter()
+    invalid = check(payloads)
+    elapsed = time.perf_counter() - t0
+    print(f"{name:<10} {elapsed:7.2f} s {len(payloads) / elapsed:10.0f} jobs/s {invalid:8d} invalid")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark job input validation.")
+    parser.add_argument("--jobs", type=int, default=100_000, help="Number of synthetic job payloads.")
+    args = parser.parse_args()
+
+    payloads = make_payloads(args.jobs)
+    measure("uncached", check_uncached, payloads)
+    measure("cached", check_cached, payloads)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+"""Benchmark memory use of a fully loaded catalogue with and without interning.
+
+Builds a synthetic catalogue from the records in ``catalogue/`` (ids, titles and dates vary per record, contacts, links
+and ``conformsTo`` are shared as in real records), loads it as raw JSON and as validated pydantic models, and reports
+the memory retained by the loaded records as measured by ``tracemalloc``.
+
+Usage:
+    python scripts/benchmarks/interning.py --records 100000
+    python scripts/benchmarks/interning.py --records 10000 --mode json
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import json
+import time
+import tracemalloc
+from collections.abc import Callable
+from typing import Any
+
+from workflow_catalogue.consts import directories
+from workflow_catalogue.core.interning import Interner
+from workflow_catalogue.schemas.notebook import EodhNotebookRecord
+from workflow_catalogue.schemas.workflow import EodhWorkflowRecord
+
+
+def make_documents(n_records: int) -> list[bytes]:
+    """Synthetic record files, serialized as they would be read from disk."""
+    templates = [
+        json.loads(path.read_text(encoding="utf-8"))
+        for path in sorted(directories.CATALOGUE_DIR.rglob("*.json"))
+        if path.name != "catalog.json"
+    ]
+    documents = []
+    for i in range(n_records):
+        record = json.loads(json.dumps(templates[i % len(templates)]))
+        record["id"] = f"{record['id']}-{i:06d}"
+        record["properties"]["title"] = f"{record['properties']['title']} #{i}"
+        record["properties"]["updated"] = f"2026-{i % 12 + 1:02d}-{i % 28 + 1:02d}T00:00:00Z"
+        for link in record["links"]:
+            if link["rel"] == "self":
+                link["href"] = f"{link['href'].rsplit('/', 1)[0]}/{record['id']}"
+        documents.append(json.dumps(record).encode("utf-8"))
+    return documents
+
+
+def load_json(documents: list[bytes], interner: Interner | None) -> list[Any]:
+    if interner is None:
+        return [json.loads(document) for document in documents]
+    return [interner.intern_json(json.loads(document)) for document in documents]
+
+
+def load_models(documents: list[bytes], interner: Interner | None) -> list[Any]:
+    records = []
+    for document in documents:
+        data = json.loads(document)
+        model_cls = EodhWorkflowRecord if data["properties"]["type"] == "workflow" else EodhNotebookRecord
+        record = model_cls.model_validate(data)
+        records.append(interner.intern_model(record) if interner is not None else record)
+    return records
+
+
+def measure(
+    name: str, loader: Callable[[list[bytes], Interner | None], list[Any]], documents: list[bytes], *, intern: bool
+) -> float:
+    gc.collect()
+    tracemalloc.start()
+    t0 = time.perf_counter()
+    interner = Interner() if intern else None
+    records = loader(documents, interner)
+    elapsed = time.perf_counter() - t0
+    interner_stats = interner.stats() if interner is not None else ""
+    del interner  # only the records are retained by a loaded catalogue
+    gc.collect()
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(
+        f"{name:<28} {current / 1e6:9.1f} MB retained {peak / 1e6:9.1f} MB peak "
+        f"{current / len(records):8.0f} B/record {elapsed:7.2f} s  {interner_stats}"
+    )
+    del records
+    return current
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark memory use of a loaded catalogue with interning.")
+    parser.add_argument("--records", type=int, default=100_000, help="Number of synthetic records.")
+    parser.add_argument("--mode", choices=["json", "models", "both"], default="both", help="What to load.")
+    args = parser.parse_args()
+
+    documents = make_documents(args.records)
+    print(f"Synthetic catalogue: {len(documents)} record(s), {sum(map(len, documents)) / 1e6:.1f} MB of JSON")
+
+    if args.mode in {"json", "both"}:
+        plain = measure("raw JSON", load_json, documents, intern=False)
+        interned = measure("raw JSON, interned", load_json, documents, intern=True)
+        print(f"raw JSON memory reduction: {plain / interned:.1f}x")
+    if args.mode in {"models", "both"}:
+        plain = measure("pydantic models", load_models, documents, intern=False)
+        interned = measure("pydantic models, interned", load_models, documents, intern=True)
+        print(f"pydantic memory reduction: {plain / interned:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
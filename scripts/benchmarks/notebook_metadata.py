@@ -0,0 +1,57 @@
+"""Benchmark reading notebook metadata with the streaming scanner against `json.load` of the whole notebook.
+
+Usage:
+    python scripts/benchmarks/notebook_metadata.py --size-mb 200
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import tempfile
+import time
+import tracemalloc
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+from workflow_catalogue.core.notebooks import NotebookMetadata
+
+
+def make_notebook(path: Path, size_mb: int) -> None:
+    """A notebook whose cells carry `size_mb` of base64-like image outputs, with metadata at the end."""
+    output = {"output_type": "display_data", "data": {"image/png": "iVBORw0KGgo" * 95_000}}
+    n_cells = max(1, size_mb)
+    with path.open("w", encoding="utf-8") as fp:
+        fp.write('{"cells": [')
+        for i in range(n_cells):
+            fp.write(("," if i else "") + json.dumps({"cell_type": "code", "source": ["plot()"], "outputs": [output]}))
+        metadata = {"kernelspec": {"name": "python3"}, "language_info": {"name": "python", "version": "3.11.4"}}
+        fp.write(f'], "metadata": {json.dumps(metadata)}, "nbformat": 4, "nbformat_minor": 5}}')
+
+
+def measure(name: str, run: Callable[[], Any]) -> None:
+    tracemalloc.start()
+    t0 = time.perf_counter()
+    result = run()
+    elapsed = time.perf_counter() - t0
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"{name:<10} {elapsed:8.2f} s {peak / 1e6:10.1f} MB peak  {result}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark notebook metadata extraction.")
+    parser.add_argument("--size-mb", type=int, default=200, help="Approximate notebook size.")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "big.ipynb"
+        make_notebook(path, args.size_mb)
+        print(f"notebook: {path.stat().st_size / 1e6:.0f} MB")
+        measure("streaming", lambda: NotebookMetadata.from_file(path))
+        measure("json.load", lambda: json.loads(path.read_bytes())["metadata"]["kernelspec"]["name"])
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+"""Benchmark memory and construction time of `RecordView` against validated pydantic records.
+
+Usage:
+    python scripts/benchmarks/record_view.py --records 100000
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import json
+import time
+import tracemalloc
+from collections.abc import Callable
+from typing import Any
+
+from workflow_catalogue.consts import directories
+from workflow_catalogue.core.record_view import RecordView
+from workflow_catalogue.schemas.notebook import EodhNotebookRecord
+from workflow_catalogue.schemas.workflow import EodhWorkflowRecord
+
+
+def make_documents(n_records: int) -> list[dict[str, Any]]:
+    """Synthetic parsed records based on the records in ``catalogue/``."""
+    templates = [
+        json.loads(path.read_text(encoding="utf-8"))
+        for path in sorted(directories.CATALOGUE_DIR.rglob("*.json"))
+        if path.name != "catalog.json"
+    ]
+    documents = []
+    for i in range(n_records):
+        record = json.loads(json.dumps(templates[i % len(templates)]))
+        record["id"] = f"{record['id']}-{i:06d}"
+        documents.append(record)
+    return documents
+
+
+def build_models(documents: list[dict[str, Any]]) -> list[Any]:
+    return [
+        (EodhWorkflowRecord if d["properties"]["type"] == "workflow" else EodhNotebookRecord).model_validate(d)
+        for d in documents
+    ]
+
+
+def build_views(documents: list[dict[str, Any]]) -> list[Any]:
+    return [RecordView.from_document(d, "bench-collection") for d in documents]
+
+
+def measure(name: str, build: Callable[[list[dict[str, Any]]], list[Any]], documents: list[dict[str, Any]]) -> None:
+    gc.collect()
+    t0 = time.perf_counter()
+    build(documents)
+    elapsed = time.perf_counter() - t0
+
+    gc.collect()
+    tracemalloc.start()
+    objects = build(documents)
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(
+        f"{name:<18} {elapsed:7.2f} s {len(documents) / elapsed:10.0f} rec/s "
+        f"{current / 1e6:9.1f} MB {current / len(objects):8.0f} B/record"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark RecordView against pydantic records.")
+    parser.add_argument("--records", type=int, default=100_000, help="Number of synthetic records.")
+    args = parser.parse_args()
+
+    documents = make_documents(args.records)
+    measure("pydantic models", build_models, documents)
+    measure("RecordView", build_views, documents)
+
+
+if __name__ == "__main__":
+    main()
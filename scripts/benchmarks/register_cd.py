@@ -0,0 +1,99 @@
+"""Benchmark the CD registration path against the local mock platform.
+
+Generates a synthetic catalogue, starts the mock platform and runs ``wfc catalogue register`` against it.
+
+Usage:
+    python scripts/benchmarks/register_cd.py --records 10000
+    python scripts/benchmarks/register_cd.py --records 1000 --latency-ms 20 --error-rate 0.01 --rate-limit 200
+"""
+
+from __future__ import annotations
+
+import argparse
+import copy
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import requests
+
+from workflow_catalogue.consts import directories
+from workflow_catalogue.core.mock_platform import MockPlatformConfig, MockPlatformServer, mock_environment
+
+TEMPLATE_COLLECTION = directories.CATALOGUE_DIR / "eodh-workflows-notebooks"
+TEMPLATE_RECORD = TEMPLATE_COLLECTION / "workflows" / "clip-workflow.json"
+
+
+def generate_catalogue(root: Path, n_records: int, base_url: str) -> list[Path]:
+    """Write ``n_records`` synthetic workflow records into ``root/catalogue/bench-collection``."""
+    collection_dir = root / "catalogue" / "bench-collection"
+    (collection_dir / "workflows").mkdir(parents=True)
+    catalog = json.loads((TEMPLATE_COLLECTION / "catalog.json").read_text(encoding="utf-8"))
+    catalog["id"] = "bench-collection"
+    (collection_dir / "catalog.json").write_text(json.dumps(catalog), encoding="utf-8")
+
+    template = json.loads(TEMPLATE_RECORD.read_text(encoding="utf-8"))
+    files = []
+    for i in range(n_records):
+        record = copy.deepcopy(template)
+        record["id"] = f"bench-workflow-{i:06d}"
+        for link in record["links"]:
+            if link["rel"] == "application":
+                link["href"] = f"{base_url}/cwl/{record['id']}.cwl"
+        path = collection_dir / "workflows" / f"{record['id']}.json"
+        path.write_text(json.dumps(record), encoding="utf-8")
+        files.append(path)
+    return files
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark wfc catalogue register against the mock platform.")
+    parser.add_argument("--records", type=int, default=10_000, help="Number of synthetic records to register.")
+    parser.add_argument("--latency-ms", type=float, default=0.0, help="Mock platform mean latency.")
+    parser.add_argument("--jitter-ms", type=float, default=0.0, help="Mock platform latency jitter.")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Mock platform 503 rate.")
+    parser.add_argument("--rate-limit", type=float, default=None, help="Mock platform requests/s per family.")
+    parser.add_argument("--skip-ades", action="store_true", help="Pass --skip-ades to the register command.")
+    parser.add_argument("--skip-publish", action="store_true", help="Pass --skip-publish to the register command.")
+    args = parser.parse_args()
+
+    config = MockPlatformConfig(
+        latency_ms=args.latency_ms,
+        jitter_ms=args.jitter_ms,
+        error_rate=args.error_rate,
+        rate_limit=args.rate_limit,
+        seed=0,
+    )
+
+    with tempfile.TemporaryDirectory() as tmp, MockPlatformServer(config) as server:
+        t0 = time.perf_counter()
+        files = generate_catalogue(Path(tmp), args.records, server.base_url)
+        print(f"Generated {len(files)} record(s) in {time.perf_counter() - t0:.2f}s")
+
+        cmd = [sys.executable, "-m", "workflow_catalogue.cli.entrypoint", "catalogue", "register", *map(str, files)]
+        if args.skip_ades:
+            cmd.append("--skip-ades")
+        if args.skip_publish:
+            cmd.append("--skip-publish")
+
+        env = {**os.environ, **mock_environment(server.base_url)}
+        t0 = time.perf_counter()
+        result = subprocess.run(cmd, env=env, capture_output=True, text=True, check=False)
+        elapsed = time.perf_counter() - t0
+
+        stats = requests.get(f"{server.base_url}/_mock/stats", timeout=10).json()
+
+    print(f"wfc catalogue register exit code: {result.returncode}")
+    print(f"Elapsed: {elapsed:.2f}s ({args.records / elapsed:.1f} records/s)")
+    print("Mock platform stats:")
+    print(json.dumps(stats, indent=4))
+    if result.returncode != 0:
+        print(result.stderr[-2000:])
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+"""Benchmark JSON serialization of catalogue records.
+
+Compares the stdlib ``json`` + ``JsonEncoder`` path with the fast (orjson, if installed) and canonical serializers
+from ``workflow_catalogue.utils.serialization``.
+
+Usage:
+    python scripts/benchmarks/serialization.py --records 10000 --repeat 5
+"""
+
+from __future__ import annotations
+
+import argparse
+import copy
+import json
+import time
+from collections.abc import Callable
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+
+from workflow_catalogue.consts import directories
+from workflow_catalogue.schemas.workflow import EodhWorkflowRecord
+from workflow_catalogue.utils.serialization import (
+    HAS_ORJSON,
+    JsonEncoder,
+    canonical_dumps,
+    dumps,
+    model_to_jsonable,
+)
+
+TEMPLATE_RECORD = directories.CATALOGUE_DIR / "eodh-workflows-notebooks" / "workflows" / "clip-workflow.json"
+
+
+def make_records(n_records: int) -> list[dict[str, Any]]:
+    """Synthetic records mixing plain JSON with datetimes and paths that need the encoder fallback."""
+    template = json.loads(TEMPLATE_RECORD.read_text(encoding="utf-8"))
+    records = []
+    for i in range(n_records):
+        record = copy.deepcopy(template)
+        record["id"] = f"bench-{i:06d}"
+        record["properties"]["created"] = datetime(2026, 1, 1, tzinfo=UTC)
+        record["properties"]["updated"] = datetime(2026, 1, 2, tzinfo=UTC)
+        record["links"].append({"rel": "alternate", "href": Path(f"records/bench-{i:06d}.json")})
+        records.append(record)
+    return records
+
+
+def bench(name: str, func: Callable[[], bytes], repeat: int, n_records: int) -> float:
+    best = float("inf")
+    size = 0
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        size = len(func())
+        best = min(best, time.perf_counter() - t0)
+    print(f"{name:<40} {best * 1000:9.1f} ms {n_records / best:12.0f} rec/s {size / best / 1e6:8.1f} MB/s")
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark catalogue record serialization.")
+    parser.add_argument("--records", type=int, default=10_000, help="Number of synthetic records.")
+    parser.add_argument("--repeat", type=int, default=5, help="Repetitions per serializer (best time is reported).")
+    args = parser.parse_args()
+
+    records = make_records(args.records)
+    models = [EodhWorkflowRecord.model_validate(json.loads(TEMPLATE_RECORD.read_text(encoding="utf-8")))] * args.records
+    print(f"orjson available: {HAS_ORJSON}")
+    print(f"{'serializer':<40} {'time':>12} {'throughput':>18} {'bandwidth':>13}")
+
+    baseline = bench(
+        "json.dumps(cls=JsonEncoder)",
+        lambda: json.dumps(records, cls=JsonEncoder).encode("utf-8"),
+        args.repeat,
+        args.records,
+    )
+    fast = bench("serialization.dumps", lambda: dumps(records), args.repeat, args.records)
+    canonical = bench("serialization.canonical_dumps", lambda: canonical_dumps(records), args.repeat, args.records)
+    bench(
+        "model_dump_json (pydantic)",
+        lambda: b"[" + b",".join(m.model_dump_json(by_alias=True).encode("utf-8") for m in models) + b"]",
+        args.repeat,
+        args.records,
+    )
+    bench(
+        "serialization.dumps(model_to_jsonable)",
+        lambda: dumps([model_to_jsonable(m) for m in models]),
+        args.repeat,
+        args.records,
+    )
+
+    print(f"\nFast path speed-up vs JsonEncoder: {baseline / fast:.2f}x")
+    print(f"Canonical speed-up vs JsonEncoder: {baseline / canonical:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
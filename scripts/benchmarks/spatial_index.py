@@ -0,0 +1,82 @@
+"""Benchmark `SpatialIndex` queries against a vectorized scan and a Python loop over all extents.
+
+Usage:
+    python scripts/benchmarks/spatial_index.py --records 100000 --queries 1000
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+from collections.abc import Callable
+from typing import Any
+
+import numpy as np
+
+from workflow_catalogue.core.spatial_index import SpatialIndex, _match
+
+Query = tuple[tuple[float, float, float, float], tuple[float, float]]
+
+YEAR = 365.25 * 86400
+
+
+def make_extents(n_records: int, rng: np.random.Generator) -> list[tuple[str, list[Any]]]:
+    """Random regional workflows: boxes up to 5 degrees wide valid for up to 5 years since 2000."""
+    x = rng.uniform(-180, 175, n_records)
+    y = rng.uniform(-90, 85, n_records)
+    size = rng.uniform(0.1, 5, (n_records, 2))
+    start = 946684800 + rng.uniform(0, 20, n_records) * YEAR
+    end = start + rng.uniform(0, 5, n_records) * YEAR
+    return [
+        (f"wf-{i:06d}", [(x[i], y[i], x[i] + size[i, 0], y[i] + size[i, 1], start[i], end[i])])
+        for i in range(n_records)
+    ]
+
+
+def make_queries(n_queries: int, rng: np.random.Generator) -> list[Query]:
+    queries = []
+    for _ in range(n_queries):
+        x, y = rng.uniform(-180, 179), rng.uniform(-90, 89)
+        t = 946684800 + rng.uniform(0, 25) * YEAR
+        queries.append(((x, y, x + 1, y + 1), (t, t + 30 * 86400)))
+    return queries
+
+
+def measure(name: str, run: Callable[[Query], int], queries: list[Query]) -> None:
+    t0 = time.perf_counter()
+    hits = sum(run(q) for q in queries)
+    elapsed = time.perf_counter() - t0
+    print(f"{name:<12} {elapsed / len(queries) * 1e6:10.1f} us/query {hits / len(queries):8.1f} hits/query")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark the spatial-temporal index.")
+    parser.add_argument("--records", type=int, default=100_000, help="Number of synthetic records.")
+    parser.add_argument("--queries", type=int, default=1_000, help="Number of random queries.")
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    extents = make_extents(args.records, rng)
+    queries = make_queries(args.queries, rng)
+
+    t0 = time.perf_counter()
+    index = SpatialIndex.build(extents)
+    print(f"built index over {len(index)} records in {time.perf_counter() - t0:.2f} s ({len(index.levels)} levels)")
+
+    bounds = np.array([e[1][0] for e in extents])
+    rows = [e[1][0] for e in extents]
+
+    def scan(query: Query) -> int:
+        return int(_match(bounds, np.array([*query[0], *query[1]]), "intersects").sum())
+
+    def loop(query: Query) -> int:
+        (x0, y0, x1, y1), (t0, t1) = query
+        return sum(r[0] <= x1 and r[2] >= x0 and r[1] <= y1 and r[3] >= y0 and r[4] <= t1 and r[5] >= t0 for r in rows)
+
+    measure("STR tree", lambda q: len(index.search(*q)), queries)
+    measure("numpy scan", scan, queries)
+    measure("python loop", loop, queries[: max(1, len(queries) // 10)])
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,52 @@
+"""Run a local mock of the EODH platform for exercising the CD pipeline.
+
+Usage:
+    python scripts/mock_platform.py --port 8080
+    python scripts/mock_platform.py --port 8080 --latency-ms 50 --jitter-ms 20 --error-rate 0.02 --rate-limit 100
+
+Point ``wfc catalogue register`` at the server with the environment variables printed on start-up.
+Request counters are available at ``GET /_mock/stats``.
+"""
+
+from __future__ import annotations
+
+import argparse
+
+from workflow_catalogue.core.mock_platform import MockPlatformConfig, MockPlatformServer, mock_environment
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Local mock of the EODH platform endpoints used by CD.")
+    parser.add_argument("--host", default="127.0.0.1", help="Interface to bind to.")
+    parser.add_argument("--port", type=int, default=8080, help="Port to bind to.")
+    parser.add_argument("--latency-ms", type=float, default=0.0, help="Mean latency added to every response.")
+    parser.add_argument("--jitter-ms", type=float, default=0.0, help="Uniform jitter added on top of the latency.")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Fraction of requests answered with 503.")
+    parser.add_argument("--rate-limit", type=float, default=None, help="Requests/s allowed per endpoint family.")
+    parser.add_argument("--burst", type=int, default=10, help="Token bucket capacity for --rate-limit.")
+    parser.add_argument("--seed", type=int, default=None, help="Seed for the error injection RNG.")
+    args = parser.parse_args()
+
+    config = MockPlatformConfig(
+        latency_ms=args.latency_ms,
+        jitter_ms=args.jitter_ms,
+        error_rate=args.error_rate,
+        rate_limit=args.rate_limit,
+        burst=args.burst,
+        seed=args.seed,
+    )
+    server = MockPlatformServer(config, host=args.host, port=args.port)
+
+    print(f"Mock platform listening on {server.base_url}")
+    print("Environment for wfc catalogue register:")
+    for key, value in mock_environment(server.base_url).items():
+        print(f"  export {key}={value}")
+
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print("\nStopping mock platform.")
+
+
+if __name__ == "__main__":
+    main()
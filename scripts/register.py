@@ -1,419 +0,0 @@
-"""CD script: register catalogue records in wf-catalogue-service and publish to ADES.
-
-Usage:
-    python scripts/register.py --files catalogue/eodh-workflows-notebooks/workflows/ndvi-workflow.json
-    python scripts/register.py --files catalogue/eodh-workflows-notebooks/workflows/*.json --skip-ades
-    python scripts/register.py --deleted-ids ndvi-workflow echo
-
-The collection ID is derived from the file path: ``catalogue/{collection-id}/workflows/foo.json``.
-If the collection does not exist in the API, it is created from ``catalog.json`` in that directory.
-
-Environment variables:
-    WF_CATALOGUE_API_URL                        - wf-catalogue-service full API URL
-    EODH__BASE_URL                              - EODH platform base URL
-    EODH__REALM                                 - Keycloak realm
-    EODH__USERNAME                              - Service account username
-    EODH__PASSWORD                              - Service account password
-    EODH__CLIENT_ID                             - OAuth2 client ID
-    EODH__WORKSPACE_SERVICES_ENDPOINT_PATH      - Workspace services API path
-    EODH__ADES_ENDPOINT_PATH                    - ADES API path
-    EODH__WORKSPACE_NAME                        - Publishing workspace name
-"""
-
-from __future__ import annotations
-
-import argparse
-import base64
-import json
-import os
-import sys
-from pathlib import Path
-from urllib.parse import urljoin
-from typing import Any
-
-import requests
-
-TIMEOUT = 30
-OGC_PROCESSES_PATH = "processes"
-
-def truncate(text: str, max_len: int = 600) -> str:
-    if len(text) <= max_len:
-        return text
-    return text[: max_len - 3] + "..."
-
-
-def decode_jwt_payload(token: str) -> dict[str, Any] | None:
-    """Decode a JWT payload for debugging purposes.
-
-    Note: this does not validate signatures; it's only to inspect token claims.
-
-    """
-    try:
-        parts = token.split(".")
-        if len(parts) < 2:
-            return None
-        payload_b64 = parts[1]
-        # Base64url padding
-        payload_b64 += "=" * (-len(payload_b64) % 4)
-        raw = base64.urlsafe_b64decode(payload_b64.encode("utf-8"))
-        result: dict[str, Any] = json.loads(raw)
-        return result
-    except Exception:
-        return None
-
-
-def log_workspace_token_claims(label: str, token: str) -> None:
-    payload = decode_jwt_payload(token)
-    if not payload:
-        print(f"  DEBUG: {label} token is not a JWT (no decodable payload)")
-        return
-
-    # Keep this small and non-secret; focus on the claims relevant to STS trust policy.
-    claim_keys = {"workspaces", "principal_tags", "principalTags", "aud", "iss", "sub", "azp"}
-    preview = {k: payload[k] for k in claim_keys if k in payload}
-    print(f"  DEBUG: {label} token claim preview: {json.dumps(preview, default=str)}")
-
-
-def get_collection_id(file_path: Path) -> str | None:
-    """Extract collection ID from file path: catalogue/{collection-id}/workflows/foo.json."""
-    parts = file_path.parts
-    try:
-        cat_idx = parts.index("catalogue")
-        return parts[cat_idx + 1]
-    except (ValueError, IndexError):
-        return None
-
-
-def get_keycloak_token() -> str:
-    """Get Keycloak access token via password grant."""
-    base_url = os.environ["EODH__BASE_URL"]
-    realm = os.environ["EODH__REALM"]
-    client_id = os.environ["EODH__CLIENT_ID"]
-    username = os.environ["EODH__USERNAME"]
-    token_url = urljoin(base_url, f"/keycloak/realms/{realm}/protocol/openid-connect/token")
-
-    print(f"  DEBUG: keycloak token URL: {token_url}")
-    print(f"  DEBUG: keycloak client_id='{client_id}' username='{username}'")
-    resp = requests.post(
-        token_url,
-        headers={"Content-Type": "application/x-www-form-urlencoded"},
-        data={
-            "client_id": client_id,
-            "username": username,
-            "password": os.environ["EODH__PASSWORD"],
-            "grant_type": "password",
-            "scope": "openid",
-        },
-        timeout=TIMEOUT,
-    )
-
-    resp.raise_for_status()
-    return str(resp.json()["access_token"])
-
-
-def get_workspace_token(keycloak_token: str, workspace: str) -> str:
-    """Exchange Keycloak token for a workspace-scoped session token."""
-    base_url = os.environ["EODH__BASE_URL"]
-    ws_path = os.environ["EODH__WORKSPACE_SERVICES_ENDPOINT_PATH"]
-    sessions_url = urljoin(base_url, f"{ws_path}/{workspace}/me/sessions")
-
-    print(f"  DEBUG: workspace session URL: {sessions_url}")
-    resp = requests.post(
-        sessions_url,
-        headers={
-            "Authorization": f"Bearer {keycloak_token}",
-            "Accept": "application/json",
-        },
-        timeout=TIMEOUT,
-    )
-    resp.raise_for_status()
-    return str(resp.json()["access"])
-
-
-def ensure_collection(collection_id: str, file_path: Path, token: str) -> bool:
-    """Ensure collection exists in the API.
-
-    Create from catalog.json if not.
-
-    """
-    api_url = os.environ["WF_CATALOGUE_API_URL"].rstrip("/")
-    headers = {"Authorization": f"Bearer {token}", "Content-Type": "application/json"}
-
-    resp = requests.get(f"{api_url}/collections/{collection_id}", headers=headers, timeout=TIMEOUT)
-    if resp.ok:
-        return True
-
-    catalog_path = file_path.parent
-    while catalog_path.name != collection_id and catalog_path != catalog_path.parent:
-        catalog_path = catalog_path.parent
-    catalog_json = catalog_path / "catalog.json"
-
-    if catalog_json.exists():
-        data = json.loads(catalog_json.read_text(encoding="utf-8"))
-        payload = {
-            "id": collection_id,
-            "title": data.get("title", collection_id),
-            "description": data.get("description", ""),
-            "keywords": data.get("keywords", []),
-            "language": data.get("language", "en"),
-            "license": data.get("license", "proprietary"),
-        }
-    else:
-        payload = {"id": collection_id, "title": collection_id, "description": ""}
-
-    resp = requests.post(f"{api_url}/collections", json=payload, headers=headers, timeout=TIMEOUT)
-    if resp.status_code in (201, 409):
-        print(f"  OK: Collection '{collection_id}' ready")
-        return True
-
-    print(f"  FAIL: Could not create collection '{collection_id}': {resp.status_code} {resp.text}")
-    return False
-
-
-def register_record(file_path: Path, token: str, catalogue_id: str) -> bool:
-    """Register a single record via POST /register.
-
-    On 409 Conflict, DELETE and re-POST.
-
-    """
-    api_url = os.environ["WF_CATALOGUE_API_URL"].rstrip("/")
-    headers = {"Authorization": f"Bearer {token}", "Content-Type": "application/json"}
-    data = json.loads(file_path.read_text(encoding="utf-8"))
-    record_id = data["id"]
-    params = {"catalogue_id": catalogue_id}
-
-    resp = requests.post(f"{api_url}/register", json=data, headers=headers, params=params, timeout=TIMEOUT)
-
-    if resp.status_code == 409:
-        print(f"  Record '{record_id}' already exists, deleting and re-registering...")
-        del_resp = requests.delete(f"{api_url}/register/{record_id}", headers=headers, timeout=TIMEOUT)
-        if del_resp.status_code not in (204, 404):
-            print(f"  FAIL: Could not delete '{record_id}': {del_resp.status_code} {del_resp.text}")
-            return False
-        resp = requests.post(f"{api_url}/register", json=data, headers=headers, params=params, timeout=TIMEOUT)
-
-    if resp.status_code == 201:
-        print(f"  OK: Registered '{record_id}' in '{catalogue_id}'")
-        return True
-
-    print(f"  FAIL: Could not register '{record_id}': {resp.status_code} {resp.text}")
-    return False
-
-
-def delete_record(record_id: str, token: str) -> bool:
-    """Delete a record via DELETE /register/{record_id}."""
-    api_url = os.environ["WF_CATALOGUE_API_URL"].rstrip("/")
-    headers = {"Authorization": f"Bearer {token}"}
-
-    resp = requests.delete(f"{api_url}/register/{record_id}", headers=headers, timeout=TIMEOUT)
-
-    if resp.status_code == 204:
-        print(f"  OK: Deleted '{record_id}'")
-        return True
-    if resp.status_code == 404:
-        print(f"  SKIP: '{record_id}' not found (already deleted)")
-        return True
-
-    print(f"  FAIL: Could not delete '{record_id}': {resp.status_code} {resp.text}")
-    return False
-
-
-def register_ades_process(file_path: Path, workspace_token: str) -> bool:
-    """Register CWL process in ADES for a workflow record."""
-    data = json.loads(file_path.read_text(encoding="utf-8"))
-
-    if data.get("properties", {}).get("type") != "workflow":
-        return True
-
-    cwl_links = [
-        link for link in data.get("links", []) if link.get("rel") == "application" and "cwl" in link.get("type", "")
-    ]
-
-    if not cwl_links:
-        print(f"  SKIP ADES: No CWL application link in {file_path.name}")
-        return True
-
-    base_url = os.environ["EODH__BASE_URL"]
-    ades_path = os.environ["EODH__ADES_ENDPOINT_PATH"]
-    workspace = os.environ["EODH__WORKSPACE_NAME"]
-    ades_url = urljoin(base_url, ades_path).rstrip("/")
-    processes_url = f"{ades_url}/{workspace}/{OGC_PROCESSES_PATH}"
-
-    print(f"  DEBUG: ADES base_url={base_url} ades_path={ades_path} ades_url={ades_url}")
-    print(f"  DEBUG: ADES workspace={workspace}")
-    print(f"  DEBUG: ADES processes_url={processes_url}")
-
-    headers = {
-        "Authorization": f"Bearer {workspace_token}",
-        "Content-Type": "application/cwl+yaml",
-        "Accept": "application/json",
-    }
-
-    record_id = data["id"]
-    ok = True
-
-    for link in cwl_links:
-        href = link["href"]
-        print(f"  Fetching CWL: {href}")
-
-        try:
-            cwl_resp = requests.get(href, timeout=TIMEOUT)
-            cwl_resp.raise_for_status()
-        except requests.RequestException as e:
-            print(f"  FAIL: Could not fetch CWL {href}: {e}")
-            ok = False
-            continue
-
-        del_url = f"{processes_url}/{record_id}"
-        print(f"  DEBUG: ADES unregister URL: {del_url}")
-        del_resp = requests.delete(del_url, headers=headers, timeout=TIMEOUT)
-        if del_resp.status_code not in (200, 204, 403, 404):
-            print(f"  WARN: Unregister returned {del_resp.status_code} for '{record_id}'")
-            if del_resp.text:
-                print(f"  DEBUG: ADES unregister response body: {truncate(del_resp.text)}")
-
-        reg_resp = requests.post(processes_url, headers=headers, data=cwl_resp.content, timeout=TIMEOUT)
-
-        if reg_resp.status_code in (200, 201):
-            print(f"  OK: ADES process registered for '{record_id}'")
-        elif reg_resp.status_code == 409:
-            print(f"  WARN: ADES process '{record_id}' already exists (409 after unregister)")
-        else:
-            print(f"  FAIL: ADES registration failed for '{record_id}': {reg_resp.status_code} {reg_resp.text}")
-            ok = False
-
-    return ok
-
-
-def publish_workflow(record_id: str, workspace_token: str) -> bool:
-    """Publish workflow by uploading access policy and triggering harvest."""
-    base_url = os.environ["EODH__BASE_URL"].rstrip("/")
-    workspace = os.environ["EODH__WORKSPACE_NAME"]
-    headers = {
-        "Authorization": f"Bearer {workspace_token}",
-        "Content-Type": "application/json",
-        "Accept": "application/json",
-    }
-
-    print(f"  DEBUG: publish endpoints for workspace='{workspace}'")
-    print(f"  DEBUG: data-loader URL: {base_url}/api/workspaces/{workspace}/data-loader")
-    print(f"  DEBUG: harvest URL: {base_url}/workspaces/{workspace}/harvest")
-
-    policy = json.dumps({"workflows": {record_id: {"access": "public"}}})
-    policy_resp = requests.post(
-        f"{base_url}/api/workspaces/{workspace}/data-loader",
-        json={"fileContent": policy, "fileName": "access-policy.json"},
-        headers=headers,
-        timeout=TIMEOUT,
-    )
-
-    if not policy_resp.ok:
-        print(
-            f"  WARN: Access policy upload failed for '{record_id}': "
-            f"{policy_resp.status_code} {truncate(policy_resp.text)}"
-        )
-        return False
-
-    harvest_resp = requests.post(
-        f"{base_url}/workspaces/{workspace}/harvest",
-        headers=headers,
-        timeout=TIMEOUT,
-    )
-
-    if not harvest_resp.ok:
-        print(
-            f"  WARN: Harvest trigger failed for '{record_id}': "
-            f"{harvest_resp.status_code} {truncate(harvest_resp.text)}"
-        )
-        return False
-
-    print(f"  OK: Published '{record_id}'")
-    return True
-
-
-def main() -> None:
-    parser = argparse.ArgumentParser(description="CD: register records and publish to ADES.")
-    parser.add_argument("--files", nargs="*", default=[], help="Catalogue JSON files to register.")
-    parser.add_argument("--deleted-ids", nargs="*", default=[], help="Record IDs to delete (from removed files).")
-    parser.add_argument("--skip-ades", action="store_true", help="Skip ADES process registration.")
-    parser.add_argument("--skip-publish", action="store_true", help="Skip access policy publishing.")
-    args = parser.parse_args()
-
-    files = [Path(f) for f in args.files if f.endswith(".json") and not f.endswith("catalog.json") and Path(f).exists()]
-
-    if not files and not args.deleted_ids:
-        print("Nothing to do.")
-        return
-
-    errors: list[str] = []
-
-    print("=== Authenticating ===")
-    try:
-        keycloak_token = get_keycloak_token()
-        print("  OK: Keycloak token obtained")
-    except Exception as e:
-        print(f"  FAIL: Could not get Keycloak token: {e}")
-        sys.exit(1)
-
-    workspace_token = None
-    needs_workspace_token = (not args.skip_ades or not args.skip_publish) and files
-    if needs_workspace_token:
-        workspace = os.environ.get("EODH__WORKSPACE_NAME", "")
-        if workspace:
-            try:
-                workspace_token = get_workspace_token(keycloak_token, workspace)
-                print("  OK: Workspace token obtained")
-                # Print relevant non-secret claims to debug downstream AWS STS issues.
-                log_workspace_token_claims("workspace-session", workspace_token)
-            except Exception as e:
-                print(f"  WARN: Could not get workspace token: {e}")
-                print("  ADES registration and publishing will be skipped.")
-
-    if files:
-        print(f"\n=== Ensuring collections exist ===")
-        seen_collections: set[str] = set()
-        for fp in files:
-            collection_id = get_collection_id(fp)
-            if collection_id and collection_id not in seen_collections:
-                if not ensure_collection(collection_id, fp, keycloak_token):
-                    errors.append(f"collection:{collection_id}")
-                seen_collections.add(collection_id)
-
-        print(f"\n=== Registering {len(files)} record(s) in wf-catalogue-service ===")
-        for fp in files:
-            collection_id = get_collection_id(fp) or "eodh-workflows-notebooks"
-            if not register_record(fp, keycloak_token, collection_id):
-                errors.append(f"register:{fp}")
-
-    if args.deleted_ids:
-        print(f"\n=== Deleting {len(args.deleted_ids)} record(s) from wf-catalogue-service ===")
-        for record_id in args.deleted_ids:
-            if not delete_record(record_id, keycloak_token):
-                errors.append(f"delete:{record_id}")
-
-    if files and not args.skip_ades and workspace_token:
-        print("\n=== Registering CWL processes in ADES ===")
-        for fp in files:
-            if not register_ades_process(fp, workspace_token):
-                errors.append(f"ades:{fp}")
-
-    if files and not args.skip_publish and workspace_token:
-        print("\n=== Publishing workflows ===")
-        for fp in files:
-            data = json.loads(fp.read_text(encoding="utf-8"))
-            if data.get("properties", {}).get("type") == "workflow":
-                record_id = data["id"]
-                if not publish_workflow(record_id, workspace_token):
-                    errors.append(f"publish:{record_id}")
-
-    if errors:
-        print(f"\n{len(errors)} error(s):")
-        for err in errors:
-            print(f"  - {err}")
-        sys.exit(1)
-
-    print("\nAll CD steps completed successfully.")
-
-
-if __name__ == "__main__":
-    main()
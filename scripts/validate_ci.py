@@ -1,4 +1,4 @@
-"""CI validation checks for catalogue records: STAC URL reachability and CWL syntax.
+"""CI validation checks for catalogue records: STAC URL reachability, CWL syntax and CWL input consistency.
 
 Usage:
     python scripts/validate_ci.py --files catalogue/eodh-workflows-notebooks/workflows/ndvi-workflow.json
@@ -9,15 +9,18 @@ from __future__ import annotations
 
 import argparse
 import json
+import os
 import subprocess
 import sys
 import tempfile
 from pathlib import Path
 from urllib.parse import urlparse
 
-import requests
+from workflow_catalogue.core.cwl import CwlError, CwlResolver
+from workflow_catalogue.core.cwl_inputs import CwlInputsCache, check_catalogue
+from workflow_catalogue.utils.profiling import PROFILE_ENV, PROFILERS, profile
 
-CWL_FETCH_TIMEOUT = 15
+CWL_FETCH_WORKERS = 8
 CWL_VALIDATE_TIMEOUT = 30
 
 
@@ -35,55 +38,71 @@ def check_applicable_collections(files: list[Path]) -> list[str]:
     return errors
 
 
-def check_cwl_links(files: list[Path]) -> list[str]:
-    """Fetch CWL files referenced in records and validate with cwltool."""
+def check_cwl_inputs(files: list[Path], resolver: CwlResolver) -> list[str]:
+    """Check that the inputParameters of workflows match the inputs declared in their CWL."""
     errors: list[str] = []
+    _, mismatches = check_catalogue(files, CwlInputsCache(resolver))
+    for mismatch in mismatches:
+        if not mismatch.parameter:
+            print(f"  WARN: {mismatch.record_id}: {mismatch.message}")
+            continue
+        print(f"  FAIL: {mismatch.record_id}.{mismatch.parameter}: {mismatch.message}")
+        errors.append(f"{mismatch.record_id}.{mismatch.parameter}")
+    if not mismatches:
+        print(f"  PASS: inputParameters match the CWL inputs of {len(files)} file(s)")
+    return errors
+
+
+def check_cwl_links(files: list[Path], resolver: CwlResolver) -> list[str]:
+    """Fetch CWL files referenced in records, pack them with their dependencies and validate with cwltool.
+
+    All files share one resolver, so tools referenced by several workflows are fetched once and every CWL link is
+    validated once.
+    """
+    errors: list[str] = []
+    hrefs: list[str] = []
     for fp in files:
         data = json.loads(fp.read_text(encoding="utf-8"))
-        cwl_links = [
-            link
-            for link in data.get("links", [])
-            if link.get("rel") == "application" and "cwl" in link.get("type", "")
-        ]
-
-        for link in cwl_links:
+        for link in data.get("links", []):
+            if link.get("rel") != "application" or "cwl" not in link.get("type", ""):
+                continue
             href = link["href"]
             if not urlparse(href).scheme:
                 print(f"  SKIP (local path): {href}")
-                continue
-
-            try:
-                resp = requests.get(href, timeout=CWL_FETCH_TIMEOUT)
-                if not resp.ok:
-                    print(f"  WARN: CWL URL returned {resp.status_code}: {href}")
-                    continue
-            except requests.RequestException as e:
-                print(f"  WARN: Could not fetch {href}: {e}")
-                continue
-
-            with tempfile.NamedTemporaryFile(suffix=".cwl", mode="w", delete=False) as tmp:
-                tmp.write(resp.text)
-                tmp_path = tmp.name
-
-            try:
-                result = subprocess.run(
-                    ["cwltool", "--validate", tmp_path],
-                    capture_output=True,
-                    text=True,
-                    timeout=CWL_VALIDATE_TIMEOUT,
-                )
-            except FileNotFoundError:
-                print("  WARN: cwltool not installed, skipping CWL validation")
-                return errors
-            except subprocess.TimeoutExpired:
-                print(f"  WARN: CWL validation timed out for {href}")
-                continue
-
-            if result.returncode != 0:
-                print(f"  FAIL: CWL invalid - {href}\n{result.stderr}")
-                errors.append(href)
-            else:
-                print(f"  PASS: CWL valid - {href}")
+            elif href not in hrefs:
+                hrefs.append(href)
+
+    resolver.resolve(hrefs)
+    for href in hrefs:
+        try:
+            packed = resolver.pack_bytes(href)
+        except CwlError as e:
+            print(f"  WARN: Could not resolve {href}: {e}")
+            continue
+
+        with tempfile.NamedTemporaryFile(suffix=".cwl", mode="wb", delete=False) as tmp:
+            tmp.write(packed)
+            tmp_path = tmp.name
+
+        try:
+            result = subprocess.run(
+                ["cwltool", "--validate", tmp_path],
+                capture_output=True,
+                text=True,
+                timeout=CWL_VALIDATE_TIMEOUT,
+            )
+        except FileNotFoundError:
+            print("  WARN: cwltool not installed, skipping CWL validation")
+            return errors
+        except subprocess.TimeoutExpired:
+            print(f"  WARN: CWL validation timed out for {href}")
+            continue
+
+        if result.returncode != 0:
+            print(f"  FAIL: CWL invalid - {href}\n{result.stderr}")
+            errors.append(href)
+        else:
+            print(f"  PASS: CWL valid - {href}")
 
     return errors
 
@@ -93,8 +112,19 @@ def main() -> None:
     parser.add_argument("--files", nargs="+", required=True, help="Catalogue JSON files to check.")
     parser.add_argument("--skip-stac", action="store_true", help="Skip applicableCollections checks.")
     parser.add_argument("--skip-cwl", action="store_true", help="Skip CWL link checks.")
+    parser.add_argument(
+        "--profile",
+        choices=PROFILERS,
+        default=os.environ.get(PROFILE_ENV) or None,
+        help=f"Profile the run and write a profile artifact and summary. Defaults to ${PROFILE_ENV}.",
+    )
     args = parser.parse_args()
 
+    with profile(args.profile, "validate_ci"):
+        run_checks(args)
+
+
+def run_checks(args: argparse.Namespace) -> None:
     files = [Path(f) for f in args.files if f.endswith(".json") and not f.endswith("catalog.json") and Path(f).exists()]
     if not files:
         print("No record files to check.")
@@ -108,7 +138,10 @@ def main() -> None:
 
     if not args.skip_cwl:
         print("=== CWL Link Validation ===")
-        errors.extend(check_cwl_links(files))
+        resolver = CwlResolver(workers=CWL_FETCH_WORKERS)
+        errors.extend(check_cwl_links(files, resolver))
+        print("=== CWL Input Consistency ===")
+        errors.extend(check_cwl_inputs(files, resolver))
 
     if errors:
         print(f"\n{len(errors)} check(s) failed.")
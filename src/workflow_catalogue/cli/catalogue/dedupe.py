@@ -0,0 +1,96 @@
+"""Catalogue near-duplicate detection CLI."""
+
+from __future__ import annotations
+
+import time
+from pathlib import Path
+
+import click
+
+from workflow_catalogue.core.dedupe import (
+    DEFAULT_NUM_PERM,
+    DEFAULT_SHINGLE_SIZE,
+    DEFAULT_THRESHOLD,
+    DuplicateCluster,
+    find_near_duplicates,
+)
+from workflow_catalogue.utils.logging import get_logger
+from workflow_catalogue.utils.serialization import format_json, loads
+
+_logger = get_logger(__name__)
+
+
+def _write_clusters(clusters: list[DuplicateCluster], output: Path) -> None:
+    """Write the clusters with their pairs as JSON.
+
+    Args:
+        clusters: Near-duplicate clusters.
+        output: Destination file.
+
+    """
+    rendered = format_json(
+        [
+            {
+                "record_ids": list(cluster.record_ids),
+                "similarity": cluster.similarity,
+                "pairs": [pair._asdict() for pair in cluster.pairs],
+            }
+            for cluster in clusters
+        ],
+        indent=2,
+    )
+    output.write_text(rendered, encoding="utf-8")
+    _logger.info("Clusters written to: %s", output)
+
+
+@click.command("dedupe")
+@click.option(
+    "--catalogue-path",
+    type=click.Path(exists=True, path_type=Path, file_okay=False, dir_okay=True),  # type: ignore[type-var]
+    required=True,
+    help="Path to catalogue directory.",
+)
+@click.option(
+    "--threshold",
+    type=click.FloatRange(min=0, max=1, min_open=True),
+    default=DEFAULT_THRESHOLD,
+    show_default=True,
+    help="Minimum estimated Jaccard similarity of near-duplicate records.",
+)
+@click.option(
+    "--num-perm",
+    type=click.IntRange(min=1),
+    default=DEFAULT_NUM_PERM,
+    show_default=True,
+    help="MinHash signature length. Longer signatures estimate similarity more accurately.",
+)
+@click.option(
+    "--shingle-size",
+    type=click.IntRange(min=1),
+    default=DEFAULT_SHINGLE_SIZE,
+    show_default=True,
+    help="Number of consecutive words per shingle.",
+)
+@click.option(
+    "--output",
+    type=click.Path(path_type=Path, file_okay=True, dir_okay=False),  # type: ignore[type-var]
+    default=None,
+    help="File to write the clusters and their pairs to as JSON.",
+)
+def dedupe_catalogue(
+    catalogue_path: Path, threshold: float, num_perm: int, shingle_size: int, output: Path | None
+) -> None:
+    """Find clusters of near-duplicate records by title, description and keywords."""
+    start = time.perf_counter()
+    documents = [loads(f.read_bytes()) for f in sorted(catalogue_path.rglob("*.json")) if f.name != "catalog.json"]
+    clusters = find_near_duplicates(documents, threshold, num_perm, shingle_size)
+    _logger.info(
+        "Compared %d record(s) in %.2fs: %d cluster(s) of near-duplicates",
+        len(documents),
+        time.perf_counter() - start,
+        len(clusters),
+    )
+    for cluster in clusters:
+        click.echo(f"{cluster.similarity:.2f} {' '.join(cluster.record_ids)}")
+    if output:
+        _write_clusters(clusters, output)
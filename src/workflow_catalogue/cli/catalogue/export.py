@@ -0,0 +1,57 @@
+"""Columnar catalogue export CLI."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import click
+
+from workflow_catalogue.core.columnar_export import (
+    DEFAULT_BATCH_SIZE,
+    EXPORT_FORMATS,
+    ExportFormat,
+    export_columnar,
+)
+from workflow_catalogue.utils.logging import get_logger
+
+_logger = get_logger(__name__)
+
+
+@click.command("export")
+@click.option(
+    "--catalogue-path",
+    type=click.Path(exists=True, path_type=Path, file_okay=False, dir_okay=True),  # type: ignore[type-var]
+    required=True,
+    help="Path to catalogue directory.",
+)
+@click.option(
+    "--output-dir",
+    type=click.Path(path_type=Path, file_okay=False, dir_okay=True),  # type: ignore[type-var]
+    required=True,
+    help="Directory to write the records and input_parameters tables to.",
+)
+@click.option(
+    "--format",
+    "export_format",
+    type=click.Choice(EXPORT_FORMATS),
+    default="parquet",
+    show_default=True,
+    help="File format. Parquet and Arrow need pyarrow (workflow_catalogue[analytics]).",
+)
+@click.option(
+    "--batch-size",
+    type=click.IntRange(min=1),
+    default=DEFAULT_BATCH_SIZE,
+    show_default=True,
+    help="Number of records held in memory before they are written.",
+)
+def export_catalogue(catalogue_path: Path, output_dir: Path, export_format: ExportFormat, batch_size: int) -> None:
+    """Export the records as columnar tables for analytics: one row per record and one per input parameter."""
+    _logger.info("Exporting catalogue at %s to %s as %s", catalogue_path, output_dir, export_format)
+    try:
+        result = export_columnar(sorted(catalogue_path.rglob("*.json")), output_dir, export_format, batch_size)
+    except RuntimeError as e:
+        raise click.UsageError(str(e)) from e
+    for path in result.written:
+        _logger.info("WRITTEN: %s", path)
+    _logger.info("%d record(s) and %d input parameter(s) exported.", result.records, result.input_parameters)
@@ -0,0 +1,51 @@
+"""Static catalogue export CLI."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import click
+
+from workflow_catalogue.core.static_export import DEFAULT_PAGE_SIZE, export_static
+from workflow_catalogue.utils.logging import get_logger
+
+_logger = get_logger(__name__)
+
+
+@click.command("export-static")
+@click.option(
+    "--catalogue-path",
+    type=click.Path(exists=True, path_type=Path, file_okay=False, dir_okay=True),  # type: ignore[type-var]
+    required=True,
+    help="Path to catalogue directory.",
+)
+@click.option(
+    "--output-dir",
+    type=click.Path(path_type=Path, file_okay=False, dir_okay=True),  # type: ignore[type-var]
+    required=True,
+    help="Directory to write the static tree to.",
+)
+@click.option(
+    "--base-url",
+    type=str,
+    default="",
+    help="URL the tree is served from, used in links. Links are root-relative when omitted.",
+)
+@click.option(
+    "--page-size",
+    type=click.IntRange(min=1),
+    default=DEFAULT_PAGE_SIZE,
+    show_default=True,
+    help="Number of records per items page.",
+)
+def export_static_catalogue(catalogue_path: Path, output_dir: Path, base_url: str, page_size: int) -> None:
+    """Render the catalogue as static OGC API - Records responses (collections, collection, paginated items)."""
+    _logger.info("Exporting catalogue at %s to %s", catalogue_path, output_dir)
+    result = export_static(catalogue_path, output_dir, base_url=base_url, page_size=page_size)
+    for path in result.written:
+        _logger.info("WRITTEN: %s", path)
+    for path in result.removed:
+        _logger.info("REMOVED: %s", path)
+    _logger.info(
+        "%d document(s) written, %d unchanged, %d removed.", len(result.written), result.unchanged, len(result.removed)
+    )
@@ -0,0 +1,71 @@
+"""Catalogue formatting CLI."""
+
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+import click
+
+from workflow_catalogue.utils.logging import get_logger
+from workflow_catalogue.utils.serialization import format_json, loads
+
+_logger = get_logger(__name__)
+
+
+@click.command("format")
+@click.option(
+    "--catalogue-path",
+    type=click.Path(exists=True, path_type=Path, file_okay=False, dir_okay=True),  # type: ignore[type-var]
+    required=True,
+    help="Path to catalogue directory.",
+)
+@click.option(
+    "--check",
+    is_flag=True,
+    default=False,
+    help="Do not rewrite files, exit with a non-zero code if any file is not in canonical form.",
+)
+def format_catalogue(
+    catalogue_path: Path,
+    check: bool,  # noqa: FBT001
+) -> None:
+    """Rewrite JSON records in the catalogue directory in canonical form (sorted keys, 4 space indentation)."""
+    files = sorted(catalogue_path.rglob("*.json"))
+    if not files:
+        _logger.info("No JSON files to format.")
+        return
+
+    changed: list[Path] = []
+    errors: list[Path] = []
+    for file_path in files:
+        try:
+            original = file_path.read_text(encoding="utf-8")
+            formatted = format_json(loads(original))
+        except ValueError:
+            _logger.exception("FAIL: %s is not valid JSON", file_path)
+            errors.append(file_path)
+            continue
+
+        if formatted == original:
+            continue
+
+        changed.append(file_path)
+        if check:
+            _logger.info("WOULD REFORMAT: %s", file_path)
+        else:
+            file_path.write_text(formatted, encoding="utf-8")
+            _logger.info("REFORMATTED: %s", file_path)
+
+    if errors:
+        _logger.error("%d file(s) could not be parsed.", len(errors))
+        sys.exit(1)
+
+    if check and changed:
+        _logger.error("%d of %d file(s) would be reformatted.", len(changed), len(files))
+        sys.exit(1)
+
+    if check:
+        _logger.info("All %d file(s) are in canonical form.", len(files))
+    else:
+        _logger.info("%d of %d file(s) reformatted.", len(changed), len(files))
@@ -0,0 +1,132 @@
+"""Catalogue reconciliation CLI."""
+
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+import click
+import requests
+
+from workflow_catalogue.client import PlatformClient
+from workflow_catalogue.core.mock_platform import enable_dry_run
+from workflow_catalogue.core.reconcile import (
+    DEFAULT_PAGE_SIZE,
+    DEFAULT_PAGE_WORKERS,
+    ReconcilePlan,
+    build_local_index,
+    reconcile_collections,
+)
+from workflow_catalogue.core.registration import CatalogueRegistrar, RegistrationOptions
+from workflow_catalogue.core.settings import current_settings
+from workflow_catalogue.utils.logging import get_logger
+from workflow_catalogue.utils.serialization import format_json
+
+_logger = get_logger(__name__)
+
+
+def _write_plans(plans: list[ReconcilePlan], output: Path | None) -> None:
+    """Write the plans as JSON to a file or stdout.
+
+    Args:
+        plans: Reconciliation plans.
+        output: Destination file. The plans are printed to stdout when `None`.
+
+    """
+    rendered = format_json([plan.model_dump(mode="json") for plan in plans], indent=2)
+    if output:
+        output.write_text(rendered, encoding="utf-8")
+        _logger.info("Plan written to: %s", output)
+    else:
+        click.echo(rendered, nl=False)
+
+
+@click.command("reconcile")
+@click.option(
+    "--catalogue-path",
+    type=click.Path(exists=True, path_type=Path, file_okay=False, dir_okay=True),  # type: ignore[type-var]
+    required=True,
+    help="Path to catalogue directory.",
+)
+@click.option(
+    "--collection",
+    "extra_collections",
+    multiple=True,
+    help="Also reconcile a remote collection that has no local directory (all its records are deleted). Repeatable.",
+)
+@click.option(
+    "--page-size",
+    type=click.IntRange(min=1),
+    default=DEFAULT_PAGE_SIZE,
+    show_default=True,
+    help="Number of remote records requested per page.",
+)
+@click.option(
+    "--page-workers",
+    type=click.IntRange(min=1),
+    default=DEFAULT_PAGE_WORKERS,
+    show_default=True,
+    help="Number of remote pages fetched in parallel.",
+)
+@click.option(
+    "--output",
+    type=click.Path(path_type=Path, file_okay=True, dir_okay=False),  # type: ignore[type-var]
+    default=None,
+    help="File to write the plan to. Defaults to stdout.",
+)
+@click.option("--apply", is_flag=True, default=False, help="Register outdated records and delete orphaned ones.")
+@click.option("--skip-ades", is_flag=True, default=False, help="Skip ADES process registration when applying.")
+@click.option("--skip-publish", is_flag=True, default=False, help="Skip access policy publishing when applying.")
+@click.option(
+    "--dry-run", is_flag=True, default=False, help="Answer requests from a local mock platform instead of the API."
+)
+def reconcile_catalogue(
+    catalogue_path: Path,
+    extra_collections: tuple[str, ...],
+    page_size: int,
+    page_workers: int,
+    output: Path | None,
+    apply: bool,  # noqa: FBT001
+    skip_ades: bool,  # noqa: FBT001
+    skip_publish: bool,  # noqa: FBT001
+    dry_run: bool,  # noqa: FBT001
+) -> None:
+    """Compare local records with wf-catalogue-service by ID and content hash and compute delete/upsert sets."""
+    session = requests.Session()
+    if dry_run:
+        enable_dry_run(session)
+    client = PlatformClient(current_settings(), session=session)
+    registrar = CatalogueRegistrar(client, RegistrationOptions(skip_ades=skip_ades, skip_publish=skip_publish))
+
+    index = build_local_index(catalogue_path.rglob("*.json"))
+    for collection_id in extra_collections:
+        index.setdefault(collection_id, {})
+
+    try:
+        token, _ = registrar.authenticate(workspace=False)
+        plans = reconcile_collections(client, index, token, page_size=page_size, workers=page_workers)
+    except requests.RequestException:
+        _logger.exception("FAIL: Could not list remote records")
+        sys.exit(1)
+
+    for plan in plans:
+        _logger.info(
+            "[%s] %d remote record(s): %d unchanged, %d to upsert, %d to delete",
+            plan.collection_id,
+            plan.remote_total,
+            plan.unchanged,
+            len(plan.upsert),
+            len(plan.delete),
+        )
+    _write_plans(plans, output)
+
+    if not apply or all(plan.in_sync for plan in plans):
+        return
+    result = registrar.run(
+        [path for plan in plans for path in plan.upsert],
+        [record_id for plan in plans for record_id in plan.delete],
+    )
+    if not result.ok:
+        _logger.error("%d error(s):\n%s", len(result.errors), "\n".join(f"  - {err}" for err in result.errors))
+        sys.exit(1)
+    _logger.info("Catalogue reconciled.")
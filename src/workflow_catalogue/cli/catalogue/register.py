@@ -0,0 +1,154 @@
+"""Catalogue registration CLI."""
+
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+import click
+import requests
+
+from workflow_catalogue.client import FAMILIES, PlatformClient
+from workflow_catalogue.core.manifest import MANIFEST_KEY_ENV, load_manifest, manifest_key
+from workflow_catalogue.core.mock_platform import RequestRecorder, enable_dry_run
+from workflow_catalogue.core.registration import CatalogueRegistrar, RegistrationOptions
+from workflow_catalogue.core.scheduler import EndpointPolicy, RequestScheduler
+from workflow_catalogue.core.settings import current_settings
+from workflow_catalogue.utils.logging import get_logger
+
+_logger = get_logger(__name__)
+
+
+def _parse_rate_limits(values: tuple[str, ...]) -> dict[str, float]:
+    """Parse `FAMILY=RPS` pairs.
+
+    Args:
+        values: Values given to `--rate-limit`.
+
+    Returns:
+        Requests per second by endpoint family.
+
+    Raises:
+        click.BadParameter: If a value is malformed or names an unknown family.
+
+    """
+    limits = {}
+    for value in values:
+        family, _, rate = value.partition("=")
+        try:
+            limits[family] = float(rate)
+        except ValueError:
+            limits[family] = -1.0
+        if family not in FAMILIES or limits[family] <= 0:
+            msg = f"Expected FAMILY=RPS with FAMILY in {FAMILIES}, got '{value}'"
+            raise click.BadParameter(msg, param_hint="--rate-limit")
+    return limits
+
+
+def _report_dry_run(recorder: RequestRecorder, output: Path | None) -> None:
+    """Log or dump the requests recorded during a dry run.
+
+    Args:
+        recorder: The recorder.
+        output: JSON lines file to write the requests to. Requests are logged when `None`.
+
+    """
+    if output is not None:
+        recorder.dump(output)
+        _logger.info("DRY-RUN: %d request(s) recorded to %s", len(recorder.requests), output)
+        return
+    _logger.info("DRY-RUN: %d request(s) would be sent:", len(recorder.requests))
+    for entry in recorder.requests:
+        _logger.info("  %s %s -> %s", entry["method"], entry["url"], entry["mock_status"])
+
+
+@click.command("register")
+@click.argument(
+    "files",
+    nargs=-1,
+    type=click.Path(path_type=Path, file_okay=True, dir_okay=False),  # type: ignore[type-var]
+)
+@click.option("--deleted-id", "deleted_ids", multiple=True, help="ID of a record to delete. Can be repeated.")
+@click.option("--skip-ades", is_flag=True, default=False, help="Skip ADES process registration.")
+@click.option("--skip-publish", is_flag=True, default=False, help="Skip access policy publishing.")
+@click.option(
+    "--dry-run", is_flag=True, default=False, help="Answer requests from a local mock platform and record them."
+)
+@click.option(
+    "--dry-run-output",
+    type=click.Path(path_type=Path, file_okay=True, dir_okay=False),  # type: ignore[type-var]
+    default=None,
+    help="JSON lines file for requests recorded during a dry run.",
+)
+@click.option(
+    "--workers", type=click.IntRange(min=1), default=8, help="Maximum number of concurrent requests per collection."
+)
+@click.option(
+    "--collection-workers",
+    type=click.IntRange(min=1),
+    default=4,
+    help="Maximum number of collections registered in parallel.",
+)
+@click.option(
+    "--rate-limit",
+    "rate_limits",
+    multiple=True,
+    metavar="FAMILY=RPS",
+    help=f"Requests per second for an endpoint family ({', '.join(FAMILIES)}). Can be repeated.",
+)
+@click.option(
+    "--manifest",
+    "manifest_path",
+    type=click.Path(path_type=Path, file_okay=True, dir_okay=False),  # type: ignore[type-var]
+    default=None,
+    help=(
+        f"Validation manifest from `wfc catalogue validate --manifest-output`, verified with ${MANIFEST_KEY_ENV}. "
+        "Unchanged files that passed validation are not validated again."
+    ),
+)
+@click.option("--max-retries", type=click.IntRange(min=0), default=5, help="Retries for throttled (429/503) requests.")
+@click.option("--stats-interval", type=float, default=10.0, help="Seconds between scheduler metric reports.")
+def register_catalogue(  # noqa: PLR0913, PLR0917
+    files: tuple[Path, ...],
+    deleted_ids: tuple[str, ...],
+    skip_ades: bool,  # noqa: FBT001
+    skip_publish: bool,  # noqa: FBT001
+    dry_run: bool,  # noqa: FBT001
+    dry_run_output: Path | None,
+    workers: int,
+    collection_workers: int,
+    rate_limits: tuple[str, ...],
+    manifest_path: Path | None,
+    max_retries: int,
+    stats_interval: float,
+) -> None:
+    """Register catalogue records in wf-catalogue-service, deploy workflows to ADES and publish them."""
+    limits = _parse_rate_limits(rate_limits)
+    record_files = [f for f in files if f.suffix == ".json" and f.name != "catalog.json" and f.exists()]
+
+    session = requests.Session()
+    recorder = enable_dry_run(session) if dry_run else None
+    policies = {
+        family: EndpointPolicy(rate=limits.get(family), max_concurrency=workers, max_retries=max_retries)
+        for family in FAMILIES
+    }
+    client = PlatformClient(current_settings(), scheduler=RequestScheduler(session, policies=policies))
+    registrar = CatalogueRegistrar(
+        client,
+        RegistrationOptions(
+            skip_ades=skip_ades, skip_publish=skip_publish, workers=workers, collection_workers=collection_workers
+        ),
+        manifest=load_manifest(manifest_path, manifest_key()) if manifest_path is not None else None,
+    )
+
+    try:
+        with client.scheduler.monitor(stats_interval, lambda stats: _logger.info("METRICS: %s", stats)):
+            result = registrar.run(record_files, list(deleted_ids))
+    finally:
+        if recorder is not None:
+            _report_dry_run(recorder, dry_run_output)
+
+    if not result.ok:
+        _logger.error("%d error(s):\n%s", len(result.errors), "\n".join(f"  - {err}" for err in result.errors))
+        sys.exit(1)
+    _logger.info("All CD steps completed successfully.")
@@ -0,0 +1,104 @@
+"""Catalogue search CLI."""
+
+from __future__ import annotations
+
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+import click
+
+from workflow_catalogue.core.spatial_index import (
+    DEFAULT_NODE_CAPACITY,
+    BBox,
+    Predicate,
+    SpatialIndex,
+    parse_bbox,
+    parse_interval,
+)
+from workflow_catalogue.utils.logging import get_logger
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+_logger = get_logger(__name__)
+
+
+def _parsed(parse: Callable[[str], Any]) -> Callable[[click.Context, click.Parameter, str | None], Any]:
+    """Wrap a parser into a click callback reporting `ValueError` as a bad parameter."""
+
+    def callback(_ctx: click.Context, _param: click.Parameter, value: str | None) -> Any:
+        if value is None:
+            return None
+        try:
+            return parse(value)
+        except ValueError as e:
+            raise click.BadParameter(str(e)) from e
+
+    return callback
+
+
+@click.command("search")
+@click.option(
+    "--catalogue-path",
+    type=click.Path(exists=True, path_type=Path, file_okay=False, dir_okay=True),  # type: ignore[type-var]
+    required=True,
+    help="Path to catalogue directory.",
+)
+@click.option(
+    "--bbox",
+    callback=_parsed(parse_bbox),
+    default=None,
+    help="Area of interest as minX,minY,maxX,maxY (WGS84). minX > maxX crosses the antimeridian.",
+)
+@click.option(
+    "--datetime",
+    "interval",
+    callback=_parsed(parse_interval),
+    default=None,
+    help="Instant or interval in ISO 8601: 2024-01-01, 2024-01-01/2024-12-31, ../2024-12-31 or 2024-01-01/..",
+)
+@click.option(
+    "--predicate",
+    type=click.Choice(["intersects", "contains"]),
+    default="intersects",
+    show_default=True,
+    help="Match extents overlapping the query or only extents covering all of it.",
+)
+@click.option(
+    "--bounded-only",
+    is_flag=True,
+    default=False,
+    help="Skip workflows without a spatial extent, which otherwise match any area.",
+)
+@click.option(
+    "--node-capacity",
+    type=click.IntRange(min=2),
+    default=DEFAULT_NODE_CAPACITY,
+    show_default=True,
+    help="Number of children per index node.",
+)
+def search_catalogue(
+    catalogue_path: Path,
+    bbox: BBox | None,
+    interval: tuple[float, float] | None,
+    predicate: Predicate,
+    bounded_only: bool,  # noqa: FBT001
+    node_capacity: int,
+) -> None:
+    """Find the workflows whose extent matches an area of interest and time range."""
+    start = time.perf_counter()
+    index = SpatialIndex.from_files(sorted(catalogue_path.rglob("*.json")), node_capacity)
+    built = time.perf_counter()
+    matches = index.search(bbox, interval, predicate=predicate, bounded_only=bounded_only)
+    elapsed = time.perf_counter() - built
+
+    _logger.info(
+        "Indexed %d workflow(s) in %.3fs; query answered in %.0f us: %d match(es)",
+        len(index),
+        built - start,
+        elapsed * 1e6,
+        len(matches),
+    )
+    for record_id in matches:
+        click.echo(record_id)
@@ -2,49 +2,202 @@
 
 from __future__ import annotations
 
-import json
 import sys
+import time
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 import click
 
-from workflow_catalogue.schemas.catalogue import EodhCatalogue
-from workflow_catalogue.schemas.notebook import EodhNotebookRecord
-from workflow_catalogue.schemas.workflow import EodhWorkflowRecord
+from workflow_catalogue.core.manifest import MANIFEST_KEY_ENV, ValidationManifest, manifest_key
+from workflow_catalogue.core.scan import scan_catalogue
+from workflow_catalogue.core.validation import (
+    RENDERERS,
+    REPORT_FORMATS,
+    FileResult,
+    ValidationReport,
+    run_validation,
+    validate_files,
+)
+from workflow_catalogue.core.watch import affected_files, create_watcher, watch_changes
 from workflow_catalogue.utils.logging import get_logger
 
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
 _logger = get_logger(__name__)
 
+SLOWEST_FILES = 5
+"""Number of slowest files listed in the validation summary."""
+
+
+def _log_result(result: FileResult) -> None:
+    """Log the outcome of validating a single file.
+
+    Args:
+        result: The validation result.
+
+    """
+    if result.warnings:
+        _logger.warning(
+            "WARN: %s\n%s",
+            result.path,
+            "\n".join(f"  {issue.json_path}: {issue.msg} [{issue.type}]" for issue in result.warnings),
+        )
+    if result.passed:
+        _logger.info("PASS: %s", result.path)
+        return
+    _logger.error(
+        "FAIL: %s\n%s",
+        result.path,
+        "\n".join(f"  {issue.json_path}: {issue.msg} [{issue.type}]" for issue in result.errors),
+    )
+
+
+def _validate_files(files: Iterable[Path]) -> dict[Path, FileResult]:
+    """Validate files and collect failures.
+
+    Args:
+        files: Paths of the JSON files to validate.
+
+    Returns:
+        Mapping of failed file path to its validation result.
+
+    """
+    errors: dict[Path, FileResult] = {}
+    for result in validate_files(files):
+        _log_result(result)
+        if not result.passed:
+            errors[result.path] = result
+    return errors
+
+
+def _revalidate(changed: set[Path], failing: dict[Path, FileResult]) -> None:
+    """Re-validate changed files and their dependents, updating the set of failing files in place.
+
+    Args:
+        changed: Paths reported by the watcher.
+        failing: Currently failing files, updated in place.
+
+    """
+    start = time.perf_counter()
+    to_validate, removed = affected_files(changed)
+    for path in removed:
+        for failed in [p for p in failing if p == path or path in p.parents]:
+            del failing[failed]
+    for path in to_validate:
+        failing.pop(path, None)
+    failing.update(_validate_files(to_validate))
+    _logger.info(
+        "Re-validated %d file(s) in %.1f ms, %d file(s) failing.",
+        len(to_validate),
+        (time.perf_counter() - start) * 1000,
+        len(failing),
+    )
+
+
+def _watch(changes: Iterable[set[Path]], failing: dict[Path, FileResult]) -> None:
+    """Re-validate files as batches of changes arrive.
+
+    Args:
+        changes: Batches of changed paths.
+        failing: Currently failing files, updated in place.
+
+    """
+    for changed in changes:
+        _revalidate(changed, failing)
+
+
+def _run_watch(catalogue_path: Path, files: list[Path], poll_interval: float | None) -> None:
+    """Validate all files once, then keep re-validating them as they change until interrupted.
+
+    Args:
+        catalogue_path: Directory to watch.
+        files: Files to validate initially.
+        poll_interval: Polling interval in seconds. Inotify is used when `None`.
+
+    """
+    failing = _validate_files(files)
+    _logger.info("%d file(s) failing. Watching %s for changes...", len(failing), catalogue_path)
+    watcher = create_watcher(catalogue_path, polling=poll_interval is not None, interval=poll_interval or 0.5)
+    try:
+        _watch(watch_changes(watcher), failing)
+    except KeyboardInterrupt:
+        _logger.info("Stopped watching.")
+    finally:
+        watcher.close()
+
+
+def _write_report(report: ValidationReport, report_format: str, report_output: Path | None) -> None:
+    """Render the report and write it to a file or stdout.
+
+    Args:
+        report: The validation report.
+        report_format: One of `REPORT_FORMATS`.
+        report_output: Destination file. The report is printed to stdout when `None`.
+
+    """
+    rendered = RENDERERS[report_format](report)
+    if report_output:
+        report_output.write_text(rendered, encoding="utf-8")
+        _logger.info("Report written to: %s", report_output)
+    else:
+        click.echo(rendered)
 
-def _validate_schema(file_path: Path) -> None:
-    """Detect record type and validate against the appropriate schema.
+
+def _signing_key(manifest_output: Path | None) -> str | None:
+    """Read the manifest signing key, failing early when a manifest is requested without one.
 
     Args:
-        file_path: Path to the JSON file to validate.
+        manifest_output: Manifest destination, `None` when no manifest is written.
+
+    Returns:
+        The signing key, or `None` when it is not set.
 
     Raises:
-        ValueError: If the record type is unknown or filename/ID mismatch.
+        click.UsageError: If a manifest is requested and the key is not set.
 
     """
-    data = json.loads(file_path.read_text(encoding="utf-8"))
+    key = manifest_key()
+    if manifest_output and key is None:
+        msg = f"--manifest-output requires the signing key in ${MANIFEST_KEY_ENV}"
+        raise click.UsageError(msg)
+    return key
 
-    if file_path.name == "catalog.json":
-        EodhCatalogue.model_validate(data)
+
+def _write_manifest(report: ValidationReport, manifest_output: Path | None, key: str | None) -> None:
+    """Write the signed validation manifest of the report, if requested.
+
+    Args:
+        report: The validation report.
+        manifest_output: Destination file. Nothing is written when `None`.
+        key: The signing key, checked by `_signing_key`.
+
+    """
+    if manifest_output is None or key is None:
         return
+    manifest = ValidationManifest.from_report(report)
+    manifest.sign(key)
+    manifest.write(manifest_output)
+    _logger.info("Validation manifest for %d file(s) written to: %s", len(manifest.files), manifest_output)
 
-    record_id = data.get("id")
-    if record_id and record_id != file_path.stem:
-        msg = f"Filename '{file_path.stem}' does not match record id '{record_id}'"
-        raise ValueError(msg)
 
-    record_type = data.get("properties", {}).get("type")
-    if record_type == "workflow":
-        EodhWorkflowRecord.model_validate(data)
-    elif record_type == "notebook":
-        EodhNotebookRecord.model_validate(data)
-    else:
-        msg = f"Unknown or missing record type: {record_type}"
-        raise ValueError(msg)
+def _log_summary(report: ValidationReport) -> None:
+    """Log timings of the slowest files.
+
+    Args:
+        report: The validation report.
+
+    """
+    _logger.info("Validated %d file(s) in %.1f ms. Slowest files:", len(report.files), report.total_ms)
+    for result in report.slowest(SLOWEST_FILES):
+        _logger.info(
+            "  %8.2f ms (parse %.2f ms, validate %.2f ms) %s",
+            result.total_ms,
+            result.parse_ms,
+            result.validate_ms,
+            result.path,
+        )
 
 
 @click.command("validate")
@@ -60,33 +213,98 @@ def _validate_schema(file_path: Path) -> None:
     default=None,
     help="Comma-separated list of changed file paths. If provided, only these files are validated.",
 )
+@click.option(
+    "--watch",
+    is_flag=True,
+    default=False,
+    help="Keep running and re-validate files (and their collection when catalog.json changes) as they are saved.",
+)
+@click.option(
+    "--poll-interval",
+    type=click.FloatRange(min=0.01),
+    default=None,
+    help="Use the polling watcher with the given interval in seconds instead of inotify.",
+)
+@click.option(
+    "--report",
+    "report_format",
+    type=click.Choice(REPORT_FORMATS),
+    default=None,
+    help="Write a machine-readable report in the given format.",
+)
+@click.option(
+    "--report-output",
+    type=click.Path(path_type=Path, file_okay=True, dir_okay=False),  # type: ignore[type-var]
+    default=None,
+    help="File to write the report to. Defaults to stdout.",
+)
+@click.option(
+    "--manifest-output",
+    type=click.Path(path_type=Path, file_okay=True, dir_okay=False),  # type: ignore[type-var]
+    default=None,
+    help=f"Write a validation manifest signed with ${MANIFEST_KEY_ENV} that registration can use to skip validation.",
+)
+@click.option("--fail-fast", is_flag=True, default=False, help="Stop at the first file that fails validation.")
+@click.option(
+    "--max-errors",
+    type=click.IntRange(min=1),
+    default=None,
+    help="Stop after this many files failed validation.",
+)
+@click.option(
+    "--workers",
+    type=click.IntRange(min=1),
+    default=1,
+    help="Number of worker processes used for validation.",
+)
 def validate_catalogue(
     catalogue_path: Path,
     changed_files: str | None,
+    watch: bool,  # noqa: FBT001
+    poll_interval: float | None,
+    report_format: str | None,
+    report_output: Path | None,
+    manifest_output: Path | None,
+    fail_fast: bool,  # noqa: FBT001
+    max_errors: int | None,
+    workers: int,
 ) -> None:
     """Validate JSON records in the catalogue directory against EODH schemas."""
     _logger.info("Validating catalogue at: %s", catalogue_path)
 
+    if watch and (changed_files or report_format or manifest_output):
+        msg = "--changed-files, --report and --manifest-output cannot be combined with --watch"
+        raise click.UsageError(msg)
+    key = _signing_key(manifest_output)
+
+    files_to_validate: Iterable[Path]
     if changed_files:
         files_to_validate = [Path(f.strip()) for f in changed_files.split(",") if f.strip().endswith(".json")]
     else:
-        files_to_validate = sorted(catalogue_path.rglob("*.json"))
+        # Validation starts on the first files found while the rest of the catalogue is still being listed.
+        files_to_validate = (file.path for file in scan_catalogue(catalogue_path, stat=False))
+
+    if watch:
+        _run_watch(catalogue_path, sorted(files_to_validate), poll_interval)
+        return
 
-    if not files_to_validate:
+    report = run_validation(files_to_validate, workers=workers, max_errors=1 if fail_fast else max_errors)
+    if not report.files and not report_format and not manifest_output:
         _logger.info("No JSON files to validate.")
         return
+    for result in report.files:
+        _log_result(result)
+    if report.files:
+        _log_summary(report)
+
+    if report_format:
+        _write_report(report, report_format, report_output)
+    _write_manifest(report, manifest_output, key)
 
-    errors: list[tuple[Path, Exception]] = []
-    for file_path in files_to_validate:
-        try:
-            _validate_schema(file_path)
-            _logger.info("PASS: %s", file_path)
-        except Exception as exc:
-            _logger.exception("FAIL: %s", file_path)
-            errors.append((file_path, exc))
-
-    if errors:
-        _logger.error("%d file(s) failed validation.", len(errors))
+    if report.stopped_early:
+        _logger.error("Stopped after %d failed file(s).", len(report.failed))
+    if report.failed:
+        _logger.error("%d file(s) failed validation.", len(report.failed))
         sys.exit(1)
 
-    _logger.info("All %d file(s) passed validation.", len(files_to_validate))
+    _logger.info("All %d file(s) passed validation.", len(report.files))
@@ -0,0 +1 @@
+"""Validation daemon CLI."""
@@ -0,0 +1,67 @@
+"""Validation daemon client CLI."""
+
+from __future__ import annotations
+
+import sys
+import time
+from pathlib import Path
+
+import click
+
+from workflow_catalogue.core.daemon import DEFAULT_TIMEOUT, format_issue, validate_paths
+from workflow_catalogue.core.watch import affected_files
+from workflow_catalogue.utils.logging import get_logger
+
+_logger = get_logger(__name__)
+
+
+@click.command("check")
+@click.argument(
+    "files",
+    nargs=-1,
+    type=click.Path(path_type=Path, dir_okay=False),  # type: ignore[type-var]
+)
+@click.option(
+    "--socket",
+    "socket_path",
+    type=click.Path(path_type=Path, dir_okay=False),  # type: ignore[type-var]
+    default=None,
+    help="Socket of the daemon. Defaults to $WFC_DAEMON_SOCKET or a per-user file in the temporary directory.",
+)
+@click.option(
+    "--timeout",
+    type=click.FloatRange(min=0.1),
+    default=DEFAULT_TIMEOUT,
+    show_default=True,
+    help="Seconds to wait for the daemon.",
+)
+def check_files(files: tuple[Path, ...], socket_path: Path | None, timeout: float) -> None:
+    """Validate FILES with the running daemon, or in process when no daemon is listening.
+
+    A `catalog.json` among FILES also validates every record of its collection, since they depend on it.
+
+    """
+    files_to_validate, _ = affected_files({f for f in files if f.suffix == ".json"})
+    if not files_to_validate:
+        _logger.info("No JSON files to validate.")
+        return
+
+    start = time.perf_counter()
+    results, from_daemon = validate_paths(files_to_validate, socket_path, timeout)
+    failed = 0
+    for result in results:
+        if not result["errors"]:
+            _logger.info("PASS: %s", result["path"])
+            continue
+        failed += 1
+        _logger.error("FAIL: %s\n%s", result["path"], "\n".join(f"  {format_issue(i)}" for i in result["errors"]))
+
+    _logger.info(
+        "Validated %d file(s) %s in %.1f ms.",
+        len(results),
+        "by the daemon" if from_daemon else "in process",
+        (time.perf_counter() - start) * 1000,
+    )
+    if failed:
+        _logger.error("%d file(s) failed validation.", failed)
+        sys.exit(1)
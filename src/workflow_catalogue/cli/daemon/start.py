@@ -0,0 +1,90 @@
+"""Validation daemon start CLI."""
+
+from __future__ import annotations
+
+import subprocess  # noqa: S404
+import sys
+import time
+from pathlib import Path
+
+import click
+
+from workflow_catalogue.core.daemon import DaemonUnavailableError, default_socket_path, send_request, serve
+from workflow_catalogue.utils.logging import get_logger
+
+_logger = get_logger(__name__)
+
+_STARTUP_TIMEOUT_S = 30.0
+_STARTUP_POLL_S = 0.05
+
+
+def _detach(socket_path: Path, catalogue_path: Path | None, log_file: Path) -> None:
+    """Start the daemon in a new session and wait until it answers.
+
+    Args:
+        socket_path: Path of the socket to listen on.
+        catalogue_path: Catalogue to warm the cache with.
+        log_file: File receiving the daemon output.
+
+    """
+    args = [sys.executable, "-m", "workflow_catalogue.cli.entrypoint", "daemon", "start", "--socket", str(socket_path)]
+    if catalogue_path:
+        args.extend(["--catalogue-path", str(catalogue_path)])
+    with log_file.open("ab") as log:
+        process = subprocess.Popen(  # noqa: S603
+            args, stdin=subprocess.DEVNULL, stdout=log, stderr=log, start_new_session=True
+        )
+
+    deadline = time.monotonic() + _STARTUP_TIMEOUT_S
+    while time.monotonic() < deadline:
+        if process.poll() is not None:
+            _logger.error("Daemon exited with status %d, see %s", process.returncode, log_file)
+            sys.exit(1)
+        try:
+            send_request(socket_path, {"op": "status"}, timeout=1.0)
+        except (DaemonUnavailableError, OSError):
+            time.sleep(_STARTUP_POLL_S)
+            continue
+        _logger.info("Daemon started (pid %d) on %s, logging to %s", process.pid, socket_path, log_file)
+        return
+    _logger.error("Daemon did not answer within %.0fs, see %s", _STARTUP_TIMEOUT_S, log_file)
+    sys.exit(1)
+
+
+@click.command("start")
+@click.option(
+    "--socket",
+    "socket_path",
+    type=click.Path(path_type=Path, dir_okay=False),  # type: ignore[type-var]
+    default=None,
+    help="Socket to listen on. Defaults to $WFC_DAEMON_SOCKET or a per-user file in the temporary directory.",
+)
+@click.option(
+    "--catalogue-path",
+    type=click.Path(exists=True, path_type=Path, file_okay=False, dir_okay=True),  # type: ignore[type-var]
+    default=None,
+    help="Validate this catalogue on start-up to warm the cache.",
+)
+@click.option("--detach", is_flag=True, default=False, help="Run in the background and return once the daemon answers.")
+@click.option(
+    "--log-file",
+    type=click.Path(path_type=Path, dir_okay=False),  # type: ignore[type-var]
+    default=None,
+    help="File receiving the output of a detached daemon. Defaults to the socket path with a .log suffix.",
+)
+def start_daemon(
+    socket_path: Path | None,
+    catalogue_path: Path | None,
+    detach: bool,  # noqa: FBT001
+    log_file: Path | None,
+) -> None:
+    """Start a resident validation daemon listening on a Unix socket."""
+    socket_path = socket_path or default_socket_path()
+    if detach:
+        _detach(socket_path, catalogue_path, log_file or socket_path.with_suffix(".log"))
+        return
+    try:
+        serve(socket_path, sorted(catalogue_path.rglob("*.json")) if catalogue_path else ())
+    except RuntimeError as e:
+        _logger.error("%s", e)  # noqa: TRY400
+        sys.exit(1)
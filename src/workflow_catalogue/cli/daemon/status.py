@@ -0,0 +1,37 @@
+"""Validation daemon status CLI."""
+
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+import click
+
+from workflow_catalogue.core.daemon import DaemonUnavailableError, default_socket_path, send_request
+from workflow_catalogue.utils.logging import get_logger
+from workflow_catalogue.utils.serialization import format_json
+
+_logger = get_logger(__name__)
+
+
+@click.command("status")
+@click.option(
+    "--socket",
+    "socket_path",
+    type=click.Path(path_type=Path, dir_okay=False),  # type: ignore[type-var]
+    default=None,
+    help="Socket of the daemon. Defaults to $WFC_DAEMON_SOCKET or a per-user file in the temporary directory.",
+)
+def daemon_status(socket_path: Path | None) -> None:
+    """Print the status of the validation daemon. Exits with status 1 when it is not running."""
+    socket_path = socket_path or default_socket_path()
+    try:
+        status = send_request(socket_path, {"op": "status"})
+    except DaemonUnavailableError:
+        _logger.info("No daemon listening on %s", socket_path)
+        sys.exit(1)
+    except (OSError, ValueError) as e:
+        # Includes `TimeoutError`: a hung or broken daemon is as good as no daemon.
+        _logger.error("Daemon on %s is not responding: %s", socket_path, e)  # noqa: TRY400
+        sys.exit(1)
+    click.echo(format_json(status, indent=2), nl=False)
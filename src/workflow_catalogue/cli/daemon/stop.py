@@ -0,0 +1,31 @@
+"""Validation daemon stop CLI."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import click
+
+from workflow_catalogue.core.daemon import DaemonUnavailableError, default_socket_path, send_request
+from workflow_catalogue.utils.logging import get_logger
+
+_logger = get_logger(__name__)
+
+
+@click.command("stop")
+@click.option(
+    "--socket",
+    "socket_path",
+    type=click.Path(path_type=Path, dir_okay=False),  # type: ignore[type-var]
+    default=None,
+    help="Socket of the daemon. Defaults to $WFC_DAEMON_SOCKET or a per-user file in the temporary directory.",
+)
+def stop_daemon(socket_path: Path | None) -> None:
+    """Stop the validation daemon."""
+    socket_path = socket_path or default_socket_path()
+    try:
+        send_request(socket_path, {"op": "shutdown"})
+    except DaemonUnavailableError:
+        _logger.info("No daemon listening on %s", socket_path)
+        return
+    _logger.info("Daemon on %s stopped.", socket_path)
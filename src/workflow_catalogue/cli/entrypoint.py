@@ -2,29 +2,96 @@
 
 from __future__ import annotations
 
+from pathlib import Path
+
 import click
 
-from workflow_catalogue.cli.catalogue.validate import validate_catalogue
-from workflow_catalogue.cli.workflow.validate import validate_workflow_schema
+from workflow_catalogue.cli.lazy import LazyGroup
+from workflow_catalogue.utils.profiling import DEFAULT_TOP, PROFILE_DIR_ENV, PROFILE_ENV, PROFILERS, Profiler, profile
 
 
 @click.group()
-def cli() -> None:
+@click.option(
+    "--profile",
+    "profiler",
+    type=click.Choice(PROFILERS),
+    envvar=PROFILE_ENV,
+    default=None,
+    help=f"Profile the command and write a profile artifact and summary. Also enabled by ${PROFILE_ENV}.",
+)
+@click.option(
+    "--profile-dir",
+    type=click.Path(path_type=Path, file_okay=False, dir_okay=True),  # type: ignore[type-var]
+    envvar=PROFILE_DIR_ENV,
+    default=None,
+    help="Directory profile artifacts are written to. Defaults to ./profiles.",
+)
+@click.option(
+    "--profile-top",
+    type=click.IntRange(min=1),
+    default=DEFAULT_TOP,
+    show_default=True,
+    help="Number of entries in the profile summary.",
+)
+@click.pass_context
+def cli(ctx: click.Context, profiler: Profiler | None, profile_dir: Path | None, profile_top: int) -> None:
     """CLI entrypoint."""
+    if profiler is not None:
+        name = f"wfc-{ctx.invoked_subcommand}" if ctx.invoked_subcommand else "wfc"
+        ctx.with_resource(profile(profiler, name, profile_dir, profile_top))
 
 
-@cli.group()
+@cli.group(
+    cls=LazyGroup,
+    lazy_subcommands={
+        "check-cwl": "workflow_catalogue.cli.workflow.check_cwl:check_workflow_cwl",
+        "check-inputs": "workflow_catalogue.cli.workflow.check_inputs:check_workflow_inputs",
+        "validate": "workflow_catalogue.cli.workflow.validate:validate_workflow_schema",
+    },
+)
 def workflow() -> None:
     """Workflow management commands."""
 
 
-@cli.group()
+@cli.group(
+    cls=LazyGroup,
+    lazy_subcommands={
+        "dedupe": "workflow_catalogue.cli.catalogue.dedupe:dedupe_catalogue",
+        "export": "workflow_catalogue.cli.catalogue.export:export_catalogue",
+        "export-static": "workflow_catalogue.cli.catalogue.export_static:export_static_catalogue",
+        "format": "workflow_catalogue.cli.catalogue.format:format_catalogue",
+        "reconcile": "workflow_catalogue.cli.catalogue.reconcile:reconcile_catalogue",
+        "register": "workflow_catalogue.cli.catalogue.register:register_catalogue",
+        "search": "workflow_catalogue.cli.catalogue.search:search_catalogue",
+        "validate": "workflow_catalogue.cli.catalogue.validate:validate_catalogue",
+    },
+)
 def catalogue() -> None:
     """Catalogue management commands."""
 
 
-workflow.add_command(validate_workflow_schema)
-catalogue.add_command(validate_catalogue)
+@cli.group(
+    cls=LazyGroup,
+    lazy_subcommands={
+        "check": "workflow_catalogue.cli.daemon.check:check_files",
+        "start": "workflow_catalogue.cli.daemon.start:start_daemon",
+        "status": "workflow_catalogue.cli.daemon.status:daemon_status",
+        "stop": "workflow_catalogue.cli.daemon.stop:stop_daemon",
+    },
+)
+def daemon() -> None:
+    """Resident validation daemon commands."""
+
+
+@cli.group(
+    cls=LazyGroup,
+    lazy_subcommands={
+        "inspect": "workflow_catalogue.cli.notebook.inspect:inspect_notebook_artifacts",
+    },
+)
+def notebook() -> None:
+    """Notebook commands."""
+
 
 if __name__ == "__main__":
     cli()
@@ -0,0 +1,66 @@
+"""Lazily loaded click command groups.
+
+Subcommand modules import pydantic models, schemas and other heavy dependencies. Registering them by import path
+instead of by object keeps `wfc --help` and unrelated commands fast - a subcommand module is only imported when the
+subcommand is actually resolved.
+
+"""
+
+from __future__ import annotations
+
+import importlib
+from typing import Any
+
+import click
+
+
+class LazyGroup(click.Group):
+    """A click group whose subcommands are imported on first use."""
+
+    def __init__(self, *args: Any, lazy_subcommands: dict[str, str] | None = None, **kwargs: Any) -> None:
+        """Initializes the group.
+
+        Args:
+            *args: Positional arguments forwarded to `click.Group`.
+            lazy_subcommands: Mapping of subcommand name to `"module.path:attribute"` import path.
+            **kwargs: Keyword arguments forwarded to `click.Group`.
+
+        """
+        super().__init__(*args, **kwargs)
+        self.lazy_subcommands = lazy_subcommands or {}
+
+    def list_commands(self, ctx: click.Context) -> list[str]:
+        """Lists eagerly registered and lazy subcommand names.
+
+        Args:
+            ctx: The click context.
+
+        Returns:
+            Sorted subcommand names.
+
+        """
+        return sorted({*super().list_commands(ctx), *self.lazy_subcommands})
+
+    def get_command(self, ctx: click.Context, cmd_name: str) -> click.Command | None:
+        """Resolves a subcommand, importing it if it was registered lazily.
+
+        Args:
+            ctx: The click context.
+            cmd_name: The subcommand name.
+
+        Returns:
+            The subcommand or `None` if it does not exist.
+
+        """
+        if cmd_name in self.lazy_subcommands:
+            return self._load(cmd_name)
+        return super().get_command(ctx, cmd_name)
+
+    def _load(self, cmd_name: str) -> click.Command:
+        import_path = self.lazy_subcommands[cmd_name]
+        module_name, _, attr = import_path.partition(":")
+        command = getattr(importlib.import_module(module_name), attr)
+        if not isinstance(command, click.Command):
+            msg = f"Lazy subcommand '{cmd_name}' ({import_path}) is not a click command: {type(command).__name__}"
+            raise TypeError(msg)
+        return command
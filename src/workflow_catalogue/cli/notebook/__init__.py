@@ -0,0 +1 @@
+"""Notebook CLI."""
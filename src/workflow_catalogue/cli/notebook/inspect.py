@@ -0,0 +1,82 @@
+"""Notebook artifact inspection CLI."""
+
+from __future__ import annotations
+
+import sys
+import time
+from pathlib import Path
+
+import click
+
+from workflow_catalogue.core.notebooks import DEFAULT_WORKERS, ArtifactCache, inspect_notebooks
+from workflow_catalogue.utils.logging import get_logger
+
+_logger = get_logger(__name__)
+
+
+@click.command("inspect")
+@click.option(
+    "--notebook-definition-path",
+    "definition_paths",
+    type=click.Path(exists=True, path_type=Path, file_okay=True, dir_okay=False),  # type: ignore[type-var]
+    multiple=True,
+    help="Path to notebook definition. Repeatable.",
+)
+@click.option(
+    "--catalogue-path",
+    type=click.Path(exists=True, path_type=Path, file_okay=False, dir_okay=True),  # type: ignore[type-var]
+    default=None,
+    help="Path to catalogue directory. Inspects every notebook in it.",
+)
+@click.option(
+    "--cache-dir",
+    type=click.Path(path_type=Path, file_okay=False, dir_okay=True),  # type: ignore[type-var]
+    default=None,
+    help="Directory downloaded notebooks and environment files are cached in. Defaults to the temporary directory.",
+)
+@click.option(
+    "--workers",
+    type=click.IntRange(min=1),
+    default=DEFAULT_WORKERS,
+    show_default=True,
+    help="Number of files downloaded in parallel.",
+)
+@click.option("--refresh", is_flag=True, default=False, help="Download files again even when they are cached.")
+def inspect_notebook_artifacts(
+    definition_paths: tuple[Path, ...],
+    catalogue_path: Path | None,
+    cache_dir: Path | None,
+    workers: int,
+    refresh: bool,  # noqa: FBT001
+) -> None:
+    """Check that linked notebooks and environment files match the kernel declared by their records."""
+    files = list(definition_paths)
+    if catalogue_path:
+        files.extend(sorted(catalogue_path.rglob("*.json")))
+    if not files:
+        msg = "Provide --notebook-definition-path or --catalogue-path."
+        raise click.UsageError(msg)
+
+    cache = ArtifactCache(cache_dir, refresh=refresh)
+    start = time.perf_counter()
+    inspections = inspect_notebooks(files, cache, workers)
+    failed = 0
+    for inspection in inspections:
+        expectation = inspection.expectation
+        if inspection.ok:
+            _logger.info("PASS: %s (%s)", expectation.record_id, expectation.href)
+        else:
+            failed += 1
+            source = f" ({expectation.href})" if expectation.href else ""
+            _logger.info("FAIL: %s - %s%s", expectation.record_id, "; ".join(inspection.problems), source)
+    _logger.info(
+        "Inspected %d notebook(s) in %.2fs: %d download(s), %.1f MB, %d cache hit(s), %d failed",
+        len(inspections),
+        time.perf_counter() - start,
+        cache.downloads,
+        cache.downloaded_bytes / 1e6,
+        cache.hits,
+        failed,
+    )
+    if failed:
+        sys.exit(1)
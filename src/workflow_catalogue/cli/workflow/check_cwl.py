@@ -0,0 +1,63 @@
+"""Workflow CWL consistency checking CLI."""
+
+from __future__ import annotations
+
+import sys
+import time
+from pathlib import Path
+
+import click
+
+from workflow_catalogue.core.cwl import DEFAULT_WORKERS, CwlResolver
+from workflow_catalogue.core.cwl_inputs import CwlInputsCache, check_catalogue
+from workflow_catalogue.utils.logging import get_logger
+
+_logger = get_logger(__name__)
+
+
+@click.command("check-cwl")
+@click.option(
+    "--workflow-definition-path",
+    "definition_paths",
+    type=click.Path(exists=True, path_type=Path, file_okay=True, dir_okay=False),  # type: ignore[type-var]
+    multiple=True,
+    help="Path to workflow definition. Repeatable.",
+)
+@click.option(
+    "--catalogue-path",
+    type=click.Path(exists=True, path_type=Path, file_okay=False, dir_okay=True),  # type: ignore[type-var]
+    default=None,
+    help="Path to catalogue directory. Checks every workflow in it.",
+)
+@click.option(
+    "--workers",
+    type=click.IntRange(min=1),
+    default=DEFAULT_WORKERS,
+    show_default=True,
+    help="Number of CWL documents fetched in parallel.",
+)
+def check_workflow_cwl(definition_paths: tuple[Path, ...], catalogue_path: Path | None, workers: int) -> None:
+    """Check that the inputParameters of workflows match the inputs of their CWL."""
+    files = list(definition_paths)
+    if catalogue_path:
+        files.extend(sorted(catalogue_path.rglob("*.json")))
+    if not files:
+        msg = "Provide --workflow-definition-path or --catalogue-path."
+        raise click.UsageError(msg)
+
+    cache = CwlInputsCache(CwlResolver(workers=workers))
+    start = time.perf_counter()
+    checked, mismatches = check_catalogue(files, cache)
+    for mismatch in mismatches:
+        location = f"{mismatch.record_id}.{mismatch.parameter}" if mismatch.parameter else mismatch.record_id
+        source = f" ({mismatch.href})" if mismatch.href else ""
+        _logger.error("FAIL: %s - %s%s", location, mismatch.message, source)
+    _logger.info(
+        "Checked %d workflow(s) against %d CWL document(s) in %.2fs: %d mismatch(es)",
+        checked,
+        len(cache),
+        time.perf_counter() - start,
+        len(mismatches),
+    )
+    if mismatches:
+        sys.exit(1)
@@ -0,0 +1,121 @@
+"""Workflow job input checking CLI."""
+
+from __future__ import annotations
+
+import sys
+import time
+from pathlib import Path
+
+import click
+
+from workflow_catalogue.core.inputs import InputError, check_job, load_validators
+from workflow_catalogue.utils.logging import get_logger
+from workflow_catalogue.utils.serialization import format_json, loads
+
+_logger = get_logger(__name__)
+
+
+def _format_errors(errors: list[InputError]) -> str:
+    return "; ".join(f"{err.parameter}: {err.message}" if err.parameter else err.message for err in errors)
+
+
+def _read_jobs(inputs_path: Path | None, jobs_path: Path | None) -> list[tuple[str, bytes]]:
+    """Read raw job payloads with their source location.
+
+    Args:
+        inputs_path: A single JSON payload.
+        jobs_path: A JSON Lines file of payloads. Blank lines are skipped.
+
+    Returns:
+        `(source, payload)` pairs.
+
+    """
+    jobs: list[tuple[str, bytes]] = []
+    if inputs_path:
+        jobs.append((inputs_path.as_posix(), inputs_path.read_bytes()))
+    if jobs_path:
+        with jobs_path.open("rb") as fp:
+            jobs.extend(
+                (f"{jobs_path.as_posix()}:{line_no}", line) for line_no, line in enumerate(fp, start=1) if line.strip()
+            )
+    return jobs
+
+
+@click.command("check-inputs")
+@click.option(
+    "--workflow-definition-path",
+    "definition_paths",
+    type=click.Path(exists=True, path_type=Path, file_okay=True, dir_okay=False),  # type: ignore[type-var]
+    multiple=True,
+    help="Path to workflow definition. Repeatable.",
+)
+@click.option(
+    "--catalogue-path",
+    type=click.Path(exists=True, path_type=Path, file_okay=False, dir_okay=True),  # type: ignore[type-var]
+    default=None,
+    help="Path to catalogue directory. Loads every workflow in it.",
+)
+@click.option(
+    "--inputs",
+    "inputs_path",
+    type=click.Path(exists=True, path_type=Path, file_okay=True, dir_okay=False),  # type: ignore[type-var]
+    default=None,
+    help='Job payload to check: an execute request such as {"inputs": {...}}.',
+)
+@click.option(
+    "--jobs",
+    "jobs_path",
+    type=click.Path(exists=True, path_type=Path, file_okay=True, dir_okay=False),  # type: ignore[type-var]
+    default=None,
+    help='JSON Lines file of job payloads to check in bulk: {"workflow": "<id>", "inputs": {...}} per line.',
+)
+@click.option("--show-schema", is_flag=True, default=False, help="Print the JSON Schema of the workflow inputs.")
+def check_workflow_inputs(
+    definition_paths: tuple[Path, ...],
+    catalogue_path: Path | None,
+    inputs_path: Path | None,
+    jobs_path: Path | None,
+    show_schema: bool,  # noqa: FBT001
+) -> None:
+    """Check job inputs against the inputParameters of workflow definitions."""
+    files = list(definition_paths)
+    if catalogue_path:
+        files.extend(sorted(catalogue_path.rglob("*.json")))
+    if not files:
+        msg = "Provide --workflow-definition-path or --catalogue-path."
+        raise click.UsageError(msg)
+
+    validators = load_validators(files)
+    default_workflow = next(iter(validators)) if len(validators) == 1 else None
+    _logger.info("Compiled input validators for %d workflow(s)", len(validators))
+
+    if show_schema:
+        click.echo(
+            format_json({workflow_id: v.json_schema() for workflow_id, v in validators.items()}, indent=2), nl=False
+        )
+
+    jobs = _read_jobs(inputs_path, jobs_path)
+    invalid = 0
+    start = time.perf_counter()
+    for source, payload in jobs:
+        try:
+            errors = check_job(loads(payload), validators, default_workflow)
+        except ValueError as e:
+            errors = [InputError("", f"invalid JSON: {e}")]
+        if errors:
+            invalid += 1
+            _logger.info("FAIL: %s - %s", source, _format_errors(errors))
+    elapsed = time.perf_counter() - start
+
+    if not jobs:
+        return
+    _logger.info(
+        "Checked %d job(s) in %.3fs (%.0f jobs/s): %d valid, %d invalid",
+        len(jobs),
+        elapsed,
+        len(jobs) / elapsed if elapsed else 0,
+        len(jobs) - invalid,
+        invalid,
+    )
+    if invalid:
+        sys.exit(1)
@@ -0,0 +1,27 @@
+"""Clients for the EO DataHub platform APIs."""
+
+from __future__ import annotations
+
+from workflow_catalogue.client.endpoints import PlatformEndpoints
+from workflow_catalogue.client.platform import (
+    ADES,
+    AUTH,
+    CATALOGUE,
+    EXTERNAL,
+    FAMILIES,
+    WORKSPACE,
+    PlatformClient,
+    TokenError,
+)
+
+__all__ = [
+    "ADES",
+    "AUTH",
+    "CATALOGUE",
+    "EXTERNAL",
+    "FAMILIES",
+    "WORKSPACE",
+    "PlatformClient",
+    "PlatformEndpoints",
+    "TokenError",
+]
@@ -0,0 +1,115 @@
+"""Platform endpoint URLs, derived once from the application settings."""
+
+from __future__ import annotations
+
+from urllib.parse import urljoin
+
+from pydantic import BaseModel, ConfigDict
+
+from workflow_catalogue.core.settings import Settings  # noqa: TC001
+
+OGC_PROCESSES_PATH = "processes"
+
+
+class PlatformEndpoints(BaseModel):
+    """Immutable set of URLs used by the CD pipeline."""
+
+    model_config = ConfigDict(frozen=True)
+
+    token_url: str
+    catalogue_api_url: str
+    workspace: str
+    workspace_sessions_url: str
+    processes_url: str
+    data_loader_url: str
+    harvest_url: str
+
+    @classmethod
+    def from_settings(cls, settings: Settings) -> PlatformEndpoints:
+        """Builds the endpoints from settings.
+
+        Args:
+            settings: Application settings.
+
+        Returns:
+            The endpoints.
+
+        Raises:
+            ValueError: If the workflow catalogue API URL is not configured.
+
+        """
+        if not settings.wf_catalogue_api_url:
+            msg = "WF_CATALOGUE_API_URL is not configured"
+            raise ValueError(msg)
+        eodh = settings.eodh
+        base_url = eodh.base_url.rstrip("/")
+        return cls(
+            token_url=eodh.token_url,
+            catalogue_api_url=settings.wf_catalogue_api_url.rstrip("/"),
+            workspace=eodh.workspace,
+            # Sessions are scoped to the workspace the records are published to, as in the original register script.
+            workspace_sessions_url=urljoin(
+                eodh.base_url, f"{eodh.workspace_services_endpoint_path}/{eodh.workspace}/me/sessions"
+            ),
+            processes_url=f"{eodh.ades_url.rstrip('/')}/{eodh.workspace}/{OGC_PROCESSES_PATH}",
+            data_loader_url=f"{base_url}/api/workspaces/{eodh.workspace}/data-loader",
+            harvest_url=f"{base_url}/workspaces/{eodh.workspace}/harvest",
+        )
+
+    @property
+    def collections_url(self) -> str:
+        """Returns the catalogue collections URL."""
+        return f"{self.catalogue_api_url}/collections"
+
+    @property
+    def register_url(self) -> str:
+        """Returns the record registration URL."""
+        return f"{self.catalogue_api_url}/register"
+
+    def collection_url(self, collection_id: str) -> str:
+        """Returns the URL of a single collection.
+
+        Args:
+            collection_id: The collection ID.
+
+        Returns:
+            The collection URL.
+
+        """
+        return f"{self.catalogue_api_url}/collections/{collection_id}"
+
+    def items_url(self, collection_id: str) -> str:
+        """Returns the URL listing the records of a collection.
+
+        Args:
+            collection_id: The collection ID.
+
+        Returns:
+            The items URL.
+
+        """
+        return f"{self.collection_url(collection_id)}/items"
+
+    def record_url(self, record_id: str) -> str:
+        """Returns the URL used to delete a registered record.
+
+        Args:
+            record_id: The record ID.
+
+        Returns:
+            The record URL.
+
+        """
+        return f"{self.catalogue_api_url}/register/{record_id}"
+
+    def process_url(self, process_id: str) -> str:
+        """Returns the URL of a single ADES process.
+
+        Args:
+            process_id: The process ID.
+
+        Returns:
+            The process URL.
+
+        """
+        return f"{self.processes_url}/{process_id}"
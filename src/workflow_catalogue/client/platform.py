@@ -0,0 +1,310 @@
+"""A thin client for the EO DataHub platform APIs used by the CD pipeline.
+
+Configuration is resolved once when the client is created: settings come from the cached `current_settings` and all
+URLs are precomputed in `PlatformEndpoints`, so request methods only format headers and send. Every call goes through
+a `RequestScheduler` under one of the endpoint families below, which keeps each API within its rate and concurrency
+limits.
+
+Methods return the raw `requests.Response` - callers decide which status codes are acceptable. Token methods are the
+exception: they raise for failed requests and `TokenError` for responses without a token.
+
+"""
+
+from __future__ import annotations
+
+import json
+from typing import TYPE_CHECKING, Any
+
+import requests
+
+from workflow_catalogue.client.endpoints import PlatformEndpoints
+from workflow_catalogue.core.scheduler import RequestScheduler
+from workflow_catalogue.core.settings import current_settings
+
+if TYPE_CHECKING:
+    from workflow_catalogue.core.settings import Settings
+
+AUTH = "auth"
+CATALOGUE = "catalogue"
+ADES = "ades"
+WORKSPACE = "workspace"
+EXTERNAL = "external"
+FAMILIES = (AUTH, CATALOGUE, ADES, WORKSPACE, EXTERNAL)
+"""Endpoint families, each scheduled with its own rate and concurrency limits."""
+
+DEFAULT_TIMEOUT = 30
+
+
+class TokenError(requests.RequestException):
+    """A token endpoint responded successfully but without the expected token."""
+
+
+def _token(resp: requests.Response, key: str) -> str:
+    try:
+        return str(resp.json()[key])
+    except (KeyError, TypeError, ValueError) as exc:
+        msg = f"No '{key}' in the response from {resp.url}"
+        raise TokenError(msg, response=resp) from exc
+
+
+class PlatformClient:
+    """Client for Keycloak, the workflow catalogue service, workspaces and ADES."""
+
+    def __init__(
+        self,
+        settings: Settings | None = None,
+        *,
+        session: requests.Session | None = None,
+        scheduler: RequestScheduler | None = None,
+        timeout: float = DEFAULT_TIMEOUT,
+    ) -> None:
+        """Initializes the client.
+
+        Args:
+            settings: Application settings. Defaults to `current_settings()`.
+            session: HTTP session. Ignored when `scheduler` is given.
+            scheduler: Request scheduler. Defaults to an unlimited scheduler over `session`.
+            timeout: Per-request timeout in seconds.
+
+        """
+        self.settings = settings or current_settings()
+        self.endpoints = PlatformEndpoints.from_settings(self.settings)
+        self.scheduler = scheduler or RequestScheduler(session or requests.Session())
+        self.timeout = timeout
+
+    @staticmethod
+    def _headers(token: str, content_type: str | None = None, *, accept_json: bool = False) -> dict[str, str]:
+        headers = {"Authorization": f"Bearer {token}"}
+        if content_type:
+            headers["Content-Type"] = content_type
+        if accept_json:
+            headers["Accept"] = "application/json"
+        return headers
+
+    def _request(self, family: str, method: str, url: str, **kwargs: Any) -> requests.Response:
+        return self.scheduler.request(family, method, url, timeout=self.timeout, **kwargs)
+
+    def keycloak_token(self) -> str:
+        """Gets a Keycloak access token via the password grant.
+
+        Returns:
+            The access token.
+
+        Raises:
+            requests.HTTPError: If the token request fails.
+            TokenError: If the response does not contain a token.
+
+        """
+        eodh = self.settings.eodh
+        resp = self._request(
+            AUTH,
+            "POST",
+            self.endpoints.token_url,
+            headers={"Content-Type": "application/x-www-form-urlencoded"},
+            data={
+                "client_id": eodh.client_id,
+                "username": eodh.username,
+                "password": eodh.password,
+                "grant_type": "password",
+                "scope": "openid",
+            },
+        )
+        resp.raise_for_status()
+        return _token(resp, "access_token")
+
+    def workspace_token(self, keycloak_token: str) -> str:
+        """Exchanges a Keycloak token for a workspace-scoped session token.
+
+        Args:
+            keycloak_token: The Keycloak access token.
+
+        Returns:
+            The workspace session token.
+
+        Raises:
+            requests.HTTPError: If the session request fails.
+            TokenError: If the response does not contain a token.
+
+        """
+        resp = self._request(
+            WORKSPACE,
+            "POST",
+            self.endpoints.workspace_sessions_url,
+            headers=self._headers(keycloak_token, accept_json=True),
+        )
+        resp.raise_for_status()
+        return _token(resp, "access")
+
+    def get_collection(self, collection_id: str, token: str) -> requests.Response:
+        """Fetches a catalogue collection.
+
+        Args:
+            collection_id: The collection ID.
+            token: Keycloak access token.
+
+        Returns:
+            The response.
+
+        """
+        return self._request(
+            CATALOGUE, "GET", self.endpoints.collection_url(collection_id), headers=self._headers(token)
+        )
+
+    def create_collection(self, payload: dict[str, Any], token: str) -> requests.Response:
+        """Creates a catalogue collection.
+
+        Args:
+            payload: The collection document.
+            token: Keycloak access token.
+
+        Returns:
+            The response.
+
+        """
+        return self._request(
+            CATALOGUE,
+            "POST",
+            self.endpoints.collections_url,
+            json=payload,
+            headers=self._headers(token, "application/json"),
+        )
+
+    def list_items(self, collection_id: str, token: str, *, page: int = 1, page_size: int = 100) -> requests.Response:
+        """Fetches a page of the records registered in a collection.
+
+        Args:
+            collection_id: The collection ID.
+            token: Keycloak access token.
+            page: 1-based page number.
+            page_size: Number of records per page.
+
+        Returns:
+            The response.
+
+        """
+        return self._request(
+            CATALOGUE,
+            "GET",
+            self.endpoints.items_url(collection_id),
+            params={"page": page, "page_size": page_size},
+            headers=self._headers(token, accept_json=True),
+        )
+
+    def register_record(self, record: dict[str, Any], catalogue_id: str, token: str) -> requests.Response:
+        """Registers a record in a catalogue collection.
+
+        Args:
+            record: The record document.
+            catalogue_id: The collection to register the record in.
+            token: Keycloak access token.
+
+        Returns:
+            The response.
+
+        """
+        return self._request(
+            CATALOGUE,
+            "POST",
+            self.endpoints.register_url,
+            json=record,
+            params={"catalogue_id": catalogue_id},
+            headers=self._headers(token, "application/json"),
+        )
+
+    def delete_record(self, record_id: str, token: str) -> requests.Response:
+        """Deletes a registered record.
+
+        Args:
+            record_id: The record ID.
+            token: Keycloak access token.
+
+        Returns:
+            The response.
+
+        """
+        return self._request(CATALOGUE, "DELETE", self.endpoints.record_url(record_id), headers=self._headers(token))
+
+    def fetch(self, url: str) -> requests.Response:
+        """Fetches an external resource, e.g. a CWL definition.
+
+        Args:
+            url: The resource URL.
+
+        Returns:
+            The response.
+
+        """
+        return self._request(EXTERNAL, "GET", url)
+
+    def unregister_process(self, process_id: str, workspace_token: str) -> requests.Response:
+        """Removes a process from ADES.
+
+        Args:
+            process_id: The process ID.
+            workspace_token: Workspace session token.
+
+        Returns:
+            The response.
+
+        """
+        return self._request(
+            ADES,
+            "DELETE",
+            self.endpoints.process_url(process_id),
+            headers=self._headers(workspace_token, "application/cwl+yaml", accept_json=True),
+        )
+
+    def register_process(self, cwl: bytes, workspace_token: str) -> requests.Response:
+        """Deploys a CWL process in ADES.
+
+        Args:
+            cwl: The CWL document.
+            workspace_token: Workspace session token.
+
+        Returns:
+            The response.
+
+        """
+        return self._request(
+            ADES,
+            "POST",
+            self.endpoints.processes_url,
+            data=cwl,
+            headers=self._headers(workspace_token, "application/cwl+yaml", accept_json=True),
+        )
+
+    def upload_access_policy(self, policy: dict[str, Any], workspace_token: str) -> requests.Response:
+        """Uploads the workspace access policy.
+
+        Args:
+            policy: The access policy document.
+            workspace_token: Workspace session token.
+
+        Returns:
+            The response.
+
+        """
+        return self._request(
+            WORKSPACE,
+            "POST",
+            self.endpoints.data_loader_url,
+            json={"fileContent": json.dumps(policy), "fileName": "access-policy.json"},
+            headers=self._headers(workspace_token, "application/json", accept_json=True),
+        )
+
+    def trigger_harvest(self, workspace_token: str) -> requests.Response:
+        """Triggers a workspace harvest.
+
+        Args:
+            workspace_token: Workspace session token.
+
+        Returns:
+            The response.
+
+        """
+        return self._request(
+            WORKSPACE,
+            "POST",
+            self.endpoints.harvest_url,
+            headers=self._headers(workspace_token, "application/json", accept_json=True),
+        )
@@ -0,0 +1,495 @@
+"""Columnar export of catalogue records for analytics.
+
+Records are exported into two tables, written as Parquet, Arrow IPC or CSV files:
+
+* `records` - one row per record. The columns are derived from the record models (`BaseEodhCatalogueRecord` and the
+  workflow and notebook extensions): nested objects are flattened into columns named by their JSON path
+  (`properties.title`, `properties.extent.spatial.crs`), lists become list columns (`properties.keywords`) and lists
+  of objects lists of structs (`properties.contacts`, `links`). Values the models cannot type, such as `geometry` or
+  parameter defaults, are JSON strings. A leading `_collection` column holds the collection of the record file, named
+  so that it cannot collide with a record field.
+* `input_parameters` - one row per entry of `properties.inputParameters`, keyed by `_collection`, `record_id` and
+  `name`, with a column per `InputParameter` field.
+
+Records are read and written in batches, so memory use is bounded by the batch size rather than the catalogue size.
+Records are not validated: values of an unexpected type are exported as null, so run `wfc catalogue validate` first.
+
+Arrow IPC files are written uncompressed so query tools (DuckDB, Polars, pyarrow) can memory-map and scan them without
+copying. Parquet files are compressed with zstd and hold one row group per batch. In CSV files, list and struct
+columns are JSON strings. Parquet and Arrow need `pyarrow` (`workflow_catalogue[analytics]`); CSV does not.
+
+"""
+
+from __future__ import annotations
+
+import csv
+import importlib
+import itertools
+import types
+import typing
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from enum import Enum
+from pathlib import PurePath
+from typing import TYPE_CHECKING, Any, Literal, Protocol
+
+from pydantic import AnyUrl, BaseModel, Field
+
+from workflow_catalogue.core.record_view import collection_id_from_path
+from workflow_catalogue.schemas.base_record import BaseEodhCatalogueRecord
+from workflow_catalogue.schemas.common import InputParameter
+from workflow_catalogue.schemas.notebook_extension import NotebookExtension
+from workflow_catalogue.schemas.workflow_extension import WorkflowExtension
+from workflow_catalogue.utils.serialization import canonical_dumps, loads
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+    from pathlib import Path
+
+ExportFormat = Literal["parquet", "arrow", "csv"]
+"""Output file format."""
+
+EXPORT_FORMATS: tuple[ExportFormat, ...] = typing.get_args(ExportFormat)
+
+DEFAULT_BATCH_SIZE = 4096
+"""Default number of records per batch (and Parquet row group)."""
+
+RECORDS_TABLE = "records"
+INPUT_PARAMETERS_TABLE = "input_parameters"
+
+COLLECTION_COLUMN = "_collection"
+"""Column holding the collection of the record file. Record fields never start with an underscore."""
+
+ColumnKind = Literal["string", "timestamp", "boolean", "int64", "float64", "json", "list", "struct"]
+
+_EXTENSIONS: dict[ExportFormat, str] = {"parquet": ".parquet", "arrow": ".arrow", "csv": ".csv"}
+_INPUT_PARAMETERS_PATH = ("properties", "inputParameters")
+_RECORD_MODELS: tuple[type[BaseModel], ...] = (BaseEodhCatalogueRecord, WorkflowExtension, NotebookExtension)
+_INT64_RANGE = range(-(2**63), 2**63)
+
+
+@dataclass(frozen=True, slots=True)
+class ColumnType:
+    """Type of a column, independent of the output format."""
+
+    kind: ColumnKind
+    item: ColumnType | None = None
+    """Item type of `list` columns."""
+    fields: tuple[tuple[str, ColumnType], ...] = ()
+    """Field names and types of `struct` columns."""
+
+
+@dataclass(frozen=True, slots=True)
+class Column:
+    """A column and the JSON path of its values in a document."""
+
+    path: tuple[str, ...]
+    type: ColumnType
+
+    @property
+    def name(self) -> str:
+        """Returns the column name, the dotted JSON path."""
+        return ".".join(self.path)
+
+
+_STRING = ColumnType("string")
+_JSON = ColumnType("json")
+_SCALAR_TYPES: tuple[tuple[type, ColumnType], ...] = (
+    (bool, ColumnType("boolean")),
+    (int, ColumnType("int64")),
+    (float, ColumnType("float64")),
+    (datetime, ColumnType("timestamp")),
+    (str, _STRING),
+    (Enum, _STRING),
+    (AnyUrl, _STRING),
+    (PurePath, _STRING),
+)
+
+
+def _unwrap(annotation: Any) -> Any:
+    """Strips `Annotated` and `None` from an optional annotation."""
+    if typing.get_origin(annotation) is typing.Annotated:
+        return _unwrap(typing.get_args(annotation)[0])
+    if typing.get_origin(annotation) in {types.UnionType, typing.Union}:
+        args = [arg for arg in typing.get_args(annotation) if arg is not type(None)]
+        if len(args) == 1:
+            return _unwrap(args[0])
+    return annotation
+
+
+def _merge(first: ColumnType, second: ColumnType) -> ColumnType:
+    """Combines the types two models give the same column, e.g. the link models of workflows and notebooks."""
+    if first == second:
+        return first
+    if first.kind == second.kind == "list" and first.item is not None and second.item is not None:
+        return ColumnType("list", item=_merge(first.item, second.item))
+    if first.kind == second.kind == "struct":
+        fields = dict(first.fields)
+        for name, field_type in second.fields:
+            fields[name] = _merge(fields[name], field_type) if name in fields else field_type
+        return ColumnType("struct", fields=tuple(fields.items()))
+    return _JSON
+
+
+def column_type(annotation: Any) -> ColumnType:
+    """Maps a model field annotation to a column type.
+
+    Args:
+        annotation: The field annotation.
+
+    Returns:
+        The column type. Annotations without a columnar equivalent (unions of different types, `dict`, `Any`) are
+        `json`.
+
+    """
+    annotation = _unwrap(annotation)
+    origin = typing.get_origin(annotation)
+    if origin is list:
+        return ColumnType("list", item=column_type(typing.get_args(annotation)[0]))
+    if origin in {types.UnionType, typing.Union}:
+        # Unions of models, such as GeoJSON geometries, are JSON; unions of scalars are typed if the types agree.
+        args = [_unwrap(arg) for arg in typing.get_args(annotation) if arg is not type(None)]
+        if any(isinstance(arg, type) and issubclass(arg, BaseModel) for arg in args):
+            return _JSON
+        variants = {column_type(arg) for arg in args}
+        return variants.pop() if len(variants) == 1 else _JSON
+    if not isinstance(annotation, type):
+        return _JSON
+    if issubclass(annotation, BaseModel):
+        return ColumnType(
+            "struct",
+            fields=tuple(
+                (field.alias or name, column_type(field.annotation)) for name, field in annotation.model_fields.items()
+            ),
+        )
+    return next((scalar for base, scalar in _SCALAR_TYPES if issubclass(annotation, base)), _JSON)
+
+
+def _model_columns(model: type[BaseModel], prefix: tuple[str, ...] = ()) -> Iterator[Column]:
+    """Flattens the fields of a model, recursing into nested models that are not in a list."""
+    for name, field in model.model_fields.items():
+        path = (*prefix, field.alias or name)
+        if path == _INPUT_PARAMETERS_PATH:
+            continue
+        annotation = _unwrap(field.annotation)
+        if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+            yield from _model_columns(annotation, path)
+        else:
+            yield Column(path, column_type(field.annotation))
+
+
+def _merged_columns(columns: Iterable[Column]) -> list[Column]:
+    merged: dict[tuple[str, ...], ColumnType] = {}
+    for column in columns:
+        merged[column.path] = _merge(merged[column.path], column.type) if column.path in merged else column.type
+    return list(itertools.starmap(Column, merged.items()))
+
+
+def record_columns() -> list[Column]:
+    """Returns the columns of the `records` table."""
+    models = (column for model in _RECORD_MODELS for column in _model_columns(model))
+    return [Column((COLLECTION_COLUMN,), _STRING), *_merged_columns(models)]
+
+
+def input_parameter_columns() -> list[Column]:
+    """Returns the columns of the `input_parameters` table."""
+    keys = [Column((name,), _STRING) for name in (COLLECTION_COLUMN, "record_id", "name")]
+    return [*keys, *_model_columns(InputParameter)]
+
+
+def _timestamp(value: Any) -> datetime | None:
+    if not isinstance(value, str):
+        return None
+    try:
+        parsed = datetime.fromisoformat(value)
+    except ValueError:
+        return None
+    return parsed.replace(tzinfo=UTC) if parsed.tzinfo is None else parsed.astimezone(UTC)
+
+
+def _number(value: Any) -> bool:
+    return isinstance(value, int | float) and not isinstance(value, bool)
+
+
+def coerce(value: Any, type_: ColumnType) -> Any:  # noqa: PLR0911
+    """Converts a JSON value to the Python value of a column, `None` when it does not have the column's type.
+
+    Args:
+        value: The value from the document.
+        type_: The column type.
+
+    Returns:
+        The converted value. `json` values are serialized to canonical JSON strings.
+
+    """
+    if value is None:
+        return None
+    match type_.kind:
+        case "string":
+            return value if isinstance(value, str) else None
+        case "boolean":
+            return value if isinstance(value, bool) else None
+        case "int64":
+            return value if isinstance(value, int) and _number(value) and value in _INT64_RANGE else None
+        case "float64":
+            return float(value) if _number(value) else None
+        case "timestamp":
+            return _timestamp(value)
+        case "list" if isinstance(value, list) and type_.item is not None:
+            return [coerce(item, type_.item) for item in value]
+        case "struct" if isinstance(value, dict):
+            return {name: coerce(value.get(name), field_type) for name, field_type in type_.fields}
+        case "json":
+            return canonical_dumps(value).decode("utf-8")
+    return None
+
+
+def _lookup(document: Any, path: tuple[str, ...]) -> Any:
+    for key in path:
+        if not isinstance(document, dict):
+            return None
+        document = document.get(key)
+    return document
+
+
+class TableBatch:
+    """Column values of a batch of rows."""
+
+    def __init__(self, columns: list[Column]) -> None:
+        """Initializes an empty batch.
+
+        Args:
+            columns: The table columns.
+
+        """
+        self.columns = columns
+        self.values: dict[str, list[Any]] = {column.name: [] for column in columns}
+        self._targets = [(self.values[column.name], column.path, column.type) for column in columns]
+
+    def __len__(self) -> int:
+        """Returns the number of rows."""
+        return len(self.values[self.columns[0].name])
+
+    def append(self, document: dict[str, Any]) -> None:
+        """Appends a row.
+
+        Args:
+            document: The row as a JSON document, looked up by the column paths.
+
+        """
+        for values, path, type_ in self._targets:
+            values.append(coerce(_lookup(document, path), type_))
+
+    def clear(self) -> None:
+        """Removes all rows."""
+        for values in self.values.values():
+            values.clear()
+
+
+class TableWriter(Protocol):
+    """Writes batches of a table to a file."""
+
+    def write(self, batch: TableBatch) -> None:
+        """Writes a batch."""
+
+    def close(self) -> None:
+        """Finishes the file."""
+
+
+def _csv_value(value: Any) -> Any:
+    if value is None:
+        return ""
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, list | dict):
+        return canonical_dumps(value).decode("utf-8")
+    return value
+
+
+class CsvTableWriter:
+    """Writes a table as CSV with a header row. List and struct values are JSON strings."""
+
+    def __init__(self, path: Path, columns: list[Column]) -> None:
+        """Opens the file and writes the header.
+
+        Args:
+            path: Destination file.
+            columns: The table columns.
+
+        """
+        self._file = path.open("w", encoding="utf-8", newline="")
+        self._writer = csv.writer(self._file)
+        self._writer.writerow([column.name for column in columns])
+
+    def write(self, batch: TableBatch) -> None:
+        """Writes a batch."""
+        columns = [[_csv_value(value) for value in values] for values in batch.values.values()]
+        self._writer.writerows(zip(*columns, strict=True))
+
+    def close(self) -> None:
+        """Closes the file."""
+        self._file.close()
+
+
+def _import_pyarrow() -> Any:
+    try:
+        return importlib.import_module("pyarrow")
+    except ImportError as e:
+        msg = "Parquet and Arrow export require pyarrow, install workflow_catalogue[analytics]"
+        raise RuntimeError(msg) from e
+
+
+def arrow_type(pa: Any, type_: ColumnType) -> Any:  # noqa: PLR0911
+    """Returns the Arrow type of a column.
+
+    Args:
+        pa: The `pyarrow` module.
+        type_: The column type.
+
+    Returns:
+        The `pyarrow.DataType`.
+
+    """
+    match type_.kind:
+        case "list" if type_.item is not None:
+            return pa.list_(arrow_type(pa, type_.item))
+        case "struct":
+            return pa.struct([pa.field(name, arrow_type(pa, field_type)) for name, field_type in type_.fields])
+        case "timestamp":
+            return pa.timestamp("us", tz="UTC")
+        case "boolean":
+            return pa.bool_()
+        case "int64":
+            return pa.int64()
+        case "float64":
+            return pa.float64()
+    return pa.string()
+
+
+class ArrowTableWriter:
+    """Writes a table as a Parquet file or an uncompressed Arrow IPC file, one record batch per batch."""
+
+    def __init__(self, path: Path, columns: list[Column], export_format: ExportFormat) -> None:
+        """Opens the file.
+
+        Args:
+            path: Destination file.
+            columns: The table columns.
+            export_format: `parquet` or `arrow`.
+
+        Raises:
+            RuntimeError: If pyarrow is not installed.
+
+        """
+        self._pa = pa = _import_pyarrow()
+        self._schema = pa.schema([pa.field(column.name, arrow_type(pa, column.type)) for column in columns])
+        if export_format == "parquet":
+            parquet = importlib.import_module("pyarrow.parquet")
+            self._writer = parquet.ParquetWriter(path, self._schema, compression="zstd")
+        else:
+            self._writer = pa.ipc.new_file(path, self._schema)
+
+    def write(self, batch: TableBatch) -> None:
+        """Writes a batch."""
+        arrays = [
+            self._pa.array(values, type=field.type)
+            for values, field in zip(batch.values.values(), self._schema, strict=True)
+        ]
+        self._writer.write_batch(self._pa.record_batch(arrays, schema=self._schema))
+
+    def close(self) -> None:
+        """Finishes the file."""
+        self._writer.close()
+
+
+def open_writer(path: Path, columns: list[Column], export_format: ExportFormat) -> TableWriter:
+    """Opens a writer for a table.
+
+    Args:
+        path: Destination file.
+        columns: The table columns.
+        export_format: The file format.
+
+    Returns:
+        The writer.
+
+    """
+    if export_format == "csv":
+        return CsvTableWriter(path, columns)
+    return ArrowTableWriter(path, columns, export_format)
+
+
+class ColumnarExportResult(BaseModel):
+    """Outcome of a columnar export."""
+
+    records: int = Field(default=0, description="Number of exported records")
+    input_parameters: int = Field(default=0, description="Number of exported input parameters")
+    written: list[str] = Field(default_factory=list, description="Files written")
+
+
+def _input_parameters(document: dict[str, Any], collection: str | None) -> Iterator[dict[str, Any]]:
+    parameters = _lookup(document, _INPUT_PARAMETERS_PATH)
+    if not isinstance(parameters, dict):
+        return
+    for name, parameter in parameters.items():
+        if isinstance(parameter, dict):
+            yield {**parameter, COLLECTION_COLUMN: collection, "record_id": document.get("id"), "name": name}
+
+
+def export_columnar(
+    files: Iterable[Path],
+    output_dir: Path,
+    export_format: ExportFormat = "parquet",
+    batch_size: int = DEFAULT_BATCH_SIZE,
+) -> ColumnarExportResult:
+    """Exports records into the `records` and `input_parameters` tables.
+
+    Args:
+        files: Record files. `catalog.json` files are skipped.
+        output_dir: Directory to write `records.<format>` and `input_parameters.<format>` to.
+        export_format: The file format.
+        batch_size: Number of records read before a batch is written.
+
+    Returns:
+        The export result.
+
+    Raises:
+        RuntimeError: If the format needs pyarrow and it is not installed.
+
+    """
+    output_dir.mkdir(parents=True, exist_ok=True)
+    paths = [output_dir / f"{table}{_EXTENSIONS[export_format]}" for table in (RECORDS_TABLE, INPUT_PARAMETERS_TABLE)]
+    records = TableBatch(record_columns())
+    parameters = TableBatch(input_parameter_columns())
+    writers = [
+        open_writer(path, batch.columns, export_format)
+        for path, batch in zip(paths, (records, parameters), strict=True)
+    ]
+    result = ColumnarExportResult(written=[str(path) for path in paths])
+
+    def flush() -> None:
+        for writer, batch in zip(writers, (records, parameters), strict=True):
+            if len(batch):
+                writer.write(batch)
+            batch.clear()
+
+    try:
+        for file_path in files:
+            if file_path.name == "catalog.json":
+                continue
+            document = loads(file_path.read_bytes())
+            collection = collection_id_from_path(file_path)
+            records.append({**document, COLLECTION_COLUMN: collection})
+            for parameter in _input_parameters(document, collection):
+                parameters.append(parameter)
+                result.input_parameters += 1
+            result.records += 1
+            if len(records) >= batch_size:
+                flush()
+        flush()
+    finally:
+        for writer in writers:
+            writer.close()
+    return result
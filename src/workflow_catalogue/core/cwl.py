@@ -0,0 +1,402 @@
+"""Resolution and packing of CWL documents that reference other files.
+
+Workflows rarely fit in one file: steps point at tool definitions with `run: tools/clip.cwl`, and any part of a document
+can be pulled in with `$import` (parsed YAML) or `$include` (raw text). `CwlResolver` crawls that dependency graph
+concurrently, caching every fetched document by URL and every parsed document by content digest, so a tool shared by
+many workflows is downloaded and parsed once per resolver. A resolver is meant to be shared by all records of a run.
+
+`CwlResolver.pack` turns a document and its dependencies into a single self-contained `$graph` document, the form
+ADES and `cwltool --validate` accept without further fetching:
+
+* every external `run:` target becomes a `$graph` entry and the reference is rewritten to `#<id>`,
+* `$import` is replaced by the imported document and `$include` by the included text,
+* entry IDs come from the document `id` (or file name) and are suffixed on collision; references to entries of a
+  `$graph` document (`tools.cwl#clip`) are kept pointing at the renamed entry.
+
+Documents without external references are passed through unchanged by `CwlResolver.pack_bytes`.
+
+"""
+
+from __future__ import annotations
+
+import hashlib
+import threading
+from collections.abc import Callable
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from pathlib import Path, PurePosixPath
+from typing import TYPE_CHECKING, Any, Literal
+from urllib.parse import urljoin, urlparse
+
+import requests
+import yaml
+
+from workflow_catalogue.utils.logging import get_logger
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+
+_logger = get_logger(__name__)
+
+CwlFetcher = Callable[[str], bytes]
+"""Fetches the raw content of a CWL document by URL."""
+
+ReferenceKind = Literal["run", "import", "include"]
+"""How a document refers to another one."""
+
+DEFAULT_WORKERS = 8
+"""Default number of documents fetched in parallel."""
+
+FETCH_TIMEOUT = 15
+"""Timeout of `fetch_url` in seconds."""
+
+_MAIN = "main"
+
+
+class CwlError(ValueError):
+    """A CWL document or one of its dependencies cannot be fetched, parsed or packed."""
+
+
+def fetch_url(url: str) -> bytes:
+    """Fetches a document over HTTP(S) or from a local path / `file://` URL.
+
+    Args:
+        url: The document URL.
+
+    Returns:
+        The raw content.
+
+    Raises:
+        requests.RequestException: If the HTTP request fails.
+        OSError: If the local file cannot be read.
+
+    """
+    parsed = urlparse(url)
+    if parsed.scheme in {"http", "https"}:
+        resp = requests.get(url, timeout=FETCH_TIMEOUT)
+        resp.raise_for_status()
+        return resp.content
+    return Path(parsed.path if parsed.scheme == "file" else url).read_bytes()
+
+
+def _split(url: str) -> tuple[str, str]:
+    document_url, _, fragment = url.partition("#")
+    return document_url, fragment
+
+
+def iter_references(node: Any, base_url: str) -> Iterator[tuple[ReferenceKind, str]]:
+    """Finds the external references of a parsed CWL document.
+
+    Args:
+        node: The parsed document or a part of it.
+        base_url: URL of the document, relative references are resolved against it.
+
+    Yields:
+        `(kind, absolute URL)` pairs. `run` URLs keep their fragment; references within the document (`#id`) are
+        skipped.
+
+    """
+    if isinstance(node, list):
+        for item in node:
+            yield from iter_references(item, base_url)
+        return
+    if not isinstance(node, dict):
+        return
+    for key, kind in (("$import", "import"), ("$include", "include")):
+        if isinstance(node.get(key), str):
+            yield kind, urljoin(base_url, node[key])  # type: ignore[misc]
+            return
+    for key, value in node.items():
+        if key == "run" and isinstance(value, str):
+            if not value.startswith("#"):
+                yield "run", urljoin(base_url, value)
+        else:
+            yield from iter_references(value, base_url)
+
+
+def _unique(name: str, used: set[str]) -> str:
+    candidate, suffix = name, 1
+    while candidate in used:
+        suffix += 1
+        candidate = f"{name}-{suffix}"
+    used.add(candidate)
+    return candidate
+
+
+def _entry_id(entry: dict[str, Any]) -> str:
+    return str(entry.get("id", _MAIN)).lstrip("#")
+
+
+class CwlResolver:
+    """Concurrent, caching resolver of CWL dependency graphs."""
+
+    def __init__(self, fetch: CwlFetcher | None = None, *, workers: int = DEFAULT_WORKERS) -> None:
+        """Initializes an empty resolver.
+
+        Args:
+            fetch: Fetches raw documents, `fetch_url` by default.
+            workers: Number of documents fetched in parallel.
+
+        """
+        self.fetch = fetch or fetch_url
+        self.workers = workers
+        self._texts: dict[str, tuple[str, str]] = {}
+        self._documents: dict[str, Any] = {}
+        self._errors: dict[str, str] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def cached_documents(self) -> int:
+        """Number of distinct documents fetched so far."""
+        return len(self._texts)
+
+    def text(self, url: str) -> tuple[str, str]:
+        """Returns the content of a document, fetching it on first use.
+
+        Args:
+            url: The document URL, without fragment.
+
+        Returns:
+            The SHA-256 digest and the text.
+
+        Raises:
+            CwlError: If the document cannot be fetched or is not UTF-8 text.
+
+        """
+        with self._lock:
+            if url in self._texts:
+                return self._texts[url]
+            if url in self._errors:
+                raise CwlError(self._errors[url])
+        try:
+            content = self.fetch(url)
+            text = content.decode("utf-8")
+        except (requests.RequestException, OSError, UnicodeDecodeError) as e:
+            reason = "Could not decode" if isinstance(e, UnicodeDecodeError) else "Could not fetch"
+            with self._lock:
+                self._errors[url] = f"{reason} {url}: {e}"
+            raise CwlError(self._errors[url]) from e
+        entry = (hashlib.sha256(content).hexdigest(), text)
+        with self._lock:
+            self._texts[url] = entry
+        return entry
+
+    def document(self, url: str) -> Any:
+        """Returns a parsed document. Documents with identical content are parsed once.
+
+        Args:
+            url: The document URL, without fragment.
+
+        Returns:
+            The parsed YAML.
+
+        Raises:
+            CwlError: If the document cannot be fetched or parsed.
+
+        """
+        digest, text = self.text(url)
+        with self._lock:
+            if digest in self._documents:
+                return self._documents[digest]
+        try:
+            document = yaml.safe_load(text)
+        except yaml.YAMLError as e:
+            msg = f"Could not parse {url}: {e}"
+            raise CwlError(msg) from e
+        with self._lock:
+            self._documents[digest] = document
+        return document
+
+    def references(self, url: str) -> list[tuple[ReferenceKind, str]]:
+        """Returns the direct external references of a document.
+
+        Args:
+            url: The document URL, without fragment.
+
+        Returns:
+            `(kind, absolute URL)` pairs.
+
+        Raises:
+            CwlError: If the document cannot be fetched or parsed.
+
+        """
+        return list(iter_references(self.document(url), url))
+
+    def _crawl_one(self, url: str, kind: ReferenceKind) -> list[tuple[ReferenceKind, str]]:
+        try:
+            if kind == "include":
+                self.text(url)
+                return []
+            return self.references(url)
+        except CwlError as e:
+            _logger.debug("Deferred CWL error: %s", e)
+            return []
+
+    def resolve(self, urls: Iterable[str], *, recursive: bool = True) -> None:
+        """Fetches and parses documents and all their transitive dependencies concurrently.
+
+        Failures are remembered and raised as `CwlError` when the document is used, e.g. by `pack`.
+
+        Args:
+            urls: Document URLs.
+            recursive: Whether to fetch dependencies as well, or only the documents themselves.
+
+        """
+        seen: set[tuple[ReferenceKind, str]] = set()
+        with ThreadPoolExecutor(max_workers=self.workers) as pool:
+            pending: set[Future[list[tuple[ReferenceKind, str]]]] = set()
+
+            def submit(kind: ReferenceKind, url: str) -> None:
+                document_url, _ = _split(url)
+                if (kind, document_url) not in seen:
+                    seen.add((kind, document_url))
+                    pending.add(pool.submit(self._crawl_one, document_url, kind))
+
+            for url in urls:
+                submit("run", url)
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    pending.discard(future)
+                    for kind, url in future.result() if recursive else ():
+                        submit(kind, url)
+
+    def pack(self, url: str) -> dict[str, Any]:
+        """Packs a document and its dependencies into a single `$graph` document.
+
+        Args:
+            url: The document URL.
+
+        Returns:
+            The packed document.
+
+        Raises:
+            CwlError: If a dependency cannot be fetched, parsed or found, or `$import`s form a cycle.
+
+        """
+        self.resolve([url])
+        return _Packer(self).pack(_split(url)[0])
+
+    def pack_bytes(self, url: str) -> bytes:
+        """Returns the document ready for upload: unchanged without external references, packed otherwise.
+
+        Args:
+            url: The document URL.
+
+        Returns:
+            The CWL document as YAML.
+
+        Raises:
+            CwlError: If the document or a dependency cannot be fetched, parsed or packed.
+
+        """
+        document_url, _ = _split(url)
+        self.resolve([document_url])
+        if not self.references(document_url):
+            return self.text(document_url)[1].encode("utf-8")
+        packed: str = yaml.safe_dump(self.pack(document_url), sort_keys=False)
+        return packed.encode("utf-8")
+
+
+class _Packer:
+    """Builds one packed document. Holds the state of a single `CwlResolver.pack` call."""
+
+    def __init__(self, resolver: CwlResolver) -> None:
+        """Initializes the packer.
+
+        Args:
+            resolver: Resolver providing the documents.
+
+        """
+        self.resolver = resolver
+        self.graph: list[dict[str, Any]] = []
+        self.namespaces: dict[str, Any] = {}
+        self.used: set[str] = set()
+        self.ids: dict[str, str] = {}
+        self.importing: set[str] = set()
+
+    def pack(self, url: str) -> dict[str, Any]:
+        root = self.resolver.document(url)
+        if not isinstance(root, dict):
+            msg = f"{url} is not a CWL document"
+            raise CwlError(msg)
+        if "$graph" in root:
+            self._add_graph(url, root)
+            packed = {key: value for key, value in root.items() if key != "$graph"}
+        else:
+            self._add_process(url, root)
+            packed = {"cwlVersion": root.get("cwlVersion")} if "cwlVersion" in root else {}
+        if self.namespaces:
+            packed["$namespaces"] = {**self.namespaces, **packed.get("$namespaces", {})}
+        packed["$graph"] = self.graph
+        return packed
+
+    def _reference(self, url: str) -> str:
+        """Adds the target of an external `run:` reference and returns its packed ID."""
+        document_url, fragment = _split(url)
+        key = f"{document_url}#{fragment}" if fragment else document_url
+        if key in self.ids:
+            return self.ids[key]
+        document = self.resolver.document(document_url)
+        if isinstance(document, dict) and "$graph" in document:
+            self._add_graph(document_url, document)
+            key = f"{document_url}#{fragment or _MAIN}"
+            if key not in self.ids:
+                msg = f"{url} does not match any entry of the $graph"
+                raise CwlError(msg)
+            return self.ids[key]
+        if not isinstance(document, dict):
+            msg = f"{document_url} is not a CWL document"
+            raise CwlError(msg)
+        return self._add_process(document_url, document)
+
+    def _add_process(self, url: str, document: dict[str, Any]) -> str:
+        name = _entry_id(document) if "id" in document else PurePosixPath(urlparse(url).path).stem or _MAIN
+        packed_id = _unique(name, self.used)
+        # Registered before inlining so that cyclic `run:` references terminate and dependencies follow their users.
+        self.ids[url] = packed_id
+        entry: dict[str, Any] = {"id": packed_id}
+        self.graph.append(entry)
+        inlined = self._inline(document, url, {})
+        self.namespaces.update(inlined.pop("$namespaces", {}))
+        entry.update((key, value) for key, value in inlined.items() if key not in {"id", "cwlVersion"})
+        return packed_id
+
+    def _add_graph(self, url: str, document: dict[str, Any]) -> None:
+        entries = [entry for entry in document["$graph"] if isinstance(entry, dict)]
+        local = {_entry_id(entry): _unique(_entry_id(entry), self.used) for entry in entries}
+        for original, packed_id in local.items():
+            self.ids[f"{url}#{original}"] = packed_id
+        self.namespaces.update(document.get("$namespaces", {}))
+        packed = [{"id": local[_entry_id(entry)]} for entry in entries]
+        self.graph.extend(packed)
+        for entry, target in zip(entries, packed, strict=True):
+            target.update((key, value) for key, value in self._inline(entry, url, local).items() if key != "id")
+
+    def _inline(self, node: Any, base_url: str, local: dict[str, str]) -> Any:
+        """Copies a document part, replacing `$import`/`$include` and rewriting `run:` references."""
+        if isinstance(node, list):
+            return [self._inline(item, base_url, local) for item in node]
+        if not isinstance(node, dict):
+            return node
+        if isinstance(node.get("$include"), str):
+            return self.resolver.text(urljoin(base_url, node["$include"]))[1]
+        if isinstance(node.get("$import"), str):
+            target = urljoin(base_url, node["$import"])
+            if target in self.importing:
+                msg = f"Cyclic $import of {target}"
+                raise CwlError(msg)
+            self.importing.add(target)
+            try:
+                return self._inline(self.resolver.document(target), target, {})
+            finally:
+                self.importing.discard(target)
+        inlined: dict[str, Any] = {}
+        for key, value in node.items():
+            if key == "run" and isinstance(value, str):
+                if value.startswith("#"):
+                    inlined[key] = f"#{local.get(value[1:], value[1:])}"
+                else:
+                    inlined[key] = f"#{self._reference(urljoin(base_url, value))}"
+            else:
+                inlined[key] = self._inline(value, base_url, local)
+        return inlined
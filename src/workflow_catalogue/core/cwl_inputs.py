@@ -0,0 +1,300 @@
+"""Consistency of record `inputParameters` with the inputs declared by the linked CWL.
+
+A workflow record describes its inputs twice: in `properties.inputParameters` for the UI and job validation, and in the
+`inputs` of the CWL it links to, which is what ADES executes. Nothing forces the two to agree, so a renamed or retyped
+input only fails when a job runs. `check_catalogue` compares them for every workflow of the catalogue:
+
+* every record parameter must be a CWL input,
+* every CWL input without a default that is not optional must be a record parameter,
+* the parameter type must be compatible with the CWL type (`number` with `int`/`float`/..., `bbox` with a string or a
+  list of numbers, data types with `string`/`File`/`Directory`),
+* a parameter the record marks as not required must be optional in the CWL or have a default,
+* defaults declared on both sides must be equal.
+
+The CWL documents are fetched concurrently through a shared `CwlResolver` and each one is reduced once to a compact
+`CwlInput` model, cached by content digest, so records sharing a CWL file reuse it.
+
+"""
+
+from __future__ import annotations
+
+import threading
+from collections.abc import Mapping
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, NamedTuple
+
+from workflow_catalogue.core.cwl import CwlError, CwlResolver
+from workflow_catalogue.core.record_view import RecordView
+from workflow_catalogue.schemas.common import ParameterType
+from workflow_catalogue.utils.serialization import loads
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+    from pathlib import Path
+
+_ANY = "Any"
+_NUMBERS = frozenset({"int", "long", "float", "double"})
+_DATA = frozenset({"string", "File", "Directory"})
+_COMPATIBLE_TYPES: dict[ParameterType, frozenset[str]] = {
+    ParameterType.number: _NUMBERS,
+    ParameterType.boolean: frozenset({"boolean"}),
+    ParameterType.text: frozenset({"string", "enum"}),
+    ParameterType.date: frozenset({"string"}),
+    ParameterType.bbox: frozenset({"string", *(f"{t}[]" for t in _NUMBERS)}),
+    **dict.fromkeys(
+        (
+            ParameterType.raster,
+            ParameterType.vector,
+            ParameterType.collection,
+            ParameterType.catalog,
+            ParameterType.netcdf,
+            ParameterType.geotiff,
+            ParameterType.wms,
+            ParameterType.wfs,
+        ),
+        _DATA,
+    ),
+}
+_PARAMETER_TYPES = {t.value: t for t in ParameterType}
+
+
+@dataclass(frozen=True, slots=True)
+class CwlInput:
+    """An input of a CWL process, reduced to what the consistency check needs."""
+
+    name: str
+    types: tuple[str, ...]
+    optional: bool = False
+    default: Any = None
+
+    @property
+    def required(self) -> bool:
+        """Returns whether a job must provide the input."""
+        return not self.optional and self.default is None
+
+
+class InputMismatch(NamedTuple):
+    """A difference between a record parameter and the CWL inputs."""
+
+    record_id: str
+    href: str
+    parameter: str
+    message: str
+
+
+def parse_type(value: Any) -> tuple[tuple[str, ...], bool]:
+    """Normalizes a CWL type declaration.
+
+    Args:
+        value: The `type` of a CWL input: `"string?"`, `"float[]"`, `["null", "File"]`, `{"type": "array", ...}`, ...
+
+    Returns:
+        The accepted type names, arrays as `<items>[]`, and whether the input is optional.
+
+    """
+    if isinstance(value, str):
+        name = value.removesuffix("?")
+        return (name,), name != value or name == "null"
+    if isinstance(value, list):
+        types: list[str] = []
+        optional = False
+        for item in value:
+            item_types, item_optional = parse_type(item)
+            types.extend(t for t in item_types if t != "null")
+            optional = optional or item_optional
+        return tuple(types), optional
+    if isinstance(value, dict):
+        kind = value.get("type")
+        if kind == "array":
+            items, _ = parse_type(value.get("items"))
+            return tuple(f"{item}[]" for item in items), False
+        if kind in {"enum", "record"}:
+            return (kind,), False
+        return parse_type(kind)
+    return (_ANY,), False
+
+
+def _process(document: Any, fragment: str) -> dict[str, Any]:
+    if isinstance(document, dict) and "$graph" in document:
+        graph = document["$graph"]
+        if not isinstance(graph, list) or not all(isinstance(entry, dict) for entry in graph):
+            msg = "$graph must be a list of objects"
+            raise CwlError(msg)
+        entries = {str(entry.get("id", "main")).lstrip("#"): entry for entry in graph}
+        process = entries.get(fragment or "main")
+        if process is None and not fragment:
+            # Application packages often name the workflow after the process instead of `main`.
+            process = next((entry for entry in entries.values() if entry.get("class") == "Workflow"), None)
+        if process is None:
+            msg = f"No $graph entry '{fragment or 'main'}'"
+            raise CwlError(msg)
+        return process  # type: ignore[no-any-return]
+    if not isinstance(document, dict):
+        msg = "Not a CWL document"
+        raise CwlError(msg)
+    return document
+
+
+def parse_inputs(document: Any, fragment: str = "") -> dict[str, CwlInput]:
+    """Extracts the inputs of a CWL process.
+
+    Args:
+        document: The parsed CWL document.
+        fragment: ID of the process within a `$graph` document, `main` by default.
+
+    Returns:
+        Inputs by name.
+
+    Raises:
+        CwlError: If the document has no such process or its inputs are malformed.
+
+    """
+    declared = _process(document, fragment).get("inputs") or {}
+    if isinstance(declared, dict):
+        declared = [
+            {"id": name, **(spec if isinstance(spec, dict) else {"type": spec})} for name, spec in declared.items()
+        ]
+    if not isinstance(declared, list):
+        msg = f"inputs must be a list or a map, got {type(declared).__name__}"
+        raise CwlError(msg)
+    inputs: dict[str, CwlInput] = {}
+    for spec in declared:
+        if not isinstance(spec, dict):
+            msg = f"input must be an object, got {type(spec).__name__}"
+            raise CwlError(msg)
+        name = str(spec.get("id", "")).rsplit("/", 1)[-1].lstrip("#")
+        types, optional = parse_type(spec.get("type"))
+        inputs[name] = CwlInput(name, types, optional, spec.get("default"))
+    return inputs
+
+
+class CwlInputsCache:
+    """Thread-safe cache of parsed CWL inputs keyed by document digest and process ID."""
+
+    def __init__(self, resolver: CwlResolver | None = None) -> None:
+        """Initializes an empty cache.
+
+        Args:
+            resolver: Resolver fetching the CWL documents. A private one is used when `None`.
+
+        """
+        self.resolver = resolver or CwlResolver()
+        self.hits = 0
+        self.misses = 0
+        self._inputs: dict[tuple[str, str], dict[str, CwlInput]] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        """Returns the number of cached CWL processes."""
+        return len(self._inputs)
+
+    def get(self, href: str) -> dict[str, CwlInput]:
+        """Returns the inputs of a CWL process.
+
+        Args:
+            href: URL of the CWL document, optionally with the process ID as fragment.
+
+        Returns:
+            Inputs by name.
+
+        Raises:
+            CwlError: If the document cannot be fetched or parsed, or has no such process.
+
+        """
+        url, _, fragment = href.partition("#")
+        key = (self.resolver.text(url)[0], fragment)
+        with self._lock:
+            if key in self._inputs:
+                self.hits += 1
+                return self._inputs[key]
+        inputs = parse_inputs(self.resolver.document(url), fragment)
+        with self._lock:
+            self.misses += 1
+            self._inputs[key] = inputs
+        return inputs
+
+
+def _compatible(parameter_type: ParameterType, cwl_types: tuple[str, ...]) -> bool:
+    return _ANY in cwl_types or not _COMPATIBLE_TYPES[parameter_type].isdisjoint(cwl_types)
+
+
+def compare_inputs(
+    record_id: str, href: str, parameters: Mapping[str, Any], inputs: Mapping[str, CwlInput]
+) -> list[InputMismatch]:
+    """Compares record parameters with CWL inputs.
+
+    Args:
+        record_id: ID of the record, for reporting.
+        href: URL of the CWL, for reporting.
+        parameters: The raw `inputParameters` of the record. Types that are not a `ParameterType` are not compared;
+            schema validation reports them.
+        inputs: The CWL inputs by name.
+
+    Returns:
+        The mismatches, empty when the two agree.
+
+    """
+    mismatches: list[InputMismatch] = []
+
+    def report(name: str, message: str) -> None:
+        mismatches.append(InputMismatch(record_id, href, name, message))
+
+    for name, parameter in parameters.items():
+        spec = parameter if isinstance(parameter, Mapping) else {}
+        cwl_input = inputs.get(name)
+        if cwl_input is None:
+            report(name, "not an input of the CWL")
+            continue
+        parameter_type = _PARAMETER_TYPES.get(str(spec.get("type")))
+        if parameter_type is not None and not _compatible(parameter_type, cwl_input.types):
+            report(name, f"type '{parameter_type.value}' does not match CWL type {'|'.join(cwl_input.types)}")
+        if spec.get("required") is False and cwl_input.required and spec.get("default") is None:
+            report(name, "optional in the record but required by the CWL")
+        if spec.get("default") is not None and cwl_input.default is not None and spec["default"] != cwl_input.default:
+            report(name, f"default {spec['default']!r} differs from the CWL default {cwl_input.default!r}")
+    for name, cwl_input in inputs.items():
+        if cwl_input.required and name not in parameters:
+            report(name, "required by the CWL but missing from inputParameters")
+    return mismatches
+
+
+def check_catalogue(files: Iterable[Path], cache: CwlInputsCache | None = None) -> tuple[int, list[InputMismatch]]:
+    """Checks the workflows of a set of record files. Notebooks and `catalog.json` files are skipped.
+
+    Args:
+        files: Record files.
+        cache: Cache to get CWL inputs from. A private cache is used when `None`.
+
+    Returns:
+        The number of workflows checked and the mismatches found. A CWL that cannot be loaded is reported as a
+        mismatch without parameter, a record file that cannot be loaded as one with the file path as record ID and
+        without CWL.
+
+    """
+    if cache is None:
+        cache = CwlInputsCache()
+    workflows: list[tuple[RecordView, Mapping[str, Any]]] = []
+    mismatches: list[InputMismatch] = []
+    for file_path in files:
+        if file_path.name == "catalog.json":
+            continue
+        try:
+            document = loads(file_path.read_bytes())
+            view = RecordView.from_document(document)
+            parameters = document["properties"].get("inputParameters") if view.is_workflow else None
+        except (OSError, TypeError, ValueError) as e:
+            mismatches.append(InputMismatch(file_path.as_posix(), "", "", f"could not load record: {e}"))
+            continue
+        if view.is_workflow:
+            workflows.append((view, parameters if isinstance(parameters, Mapping) else {}))
+    cache.resolver.resolve((href for view, _ in workflows for href in view.cwl_hrefs), recursive=False)
+
+    for view, parameters in workflows:
+        for href in view.cwl_hrefs:
+            try:
+                inputs = cache.get(href)
+            except CwlError as e:
+                mismatches.append(InputMismatch(view.id, href, "", f"could not load CWL: {e}"))
+                continue
+            mismatches.extend(compare_inputs(view.id, href, parameters, inputs))
+    return len(workflows), mismatches
@@ -0,0 +1,288 @@
+"""Resident validation daemon.
+
+Every `wfc catalogue validate` run pays for interpreter start-up, importing pydantic and building the schema validators
+before the first file is checked. `ValidationDaemon` keeps a warm process behind a Unix socket instead, together with
+the results of the files it has already validated, keyed by path, modification time and size. Unchanged files are
+answered from memory and changed ones are re-validated.
+
+The protocol is one JSON object per line, one request per connection:
+
+* `{"op": "validate", "paths": [...]}` returns `{"ok": true, "results": [...]}` with one `FileResult` per path,
+* `{"op": "status"}` returns the process ID, uptime and cache counters,
+* `{"op": "shutdown"}` stops the daemon.
+
+`validate_paths` is the client side: it asks the daemon and falls back to validating in the current process when no
+daemon is listening. The client does not import pydantic or the schemas unless it has to fall back, so the round trip
+to a running daemon costs milliseconds.
+
+"""
+
+from __future__ import annotations
+
+import contextlib
+import json
+import os
+import socket
+import socketserver
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from workflow_catalogue.utils.logging import get_logger
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+_logger = get_logger(__name__)
+
+SOCKET_ENV = "WFC_DAEMON_SOCKET"
+"""Environment variable overriding the default socket path."""
+
+DEFAULT_TIMEOUT = 60.0
+"""Default client timeout in seconds."""
+
+_CONNECT_TIMEOUT = 0.5
+_MAX_LINE = 64 * 1024 * 1024
+
+
+class DaemonUnavailableError(ConnectionError):
+    """No daemon is listening on the socket."""
+
+
+def default_socket_path() -> Path:
+    """Returns the socket path: `$WFC_DAEMON_SOCKET` or a per-user file in the temporary directory."""
+    if override := os.environ.get(SOCKET_ENV):
+        return Path(override)
+    return Path(tempfile.gettempdir()) / f"wfc-daemon-{os.getuid()}.sock"
+
+
+def send_request(socket_path: Path, request: dict[str, Any], timeout: float = DEFAULT_TIMEOUT) -> dict[str, Any]:
+    """Sends a request to the daemon and waits for the response.
+
+    Args:
+        socket_path: The daemon socket.
+        request: The request, see the module docstring.
+        timeout: Seconds to wait for the response.
+
+    Returns:
+        The response.
+
+    Raises:
+        DaemonUnavailableError: If no daemon is listening on the socket.
+        TimeoutError: If the daemon does not answer in time.
+
+    """
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.settimeout(_CONNECT_TIMEOUT)
+        try:
+            sock.connect(os.fspath(socket_path))
+        except (FileNotFoundError, ConnectionRefusedError) as e:
+            msg = f"No daemon listening on {socket_path}"
+            raise DaemonUnavailableError(msg) from e
+        sock.settimeout(timeout)
+        sock.sendall(json.dumps(request).encode() + b"\n")
+        with sock.makefile("rb") as reader:
+            line = reader.readline(_MAX_LINE)
+    if not line:
+        msg = f"Daemon on {socket_path} closed the connection without answering"
+        raise DaemonUnavailableError(msg)
+    response: dict[str, Any] = json.loads(line)
+    return response
+
+
+def _signature(path: Path) -> tuple[int, int] | None:
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+def _validate_in_process(paths: Iterable[Path]) -> list[dict[str, Any]]:
+    # Imported here so that clients talking to a running daemon never import pydantic.
+    from workflow_catalogue.core.validation import validate_file  # noqa: PLC0415
+
+    return [validate_file(path).model_dump(mode="json") for path in paths]
+
+
+class _RequestHandler(socketserver.StreamRequestHandler):
+    server: ValidationDaemon
+
+    def handle(self) -> None:
+        line = self.rfile.readline(_MAX_LINE)
+        if not line:
+            return
+        try:
+            response = self.server.dispatch(json.loads(line))
+        except Exception as e:  # noqa: BLE001
+            response = {"ok": False, "error": f"{type(e).__name__}: {e}"}
+        self.wfile.write(json.dumps(response).encode() + b"\n")
+
+
+class ValidationDaemon(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    """Unix socket server validating catalogue files with a warm process and a result cache."""
+
+    daemon_threads = True
+
+    def __init__(self, socket_path: Path) -> None:
+        """Binds the socket. A stale socket file left by a daemon that died is replaced.
+
+        Args:
+            socket_path: Path of the socket to listen on.
+
+        Raises:
+            RuntimeError: If another daemon is already listening on the socket.
+
+        """
+        if socket_path.exists():
+            try:
+                send_request(socket_path, {"op": "status"}, timeout=_CONNECT_TIMEOUT)
+            except (DaemonUnavailableError, OSError, ValueError):
+                socket_path.unlink()
+            else:
+                msg = f"A daemon is already listening on {socket_path}"
+                raise RuntimeError(msg)
+        self.socket_path = socket_path
+        self.started = time.monotonic()
+        self.requests = 0
+        self.hits = 0
+        self.misses = 0
+        self._results: dict[Path, tuple[tuple[int, int], dict[str, Any]]] = {}
+        self._lock = threading.Lock()
+        super().__init__(os.fspath(socket_path), _RequestHandler)
+        socket_path.chmod(0o600)
+
+    def server_close(self) -> None:
+        """Closes the socket and removes the socket file."""
+        super().server_close()
+        with contextlib.suppress(FileNotFoundError):
+            self.socket_path.unlink()
+
+    def validate(self, paths: Iterable[Path]) -> list[dict[str, Any]]:
+        """Validates files, reusing cached results of files that did not change.
+
+        Args:
+            paths: Files to validate.
+
+        Returns:
+            Serialized `FileResult`s in the order of `paths`.
+
+        """
+        results: list[dict[str, Any]] = []
+        for path in paths:
+            signature = _signature(path)
+            with self._lock:
+                cached = self._results.get(path)
+            if signature is not None and cached is not None and cached[0] == signature:
+                with self._lock:
+                    self.hits += 1
+                results.append(cached[1])
+                continue
+            result = _validate_in_process([path])[0]
+            with self._lock:
+                self.misses += 1
+                if signature is not None:
+                    self._results[path] = (signature, result)
+            results.append(result)
+        return results
+
+    def dispatch(self, request: dict[str, Any]) -> dict[str, Any]:
+        """Answers a request.
+
+        Args:
+            request: The request, see the module docstring.
+
+        Returns:
+            The response.
+
+        """
+        with self._lock:
+            self.requests += 1
+        op = request.get("op")
+        if op == "validate":
+            return {"ok": True, "results": self.validate(Path(p).absolute() for p in request.get("paths", []))}
+        if op == "status":
+            return {
+                "ok": True,
+                "pid": os.getpid(),
+                "uptime_s": round(time.monotonic() - self.started, 3),
+                "requests": self.requests,
+                "cached_files": len(self._results),
+                "hits": self.hits,
+                "misses": self.misses,
+            }
+        if op == "shutdown":
+            threading.Thread(target=self.shutdown, daemon=True).start()
+            return {"ok": True}
+        return {"ok": False, "error": f"Unknown op: {op}"}
+
+
+def serve(socket_path: Path, warm_paths: Iterable[Path] = ()) -> None:
+    """Runs the daemon until it receives a `shutdown` request or the process is interrupted.
+
+    Args:
+        socket_path: Path of the socket to listen on.
+        warm_paths: Files validated before accepting requests, to fill the cache.
+
+    """
+    with ValidationDaemon(socket_path) as daemon:
+        start = time.perf_counter()
+        warmed = daemon.validate(path.absolute() for path in warm_paths)
+        _logger.info("Warmed up with %d file(s) in %.1f ms", len(warmed), (time.perf_counter() - start) * 1000)
+        _logger.info("Listening on %s (pid %d)", socket_path, os.getpid())
+        try:
+            daemon.serve_forever()
+        except KeyboardInterrupt:
+            _logger.info("Interrupted.")
+    _logger.info("Daemon stopped.")
+
+
+def validate_paths(
+    paths: Iterable[Path],
+    socket_path: Path | None = None,
+    timeout: float = DEFAULT_TIMEOUT,
+) -> tuple[list[dict[str, Any]], bool]:
+    """Validates files with the daemon, or in the current process when no daemon is listening.
+
+    Args:
+        paths: Files to validate.
+        socket_path: The daemon socket. Defaults to `default_socket_path()`.
+        timeout: Seconds to wait for the daemon.
+
+    Returns:
+        Serialized `FileResult`s in the order of `paths` and whether the daemon answered.
+
+    """
+    paths = [path.absolute() for path in paths]
+    try:
+        response = send_request(
+            socket_path or default_socket_path(),
+            {"op": "validate", "paths": [path.as_posix() for path in paths]},
+            timeout,
+        )
+    except DaemonUnavailableError:
+        return _validate_in_process(paths), False
+    except (OSError, ValueError) as exc:
+        # Timeouts, reset connections and garbled responses: the files still get validated.
+        _logger.warning("Daemon did not answer (%r), validating in process", exc)
+        return _validate_in_process(paths), False
+    if not response.get("ok"):
+        _logger.warning("Daemon failed (%s), validating in process", response.get("error"))
+        return _validate_in_process(paths), False
+    return response["results"], True
+
+
+def format_issue(issue: dict[str, Any]) -> str:
+    """Formats a serialized `ValidationIssue` like `ValidationIssue.json_path`, without importing pydantic.
+
+    Args:
+        issue: The issue.
+
+    Returns:
+        `path: message [type]`.
+
+    """
+    path = "$" + "".join(f"[{part}]" if isinstance(part, int) else f".{part}" for part in issue.get("loc", []))
+    return f"{path}: {issue['msg']} [{issue['type']}]"
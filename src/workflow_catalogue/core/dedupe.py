@@ -0,0 +1,323 @@
+"""Near-duplicate detection of catalogue records with MinHash and locality-sensitive hashing (LSH).
+
+Records are compared on the words of `properties.title` and `properties.description` and on `properties.keywords`:
+
+* the text is lower-cased and split into words, each keyword is one token; the shingles of a record are its
+  `shingle_size`-word n-grams (a record with fewer tokens is a single shingle),
+* every record gets a MinHash signature: for each of `num_perm` random hash functions, the minimum hash over its
+  shingles. The fraction of equal signature values estimates the Jaccard similarity of two shingle sets,
+* the signatures are split into `bands` of `rows` values. Records whose values are equal in at least one band are
+  candidate pairs; `bands` and `rows` are chosen so that pairs around `threshold` become candidates,
+* candidates whose estimated similarity is at least `threshold` are near-duplicates, and connected near-duplicates
+  form a cluster.
+
+Shingle hashing, signatures and banding run on NumPy arrays over all records at once, so no pair of records is
+compared unless it shares a band. Records without title, description and keywords are not compared.
+
+"""
+
+from __future__ import annotations
+
+import re
+import zlib
+from dataclasses import dataclass
+from itertools import chain
+from typing import TYPE_CHECKING, Any, NamedTuple
+
+import numpy as np
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Sequence
+
+    from numpy.typing import NDArray
+
+DEFAULT_THRESHOLD = 0.7
+"""Default minimum estimated Jaccard similarity of near-duplicates."""
+
+DEFAULT_NUM_PERM = 128
+"""Default number of hash functions, i.e. MinHash signature length."""
+
+DEFAULT_SHINGLE_SIZE = 1
+"""Default number of words per shingle."""
+
+_TOKEN = re.compile(r"\w+")
+_TEXT_FIELDS = ("title", "description")
+_HASH_BITS = np.uint64(32)
+_VERIFY_CHUNK = 1 << 16
+_INTEGRATION_POINTS = 101
+
+
+class DuplicatePair(NamedTuple):
+    """Two records with their estimated Jaccard similarity."""
+
+    first: str
+    second: str
+    similarity: float
+
+
+@dataclass(frozen=True, slots=True)
+class DuplicateCluster:
+    """Records connected by near-duplicate pairs."""
+
+    record_ids: tuple[str, ...]
+    pairs: tuple[DuplicatePair, ...]
+
+    @property
+    def similarity(self) -> float:
+        """Returns the highest similarity of a pair in the cluster."""
+        return max(pair.similarity for pair in self.pairs)
+
+
+def record_tokens(document: dict[str, Any]) -> list[str]:
+    """Returns the lower-cased words of the title and description of a record, followed by its keywords.
+
+    Args:
+        document: The record document.
+
+    Returns:
+        The tokens, empty when the record has none of the fields.
+
+    """
+    properties = document.get("properties")
+    if not isinstance(properties, dict):
+        return []
+    text = " ".join([value for field in _TEXT_FIELDS if isinstance(value := properties.get(field), str)])
+    tokens: list[str] = _TOKEN.findall(text.lower())
+    keywords = properties.get("keywords")
+    if isinstance(keywords, list):
+        tokens += [keyword.strip().lower() for keyword in keywords if isinstance(keyword, str)]
+    return tokens
+
+
+def _starts(lengths: NDArray[np.intp]) -> NDArray[np.intp]:
+    """Start offsets of consecutive segments of the given lengths."""
+    starts: NDArray[np.intp] = np.cumsum(lengths) - lengths
+    return starts
+
+
+def _mix(values: NDArray[np.uint64]) -> NDArray[np.uint64]:
+    """Finalizer of SplitMix64: spreads every input bit over all output bits. Updates `values` in place."""
+    with np.errstate(over="ignore"):
+        values ^= values >> np.uint64(30)
+        values *= np.uint64(0xBF58476D1CE4E5B9)
+        values ^= values >> np.uint64(27)
+        values *= np.uint64(0x94D049BB133111EB)
+        return values ^ (values >> np.uint64(31))
+
+
+def shingle_hashes(
+    token_lists: Sequence[list[str]], shingle_size: int = DEFAULT_SHINGLE_SIZE
+) -> tuple[NDArray[np.uint64], NDArray[np.intp]]:
+    """Hashes the word n-grams of every record to 32-bit values.
+
+    Args:
+        token_lists: The tokens of every record, see `record_tokens`.
+        shingle_size: Number of words per shingle.
+
+    Returns:
+        The shingle hashes of all records, concatenated, and the number of shingles of every record.
+
+    """
+    lengths = np.fromiter(map(len, token_lists), dtype=np.intp, count=len(token_lists))
+    tokens = list(chain.from_iterable(token_lists))
+    # Each distinct word is hashed once, then looked up by its index in the vocabulary.
+    vocabulary = {word: index for index, word in enumerate(dict.fromkeys(tokens))}
+    word_hashes = np.fromiter(
+        (zlib.crc32(word.encode("utf-8")) for word in vocabulary), dtype=np.uint64, count=len(vocabulary)
+    )
+    indices = np.fromiter(map(vocabulary.__getitem__, tokens), dtype=np.intp, count=len(tokens))
+
+    # Records shorter than a shingle are padded with zeros, which do not change the shingle hash.
+    padded = np.where((lengths > 0) & (lengths < shingle_size), shingle_size, lengths)
+    words = np.zeros(int(padded.sum()), dtype=np.uint64)
+    words[np.arange(len(tokens)) + np.repeat(_starts(padded) - _starts(lengths), lengths)] = word_hashes[indices]
+    counts = np.maximum(padded - shingle_size + 1, 0)
+    if not counts.any():
+        return np.empty(0, dtype=np.uint64), counts
+
+    # The hash of the window starting at each word, weighting words by position so that word order matters.
+    positions = np.arange(1, 2 * shingle_size, 2, dtype=np.uint64) * np.uint64(0x9E3779B97F4A7C15)
+    windows = np.lib.stride_tricks.sliding_window_view(words, shingle_size)
+    with np.errstate(over="ignore"):
+        keys = (windows * positions).sum(axis=1, dtype=np.uint64)
+    # Keep the windows starting in a record and ending in the same record.
+    starts = np.arange(counts.sum()) + np.repeat(_starts(padded) - _starts(counts), counts)
+    return _mix(keys[starts]) >> _HASH_BITS, counts
+
+
+def minhash_signatures(
+    hashes: NDArray[np.uint64], counts: NDArray[np.intp], num_perm: int = DEFAULT_NUM_PERM, seed: int = 0
+) -> NDArray[np.uint32]:
+    """Computes the MinHash signature of every record.
+
+    The hash functions are `h(x) = (a * x + b) >> 32` with random 64-bit `a` and `b` (multiply-add-shift), a
+    universal family of 32-bit hashes that NumPy evaluates without overflow checks or divisions.
+
+    Args:
+        hashes: The 32-bit shingle hashes of all records, see `shingle_hashes`.
+        counts: The number of shingles of every record. Every record must have at least one.
+        num_perm: Number of hash functions.
+        seed: Seed of the hash functions. Signatures are only comparable with the same seed.
+
+    Returns:
+        The signatures, `(records, num_perm)`.
+
+    """
+    rng = np.random.default_rng(seed)
+    multipliers = rng.integers(1, np.iinfo(np.uint64).max, num_perm, dtype=np.uint64, endpoint=True)
+    increments = rng.integers(0, np.iinfo(np.uint64).max, num_perm, dtype=np.uint64, endpoint=True)
+    offsets = _starts(counts)
+    signatures = np.empty((num_perm, len(counts)), dtype=np.uint32)
+    permuted = np.empty_like(hashes)
+    for i in range(num_perm):
+        # One hash function at a time over all shingles keeps memory at one copy of the hashes. The shift is
+        # monotonic, so it is applied to the minima only.
+        np.multiply(hashes, multipliers[i], out=permuted)
+        permuted += increments[i]
+        signatures[i] = np.minimum.reduceat(permuted, offsets) >> _HASH_BITS
+    return np.ascontiguousarray(signatures.T)
+
+
+def lsh_params(threshold: float, num_perm: int = DEFAULT_NUM_PERM) -> tuple[int, int]:
+    """Chooses the number of bands and rows per band for a similarity threshold.
+
+    Two records with similarity `s` share a band with probability `1 - (1 - s**rows)**bands`. The chosen split
+    minimizes the probability mass of pairs below the threshold becoming candidates plus that of pairs above it not
+    becoming candidates.
+
+    Args:
+        threshold: The similarity threshold.
+        num_perm: Signature length. `bands * rows` does not exceed it.
+
+    Returns:
+        `(bands, rows)`.
+
+    """
+    below = np.linspace(0.0, threshold, _INTEGRATION_POINTS)
+    above = np.linspace(threshold, 1.0, _INTEGRATION_POINTS)
+
+    def error(params: tuple[int, int]) -> float:
+        bands, rows = params
+        false_positives = np.trapezoid(1 - (1 - below**rows) ** bands, below)
+        false_negatives = np.trapezoid((1 - above**rows) ** bands, above)
+        return float(false_positives + false_negatives)
+
+    return min(
+        ((bands, rows) for bands in range(1, num_perm + 1) for rows in range(1, num_perm // bands + 1)), key=error
+    )
+
+
+def candidate_pairs(signatures: NDArray[np.uint32], bands: int, rows: int, seed: int = 0) -> NDArray[np.intp]:
+    """Finds the pairs of records with equal signature values in at least one band.
+
+    Within a bucket of records sharing a band, every record is paired with the first one only, so identical records
+    cost linear rather than quadratic time. Clusters are connected through these pairs.
+
+    Args:
+        signatures: The MinHash signatures, `(records, bands * rows)` or longer.
+        bands: Number of bands.
+        rows: Signature values per band.
+        seed: Seed of the band hashes.
+
+    Returns:
+        Unique `(i, j)` record index pairs with `i < j`, `(pairs, 2)`.
+
+    """
+    weights = np.random.default_rng(seed).integers(1, np.iinfo(np.uint64).max, rows, dtype=np.uint64) | np.uint64(1)
+    found = []
+    for band in range(bands):
+        with np.errstate(over="ignore"):
+            keys = (signatures[:, band * rows : (band + 1) * rows] * weights).sum(axis=1, dtype=np.uint64)
+        order = np.argsort(keys, kind="stable")
+        sorted_keys = keys[order]
+        first_in_bucket = np.ones(len(order), dtype=np.bool_)
+        first_in_bucket[1:] = sorted_keys[1:] != sorted_keys[:-1]
+        heads = order[first_in_bucket][np.cumsum(first_in_bucket) - 1]
+        found.append(np.column_stack([heads[~first_in_bucket], order[~first_in_bucket]]))
+    pairs = np.sort(np.concatenate(found), axis=1) if found else np.empty((0, 2), dtype=np.intp)
+    return np.unique(pairs, axis=0)
+
+
+def estimate_similarity(signatures: NDArray[np.uint32], pairs: NDArray[np.intp]) -> NDArray[np.float64]:
+    """Estimates the Jaccard similarity of record pairs as the fraction of equal signature values.
+
+    Args:
+        signatures: The MinHash signatures.
+        pairs: Record index pairs, `(pairs, 2)`.
+
+    Returns:
+        The similarity of every pair.
+
+    """
+    similarity = np.empty(len(pairs), dtype=np.float64)
+    for start in range(0, len(pairs), _VERIFY_CHUNK):
+        chunk = pairs[start : start + _VERIFY_CHUNK]
+        similarity[start : start + len(chunk)] = (signatures[chunk[:, 0]] == signatures[chunk[:, 1]]).mean(axis=1)
+    return similarity
+
+
+def _clusters(record_ids: Sequence[str], pairs: list[DuplicatePair]) -> list[DuplicateCluster]:
+    parents = {record_id: record_id for pair in pairs for record_id in pair[:2]}
+
+    def root(record_id: str) -> str:
+        while parents[record_id] != record_id:
+            parents[record_id] = parents[parents[record_id]]
+            record_id = parents[record_id]
+        return record_id
+
+    for pair in pairs:
+        parents[root(pair.first)] = root(pair.second)
+    members: dict[str, list[str]] = {}
+    for record_id in record_ids:
+        if record_id in parents:
+            members.setdefault(root(record_id), []).append(record_id)
+    edges: dict[str, list[DuplicatePair]] = {}
+    for pair in pairs:
+        edges.setdefault(root(pair.first), []).append(pair)
+    clusters = [
+        DuplicateCluster(tuple(sorted(ids)), tuple(sorted(edges[group], key=lambda p: (-p.similarity, p[:2]))))
+        for group, ids in members.items()
+    ]
+    return sorted(clusters, key=lambda c: (-len(c.record_ids), c.record_ids))
+
+
+def find_near_duplicates(
+    documents: Iterable[dict[str, Any]],
+    threshold: float = DEFAULT_THRESHOLD,
+    num_perm: int = DEFAULT_NUM_PERM,
+    shingle_size: int = DEFAULT_SHINGLE_SIZE,
+    seed: int = 0,
+) -> list[DuplicateCluster]:
+    """Finds clusters of near-duplicate records.
+
+    Args:
+        documents: Record documents.
+        threshold: Minimum estimated Jaccard similarity of near-duplicates.
+        num_perm: Number of hash functions.
+        shingle_size: Number of words per shingle.
+        seed: Seed of the hash functions.
+
+    Returns:
+        The clusters, largest first. Records without near-duplicates are not reported.
+
+    """
+    record_ids: list[str] = []
+    token_lists: list[list[str]] = []
+    for document in documents:
+        tokens = record_tokens(document)
+        if tokens:
+            record_ids.append(str(document["id"]))
+            token_lists.append(tokens)
+    if len(record_ids) < 2:  # noqa: PLR2004
+        return []
+
+    hashes, counts = shingle_hashes(token_lists, shingle_size)
+    signatures = minhash_signatures(hashes, counts, num_perm, seed)
+    pairs = candidate_pairs(signatures, *lsh_params(threshold, num_perm), seed=seed)
+    similarity = estimate_similarity(signatures, pairs)
+    keep = similarity >= threshold
+    duplicates = [
+        DuplicatePair(record_ids[i], record_ids[j], round(float(s), 4))
+        for (i, j), s in zip(pairs[keep].tolist(), similarity[keep].tolist(), strict=True)
+    ]
+    return _clusters(record_ids, duplicates)
@@ -0,0 +1,279 @@
+"""Vectorized validation of GeoJSON record geometries.
+
+`geojson_pydantic` validates coordinates as nested Python lists, building a named tuple per position, which dominates
+validation of records with detailed coverage polygons. `pack_geometry` instead packs all positions of a geometry into
+one `(n, 2)` or `(n, 3)` NumPy array with the start and end of every linear ring, and checks on those arrays what
+`geojson_pydantic` checks:
+
+* positions have 2 or 3 numeric coordinates,
+* line strings have at least 2 positions, linear rings at least 4 and start and end at the same position,
+* a geometry `bbox` has 4 or 6 numbers with its minimum Y (and Z) not above the maximum,
+* the members of a `GeometryCollection` do not mix 2D and 3D positions.
+
+The result is conservative: a geometry is only packed when `geojson_pydantic` accepts it. Anything else - invalid
+geometries, but also unusual ones such as positions of mixed dimensions or non-finite coordinates - returns `None`, so
+the caller validates it with pydantic and reports the same errors as before.
+
+`geometry_warnings` adds checks the schema does not enforce and that do not fail validation: coordinates outside the
+WGS 84 longitude/latitude range, rings not following the RFC 7946 right-hand rule (counterclockwise exteriors,
+clockwise holes) and positions outside the record's `properties.extent.spatial.bbox`.
+
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from itertools import chain
+from typing import TYPE_CHECKING, Any, NamedTuple
+
+import numpy as np
+
+if TYPE_CHECKING:
+    from numpy.typing import NDArray
+
+_POSITION_DIMS = (2, 3)
+_PACKED_NDIM = 2
+_BBOX_SIZES = (4, 6)
+_MIN_LINE_POSITIONS = 2
+_MIN_RING_POSITIONS = 4
+_NUMERIC_KINDS = "biuf"
+_MAX_LONGITUDE = 180.0
+_MAX_LATITUDE = 90.0
+
+
+@dataclass(frozen=True, slots=True)
+class PackedGeometry:
+    """Positions of a valid geometry packed into flat arrays."""
+
+    coordinates: NDArray[np.float64]
+    """All positions, `(n, 2)` or `(n, 3)`."""
+    rings: NDArray[np.intp]
+    """Start and (exclusive) end of every linear ring in `coordinates`, `(k, 2)`."""
+    exterior: NDArray[np.bool_]
+    """Whether each ring is the exterior ring of its polygon, `(k,)`."""
+
+    @property
+    def has_z(self) -> bool:
+        """Returns whether the positions are 3D."""
+        return len(self.coordinates) > 0 and self.coordinates.shape[1] == _POSITION_DIMS[1]
+
+
+class GeometryWarning(NamedTuple):
+    """A geometry problem that does not fail validation."""
+
+    type: str
+    msg: str
+
+
+def _positions(items: Any) -> NDArray[np.float64] | None:
+    """Packs a list of positions, `None` unless they are all finite numeric positions of the same dimension."""
+    if not isinstance(items, list):
+        return None
+    if not items:
+        return np.empty((0, _POSITION_DIMS[0]))
+    try:
+        array = np.asarray(items)
+    except (ValueError, TypeError, OverflowError):
+        return None
+    if array.ndim != _PACKED_NDIM or array.shape[1] not in _POSITION_DIMS or array.dtype.kind not in _NUMERIC_KINDS:
+        return None
+    array = array.astype(np.float64, copy=False)
+    return array if np.isfinite(array).all() else None
+
+
+def _parts(items: Any, min_positions: int) -> tuple[NDArray[np.float64], NDArray[np.intp]] | None:
+    """Packs a list of position lists, returning the positions and the offset of every list."""
+    if not isinstance(items, list) or not all(isinstance(part, list) for part in items):
+        return None
+    lengths = np.fromiter((len(part) for part in items), dtype=np.intp, count=len(items))
+    if (lengths < min_positions).any():
+        return None
+    coordinates = _positions(list(chain.from_iterable(items)))
+    if coordinates is None:
+        return None
+    return coordinates, np.concatenate([[0], np.cumsum(lengths)]).astype(np.intp)
+
+
+def _rings(polygons: list[Any]) -> PackedGeometry | None:
+    """Packs the rings of polygons and checks that every ring is closed."""
+    if not all(isinstance(polygon, list) for polygon in polygons):
+        return None
+    packed = _parts(list(chain.from_iterable(polygons)), _MIN_RING_POSITIONS)
+    if packed is None:
+        return None
+    coordinates, offsets = packed
+    rings = np.column_stack([offsets[:-1], offsets[1:]])
+    if not (coordinates[rings[:, 0]] == coordinates[rings[:, 1] - 1]).all():
+        return None
+    exterior = np.zeros(len(rings), dtype=np.bool_)
+    first_rings = np.cumsum([0, *(len(polygon) for polygon in polygons[:-1])])
+    exterior[first_rings[[len(polygon) > 0 for polygon in polygons]]] = True
+    return PackedGeometry(coordinates, rings, exterior)
+
+
+def _valid_bbox(bbox: Any) -> bool:
+    if bbox is None:
+        return True
+    if not isinstance(bbox, list) or len(bbox) not in _BBOX_SIZES:
+        return False
+    try:
+        values = np.asarray(bbox)
+    except (ValueError, TypeError, OverflowError):
+        return False
+    if values.dtype.kind not in _NUMERIC_KINDS or not np.isfinite(values).all():
+        return False
+    offset = len(bbox) // 2
+    return bool((values[1:offset] <= values[offset + 1 :]).all())
+
+
+def _lines(coordinates: NDArray[np.float64]) -> PackedGeometry:
+    return PackedGeometry(coordinates, np.empty((0, 2), dtype=np.intp), np.empty(0, dtype=np.bool_))
+
+
+def _concatenate(members: list[PackedGeometry]) -> PackedGeometry | None:
+    if len({member.has_z for member in members}) > 1:
+        return None
+    non_empty = [member for member in members if len(member.coordinates)] or [_lines(np.empty((0, 2)))]
+    shifts = np.cumsum([0, *(len(member.coordinates) for member in non_empty[:-1])])
+    return PackedGeometry(
+        np.concatenate([member.coordinates for member in non_empty]),
+        np.concatenate([member.rings + shift for member, shift in zip(non_empty, shifts, strict=True)]),
+        np.concatenate([member.exterior for member in non_empty]),
+    )
+
+
+def pack_geometry(geometry: Any) -> PackedGeometry | None:  # noqa: C901, PLR0911
+    """Packs and validates a GeoJSON geometry.
+
+    Args:
+        geometry: The `geometry` of a record, as parsed from JSON.
+
+    Returns:
+        The packed positions if `geojson_pydantic` accepts the geometry, otherwise `None`. `None` is also returned for
+        geometries that cannot be checked on arrays; validate those with pydantic.
+
+    """
+    if not isinstance(geometry, dict) or not _valid_bbox(geometry.get("bbox")):
+        return None
+    geometry_type = geometry.get("type")
+    if geometry_type == "GeometryCollection":
+        members = geometry.get("geometries")
+        if not isinstance(members, list):
+            return None
+        packed_members = [pack_geometry(member) for member in members]
+        if any(member is None for member in packed_members):
+            return None
+        return _concatenate([member for member in packed_members if member is not None])
+
+    coordinates = geometry.get("coordinates")
+    if geometry_type == "Point":
+        point = _positions([coordinates])
+        return _lines(point) if point is not None else None
+    if geometry_type in {"MultiPoint", "LineString"}:
+        positions = _positions(coordinates)
+        if positions is None or (geometry_type == "LineString" and len(positions) < _MIN_LINE_POSITIONS):
+            return None
+        return _lines(positions)
+    if geometry_type == "MultiLineString":
+        parts = _parts(coordinates, _MIN_LINE_POSITIONS)
+        return _lines(parts[0]) if parts is not None else None
+    if geometry_type == "Polygon":
+        return _rings([coordinates]) if isinstance(coordinates, list) else None
+    if geometry_type == "MultiPolygon":
+        return _rings(coordinates) if isinstance(coordinates, list) else None
+    return None
+
+
+def extent_bboxes(document: dict[str, Any]) -> NDArray[np.float64] | None:
+    """Returns the 2D boxes of `properties.extent.spatial.bbox` as a `(k, 4)` array.
+
+    Args:
+        document: The record document.
+
+    Returns:
+        The boxes, or `None` when the record has no spatial extent or it is malformed.
+
+    """
+    properties = document.get("properties")
+    extent = properties.get("extent") if isinstance(properties, dict) else None
+    spatial = extent.get("spatial") if isinstance(extent, dict) else None
+    bboxes = spatial.get("bbox") if isinstance(spatial, dict) else None
+    if not isinstance(bboxes, list) or not bboxes:
+        return None
+    boxes = []
+    for bbox in bboxes:
+        if bbox is None or not _valid_bbox(bbox):
+            return None
+        boxes.append(bbox[:2] + bbox[3:5] if len(bbox) == _BBOX_SIZES[1] else bbox)
+    return np.asarray(boxes, dtype=np.float64)
+
+
+def _signed_areas(packed: PackedGeometry) -> NDArray[np.float64]:
+    """Twice the signed area of every ring, positive for counterclockwise rings (shoelace formula)."""
+    if not len(packed.rings):
+        return np.empty(0)
+    x = packed.coordinates[:, 0]
+    y = packed.coordinates[:, 1]
+    cross = x[:-1] * y[1:] - x[1:] * y[:-1]
+    # Only sum the edges within rings, not the pairs joining the end of a ring with the next ring or line.
+    in_ring = np.zeros(len(cross) + 1, dtype=np.intp)
+    np.add.at(in_ring, packed.rings[:, 0], 1)
+    np.add.at(in_ring, packed.rings[:, 1] - 1, -1)
+    cross[np.cumsum(in_ring)[:-1] == 0] = 0.0
+    areas: NDArray[np.float64] = np.add.reduceat(cross, packed.rings[:, 0])
+    return areas
+
+
+def _inside(coordinates: NDArray[np.float64], boxes: NDArray[np.float64]) -> NDArray[np.bool_]:
+    """Whether each position lies in at least one box. Boxes with minX > maxX cross the antimeridian."""
+    x = coordinates[:, [0]]
+    y = coordinates[:, [1]]
+    min_x, min_y, max_x, max_y = boxes.T
+    in_x = np.where(min_x <= max_x, (x >= min_x) & (x <= max_x), (x >= min_x) | (x <= max_x))
+    inside: NDArray[np.bool_] = (in_x & (y >= min_y) & (y <= max_y)).any(axis=1)
+    return inside
+
+
+def geometry_warnings(packed: PackedGeometry, bboxes: NDArray[np.float64] | None = None) -> list[GeometryWarning]:
+    """Checks a packed geometry for problems the schema accepts.
+
+    Args:
+        packed: The packed geometry.
+        bboxes: The record's spatial extent from `extent_bboxes`. Positions are not compared with it when `None`.
+
+    Returns:
+        The warnings, empty when the geometry is fine.
+
+    """
+    warnings = []
+    coordinates = packed.coordinates
+    out_of_range = int(
+        ((np.abs(coordinates[:, 0]) > _MAX_LONGITUDE) | (np.abs(coordinates[:, 1]) > _MAX_LATITUDE)).sum()
+    )
+    if out_of_range:
+        warnings.append(
+            GeometryWarning(
+                "geometry_bounds",
+                f"{out_of_range} position(s) outside longitude [-180, 180] or latitude [-90, 90]",
+            )
+        )
+
+    areas = _signed_areas(packed)
+    clockwise_exteriors = int((packed.exterior & (areas < 0)).sum())
+    counterclockwise_holes = int((~packed.exterior & (areas > 0)).sum())
+    if clockwise_exteriors or counterclockwise_holes:
+        warnings.append(
+            GeometryWarning(
+                "geometry_winding",
+                f"{clockwise_exteriors} clockwise exterior ring(s) and {counterclockwise_holes} counterclockwise "
+                "hole(s), RFC 7946 expects counterclockwise exteriors and clockwise holes",
+            )
+        )
+
+    if bboxes is not None and len(coordinates):
+        outside = int((~_inside(coordinates, bboxes)).sum())
+        if outside:
+            warnings.append(
+                GeometryWarning("geometry_extent", f"{outside} position(s) outside properties.extent.spatial.bbox")
+            )
+    return warnings
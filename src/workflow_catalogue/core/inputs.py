@@ -0,0 +1,388 @@
+"""Validation of job inputs against the `inputParameters` of a workflow record.
+
+A record's `inputParameters` are compiled once into an `InputValidator`: every parameter becomes a `CompiledParameter`
+with its regex `pattern` precompiled and its `enum` values put in a set, so validating a job only runs cheap checks.
+Compiled validators are kept in a `ValidatorCache`, an LRU keyed by record ID and content hash, so an edited record is
+recompiled while unchanged records are compiled only once per process.
+
+Parameter types are checked as follows:
+
+* `number` - an int or float (not a bool), within `min`/`max`,
+* `boolean` - a bool,
+* `text` - a string matching `pattern`,
+* `date` - an ISO 8601 date or datetime string, exported as JSON Schema `date-time` or `date` format,
+* `bbox` - a list of 4 (2D) or 6 (3D) numbers with minimums not greater than maximums,
+* data types (`raster`, `vector`, `collection`, ...) - a non-empty string reference, e.g. a URL.
+
+Definitions are compiled from the raw JSON without schema validation. Parameters of a type outside `ParameterType`
+only have their `enum` and, for strings, their `pattern` checked.
+
+A parameter is mandatory only when it is marked `required` and has no default. Inputs that are not declared are
+reported as errors. Validators can also be exported as JSON Schema with `InputValidator.json_schema`.
+
+"""
+
+from __future__ import annotations
+
+import re
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import date, datetime
+from typing import TYPE_CHECKING, Any, NamedTuple
+
+from workflow_catalogue.core.record_view import RecordView
+from workflow_catalogue.schemas.common import InputParameter, ParameterType
+from workflow_catalogue.utils.logging import get_logger
+from workflow_catalogue.utils.serialization import loads
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Mapping
+    from pathlib import Path
+
+_logger = get_logger(__name__)
+
+DEFAULT_CACHE_SIZE = 256
+"""Default number of compiled validators kept in a `ValidatorCache`."""
+
+_BBOX_2D = 4
+_BBOX_3D = 6
+_JSON_SCHEMA_DIALECT = "https://json-schema.org/draft/2020-12/schema"
+_PARAMETER_TYPES = {parameter_type.value: parameter_type for parameter_type in ParameterType}
+_REFERENCE_SCHEMA: dict[str, Any] = {"type": "string", "minLength": 1}
+_JSON_SCHEMA_TYPES: dict[ParameterType, dict[str, Any]] = {
+    **dict.fromkeys(ParameterType, _REFERENCE_SCHEMA),
+    ParameterType.number: {"type": "number"},
+    ParameterType.boolean: {"type": "boolean"},
+    ParameterType.text: {"type": "string"},
+    ParameterType.date: {"type": "string", "anyOf": [{"format": "date-time"}, {"format": "date"}]},
+    ParameterType.bbox: {"type": "array", "items": {"type": "number"}, "minItems": _BBOX_2D, "maxItems": _BBOX_3D},
+}
+
+
+class InputError(NamedTuple):
+    """A problem with a single job input."""
+
+    parameter: str
+    message: str
+
+
+def _is_number(value: Any) -> bool:
+    return isinstance(value, int | float) and not isinstance(value, bool)
+
+
+def _is_iso_date(value: str) -> bool:
+    try:
+        datetime.fromisoformat(value)
+    except ValueError:
+        try:
+            date.fromisoformat(value)
+        except ValueError:
+            return False
+    return True
+
+
+def _hashable_set(values: Iterable[Any]) -> frozenset[Any] | None:
+    try:
+        return frozenset(values)
+    except TypeError:
+        return None
+
+
+@dataclass(frozen=True, slots=True)
+class CompiledParameter:
+    """An input parameter prepared for fast validation."""
+
+    name: str
+    type: ParameterType | None
+    required: bool
+    minimum: float | None = None
+    maximum: float | None = None
+    pattern: re.Pattern[str] | None = None
+    enum: tuple[Any, ...] | None = None
+    enum_set: frozenset[Any] | None = None
+    """The `enum` values as a set for constant-time lookups, `None` when some value is a list or an object."""
+
+    @classmethod
+    def compile(cls, name: str, parameter: InputParameter | Mapping[str, Any]) -> CompiledParameter:
+        """Compiles a parameter definition.
+
+        Args:
+            name: The parameter name.
+            parameter: The parameter definition, as a model or raw JSON.
+
+        Returns:
+            The compiled parameter.
+
+        Raises:
+            re.error: If the parameter `pattern` is not a valid regular expression.
+
+        """
+        if isinstance(parameter, InputParameter):
+            parameter = parameter.model_dump(mode="json")
+        pattern = parameter.get("pattern")
+        enum = parameter.get("enum")
+        return cls(
+            name=name,
+            type=_PARAMETER_TYPES.get(str(parameter.get("type"))),
+            required=bool(parameter.get("required")) and parameter.get("default") is None,
+            minimum=parameter.get("min"),
+            maximum=parameter.get("max"),
+            pattern=re.compile(pattern) if pattern else None,
+            enum=tuple(enum) if enum else None,
+            enum_set=_hashable_set(enum) if enum else None,
+        )
+
+    def _in_enum(self, value: Any) -> bool:
+        if self.enum_set is not None:
+            try:
+                return value in self.enum_set
+            except TypeError:
+                # Unhashable values, such as lists, cannot be in a set of hashable values.
+                return False
+        return value in (self.enum or ())
+
+    def check(self, value: Any) -> str | None:  # noqa: C901, PLR0911, PLR0912
+        """Checks a value against the parameter.
+
+        Args:
+            value: The input value.
+
+        Returns:
+            An error message or `None` if the value is valid.
+
+        """
+        if self.enum is not None and not self._in_enum(value):
+            return f"must be one of {sorted(map(str, self.enum))}"
+        kind = self.type
+        if kind is ParameterType.number:
+            if not _is_number(value):
+                return "must be a number"
+            if self.minimum is not None and value < self.minimum:
+                return f"must be >= {self.minimum}"
+            if self.maximum is not None and value > self.maximum:
+                return f"must be <= {self.maximum}"
+        elif kind is ParameterType.boolean:
+            if not isinstance(value, bool):
+                return "must be a boolean"
+        elif kind is ParameterType.text or kind is None:
+            if kind is not None and not isinstance(value, str):
+                return "must be a string"
+            if self.pattern is not None and isinstance(value, str) and self.pattern.fullmatch(value) is None:
+                return f"must match pattern '{self.pattern.pattern}'"
+        elif kind is ParameterType.date:
+            if not isinstance(value, str) or not _is_iso_date(value):
+                return "must be an ISO 8601 date or datetime"
+        elif kind is ParameterType.bbox:
+            if not isinstance(value, list) or len(value) not in {_BBOX_2D, _BBOX_3D} or not all(map(_is_number, value)):
+                return "must be a list of 4 or 6 numbers"
+            half = len(value) // 2
+            if any(value[i] > value[i + half] for i in range(half)):
+                return "minimums must not be greater than maximums"
+        elif not isinstance(value, str) or not value:
+            return "must be a non-empty string reference"
+        return None
+
+    def json_schema(self) -> dict[str, Any]:
+        """Returns the JSON Schema of the parameter."""
+        schema = dict(_JSON_SCHEMA_TYPES[self.type]) if self.type is not None else {}
+        if self.type is ParameterType.number:
+            if self.minimum is not None:
+                schema["minimum"] = self.minimum
+            if self.maximum is not None:
+                schema["maximum"] = self.maximum
+        if self.pattern is not None and self.type in {ParameterType.text, None}:
+            schema["pattern"] = self.pattern.pattern
+        if self.enum is not None:
+            schema["enum"] = sorted(self.enum, key=str)
+        return schema
+
+
+class InputValidator:
+    """Validates job inputs against the compiled `inputParameters` of a record."""
+
+    __slots__ = ("_required", "parameters")
+
+    def __init__(self, parameters: Mapping[str, CompiledParameter]) -> None:
+        """Initializes the validator.
+
+        Args:
+            parameters: Compiled parameters by name.
+
+        """
+        self.parameters = dict(parameters)
+        self._required = tuple(name for name, parameter in self.parameters.items() if parameter.required)
+
+    @classmethod
+    def compile(cls, input_parameters: Mapping[str, InputParameter | Mapping[str, Any]] | None) -> InputValidator:
+        """Compiles the `inputParameters` of a record.
+
+        Args:
+            input_parameters: Parameter definitions by name, as models or raw JSON.
+
+        Returns:
+            The validator.
+
+        Raises:
+            re.error: If a parameter `pattern` is not a valid regular expression.
+
+        """
+        return cls({
+            name: CompiledParameter.compile(name, parameter) for name, parameter in (input_parameters or {}).items()
+        })
+
+    def validate(self, inputs: Mapping[str, Any]) -> list[InputError]:
+        """Validates job inputs.
+
+        Args:
+            inputs: Input values by parameter name.
+
+        Returns:
+            The problems found, empty when the inputs are valid.
+
+        """
+        errors = [InputError(name, "is required") for name in self._required if name not in inputs]
+        parameters = self.parameters
+        for name, value in inputs.items():
+            parameter = parameters.get(name)
+            if parameter is None:
+                errors.append(InputError(name, "is not a parameter of the workflow"))
+                continue
+            message = parameter.check(value)
+            if message is not None:
+                errors.append(InputError(name, message))
+        return errors
+
+    def json_schema(self) -> dict[str, Any]:
+        """Returns a JSON Schema describing valid inputs."""
+        return {
+            "$schema": _JSON_SCHEMA_DIALECT,
+            "type": "object",
+            "properties": {name: parameter.json_schema() for name, parameter in self.parameters.items()},
+            "required": list(self._required),
+            "additionalProperties": False,
+        }
+
+
+class ValidatorCache:
+    """Thread-safe LRU cache of compiled validators keyed by record ID and content hash."""
+
+    def __init__(self, maxsize: int = DEFAULT_CACHE_SIZE) -> None:
+        """Initializes an empty cache.
+
+        Args:
+            maxsize: Maximum number of validators kept.
+
+        """
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._validators: OrderedDict[tuple[str, str], InputValidator] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        """Returns the number of cached validators."""
+        return len(self._validators)
+
+    def get(
+        self,
+        record_id: str,
+        content_hash: str,
+        input_parameters: Mapping[str, InputParameter | Mapping[str, Any]] | None,
+    ) -> InputValidator:
+        """Returns the validator of a record, compiling it on a cache miss.
+
+        Args:
+            record_id: The record ID.
+            content_hash: Content hash of the record, e.g. `RecordView.content_hash`.
+            input_parameters: The record's `inputParameters`, only used on a cache miss.
+
+        Returns:
+            The validator.
+
+        """
+        key = (record_id, content_hash)
+        with self._lock:
+            validator = self._validators.get(key)
+            if validator is not None:
+                self._validators.move_to_end(key)
+                self.hits += 1
+                return validator
+        validator = InputValidator.compile(input_parameters)
+        with self._lock:
+            self.misses += 1
+            self._validators[key] = validator
+            self._validators.move_to_end(key)
+            while len(self._validators) > self.maxsize:
+                self._validators.popitem(last=False)
+        return validator
+
+
+def _check_input_parameters(input_parameters: Any) -> dict[str, dict[str, Any]] | None:
+    """Checks that raw `inputParameters` JSON is an object of objects before compiling it."""
+    if input_parameters is None:
+        return None
+    if not isinstance(input_parameters, dict):
+        msg = f"inputParameters must be an object, got {type(input_parameters).__name__}"
+        raise TypeError(msg)
+    for name, parameter in input_parameters.items():
+        if not isinstance(parameter, dict):
+            msg = f"Parameter '{name}' must be an object, got {type(parameter).__name__}"
+            raise TypeError(msg)
+    return input_parameters
+
+
+def load_validators(files: Iterable[Path], cache: ValidatorCache | None = None) -> dict[str, InputValidator]:
+    """Compiles the validators of workflow records, skipping notebooks and `catalog.json` files.
+
+    Args:
+        files: Record files.
+        cache: Cache to get validators from. A private cache is used when `None`.
+
+    Returns:
+        Validators by workflow ID. Records that cannot be read or compiled are skipped with a warning.
+
+    """
+    if cache is None:
+        cache = ValidatorCache()
+    validators: dict[str, InputValidator] = {}
+    for file_path in files:
+        if file_path.name == "catalog.json":
+            continue
+        try:
+            document = loads(file_path.read_bytes())
+            view = RecordView.from_document(document)
+            if view.is_workflow:
+                input_parameters = _check_input_parameters(document["properties"].get("inputParameters"))
+                validators[view.id] = cache.get(view.id, view.content_hash, input_parameters)
+        except (OSError, TypeError, ValueError, re.error) as exc:
+            _logger.warning("SKIP: %s - %s", file_path, exc)
+    return validators
+
+
+def check_job(
+    job: Any,
+    validators: Mapping[str, InputValidator],
+    default_workflow: str | None = None,
+) -> list[InputError]:
+    """Validates a job payload: an OGC API Processes execute request with an optional `workflow` ID.
+
+    Args:
+        job: The payload, e.g. `{"workflow": "clip-workflow", "inputs": {"bbox": [0, 0, 1, 1]}}`.
+        validators: Validators by workflow ID.
+        default_workflow: Workflow used when the payload has no `workflow` key.
+
+    Returns:
+        The problems found, empty when the job is valid.
+
+    """
+    if not isinstance(job, dict):
+        return [InputError("", "job must be a JSON object")]
+    workflow_id = job.get("workflow", default_workflow)
+    validator = validators.get(workflow_id) if isinstance(workflow_id, str) else None
+    if validator is None:
+        return [InputError("workflow", f"unknown workflow '{workflow_id}'")]
+    inputs = job.get("inputs", {})
+    if not isinstance(inputs, dict):
+        return [InputError("inputs", "must be a JSON object")]
+    return validator.validate(inputs)
@@ -0,0 +1,145 @@
+"""Interning of structurally identical sub-objects across loaded records.
+
+Records repeat a lot of content verbatim: the same contacts, `conformsTo` arrays, `root`/`parent` links, keywords and
+media types. When a whole catalogue is loaded every record carries its own copy of each of them. An `Interner` keeps
+one canonical instance per distinct value and replaces equal copies with it, so a loaded catalogue only pays for the
+distinct sub-objects.
+
+Both raw JSON documents (`intern_json`) and validated pydantic models (`intern_model`) are supported. Values are
+compared structurally: two sub-objects are shared when they have the same type and equal content (for models, also the
+same set of explicitly set fields, so `exclude_unset` serialization is unaffected). Containers are keyed by the
+identities of their already-interned children, which keeps keys flat and hashing cheap.
+
+Interned objects are shared between records and must be treated as read-only. The top-level object passed in is never
+shared. An `Interner` is not thread-safe.
+
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, TypeVar
+
+from pydantic import BaseModel
+
+if TYPE_CHECKING:
+    from collections.abc import Hashable
+
+M = TypeVar("M", bound=BaseModel)
+
+_SCALARS = (bool, int, float, type(None))
+
+
+class Interner:
+    """Pool of canonical instances of strings, JSON containers and pydantic models."""
+
+    def __init__(self) -> None:
+        """Initializes an empty pool."""
+        self._pool: dict[Hashable, Any] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        """Returns the number of distinct pooled values."""
+        return len(self._pool)
+
+    def _canonical(self, key: Hashable, value: Any) -> Any:
+        existing = self._pool.get(key)
+        if existing is None:
+            self._pool[key] = value
+            self.misses += 1
+            return value
+        self.hits += 1
+        return existing
+
+    def _leaf(self, value: Any) -> tuple[Any, Hashable]:
+        if type(value) is str:
+            canonical = self._canonical(value, value)
+            return canonical, id(canonical)
+        if isinstance(value, _SCALARS):
+            # repr() tells apart values that compare equal but serialize differently, e.g. 0.0 and -0.0.
+            return value, (type(value), repr(value))
+        try:
+            # Aware datetimes in different time zones compare equal, so the representation is part of the key.
+            canonical = self._canonical((type(value), value, repr(value)), value)
+        except TypeError:
+            # Unhashable values are never shared, and neither is any container holding them.
+            return value, object()
+        return canonical, id(canonical)
+
+    def _json(self, value: Any, *, root: bool = False) -> tuple[Any, Hashable]:
+        if isinstance(value, dict):
+            keys = [self._leaf(key)[0] for key in value]
+            children = [self._json(child) for child in value.values()]
+            result: Any = dict(zip(keys, (child for child, _ in children), strict=True))
+            key: Hashable = (dict, tuple(map(id, keys)), tuple(child_key for _, child_key in children))
+        elif isinstance(value, list):
+            children = [self._json(child) for child in value]
+            result = [child for child, _ in children]
+            key = (list, tuple(child_key for _, child_key in children))
+        else:
+            return self._leaf(value)
+        if root:
+            return result, key
+        canonical = self._canonical(key, result)
+        return canonical, id(canonical)
+
+    def _value(self, value: Any) -> tuple[Any, Hashable]:
+        if isinstance(value, BaseModel):
+            return self._model(value)
+        if isinstance(value, list):
+            children = [self._value(child) for child in value]
+            canonical = self._canonical((list, tuple(key for _, key in children)), [child for child, _ in children])
+            return canonical, id(canonical)
+        if isinstance(value, dict):
+            keys = [self._leaf(key)[0] for key in value]
+            children = [self._value(child) for child in value.values()]
+            canonical = self._canonical(
+                (dict, tuple(map(id, keys)), tuple(key for _, key in children)),
+                dict(zip(keys, (child for child, _ in children), strict=True)),
+            )
+            return canonical, id(canonical)
+        return self._leaf(value)
+
+    def _intern_fields(self, model: BaseModel) -> Hashable:
+        """Replaces field values of a model with their canonical instances in place and returns the model key."""
+        keys = []
+        for name, value in model.__dict__.items():
+            canonical, key = self._value(value)
+            model.__dict__[name] = canonical
+            keys.append(key)
+        return (type(model), tuple(sorted(model.model_fields_set)), tuple(keys), repr(model.model_extra))
+
+    def _model(self, model: BaseModel) -> tuple[Any, Hashable]:
+        canonical = self._canonical(self._intern_fields(model), model)
+        return canonical, id(canonical)
+
+    def intern_json(self, document: Any) -> Any:
+        """Interns the strings and sub-objects of a parsed JSON document.
+
+        Args:
+            document: The parsed document.
+
+        Returns:
+            An equal document whose nested dicts, lists and strings are shared with previously interned documents.
+
+        """
+        return self._json(document, root=True)[0]
+
+    def intern_model(self, model: M) -> M:
+        """Interns the nested models, containers and values of a pydantic model in place.
+
+        Args:
+            model: The model. It is updated in place and not shared itself.
+
+        Returns:
+            The same model instance.
+
+        """
+        self._intern_fields(model)
+        return model
+
+    def stats(self) -> str:
+        """Returns a one-line summary of the pool."""
+        total = self.hits + self.misses
+        ratio = self.hits / total if total else 0.0
+        return f"{len(self)} distinct value(s), {self.hits} of {total} lookups shared ({ratio:.0%})"
@@ -0,0 +1,174 @@
+"""Signed validation manifests.
+
+`wfc catalogue validate --manifest-output` records, for every validated file, the SHA-256 of its content and its
+verdict, together with a fingerprint of the record schemas. The manifest is signed with HMAC-SHA256 using the key in
+`$WFC_MANIFEST_KEY`, so only a pipeline holding the key can produce one that registration accepts.
+
+`wfc catalogue register --manifest` then skips schema validation of files whose content hash matches a passing entry.
+Everything else falls back to full validation:
+
+* a missing, unreadable or wrongly signed manifest, or one without a key to check it, is ignored,
+* a manifest written for other schemas (different fingerprint or manifest version) is stale and ignored,
+* files that changed since validation, failed it or are not listed are validated as usual.
+
+"""
+
+from __future__ import annotations
+
+import hashlib
+import hmac
+import os
+from functools import cache
+from pathlib import Path
+
+import pydantic
+from pydantic import BaseModel, Field, ValidationError
+
+from workflow_catalogue.core.validation import ValidationReport  # noqa: TC001
+from workflow_catalogue.schemas.catalogue import EodhCatalogue
+from workflow_catalogue.schemas.notebook import EodhNotebookRecord
+from workflow_catalogue.schemas.workflow import EodhWorkflowRecord
+from workflow_catalogue.utils.logging import get_logger
+from workflow_catalogue.utils.serialization import canonical_dumps
+
+_logger = get_logger(__name__)
+
+MANIFEST_VERSION = 1
+"""Version of the manifest format. Manifests of other versions are treated as stale."""
+
+MANIFEST_KEY_ENV = "WFC_MANIFEST_KEY"
+"""Environment variable holding the manifest signing key."""
+
+
+@cache
+def schema_fingerprint() -> str:
+    """Returns the SHA-256 of the JSON schemas of the record models and the pydantic version.
+
+    Any change to the record schemas changes the fingerprint and so invalidates existing manifests.
+    """
+    schemas = {
+        model.__name__: model.model_json_schema() for model in (EodhCatalogue, EodhWorkflowRecord, EodhNotebookRecord)
+    }
+    return hashlib.sha256(canonical_dumps({"pydantic": pydantic.VERSION, "schemas": schemas})).hexdigest()
+
+
+def file_key(file_path: Path) -> str:
+    """Returns the key a file is listed under: its path relative to the working directory when possible, as POSIX."""
+    absolute = file_path.absolute()
+    try:
+        return absolute.relative_to(Path.cwd()).as_posix()
+    except ValueError:
+        return absolute.as_posix()
+
+
+class ManifestEntry(BaseModel):
+    """Validation outcome of a single file."""
+
+    sha256: str = Field(description="SHA-256 of the file content")
+    record_type: str | None = None
+    passed: bool
+
+
+class ValidationManifest(BaseModel):
+    """Validation outcomes by file, bound to the schemas they were validated against."""
+
+    version: int = MANIFEST_VERSION
+    schema_fingerprint: str = Field(default_factory=schema_fingerprint)
+    files: dict[str, ManifestEntry] = Field(default_factory=dict, description="Entries by `file_key`")
+    signature: str = Field(default="", description="HMAC-SHA256 of the other fields in canonical JSON")
+
+    @classmethod
+    def from_report(cls, report: ValidationReport) -> ValidationManifest:
+        """Builds an unsigned manifest from a validation report. Files that could not be read are left out.
+
+        Args:
+            report: The validation report.
+
+        Returns:
+            The manifest.
+
+        """
+        return cls(
+            files={
+                file_key(result.path): ManifestEntry(
+                    sha256=result.sha256, record_type=result.record_type, passed=result.passed
+                )
+                for result in report.files
+                if result.sha256 is not None
+            }
+        )
+
+    def _digest(self, key: str) -> str:
+        payload = canonical_dumps(self.model_dump(mode="json", exclude={"signature"}))
+        return hmac.new(key.encode("utf-8"), payload, hashlib.sha256).hexdigest()
+
+    def sign(self, key: str) -> None:
+        """Signs the manifest in place.
+
+        Args:
+            key: The signing key.
+
+        """
+        self.signature = self._digest(key)
+
+    def verify(self, key: str) -> bool:
+        """Returns whether the manifest was signed with `key` and not modified since."""
+        return hmac.compare_digest(self.signature, self._digest(key))
+
+    @property
+    def is_current(self) -> bool:
+        """Returns whether the manifest was written by this manifest version for the current schemas."""
+        return self.version == MANIFEST_VERSION and self.schema_fingerprint == schema_fingerprint()
+
+    def trusts(self, file_path: Path, content: bytes) -> bool:
+        """Returns whether `content` of `file_path` passed validation, i.e. it is listed as passed with the same hash.
+
+        Args:
+            file_path: Path of the file.
+            content: The current file content.
+
+        """
+        entry = self.files.get(file_key(file_path))
+        return entry is not None and entry.passed and entry.sha256 == hashlib.sha256(content).hexdigest()
+
+    def write(self, path: Path) -> None:
+        """Writes the manifest as JSON.
+
+        Args:
+            path: Destination file.
+
+        """
+        path.write_text(self.model_dump_json(indent=2), encoding="utf-8")
+
+
+def manifest_key() -> str | None:
+    """Returns the signing key from `$WFC_MANIFEST_KEY`, or `None` when it is not set."""
+    return os.environ.get(MANIFEST_KEY_ENV) or None
+
+
+def load_manifest(path: Path, key: str | None) -> ValidationManifest | None:
+    """Loads a manifest for registration, logging why it cannot be used.
+
+    Args:
+        path: Path to the manifest.
+        key: The signing key. Manifests cannot be trusted without one.
+
+    Returns:
+        The verified, current manifest, or `None` when files must be fully validated.
+
+    """
+    if key is None:
+        _logger.warning("WARN: %s is not set, ignoring validation manifest %s", MANIFEST_KEY_ENV, path)
+        return None
+    try:
+        manifest = ValidationManifest.model_validate_json(path.read_bytes())
+    except (OSError, ValidationError) as exc:
+        _logger.warning("WARN: Could not read validation manifest %s, validating all files: %s", path, exc)
+        return None
+    if not manifest.verify(key):
+        _logger.warning("WARN: Validation manifest %s has an invalid signature, validating all files", path)
+        return None
+    if not manifest.is_current:
+        _logger.warning("WARN: Validation manifest %s was written for other schemas, validating all files", path)
+        return None
+    return manifest
@@ -0,0 +1,560 @@
+"""Local mock of the EODH platform endpoints used by the CD pipeline.
+
+The mock emulates Keycloak (token), workspace services (sessions, data-loader, harvest), wf-catalogue-service
+(collections, register) and ADES (processes) closely enough for the registration flow to run end-to-end without
+touching the live platform. Latency, error rates and per-endpoint-family rate limits are configurable, which makes it
+suitable for load testing and profiling the CD path.
+
+Examples:
+    ```python
+    from workflow_catalogue.core.mock_platform import MockPlatformConfig, MockPlatformServer
+
+    with MockPlatformServer(MockPlatformConfig(latency_ms=20, error_rate=0.01)) as server:
+        print(server.base_url)  # http://127.0.0.1:<port>
+    ```
+
+"""
+
+from __future__ import annotations
+
+import base64
+import json
+import math
+import os
+import random
+import re
+import threading
+import time
+from collections import Counter
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import TYPE_CHECKING, Any, NamedTuple, Self
+from urllib.parse import parse_qs, urlsplit
+
+from pydantic import BaseModel, Field
+from requests import Response
+from requests.adapters import BaseAdapter
+from requests.structures import CaseInsensitiveDict
+
+from workflow_catalogue.core.scheduler import TokenBucket
+from workflow_catalogue.core.settings import current_settings
+from workflow_catalogue.utils.logging import get_logger
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from pathlib import Path
+
+    from requests import PreparedRequest, Session
+
+_logger = get_logger(__name__)
+
+_CWL_TEMPLATE = """cwlVersion: v1.0
+$graph:
+  - class: Workflow
+    id: {name}
+    inputs: {{}}
+    outputs: {{}}
+    steps: {{}}
+"""
+_REDACTED = "***"
+_SENSITIVE_FORM_FIELDS = {"password", "client_secret"}
+
+
+class MockPlatformConfig(BaseModel):
+    """Behaviour knobs for the mock platform."""
+
+    latency_ms: float = Field(default=0.0, ge=0, description="Mean latency added to every response")
+    jitter_ms: float = Field(default=0.0, ge=0, description="Uniform jitter added on top of the mean latency")
+    error_rate: float = Field(default=0.0, ge=0, le=1, description="Fraction of requests answered with 503")
+    rate_limit: float | None = Field(default=None, gt=0, description="Requests per second allowed per endpoint family")
+    burst: int = Field(default=10, ge=1, description="Token bucket capacity used together with `rate_limit`")
+    seed: int | None = Field(default=None, description="Seed for the error injection RNG")
+
+
+class MockResponse(NamedTuple):
+    """Response produced by the mock platform."""
+
+    status: int
+    headers: dict[str, str]
+    body: bytes
+
+
+class _MockRequest(NamedTuple):
+    match: re.Match[str]
+    query: dict[str, list[str]]
+    body: bytes
+
+
+class _Route(NamedTuple):
+    method: str
+    pattern: re.Pattern[str]
+    family: str
+    handler: str
+
+
+_ROUTES = [
+    _Route("POST", re.compile(r"/protocol/openid-connect/token$"), "auth", "_token"),
+    _Route("POST", re.compile(r"/(?P<workspace>[^/]+)/me/sessions$"), "workspace", "_session"),
+    _Route("POST", re.compile(r"/data-loader$"), "workspace", "_data_loader"),
+    _Route("POST", re.compile(r"/harvest$"), "workspace", "_harvest"),
+    _Route("GET", re.compile(r"/collections/(?P<id>[^/]+)$"), "catalogue", "_get_collection"),
+    _Route("GET", re.compile(r"/collections/(?P<id>[^/]+)/items$"), "catalogue", "_list_items"),
+    _Route("POST", re.compile(r"/collections$"), "catalogue", "_create_collection"),
+    _Route("POST", re.compile(r"/register$"), "catalogue", "_register"),
+    _Route("DELETE", re.compile(r"/register/(?P<id>[^/]+)$"), "catalogue", "_unregister"),
+    _Route("POST", re.compile(r"/processes$"), "ades", "_deploy_process"),
+    _Route("DELETE", re.compile(r"/processes/(?P<id>[^/]+)$"), "ades", "_undeploy_process"),
+    _Route("GET", re.compile(r"/(?P<name>[^/]+)\.cwl$"), "cwl", "_cwl"),
+]
+
+
+def _json(status: int, payload: Any) -> MockResponse:
+    return MockResponse(status, {"Content-Type": "application/json"}, json.dumps(payload).encode("utf-8"))
+
+
+def _empty(status: int) -> MockResponse:
+    return MockResponse(status, {}, b"")
+
+
+def _fake_jwt(claims: dict[str, Any]) -> str:
+    def encode(obj: dict[str, Any]) -> str:
+        return base64.urlsafe_b64encode(json.dumps(obj).encode("utf-8")).rstrip(b"=").decode("ascii")
+
+    return f"{encode({'alg': 'none', 'typ': 'JWT'})}.{encode(claims)}.mock-signature"
+
+
+class MockPlatform:
+    """In-memory state and request handling for the mock platform.
+
+    The class is transport-agnostic: `MockPlatformServer` exposes it over HTTP and `MockPlatformAdapter` plugs it
+    straight into a `requests.Session`.
+
+    """
+
+    def __init__(self, config: MockPlatformConfig | None = None) -> None:
+        """Initializes an empty platform.
+
+        Args:
+            config: Behaviour configuration. Defaults to an instant, error-free platform.
+
+        """
+        self.config = config or MockPlatformConfig()
+        self.collections: dict[str, dict[str, Any]] = {}
+        self.records: dict[str, dict[str, Any]] = {}
+        self.record_collections: dict[str, str] = {}
+        self.processes: set[str] = set()
+        self.stats: Counter[str] = Counter()
+        self._lock = threading.Lock()
+        self._rng = random.Random(self.config.seed)  # noqa: S311
+        self._buckets: dict[str, TokenBucket] = {}
+
+    def handle(
+        self, method: str, url: str, body: bytes | None = None, *, simulate_latency: bool = True
+    ) -> MockResponse:
+        """Handles a single request.
+
+        Args:
+            method: HTTP method.
+            url: Request URL or path, optionally with a query string.
+            body: Raw request body.
+            simulate_latency: Whether to sleep for the configured latency.
+
+        Returns:
+            The mock response.
+
+        """
+        parsed = urlsplit(url)
+        route, match = self._resolve(method.upper(), parsed.path)
+        if route is None or match is None:
+            self._count("unrouted")
+            return _json(HTTPStatus.NOT_FOUND, {"detail": f"No mock route for {method} {parsed.path}"})
+
+        if simulate_latency and (self.config.latency_ms or self.config.jitter_ms):
+            time.sleep((self.config.latency_ms + self._uniform(0, self.config.jitter_ms)) / 1000)
+
+        with self._lock:
+            self.stats[f"{route.family}:requests"] += 1
+            retry_after = self._throttle(route.family)
+            if retry_after:
+                self.stats[f"{route.family}:429"] += 1
+                return MockResponse(
+                    HTTPStatus.TOO_MANY_REQUESTS,
+                    {"Retry-After": str(math.ceil(retry_after)), "Content-Type": "application/json"},
+                    b'{"detail": "rate limited"}',
+                )
+            if self.config.error_rate and self._rng.random() < self.config.error_rate:
+                self.stats[f"{route.family}:503"] += 1
+                return _json(HTTPStatus.SERVICE_UNAVAILABLE, {"detail": "injected failure"})
+
+            handler: Callable[[_MockRequest], MockResponse] = getattr(self, route.handler)
+            response = handler(_MockRequest(match, parse_qs(parsed.query), body or b""))
+            self.stats[f"{route.family}:{response.status}"] += 1
+            return response
+
+    def snapshot(self) -> dict[str, Any]:
+        """Returns a JSON-serializable summary of the platform state."""
+        with self._lock:
+            return {
+                "collections": sorted(self.collections),
+                "records": len(self.records),
+                "processes": len(self.processes),
+                "stats": dict(self.stats),
+            }
+
+    @staticmethod
+    def _resolve(method: str, path: str) -> tuple[_Route | None, re.Match[str] | None]:
+        for route in _ROUTES:
+            if route.method != method:
+                continue
+            match = route.pattern.search(path)
+            if match:
+                return route, match
+        return None, None
+
+    def _count(self, key: str) -> None:
+        with self._lock:
+            self.stats[key] += 1
+
+    def _uniform(self, low: float, high: float) -> float:
+        with self._lock:
+            return self._rng.uniform(low, high)
+
+    def _throttle(self, family: str) -> float:
+        if self.config.rate_limit is None:
+            return 0.0
+        bucket = self._buckets.get(family)
+        if bucket is None:
+            bucket = self._buckets[family] = TokenBucket(self.config.rate_limit, self.config.burst)
+        return bucket.try_acquire()
+
+    @staticmethod
+    def _token(request: _MockRequest) -> MockResponse:
+        form = parse_qs(request.body.decode("utf-8"))
+        username = form.get("username", ["mock-user"])[0]
+        return _json(HTTPStatus.OK, {"access_token": _fake_jwt({"sub": username, "azp": "mock"}), "expires_in": 300})
+
+    @staticmethod
+    def _session(request: _MockRequest) -> MockResponse:
+        workspace = request.match["workspace"]
+        return _json(HTTPStatus.CREATED, {"access": _fake_jwt({"workspaces": [workspace], "sub": workspace})})
+
+    @staticmethod
+    def _data_loader(_request: _MockRequest) -> MockResponse:
+        return _json(HTTPStatus.OK, {"status": "uploaded"})
+
+    @staticmethod
+    def _harvest(_request: _MockRequest) -> MockResponse:
+        return _json(HTTPStatus.OK, {"status": "harvest triggered"})
+
+    def _get_collection(self, request: _MockRequest) -> MockResponse:
+        collection = self.collections.get(request.match["id"])
+        if collection is None:
+            return _json(HTTPStatus.NOT_FOUND, {"detail": "collection not found"})
+        return _json(HTTPStatus.OK, collection)
+
+    def _create_collection(self, request: _MockRequest) -> MockResponse:
+        payload = json.loads(request.body)
+        if payload["id"] in self.collections:
+            return _json(HTTPStatus.CONFLICT, {"detail": "collection exists"})
+        self.collections[payload["id"]] = payload
+        return _json(HTTPStatus.CREATED, payload)
+
+    def _register(self, request: _MockRequest) -> MockResponse:
+        payload = json.loads(request.body)
+        if payload["id"] in self.records:
+            return _json(HTTPStatus.CONFLICT, {"detail": "record exists"})
+        catalogue_id = request.query.get("catalogue_id", [None])[0]
+        if catalogue_id not in self.collections:
+            return _json(HTTPStatus.NOT_FOUND, {"detail": f"collection '{catalogue_id}' not found"})
+        self.records[payload["id"]] = payload
+        self.record_collections[payload["id"]] = catalogue_id
+        return _json(HTTPStatus.CREATED, {"id": payload["id"]})
+
+    def _unregister(self, request: _MockRequest) -> MockResponse:
+        if self.records.pop(request.match["id"], None) is None:
+            return _json(HTTPStatus.NOT_FOUND, {"detail": "record not found"})
+        self.record_collections.pop(request.match["id"], None)
+        return _empty(HTTPStatus.NO_CONTENT)
+
+    def _list_items(self, request: _MockRequest) -> MockResponse:
+        collection_id = request.match["id"]
+        if collection_id not in self.collections:
+            return _json(HTTPStatus.NOT_FOUND, {"detail": "collection not found"})
+        page = int(request.query.get("page", ["1"])[0])
+        page_size = int(request.query.get("page_size", ["10"])[0])
+        ids = sorted(i for i, c in self.record_collections.items() if c == collection_id)
+        items = [self.records[i] for i in ids[(page - 1) * page_size : page * page_size]]
+        return _json(
+            HTTPStatus.OK,
+            {
+                "items": items,
+                "total_items": len(ids),
+                "page": page,
+                "total_pages": max(1, -(-len(ids) // page_size)),
+                "page_size": page_size,
+            },
+        )
+
+    def _deploy_process(self, request: _MockRequest) -> MockResponse:
+        process_id = re.search(rb"^\s*-?\s*id:\s*['\"]?([^'\"\s]+)", request.body, flags=re.MULTILINE)
+        self.processes.add(process_id[1].decode("utf-8") if process_id else f"process-{len(self.processes)}")
+        return _json(HTTPStatus.CREATED, {"status": "deployed"})
+
+    def _undeploy_process(self, request: _MockRequest) -> MockResponse:
+        if request.match["id"] not in self.processes:
+            return _json(HTTPStatus.NOT_FOUND, {"detail": "process not found"})
+        self.processes.discard(request.match["id"])
+        return _empty(HTTPStatus.NO_CONTENT)
+
+    @staticmethod
+    def _cwl(request: _MockRequest) -> MockResponse:
+        document = _CWL_TEMPLATE.format(name=request.match["name"]).encode("utf-8")
+        return MockResponse(HTTPStatus.OK, {"Content-Type": "application/cwl+yaml"}, document)
+
+
+class RequestRecorder:
+    """Collects the requests sent through a `MockPlatformAdapter`.
+
+    Credentials (the `Authorization` header and password form fields) are redacted before recording.
+
+    """
+
+    def __init__(self) -> None:
+        """Initializes an empty recorder."""
+        self.requests: list[dict[str, Any]] = []
+        self._lock = threading.Lock()
+
+    def record(self, request: PreparedRequest, status: int) -> None:
+        """Stores a redacted copy of the request along with the mock status code.
+
+        Args:
+            request: The prepared request.
+            status: The status code returned by the mock platform.
+
+        """
+        headers = {k: (_REDACTED if k.lower() == "authorization" else str(v)) for k, v in request.headers.items()}
+        body = request.body if isinstance(request.body, bytes | str) else None
+        entry = {
+            "method": request.method,
+            "url": request.url,
+            "headers": headers,
+            "body": self._redact_body(body, headers.get("Content-Type", "")),
+            "mock_status": status,
+        }
+        with self._lock:
+            self.requests.append(entry)
+
+    def dump(self, path: Path) -> None:
+        """Writes recorded requests to a JSON lines file.
+
+        Args:
+            path: Output file path.
+
+        """
+        with self._lock, path.open("w", encoding="utf-8") as fp:
+            fp.writelines(json.dumps(entry) + "\n" for entry in self.requests)
+
+    @staticmethod
+    def _redact_body(body: bytes | str | None, content_type: str) -> Any:
+        if body is None:
+            return None
+        text = body.decode("utf-8", errors="replace") if isinstance(body, bytes) else body
+        if "application/json" in content_type:
+            try:
+                return json.loads(text)
+            except ValueError:
+                return text
+        if "application/x-www-form-urlencoded" in content_type:
+            form = {k: v[0] for k, v in parse_qs(text).items()}
+            return {k: (_REDACTED if k in _SENSITIVE_FORM_FIELDS else v) for k, v in form.items()}
+        return {"bytes": len(text.encode("utf-8"))}
+
+
+class MockPlatformAdapter(BaseAdapter):
+    """`requests` transport adapter answering every request from an in-process `MockPlatform`.
+
+    Mount it on a session to run the CD pipeline without any network traffic (dry-run mode).
+
+    """
+
+    def __init__(self, platform: MockPlatform, recorder: RequestRecorder | None = None) -> None:
+        """Initializes the adapter.
+
+        Args:
+            platform: The mock platform answering requests.
+            recorder: Optional recorder receiving every request sent through the adapter.
+
+        """
+        super().__init__()
+        self.platform = platform
+        self.recorder = recorder
+
+    def send(  # type: ignore[override]
+        self,
+        request: PreparedRequest,
+        stream: bool = False,  # noqa: ARG002, FBT001, FBT002
+        timeout: float | tuple[float, float] | None = None,  # noqa: ARG002
+        verify: bool | str = True,  # noqa: ARG002, FBT001, FBT002
+        cert: Any = None,  # noqa: ARG002
+        proxies: dict[str, str] | None = None,  # noqa: ARG002
+    ) -> Response:
+        """Answers the request from the mock platform."""
+        body = request.body.encode("utf-8") if isinstance(request.body, str) else request.body
+        result = self.platform.handle(request.method or "GET", request.url or "/", body, simulate_latency=False)
+        if self.recorder is not None:
+            self.recorder.record(request, result.status)
+
+        response = Response()
+        response.status_code = result.status
+        response.headers = CaseInsensitiveDict(result.headers)
+        response._content = result.body  # noqa: SLF001
+        response.url = request.url or ""
+        response.request = request
+        response.reason = HTTPStatus(result.status).phrase
+        response.encoding = "utf-8"
+        return response
+
+    def close(self) -> None:
+        """Nothing to release."""
+
+
+class _Handler(BaseHTTPRequestHandler):
+    server: _MockHTTPServer
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+
+    def do_GET(self) -> None:
+        if self.path.startswith("/_mock/stats"):
+            self._send(_json(HTTPStatus.OK, self.server.platform.snapshot()))
+            return
+        self._dispatch()
+
+    def do_POST(self) -> None:
+        self._dispatch()
+
+    def do_DELETE(self) -> None:
+        self._dispatch()
+
+    def _dispatch(self) -> None:
+        length = int(self.headers.get("Content-Length") or 0)
+        body = self.rfile.read(length) if length else b""
+        self._send(self.server.platform.handle(self.command, self.path, body))
+
+    def _send(self, response: MockResponse) -> None:
+        self.send_response(response.status)
+        for key, value in response.headers.items():
+            self.send_header(key, value)
+        self.send_header("Content-Length", str(len(response.body)))
+        self.end_headers()
+        self.wfile.write(response.body)
+
+    @staticmethod
+    def log_message(format: str, *args: Any) -> None:  # noqa: A002
+        _logger.debug(format, *args)
+
+
+class _MockHTTPServer(ThreadingHTTPServer):
+    daemon_threads = True
+    request_queue_size = 128
+
+    def __init__(self, address: tuple[str, int], platform: MockPlatform) -> None:
+        super().__init__(address, _Handler)
+        self.platform = platform
+
+
+class MockPlatformServer:
+    """HTTP server exposing a `MockPlatform` on a background thread."""
+
+    def __init__(self, config: MockPlatformConfig | None = None, host: str = "127.0.0.1", port: int = 0) -> None:
+        """Binds the server socket.
+
+        Args:
+            config: Behaviour configuration of the mock platform.
+            host: Interface to bind to.
+            port: Port to bind to. `0` picks a free port.
+
+        """
+        self.platform = MockPlatform(config)
+        self._server = _MockHTTPServer((host, port), self.platform)
+        self._thread: threading.Thread | None = None
+
+    @property
+    def base_url(self) -> str:
+        """Returns the base URL the server listens on."""
+        host, port = self._server.server_address[:2]
+        return f"http://{host!s}:{port}"
+
+    def start(self) -> None:
+        """Starts serving on a daemon thread."""
+        self._thread = threading.Thread(target=self._server.serve_forever, name="mock-platform", daemon=True)
+        self._thread.start()
+
+    def serve_forever(self) -> None:
+        """Serves on the current thread until interrupted."""
+        self._server.serve_forever()
+
+    def stop(self) -> None:
+        """Stops the server and releases the socket."""
+        self._server.shutdown()
+        self._server.server_close()
+        if self._thread is not None:
+            self._thread.join()
+
+    def __enter__(self) -> Self:
+        """Starts the server."""
+        self.start()
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        """Stops the server."""
+        self.stop()
+
+
+def mock_environment(base_url: str) -> dict[str, str]:
+    """Builds the environment variables pointing the CD scripts at a mock platform.
+
+    Args:
+        base_url: Base URL of the mock platform.
+
+    Returns:
+        Environment variables understood by `wfc catalogue register`.
+
+    """
+    return {
+        "WF_CATALOGUE_API_URL": f"{base_url}/api/wf-catalogue/v1.0",
+        "EODH__BASE_URL": base_url,
+        "EODH__REALM": "eodh",
+        "EODH__USERNAME": "mock-user",
+        "EODH__PASSWORD": "mock-password",
+        "EODH__CLIENT_ID": "mock-client",
+        "EODH__WORKSPACE_SERVICES_ENDPOINT_PATH": "/api/workspaces",
+        "EODH__ADES_ENDPOINT_PATH": "/api/ades",
+        "EODH__WORKSPACE_NAME": "mock-workspace",
+    }
+
+
+DRY_RUN_BASE_URL = "https://dry-run.invalid"
+"""Base URL used by the in-process mock platform in dry-run mode."""
+
+
+def enable_dry_run(session: Session, platform: MockPlatform | None = None) -> RequestRecorder:
+    """Routes all requests of a session to an in-process mock platform and records them.
+
+    Platform settings missing from the environment are filled in with mock values.
+
+    Args:
+        session: The session to route through the mock platform.
+        platform: The mock platform. Defaults to an empty, instant one.
+
+    Returns:
+        The recorder collecting every request.
+
+    """
+    for key, value in mock_environment(DRY_RUN_BASE_URL).items():
+        os.environ.setdefault(key, value)
+    current_settings.cache_clear()
+    recorder = RequestRecorder()
+    adapter = MockPlatformAdapter(platform or MockPlatform(), recorder)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return recorder
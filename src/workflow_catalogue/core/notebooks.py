@@ -0,0 +1,536 @@
+"""Inspection of the notebook and environment files linked from notebook records.
+
+Notebook records declare the Jupyter kernel a notebook needs on their application link (`jupyter:kernel` with `name`,
+`pythonVersion` and `envFile`, or `properties.jupyter_kernel_info`), but nothing checks that the linked `.ipynb`
+agrees. `inspect_notebooks` does, for a whole catalogue:
+
+1. every linked notebook and environment file is downloaded once, concurrently, into an `ArtifactCache` on disk.
+   Downloads are streamed in chunks, so no file is ever held in memory,
+2. `read_notebook_metadata` reads the top-level `metadata` of each notebook with a streaming scanner that skips
+   `cells` without decoding them, so notebooks with hundreds of MB of outputs cost one chunk of memory,
+3. the kernel name (`metadata.kernelspec.name`) and Python `major.minor` version (`metadata.language_info.version`)
+   are compared with the record, and a Python pin in the environment file (`python=3.11`) with the record version.
+
+Memory use is bounded by the number of workers times the chunk size plus the small per-notebook results.
+
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import re
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path, PurePosixPath
+from typing import IO, TYPE_CHECKING, Any
+from urllib.parse import urlparse
+
+import requests
+
+from workflow_catalogue.core.record_view import RecordView
+from workflow_catalogue.utils.serialization import loads
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+CHUNK_SIZE = 64 * 1024
+"""Bytes read or downloaded at a time."""
+
+DEFAULT_WORKERS = 8
+"""Default number of files downloaded in parallel."""
+
+FETCH_TIMEOUT = 30
+"""Timeout of a download in seconds."""
+
+MAX_ENV_FILE_SIZE = 1024 * 1024
+"""Environment files larger than this are not scanned for a Python pin."""
+
+_NOTEBOOK_KEYS = frozenset({"metadata", "nbformat", "nbformat_minor"})
+# A run of complete strings and non-bracket bytes, a bracket, or the opening quote of a string continuing past the
+# buffer. Matching whole runs keeps the Python loop to one iteration per bracket instead of one per string.
+_TOKEN = re.compile(rb'(?:"(?:[^"\\]++|\\.)*+"|[^"\[\]{}]++)++|[\[\]{}]|"', re.DOTALL)
+_SCALAR_END = re.compile(rb"[,\]}\s]")
+_WHITESPACE = b" \t\r\n"
+_PYTHON_PIN = re.compile(r"^\s*-?\s*python\s*(?:==?|-)\s*(\d+\.\d+)", re.IGNORECASE | re.MULTILINE)
+
+
+class NotebookError(ValueError):
+    """A notebook cannot be read."""
+
+
+def default_cache_dir() -> Path:
+    """Returns the default artifact cache directory in the temporary directory."""
+    return Path(tempfile.gettempdir()) / "wfc-artifacts"
+
+
+class _Scanner:
+    """Reads JSON values from a binary stream chunk by chunk, decoding only the values asked for."""
+
+    def __init__(self, fp: IO[bytes], chunk_size: int) -> None:
+        """Initializes the scanner.
+
+        Args:
+            fp: The stream.
+            chunk_size: Bytes read at a time.
+
+        """
+        self.fp = fp
+        self.chunk_size = chunk_size
+        self.buf = b""
+        self.pos = 0
+        self.mark = 0
+        self.captured: list[bytes] | None = None
+
+    def _fill(self) -> None:
+        chunk = self.fp.read(self.chunk_size)
+        if not chunk:
+            msg = "Unexpected end of notebook"
+            raise NotebookError(msg)
+        if self.captured is not None:
+            self.captured.append(self.buf[self.mark : self.pos])
+        self.buf = self.buf[self.pos :] + chunk
+        self.pos = self.mark = 0
+
+    def next_token(self) -> bytes:
+        """Skips whitespace and returns the next byte without consuming it."""
+        while True:
+            while self.pos < len(self.buf) and self.buf[self.pos] in _WHITESPACE:
+                self.pos += 1
+            if self.pos < len(self.buf):
+                return self.buf[self.pos : self.pos + 1]
+            self._fill()
+
+    def expect(self, token: bytes) -> None:
+        """Consumes `token` after optional whitespace.
+
+        Raises:
+            NotebookError: If the next byte is not `token`.
+
+        """
+        if self.next_token() != token:
+            msg = f"Expected {token.decode()!r} in notebook"
+            raise NotebookError(msg)
+        self.pos += 1
+
+    def _search(self, pattern: re.Pattern[bytes]) -> int:
+        while (match := pattern.search(self.buf, self.pos)) is None:
+            self.pos = len(self.buf)
+            self._fill()
+        return match.start()
+
+    def _skip_string(self) -> None:
+        # `bytes.find` is much faster than a regular expression over the long strings of cell outputs. The position
+        # of the next quote is kept between escapes so that strings full of `\\n` are scanned once.
+        self.pos += 1
+        quote: int | None = None
+        while True:
+            if quote is None or 0 <= quote < self.pos:
+                quote = self.buf.find(b'"', self.pos)
+            backslash = self.buf.find(b"\\", self.pos, len(self.buf) if quote < 0 else quote)
+            if backslash >= 0 and backslash + 1 < len(self.buf):
+                self.pos = backslash + 2
+            elif backslash >= 0:
+                self.pos = backslash
+                self._fill()
+                quote = None
+            elif quote >= 0:
+                self.pos = quote + 1
+                return
+            else:
+                self.pos = len(self.buf)
+                self._fill()
+                quote = None
+
+    def skip_value(self) -> None:
+        """Consumes the next value."""
+        token = self.next_token()
+        if token == b'"':
+            self._skip_string()
+            return
+        if token not in {b"{", b"["}:
+            self.pos = self._search(_SCALAR_END)
+            return
+        depth = 0
+        while True:
+            match = _TOKEN.search(self.buf, self.pos)
+            if match is None:
+                self.pos = len(self.buf)
+                self._fill()
+                continue
+            token = match.group()
+            if token == b'"':
+                self.pos = match.start()
+                self._skip_string()
+                continue
+            self.pos = match.end()
+            if token not in {b"{", b"[", b"}", b"]"}:
+                continue
+            depth += 1 if token in {b"{", b"["} else -1
+            if depth == 0:
+                return
+
+    def read_value(self) -> Any:
+        """Consumes and decodes the next value."""
+        self.next_token()
+        self.captured, self.mark = [], self.pos
+        try:
+            self.skip_value()
+            raw = b"".join([*self.captured, self.buf[self.mark : self.pos]])
+        finally:
+            self.captured = None
+        return json.loads(raw)
+
+
+def read_notebook_metadata(fp: IO[bytes], chunk_size: int = CHUNK_SIZE) -> dict[str, Any]:
+    """Reads the top-level `metadata`, `nbformat` and `nbformat_minor` of a notebook without decoding its cells.
+
+    Args:
+        fp: The notebook, opened in binary mode.
+        chunk_size: Bytes read at a time.
+
+    Returns:
+        The keys found.
+
+    Raises:
+        NotebookError: If the notebook is not a JSON object.
+
+    """
+    scanner = _Scanner(fp, chunk_size)
+    scanner.expect(b"{")
+    found: dict[str, Any] = {}
+    while (token := scanner.next_token()) != b"}":
+        if token == b",":
+            scanner.pos += 1
+            continue
+        key = scanner.read_value()
+        scanner.expect(b":")
+        if key in _NOTEBOOK_KEYS:
+            found[key] = scanner.read_value()
+            if len(found) == len(_NOTEBOOK_KEYS):
+                break
+        else:
+            scanner.skip_value()
+    return found
+
+
+def _major_minor(version: Any) -> str | None:
+    """Returns `"3.11"` for `"3.11.4"` or `"3.11"` and `None` when there is no version."""
+    parts = str(version).split(".") if version is not None else []
+    try:
+        return f"{int(parts[0])}.{int(parts[1])}"
+    except (IndexError, ValueError):
+        return None
+
+
+def _matches(version: str | None, record_version: float) -> bool:
+    # Records store the version as a number, which turns "3.10" into 3.1: normalise both the same way.
+    return version is not None and f"{float(version):g}" == f"{record_version:g}"
+
+
+@dataclass(frozen=True, slots=True)
+class NotebookMetadata:
+    """The parts of a notebook's metadata the inspection compares with the record."""
+
+    kernel_name: str | None
+    python_version: str | None
+    nbformat: int | None
+
+    @classmethod
+    def from_file(cls, path: Path, chunk_size: int = CHUNK_SIZE) -> NotebookMetadata:
+        """Reads the metadata of a notebook file.
+
+        Args:
+            path: The notebook.
+            chunk_size: Bytes read at a time.
+
+        Returns:
+            The metadata.
+
+        Raises:
+            NotebookError: If the notebook is not valid JSON.
+
+        """
+        with path.open("rb") as fp:
+            try:
+                found = read_notebook_metadata(fp, chunk_size)
+            except ValueError as e:
+                msg = f"Invalid notebook: {e}"
+                raise NotebookError(msg) from e
+        metadata: dict[str, Any] = found["metadata"] if isinstance(found.get("metadata"), dict) else {}
+        kernelspec = metadata.get("kernelspec") or {}
+        language_info = metadata.get("language_info") or {}
+        return cls(
+            kernel_name=kernelspec.get("name"),
+            python_version=_major_minor(language_info.get("version")),
+            nbformat=found.get("nbformat"),
+        )
+
+
+def env_python_version(path: Path) -> str | None:
+    """Finds the Python version pinned by an environment file (`python=3.11` in a conda file, `python-3.11`, ...).
+
+    Args:
+        path: The environment file.
+
+    Returns:
+        The `major.minor` version, `None` when the file pins none or is larger than `MAX_ENV_FILE_SIZE`.
+
+    """
+    if path.stat().st_size > MAX_ENV_FILE_SIZE:
+        return None
+    match = _PYTHON_PIN.search(path.read_text(encoding="utf-8", errors="replace"))
+    return _major_minor(match.group(1)) if match else None
+
+
+class ArtifactCache:
+    """On-disk cache of downloaded files keyed by URL. Local paths and `file://` URLs are used in place."""
+
+    def __init__(
+        self,
+        cache_dir: Path | None = None,
+        session: requests.Session | None = None,
+        *,
+        refresh: bool = False,
+    ) -> None:
+        """Initializes the cache.
+
+        Args:
+            cache_dir: Directory holding the downloads. Defaults to `default_cache_dir()`.
+            session: Session used for downloads.
+            refresh: Whether to download files again even when they are cached.
+
+        """
+        self.cache_dir = cache_dir or default_cache_dir()
+        self.session = session or requests.Session()
+        self.refresh = refresh
+        self.hits = 0
+        self.downloads = 0
+        self.downloaded_bytes = 0
+        self._lock = threading.Lock()
+
+    def path(self, url: str) -> Path:
+        """Returns where the file of a URL is cached."""
+        suffix = PurePosixPath(urlparse(url).path).suffix
+        return self.cache_dir / f"{hashlib.sha256(url.encode()).hexdigest()[:32]}{suffix}"
+
+    def fetch(self, url: str) -> Path:
+        """Returns the local path of a file, downloading it unless it is cached.
+
+        Args:
+            url: The file URL or local path.
+
+        Returns:
+            The local path.
+
+        Raises:
+            requests.RequestException: If the download fails.
+            OSError: If the file cannot be written.
+
+        """
+        parsed = urlparse(url)
+        if parsed.scheme not in {"http", "https"}:
+            local = Path(parsed.path if parsed.scheme == "file" else url)
+            if not local.is_file():
+                msg = f"No such file: {local}"
+                raise FileNotFoundError(msg)
+            return local
+        target = self.path(url)
+        if target.exists() and not self.refresh:
+            with self._lock:
+                self.hits += 1
+            return target
+        target.parent.mkdir(parents=True, exist_ok=True)
+        size = 0
+        with self.session.get(url, stream=True, timeout=FETCH_TIMEOUT) as resp:
+            resp.raise_for_status()
+            fd, tmp_name = tempfile.mkstemp(dir=target.parent, suffix=".part")
+            try:
+                with os.fdopen(fd, "wb") as fp:
+                    for chunk in resp.iter_content(CHUNK_SIZE):
+                        fp.write(chunk)
+                        size += len(chunk)
+                Path(tmp_name).replace(target)
+            except BaseException:
+                Path(tmp_name).unlink(missing_ok=True)
+                raise
+        with self._lock:
+            self.downloads += 1
+            self.downloaded_bytes += size
+        return target
+
+
+@dataclass(frozen=True, slots=True)
+class KernelExpectation:
+    """A notebook linked from a record with the kernel the record declares for it."""
+
+    record_id: str
+    href: str
+    kernel_name: str | None = None
+    python_version: float | None = None
+    env_file: str | None = None
+
+
+@dataclass(slots=True)
+class NotebookInspection:
+    """Outcome of inspecting one linked notebook."""
+
+    expectation: KernelExpectation
+    metadata: NotebookMetadata | None = None
+    problems: list[str] = field(default_factory=list)
+
+    @property
+    def ok(self) -> bool:
+        """Returns whether the notebook matches the record."""
+        return not self.problems
+
+
+def _record_version(value: Any) -> float | None:
+    try:
+        return float(value) if value is not None else None
+    except (TypeError, ValueError):
+        return None
+
+
+def _is_notebook_link(link: Any) -> bool:
+    return (
+        isinstance(link, dict)
+        and link.get("rel") == "application"
+        and isinstance(link.get("href"), str)
+        and ("ipynb" in (link.get("type") or "") or link["href"].endswith(".ipynb"))
+    )
+
+
+def expected_kernels(document: dict[str, Any]) -> list[KernelExpectation]:
+    """Lists the notebooks linked from a notebook record with their declared kernel.
+
+    The `jupyter:kernel` of the link takes precedence over `properties.jupyter_kernel_info`.
+
+    Args:
+        document: The record document.
+
+    Returns:
+        One expectation per notebook link.
+
+    """
+    properties = document.get("properties") or {}
+    info = properties.get("jupyter_kernel_info")
+    if not isinstance(info, dict):
+        info = {}
+    expectations = []
+    for link in document.get("links") or []:
+        if not _is_notebook_link(link):
+            continue
+        kernel = link.get("jupyter:kernel")
+        if not isinstance(kernel, dict):
+            kernel = {}
+        expectations.append(
+            KernelExpectation(
+                record_id=str(document.get("id")),
+                href=link["href"],
+                kernel_name=kernel.get("name", info.get("name")),
+                python_version=_record_version(kernel.get("pythonVersion", info.get("python_version"))),
+                env_file=kernel.get("envFile", info.get("env_file")),
+            )
+        )
+    return expectations
+
+
+def inspect_notebook(
+    expectation: KernelExpectation, notebook: Path, env_file: Path | None = None
+) -> NotebookInspection:
+    """Compares a downloaded notebook and environment file with the kernel declared by the record.
+
+    Args:
+        expectation: The declared kernel.
+        notebook: The notebook file.
+        env_file: The environment file, when the record links one.
+
+    Returns:
+        The inspection.
+
+    """
+    inspection = NotebookInspection(expectation)
+    try:
+        metadata = inspection.metadata = NotebookMetadata.from_file(notebook)
+    except NotebookError as e:
+        inspection.problems.append(str(e))
+        return inspection
+    if expectation.kernel_name is not None and metadata.kernel_name != expectation.kernel_name:
+        inspection.problems.append(
+            f"kernel '{metadata.kernel_name}' does not match the record kernel '{expectation.kernel_name}'"
+        )
+    if expectation.python_version is not None and not _matches(metadata.python_version, expectation.python_version):
+        inspection.problems.append(
+            f"Python {metadata.python_version} does not match the record version {expectation.python_version}"
+        )
+    if env_file is not None:
+        pinned = env_python_version(env_file)
+        if (
+            pinned is not None
+            and expectation.python_version is not None
+            and not _matches(pinned, expectation.python_version)
+        ):
+            inspection.problems.append(
+                f"environment pins Python {pinned}, the record declares {expectation.python_version}"
+            )
+    return inspection
+
+
+def _load_record(file_path: Path) -> list[KernelExpectation | NotebookInspection]:
+    """Returns the expectations of a notebook record, or a failed inspection when the file cannot be loaded."""
+    try:
+        document = loads(file_path.read_bytes())
+        is_notebook = RecordView.from_document(document).type == "notebook"
+    except (OSError, TypeError, ValueError) as e:
+        expectation = KernelExpectation(record_id=file_path.as_posix(), href="")
+        return [NotebookInspection(expectation, problems=[f"could not load record: {e}"])]
+    return list(expected_kernels(document)) if is_notebook else []
+
+
+def inspect_notebooks(
+    files: Iterable[Path], cache: ArtifactCache | None = None, workers: int = DEFAULT_WORKERS
+) -> list[NotebookInspection]:
+    """Inspects the notebooks linked from a set of record files. Workflows and `catalog.json` files are skipped.
+
+    Args:
+        files: Record files.
+        cache: Cache downloads go to. A cache in `default_cache_dir()` is used when `None`.
+        workers: Number of files downloaded in parallel.
+
+    Returns:
+        One inspection per notebook link, in file order. A record file that cannot be loaded gets a failed inspection
+        with the file path as record ID and no link.
+
+    """
+    if cache is None:
+        cache = ArtifactCache()
+    entries = [entry for file_path in files if file_path.name != "catalog.json" for entry in _load_record(file_path)]
+    expectations = [e for e in entries if isinstance(e, KernelExpectation)]
+
+    urls = list(dict.fromkeys(url for e in expectations for url in (e.href, e.env_file) if url))
+    fetched: dict[str, Path | str] = {}
+
+    def fetch(url: str) -> None:
+        try:
+            fetched[url] = cache.fetch(url)
+        except (requests.RequestException, OSError) as e:
+            fetched[url] = f"could not fetch {url}: {e}"
+
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        list(pool.map(fetch, urls))
+
+        def inspect(expectation: KernelExpectation | NotebookInspection) -> NotebookInspection:
+            if isinstance(expectation, NotebookInspection):
+                return expectation
+            notebook = fetched[expectation.href]
+            env_file = fetched.get(expectation.env_file) if expectation.env_file else None
+            failures = [f for f in (notebook, env_file) if isinstance(f, str)]
+            if failures:
+                return NotebookInspection(expectation, problems=failures)
+            return inspect_notebook(expectation, notebook, env_file)  # type: ignore[arg-type]
+
+        return list(pool.map(inspect, entries))
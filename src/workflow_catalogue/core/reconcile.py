@@ -0,0 +1,236 @@
+"""Reconciliation of the local catalogue against the records registered in wf-catalogue-service.
+
+CD normally learns about deleted records from the files removed in the last commit, which misses records orphaned by
+skipped runs or force-pushes. Reconciliation instead compares the full remote listing of a collection with the local
+records by ID and content hash and produces the sets of records to delete and to (re-)register. Records are deleted
+by ID alone, so a record moved to another collection is only re-registered there, never deleted.
+
+Remote pages are fetched in parallel: the first page reports the number of pages and the remaining ones are requested
+with a bounded number in flight. Each remote item is reduced to its ID and content hash as soon as its page arrives, so
+memory stays bounded by the local index plus a few pages, however large the remote collection is.
+
+"""
+
+from __future__ import annotations
+
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from pathlib import Path  # noqa: TC003
+from typing import TYPE_CHECKING, Any, NamedTuple
+
+from pydantic import BaseModel, Field
+
+from workflow_catalogue.core.record_view import RecordView
+from workflow_catalogue.utils.logging import get_logger
+from workflow_catalogue.utils.serialization import content_hash
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+
+    from workflow_catalogue.client import PlatformClient
+
+_logger = get_logger(__name__)
+
+DEFAULT_PAGE_SIZE = 100
+"""Default number of remote records requested per page."""
+
+DEFAULT_PAGE_WORKERS = 4
+"""Default number of remote pages fetched in parallel."""
+
+
+class LocalEntry(NamedTuple):
+    """A local record as seen by reconciliation."""
+
+    content_hash: str
+    path: Path
+
+
+LocalIndex = dict[str, dict[str, LocalEntry]]
+"""Local records by collection ID and record ID."""
+
+
+class ReconcilePlan(BaseModel):
+    """Differences between the local and the remote records of a collection."""
+
+    collection_id: str
+    upsert: list[Path] = Field(default_factory=list, description="Local records missing or outdated remotely")
+    delete: list[str] = Field(default_factory=list, description="IDs of remote records without a local file")
+    unchanged: int = Field(default=0, description="Number of records identical on both sides")
+    remote_total: int = Field(default=0, description="Number of records listed remotely")
+
+    @property
+    def in_sync(self) -> bool:
+        """Returns whether nothing needs to change."""
+        return not self.upsert and not self.delete
+
+
+def build_local_index(files: Iterable[Path]) -> LocalIndex:
+    """Indexes local record files by collection and ID.
+
+    Args:
+        files: Record files. `catalog.json` files, records outside a collection directory and files that cannot be
+            read as records are skipped.
+
+    Returns:
+        The local index.
+
+    """
+    index: LocalIndex = {}
+    for path in sorted(f for f in files if f.name != "catalog.json"):
+        try:
+            view = RecordView.from_file(path)
+        except (OSError, TypeError, ValueError) as exc:
+            _logger.warning("SKIP: %s cannot be read as a record: %s", path, exc)
+            continue
+        if view.collection is None:
+            _logger.warning("SKIP: %s is not inside a collection directory", path)
+            continue
+        index.setdefault(view.collection, {})[view.id] = LocalEntry(view.content_hash, path)
+    return index
+
+
+def _fetch_page(client: PlatformClient, collection_id: str, token: str, page: int, page_size: int) -> dict[str, Any]:
+    resp = client.list_items(collection_id, token, page=page, page_size=page_size)
+    resp.raise_for_status()
+    payload: dict[str, Any] = resp.json()
+    return payload
+
+
+def iter_remote_items(
+    client: PlatformClient,
+    collection_id: str,
+    token: str,
+    *,
+    page_size: int = DEFAULT_PAGE_SIZE,
+    workers: int = DEFAULT_PAGE_WORKERS,
+) -> Iterator[dict[str, Any]]:
+    """Iterates over the records registered in a collection, fetching pages in parallel.
+
+    Args:
+        client: The platform client.
+        collection_id: The collection ID.
+        token: Keycloak access token.
+        page_size: Number of records requested per page.
+        workers: Maximum number of pages in flight.
+
+    Yields:
+        Remote records. Pages after the first are yielded in completion order.
+
+    Raises:
+        requests.HTTPError: If a page cannot be fetched.
+
+    """
+    first = _fetch_page(client, collection_id, token, 1, page_size)
+    yield from first.get("items", [])
+    pages = iter(range(2, int(first.get("total_pages", 1)) + 1))
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        in_flight: set[Future[dict[str, Any]]] = set()
+
+        def fill() -> None:
+            while len(in_flight) < workers:
+                page = next(pages, None)
+                if page is None:
+                    return
+                in_flight.add(executor.submit(_fetch_page, client, collection_id, token, page, page_size))
+
+        fill()
+        while in_flight:
+            done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+            for future in done:
+                in_flight.discard(future)
+                yield from future.result().get("items", [])
+            fill()
+
+
+def reconcile_collection(
+    client: PlatformClient,
+    collection_id: str,
+    local: dict[str, LocalEntry],
+    token: str,
+    *,
+    page_size: int = DEFAULT_PAGE_SIZE,
+    workers: int = DEFAULT_PAGE_WORKERS,
+) -> ReconcilePlan:
+    """Compares the local records of a collection with the remote listing.
+
+    Args:
+        client: The platform client.
+        collection_id: The collection ID.
+        local: Local records of the collection by ID.
+        token: Keycloak access token.
+        page_size: Number of records requested per page.
+        workers: Maximum number of pages fetched in parallel.
+
+    Returns:
+        The reconciliation plan. A collection that does not exist remotely has all its local records to upsert.
+
+    Raises:
+        requests.HTTPError: If the remote listing cannot be fetched.
+
+    """
+    plan = ReconcilePlan(collection_id=collection_id)
+    if not client.get_collection(collection_id, token).ok:
+        _logger.info("Collection '%s' does not exist remotely", collection_id)
+        plan.upsert = sorted(entry.path for entry in local.values())
+        return plan
+
+    seen: set[str] = set()
+    for item in iter_remote_items(client, collection_id, token, page_size=page_size, workers=workers):
+        plan.remote_total += 1
+        record_id = str(item.get("id"))
+        entry = local.get(record_id)
+        if entry is None:
+            plan.delete.append(record_id)
+            continue
+        seen.add(record_id)
+        if content_hash(item) == entry.content_hash:
+            plan.unchanged += 1
+        else:
+            plan.upsert.append(entry.path)
+
+    plan.upsert.extend(entry.path for record_id, entry in local.items() if record_id not in seen)
+    plan.upsert.sort()
+    plan.delete.sort()
+    return plan
+
+
+def reconcile_collections(
+    client: PlatformClient,
+    index: LocalIndex,
+    token: str,
+    *,
+    page_size: int = DEFAULT_PAGE_SIZE,
+    workers: int = DEFAULT_PAGE_WORKERS,
+) -> list[ReconcilePlan]:
+    """Compares every collection of the local index with its remote listing.
+
+    A record moved between collections is listed remotely in its old collection and upserted into its new one. It is
+    not deleted from the old collection: deleting by ID would remove the record just registered in the new one.
+
+    Args:
+        client: The platform client.
+        index: The local index.
+        token: Keycloak access token.
+        page_size: Number of records requested per page.
+        workers: Maximum number of pages fetched in parallel per collection.
+
+    Returns:
+        The reconciliation plans, ordered by collection ID.
+
+    Raises:
+        requests.HTTPError: If a remote listing cannot be fetched.
+
+    """
+    plans = [
+        reconcile_collection(client, collection_id, local, token, page_size=page_size, workers=workers)
+        for collection_id, local in sorted(index.items())
+    ]
+    upserted: set[str] = set()
+    for plan in plans:
+        paths = set(plan.upsert)
+        upserted.update(record_id for record_id, entry in index[plan.collection_id].items() if entry.path in paths)
+    for plan in plans:
+        if moved := [record_id for record_id in plan.delete if record_id in upserted]:
+            _logger.info("[%s] %d record(s) moved to other collections: %s", plan.collection_id, len(moved), moved)
+            plan.delete = [record_id for record_id in plan.delete if record_id not in upserted]
+    return plans
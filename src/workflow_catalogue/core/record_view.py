@@ -0,0 +1,136 @@
+"""Lightweight read-only views of catalogue records.
+
+Indexing, searching, diffing and planning only need a handful of fields of each record. A `RecordView` holds just
+those, is built straight from the raw JSON document without schema validation, and uses `__slots__` so a loaded
+catalogue of views costs a fraction of the memory and load time of validated `EodhWorkflowRecord`/`EodhNotebookRecord`
+models.
+
+Views do not validate: run `wfc catalogue validate` (or use the pydantic models) where correctness matters.
+
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+from workflow_catalogue.utils.serialization import content_hash, loads
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+    from pathlib import Path
+
+CATALOGUE_ROOT_NAME = "catalogue"
+"""Name of the directory holding the collections."""
+
+
+def collection_id_from_path(file_path: Path) -> str | None:
+    """Extracts the collection ID from a record path: `catalogue/{collection-id}/workflows/foo.json`.
+
+    Args:
+        file_path: Path to the record file.
+
+    Returns:
+        The collection ID or `None` if the file is not inside a `catalogue` directory.
+
+    """
+    parts = file_path.parts
+    try:
+        return parts[parts.index(CATALOGUE_ROOT_NAME) + 1]
+    except (ValueError, IndexError):
+        return None
+
+
+def _strings(value: Any) -> tuple[str, ...]:
+    return tuple(str(item) for item in value) if isinstance(value, list) else ()
+
+
+@dataclass(frozen=True, slots=True)
+class RecordView:
+    """Immutable summary of a catalogue record."""
+
+    id: str
+    type: str | None
+    collection: str | None
+    title: str | None
+    keywords: tuple[str, ...]
+    applicable_collections: tuple[str, ...]
+    cwl_hrefs: tuple[str, ...]
+    content_hash: str
+
+    @property
+    def is_workflow(self) -> bool:
+        """Returns whether the record describes a workflow."""
+        return self.type == "workflow"
+
+    @classmethod
+    def from_document(cls, document: Any, collection: str | None = None) -> RecordView:
+        """Builds a view from a parsed record document.
+
+        Args:
+            document: The parsed record document, any JSON value.
+            collection: ID of the collection the record belongs to.
+
+        Returns:
+            The view.
+
+        Raises:
+            TypeError: If the document is not a JSON object.
+            ValueError: If the document has no string `id`.
+
+        """
+        if not isinstance(document, dict):
+            msg = f"Record must be a JSON object, got {type(document).__name__}"
+            raise TypeError(msg)
+        if not isinstance(document.get("id"), str):
+            msg = "Record must have a string 'id'"
+            raise ValueError(msg)  # noqa: TRY004
+        properties = document.get("properties")
+        if not isinstance(properties, dict):
+            properties = {}
+        links = document.get("links")
+        return cls(
+            id=document["id"],
+            type=properties.get("type"),
+            collection=collection,
+            title=properties.get("title"),
+            keywords=_strings(properties.get("keywords")),
+            applicable_collections=_strings(properties.get("applicableCollections")),
+            cwl_hrefs=tuple(
+                str(link["href"])
+                for link in (links if isinstance(links, list) else [])
+                if isinstance(link, dict)
+                and link.get("rel") == "application"
+                and "cwl" in (link.get("type") or "")
+                and "href" in link
+            ),
+            content_hash=content_hash(document),
+        )
+
+    @classmethod
+    def from_file(cls, file_path: Path) -> RecordView:
+        """Builds a view from a record file. The collection is derived from the file path.
+
+        Args:
+            file_path: Path to the record file.
+
+        Returns:
+            The view.
+
+        """
+        return cls.from_document(loads(file_path.read_bytes()), collection_id_from_path(file_path))
+
+
+def load_record_views(files: Iterable[Path]) -> Iterator[RecordView]:
+    """Builds views of record files, skipping `catalog.json` files.
+
+    Args:
+        files: Record files.
+
+    Yields:
+        Record views in file order.
+
+    """
+    for file_path in files:
+        if file_path.name != "catalog.json":
+            yield RecordView.from_file(file_path)
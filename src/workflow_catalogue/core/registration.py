@@ -0,0 +1,599 @@
+"""Catalogue registration - the CD pipeline that publishes catalogue records to the EO DataHub platform.
+
+For a set of changed record files and deleted record IDs the registrar:
+
+1. authenticates with Keycloak and exchanges the token for a workspace session,
+2. shards the records by collection and, for every collection in parallel:
+    1. makes sure the collection exists (creating it from its `catalog.json`),
+    2. registers its records in wf-catalogue-service (re-registering on conflict),
+    3. deploys the CWL of its workflows as ADES processes,
+3. deletes removed records,
+4. publishes workflows by uploading an access policy and triggering a harvest.
+
+Each record file is read and validated exactly once into a `CatalogueRecord` that all phases share. Files that a signed
+validation manifest of the validate step lists as passed, with the same content hash, are not validated again. Errors
+are collected per collection shard, so a collection that cannot be created or whose records fail does not hold back
+the others. Requests within a shard run concurrently as well; the `PlatformClient` scheduler keeps every endpoint
+family within its rate limits.
+
+CWL definitions are resolved by one `CwlResolver` shared by all shards: the CWL of every workflow and the tools it
+references are fetched concurrently up front, shared tools once, and each process is deployed as a single packed
+document so ADES never has to follow relative references.
+
+The collection ID is derived from the file path: `catalogue/{collection-id}/workflows/foo.json`. Records outside such
+a directory are rejected instead of being registered in a default collection.
+
+"""
+
+from __future__ import annotations
+
+import base64
+import binascii
+import json
+from concurrent.futures import ThreadPoolExecutor
+from http import HTTPStatus
+from pathlib import Path  # noqa: TC003
+from typing import TYPE_CHECKING, Any, TypeVar
+
+import requests
+from pydantic import BaseModel, ConfigDict, Field, ValidationError
+
+from workflow_catalogue.core.cwl import CwlError, CwlResolver
+from workflow_catalogue.core.interning import Interner
+from workflow_catalogue.core.record_view import CATALOGUE_ROOT_NAME, RecordView, collection_id_from_path
+from workflow_catalogue.schemas.notebook import EodhNotebookRecord
+from workflow_catalogue.schemas.workflow import EodhWorkflowRecord
+from workflow_catalogue.utils.logging import get_logger
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from workflow_catalogue.client import PlatformClient
+    from workflow_catalogue.core.manifest import ValidationManifest
+
+_logger = get_logger(__name__)
+
+T = TypeVar("T")
+
+_MAX_BODY_PREVIEW = 600
+_TOKEN_CLAIMS = {"workspaces", "principal_tags", "principalTags", "aud", "iss", "sub", "azp"}
+
+
+class CatalogueRecord(BaseModel):
+    """A record file loaded and validated once, shared by all registration phases."""
+
+    model_config = ConfigDict(frozen=True)
+
+    path: Path
+    collection_id: str
+    document: dict[str, Any] = Field(description="The record exactly as stored in the file, sent to the API")
+    view: RecordView = Field(description="The fields the registration phases need")
+    record: EodhWorkflowRecord | EodhNotebookRecord | None = Field(
+        default=None, description="The validated record, unset when the file was trusted from a validation manifest"
+    )
+
+    @property
+    def id(self) -> str:
+        """Returns the record ID."""
+        return self.view.id
+
+    @property
+    def is_workflow(self) -> bool:
+        """Returns whether the record describes a workflow."""
+        return self.view.is_workflow
+
+    @property
+    def cwl_hrefs(self) -> list[str]:
+        """Returns the URLs of the CWL application definitions linked from the record."""
+        return list(self.view.cwl_hrefs)
+
+
+class RegistrationOptions(BaseModel):
+    """Options controlling the registration run."""
+
+    skip_ades: bool = Field(default=False, description="Skip ADES process registration")
+    skip_publish: bool = Field(default=False, description="Skip access policy publishing")
+    workers: int = Field(default=8, ge=1, description="Maximum number of concurrent requests per collection")
+    collection_workers: int = Field(default=4, ge=1, description="Maximum number of collections processed in parallel")
+
+
+class ShardResult(BaseModel):
+    """Outcome of registering the records of a single collection."""
+
+    collection_id: str
+    registered: list[str] = Field(default_factory=list)
+    errors: list[str] = Field(default_factory=list, description="Failed steps as `phase:subject` entries")
+
+    @property
+    def ok(self) -> bool:
+        """Returns whether every step succeeded."""
+        return not self.errors
+
+
+class RegistrationResult(BaseModel):
+    """Outcome of a registration run."""
+
+    registered: list[str] = Field(default_factory=list)
+    deleted: list[str] = Field(default_factory=list)
+    errors: list[str] = Field(default_factory=list, description="Failed steps as `phase:subject` entries")
+    shards: dict[str, ShardResult] = Field(default_factory=dict, description="Results by collection ID")
+
+    @property
+    def ok(self) -> bool:
+        """Returns whether every step succeeded."""
+        return not self.errors
+
+    def add_shard(self, shard: ShardResult) -> None:
+        """Merges the result of a collection shard.
+
+        Args:
+            shard: The shard result.
+
+        """
+        self.shards[shard.collection_id] = shard
+        self.registered.extend(shard.registered)
+        self.errors.extend(shard.errors)
+
+
+def load_record(
+    file_path: Path, interner: Interner | None = None, manifest: ValidationManifest | None = None
+) -> CatalogueRecord:
+    """Reads and validates a record file.
+
+    Args:
+        file_path: Path to the record file.
+        interner: Interner sharing identical sub-objects (contacts, links, strings) with previously loaded records.
+        manifest: Validation manifest. The record is not validated again when the manifest trusts its content.
+
+    Returns:
+        The loaded record.
+
+    Raises:
+        ValueError: If the file is not a JSON object, is not inside a collection directory or its record type is
+            unknown.
+        ValidationError: If the record does not match its schema.
+
+    """
+    collection_id = collection_id_from_path(file_path)
+    if collection_id is None:
+        msg = f"Record is not inside a '{CATALOGUE_ROOT_NAME}/{{collection-id}}/' directory"
+        raise ValueError(msg)
+    content = file_path.read_bytes()
+    document = json.loads(content.decode("utf-8"))
+    if not isinstance(document, dict):
+        msg = f"Record must be a JSON object, got {type(document).__name__}"
+        raise ValueError(msg)  # noqa: TRY004
+    record: EodhWorkflowRecord | EodhNotebookRecord | None = None
+    if manifest is None or not manifest.trusts(file_path, content):
+        properties = document.get("properties", {})
+        if not isinstance(properties, dict):
+            msg = f"Record properties must be a JSON object, got {type(properties).__name__}"
+            raise ValueError(msg)
+        record_type = properties.get("type")
+        if record_type == "workflow":
+            record = EodhWorkflowRecord.model_validate(document)
+        elif record_type == "notebook":
+            record = EodhNotebookRecord.model_validate(document)
+        else:
+            msg = f"Unknown or missing record type: {record_type}"
+            raise ValueError(msg)
+    if interner is not None:
+        document = interner.intern_json(document)
+        if record is not None:
+            record = interner.intern_model(record)
+    return CatalogueRecord(
+        path=file_path,
+        collection_id=collection_id,
+        document=document,
+        view=RecordView.from_document(document, collection_id),
+        record=record,
+    )
+
+
+def _truncate(text: str, max_len: int = _MAX_BODY_PREVIEW) -> str:
+    return text if len(text) <= max_len else text[: max_len - 3] + "..."
+
+
+def _token_claims(token: str) -> dict[str, Any] | None:
+    """Decodes non-secret JWT claims for debugging. Signatures are not verified."""
+    parts = token.split(".")
+    if len(parts) < 2:  # noqa: PLR2004
+        return None
+    payload = parts[1] + "=" * (-len(parts[1]) % 4)
+    try:
+        claims = json.loads(base64.urlsafe_b64decode(payload.encode("utf-8")))
+    except (binascii.Error, ValueError):
+        return None
+    if not isinstance(claims, dict):
+        return None
+    return {k: claims[k] for k in _TOKEN_CLAIMS if k in claims}
+
+
+class CatalogueRegistrar:
+    """Registers catalogue records on the EO DataHub platform."""
+
+    def __init__(
+        self,
+        client: PlatformClient,
+        options: RegistrationOptions | None = None,
+        manifest: ValidationManifest | None = None,
+    ) -> None:
+        """Initializes the registrar.
+
+        Args:
+            client: The platform client.
+            options: Registration options.
+            manifest: Verified validation manifest of the validate step. Files it trusts are not validated again.
+
+        """
+        self.client = client
+        self.options = options or RegistrationOptions()
+        self.manifest = manifest
+        self.cwl = CwlResolver(self._fetch_cwl, workers=self.options.workers)
+
+    def _fetch_cwl(self, url: str) -> bytes:
+        resp = self.client.fetch(url)
+        resp.raise_for_status()
+        return resp.content
+
+    def _map(self, func: Callable[[T], bool], items: list[T]) -> list[bool]:
+        with ThreadPoolExecutor(max_workers=self.options.workers) as pool:
+            return list(pool.map(func, items))
+
+    def _log_metrics(self) -> None:
+        _logger.info("METRICS: %s", self.client.scheduler.format_stats())
+
+    def load(self, files: list[Path], result: RegistrationResult) -> list[CatalogueRecord]:
+        """Loads and validates record files, recording failures.
+
+        Args:
+            files: Record files. `catalog.json` files are skipped.
+            result: Result receiving load errors.
+
+        Returns:
+            The loaded records.
+
+        """
+        records = []
+        interner = Interner()
+        for file_path in files:
+            if file_path.name == "catalog.json":
+                continue
+            try:
+                records.append(load_record(file_path, interner, self.manifest))
+            except (OSError, ValueError, ValidationError) as exc:
+                _logger.error("FAIL: Could not load '%s': %s", file_path, exc)  # noqa: TRY400
+                result.errors.append(f"load:{file_path}")
+        if self.manifest is not None:
+            trusted = sum(record.record is None for record in records)
+            _logger.info("Trusted %d of %d record(s) from the validation manifest", trusted, len(records))
+        _logger.debug("Interned records: %s", interner.stats())
+        return records
+
+    def authenticate(self, *, workspace: bool = True) -> tuple[str, str | None]:
+        """Obtains the Keycloak token and, when a workspace is configured, a workspace session token.
+
+        Args:
+            workspace: Whether a workspace session token is needed.
+
+        Returns:
+            The Keycloak token and the workspace token (`None` when not needed or unavailable).
+
+        """
+        _logger.debug("Keycloak token URL: %s", self.client.endpoints.token_url)
+        keycloak_token = self.client.keycloak_token()
+        _logger.info("OK: Keycloak token obtained")
+
+        if not workspace or not self.client.settings.eodh.workspace_name:
+            return keycloak_token, None
+        try:
+            workspace_token = self.client.workspace_token(keycloak_token)
+        except requests.RequestException as exc:
+            _logger.warning(
+                "WARN: Could not get workspace token: %s. ADES registration and publishing are skipped.", exc
+            )
+            return keycloak_token, None
+        _logger.info("OK: Workspace token obtained")
+        # Non-secret claims help debugging downstream AWS STS trust policy issues.
+        _logger.debug("Workspace session token claims: %s", _token_claims(workspace_token))
+        return keycloak_token, workspace_token
+
+    def ensure_collection(self, collection_id: str, record_path: Path, token: str) -> bool:
+        """Makes sure a collection exists, creating it from its `catalog.json` if needed.
+
+        Args:
+            collection_id: The collection ID.
+            record_path: Path of a record in the collection, used to locate `catalog.json`.
+            token: Keycloak access token.
+
+        Returns:
+            Whether the collection exists.
+
+        """
+        if self.client.get_collection(collection_id, token).ok:
+            return True
+
+        catalog_dir = record_path.parent
+        while catalog_dir.name != collection_id and catalog_dir != catalog_dir.parent:
+            catalog_dir = catalog_dir.parent
+        catalog_json = catalog_dir / "catalog.json"
+
+        payload: dict[str, Any] = {"id": collection_id, "title": collection_id, "description": ""}
+        if catalog_json.exists():
+            data = json.loads(catalog_json.read_text(encoding="utf-8"))
+            payload = {
+                "id": collection_id,
+                "title": data.get("title", collection_id),
+                "description": data.get("description", ""),
+                "keywords": data.get("keywords", []),
+                "language": data.get("language", "en"),
+                "license": data.get("license", "proprietary"),
+            }
+
+        resp = self.client.create_collection(payload, token)
+        if resp.status_code in {HTTPStatus.CREATED, HTTPStatus.CONFLICT}:
+            _logger.info("OK: Collection '%s' ready", collection_id)
+            return True
+        _logger.error("FAIL: Could not create collection '%s': %s %s", collection_id, resp.status_code, resp.text)
+        return False
+
+    def register_record(self, record: CatalogueRecord, token: str) -> bool:
+        """Registers a record, deleting and re-registering it on conflict.
+
+        Args:
+            record: The record.
+            token: Keycloak access token.
+
+        Returns:
+            Whether the record was registered.
+
+        """
+        catalogue_id = record.collection_id
+        resp = self.client.register_record(record.document, catalogue_id, token)
+
+        if resp.status_code == HTTPStatus.CONFLICT:
+            _logger.info("Record '%s' already exists, deleting and re-registering...", record.id)
+            del_resp = self.client.delete_record(record.id, token)
+            if del_resp.status_code not in {HTTPStatus.NO_CONTENT, HTTPStatus.NOT_FOUND}:
+                _logger.error("FAIL: Could not delete '%s': %s %s", record.id, del_resp.status_code, del_resp.text)
+                return False
+            resp = self.client.register_record(record.document, catalogue_id, token)
+
+        if resp.status_code == HTTPStatus.CREATED:
+            _logger.info("OK: Registered '%s' in '%s'", record.id, catalogue_id)
+            return True
+        _logger.error("FAIL: Could not register '%s': %s %s", record.id, resp.status_code, resp.text)
+        return False
+
+    def delete_record(self, record_id: str, token: str) -> bool:
+        """Deletes a record.
+
+        Args:
+            record_id: The record ID.
+            token: Keycloak access token.
+
+        Returns:
+            Whether the record no longer exists.
+
+        """
+        resp = self.client.delete_record(record_id, token)
+        if resp.status_code == HTTPStatus.NO_CONTENT:
+            _logger.info("OK: Deleted '%s'", record_id)
+            return True
+        if resp.status_code == HTTPStatus.NOT_FOUND:
+            _logger.info("SKIP: '%s' not found (already deleted)", record_id)
+            return True
+        _logger.error("FAIL: Could not delete '%s': %s %s", record_id, resp.status_code, resp.text)
+        return False
+
+    def register_ades_process(self, record: CatalogueRecord, workspace_token: str) -> bool:
+        """Deploys the CWL linked from a workflow record as an ADES process.
+
+        Args:
+            record: The record. Notebooks are skipped.
+            workspace_token: Workspace session token.
+
+        Returns:
+            Whether all CWL definitions were deployed.
+
+        """
+        if not record.is_workflow:
+            return True
+        hrefs = record.cwl_hrefs
+        if not hrefs:
+            _logger.info("SKIP ADES: No CWL application link in %s", record.path.name)
+            return True
+
+        ok = True
+        for href in hrefs:
+            _logger.info("Resolving CWL: %s", href)
+            try:
+                cwl = self.cwl.pack_bytes(href)
+            except CwlError as exc:
+                _logger.error("FAIL: Could not resolve CWL %s: %s", href, exc)  # noqa: TRY400
+                ok = False
+                continue
+
+            del_resp = self.client.unregister_process(record.id, workspace_token)
+            if del_resp.status_code not in {
+                HTTPStatus.OK,
+                HTTPStatus.NO_CONTENT,
+                HTTPStatus.FORBIDDEN,
+                HTTPStatus.NOT_FOUND,
+            }:
+                _logger.warning("WARN: Unregister returned %s for '%s'", del_resp.status_code, record.id)
+                _logger.debug("ADES unregister response body: %s", _truncate(del_resp.text))
+
+            reg_resp = self.client.register_process(cwl, workspace_token)
+            if reg_resp.status_code in {HTTPStatus.OK, HTTPStatus.CREATED}:
+                _logger.info("OK: ADES process registered for '%s'", record.id)
+            elif reg_resp.status_code == HTTPStatus.CONFLICT:
+                _logger.warning("WARN: ADES process '%s' already exists (409 after unregister)", record.id)
+            else:
+                _logger.error(
+                    "FAIL: ADES registration failed for '%s': %s %s", record.id, reg_resp.status_code, reg_resp.text
+                )
+                ok = False
+        return ok
+
+    def publish_workflow(self, record_id: str, workspace_token: str) -> bool:
+        """Publishes a workflow by uploading an access policy and triggering a harvest.
+
+        Args:
+            record_id: The workflow record ID.
+            workspace_token: Workspace session token.
+
+        Returns:
+            Whether the workflow was published.
+
+        """
+        policy = {"workflows": {record_id: {"access": "public"}}}
+        policy_resp = self.client.upload_access_policy(policy, workspace_token)
+        if not policy_resp.ok:
+            _logger.warning(
+                "WARN: Access policy upload failed for '%s': %s %s",
+                record_id,
+                policy_resp.status_code,
+                _truncate(policy_resp.text),
+            )
+            return False
+
+        harvest_resp = self.client.trigger_harvest(workspace_token)
+        if not harvest_resp.ok:
+            _logger.warning(
+                "WARN: Harvest trigger failed for '%s': %s %s",
+                record_id,
+                harvest_resp.status_code,
+                _truncate(harvest_resp.text),
+            )
+            return False
+
+        _logger.info("OK: Published '%s'", record_id)
+        return True
+
+    def run(self, files: list[Path], deleted_ids: list[str]) -> RegistrationResult:
+        """Runs all registration phases.
+
+        Args:
+            files: Changed record files.
+            deleted_ids: IDs of records whose files were removed.
+
+        Returns:
+            The registration result.
+
+        """
+        result = RegistrationResult()
+        records = self.load(files, result)
+        if not records and not deleted_ids:
+            _logger.info("Nothing to do.")
+            return result
+
+        _logger.info("=== Authenticating ===")
+        needs_workspace = bool(records) and not (self.options.skip_ades and self.options.skip_publish)
+        try:
+            token, workspace_token = self.authenticate(workspace=needs_workspace)
+        except requests.RequestException as exc:
+            _logger.error("FAIL: Could not get Keycloak token: %s", exc)  # noqa: TRY400
+            result.errors.append("auth:keycloak")
+            return result
+
+        if records and workspace_token and not self.options.skip_ades:
+            _logger.info("=== Resolving CWL dependencies ===")
+            self.cwl.resolve(href for record in records if record.is_workflow for href in record.cwl_hrefs)
+            _logger.info("Fetched %d CWL document(s)", self.cwl.cached_documents)
+        if records:
+            self._run_shards(records, token, workspace_token, result)
+        if deleted_ids:
+            self._delete(deleted_ids, token, result)
+        if records and workspace_token and not self.options.skip_publish:
+            self._publish(records, workspace_token, result)
+        return result
+
+    def run_shard(
+        self, collection_id: str, records: list[CatalogueRecord], token: str, workspace_token: str | None
+    ) -> ShardResult:
+        """Registers the records of a single collection.
+
+        The collection is created first; when that fails its records are not registered. Failures are recorded in the
+        shard result rather than raised, so a broken collection does not stop the others.
+
+        Args:
+            collection_id: The collection ID.
+            records: Records of the collection.
+            token: Keycloak access token.
+            workspace_token: Workspace session token. ADES deployment is skipped when `None`.
+
+        Returns:
+            The shard result.
+
+        """
+        shard = ShardResult(collection_id=collection_id)
+        _logger.info("=== [%s] Registering %d record(s) ===", collection_id, len(records))
+        try:
+            if not self.ensure_collection(collection_id, records[0].path, token):
+                shard.errors.append(f"collection:{collection_id}")
+                return shard
+            for record, ok in zip(records, self._map(lambda r: self.register_record(r, token), records), strict=True):
+                if ok:
+                    shard.registered.append(record.id)
+                else:
+                    shard.errors.append(f"register:{record.path}")
+            if workspace_token and not self.options.skip_ades:
+                _logger.info("=== [%s] Registering CWL processes in ADES ===", collection_id)
+                results = self._map(lambda r: self.register_ades_process(r, workspace_token), records)
+                shard.errors.extend(
+                    f"ades:{record.path}" for record, ok in zip(records, results, strict=True) if not ok
+                )
+        except requests.RequestException as exc:
+            _logger.error("FAIL: [%s] Request failed: %s", collection_id, exc)  # noqa: TRY400
+            shard.errors.append(f"shard:{collection_id}")
+        except Exception:
+            # A broken catalog.json or CWL document must not abort the other collections.
+            _logger.exception("FAIL: [%s] Registration failed", collection_id)
+            shard.errors.append(f"shard:{collection_id}")
+        return shard
+
+    def _run_shards(
+        self, records: list[CatalogueRecord], token: str, workspace_token: str | None, result: RegistrationResult
+    ) -> None:
+        shards: dict[str, list[CatalogueRecord]] = {}
+        for record in records:
+            shards.setdefault(record.collection_id, []).append(record)
+        _logger.info("=== Processing %d collection(s) ===", len(shards))
+        with ThreadPoolExecutor(max_workers=self.options.collection_workers) as pool:
+            futures = [
+                pool.submit(self.run_shard, collection_id, shard_records, token, workspace_token)
+                for collection_id, shard_records in shards.items()
+            ]
+            for future in futures:
+                result.add_shard(future.result())
+        for shard in result.shards.values():
+            if shard.ok:
+                _logger.info("OK: [%s] %d record(s) registered", shard.collection_id, len(shard.registered))
+            else:
+                _logger.error(
+                    "FAIL: [%s] %d record(s) registered, %d error(s)",
+                    shard.collection_id,
+                    len(shard.registered),
+                    len(shard.errors),
+                )
+        self._log_metrics()
+
+    def _delete(self, deleted_ids: list[str], token: str, result: RegistrationResult) -> None:
+        _logger.info("=== Deleting %d record(s) from wf-catalogue-service ===", len(deleted_ids))
+        for record_id, ok in zip(
+            deleted_ids, self._map(lambda i: self.delete_record(i, token), deleted_ids), strict=True
+        ):
+            if ok:
+                result.deleted.append(record_id)
+            else:
+                result.errors.append(f"delete:{record_id}")
+        self._log_metrics()
+
+    def _publish(self, records: list[CatalogueRecord], workspace_token: str, result: RegistrationResult) -> None:
+        # Sequential on purpose: every publish overwrites the same access-policy.json before triggering a harvest.
+        _logger.info("=== Publishing workflows ===")
+        for record in records:
+            if record.is_workflow and not self.publish_workflow(record.id, workspace_token):
+                result.errors.append(f"publish:{record.id}")
+        self._log_metrics()
@@ -0,0 +1,147 @@
+"""Parallel discovery of catalogue files.
+
+`Path.rglob` walks the tree one directory at a time and returns bare paths, so every consumer then sorts them, scans
+`Path.parts` for the collection and calls `stat` again for cache lookups. On network file systems and deeply sharded
+catalogues the latency of each directory listing adds up to seconds before the first file is looked at.
+
+`scan_catalogue` lists directories with `os.scandir` on a thread pool instead, so listings of sibling directories
+overlap, and classifies every JSON file in the same pass:
+
+* `catalog.json` files vs records,
+* the collection - the directory below `catalogue/` - and the subdirectory below it (`workflows`, `notebooks`), both
+  carried down from the parent directory instead of being parsed out of every path,
+* modification time and size, taken while the directory is listed.
+
+Files are yielded as soon as their directory has been listed, so callers can start working on them before the walk
+finishes. The order is not deterministic; sort the results when it matters.
+
+"""
+
+from __future__ import annotations
+
+import os
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, NamedTuple
+
+from workflow_catalogue.core.record_view import CATALOGUE_ROOT_NAME
+
+if TYPE_CHECKING:
+    from collections.abc import Generator
+
+CATALOG_FILE_NAME = "catalog.json"
+"""Name of the collection-level catalog file. Changing it affects every record in the collection."""
+
+DEFAULT_WORKERS = 8
+"""Default number of directories listed concurrently."""
+
+
+@dataclass(frozen=True, slots=True)
+class ScannedFile:
+    """A JSON file found in the catalogue."""
+
+    path: Path
+    collection: str | None
+    """Collection ID, `None` when the file is not inside a `catalogue/{collection-id}/` directory."""
+    subdirectory: str | None
+    """Directory below the collection, e.g. `workflows` or `notebooks`."""
+    is_catalog: bool
+    """Whether the file is a collection's `catalog.json` rather than a record."""
+    mtime_ns: int | None = None
+    """Modification time in nanoseconds, `None` when the scan did not `stat` the files."""
+    size: int | None = None
+    """Size in bytes, `None` when the scan did not `stat` the files."""
+
+    @property
+    def is_record(self) -> bool:
+        """Whether the file is a record."""
+        return not self.is_catalog
+
+
+class _Directory(NamedTuple):
+    path: str
+    in_catalogue: bool
+    collection: str | None
+    subdirectory: str | None
+
+    def child(self, path: str, name: str) -> _Directory:
+        if not self.in_catalogue:
+            return _Directory(path, in_catalogue=name == CATALOGUE_ROOT_NAME, collection=None, subdirectory=None)
+        if self.collection is None:
+            return _Directory(path, in_catalogue=True, collection=name, subdirectory=None)
+        return _Directory(path, in_catalogue=True, collection=self.collection, subdirectory=self.subdirectory or name)
+
+
+def _root_directory(root: Path) -> _Directory:
+    """Locates the scan root in the catalogue layout, once for the whole scan."""
+    parts = root.parts
+    if CATALOGUE_ROOT_NAME not in parts:
+        return _Directory(os.fspath(root), in_catalogue=False, collection=None, subdirectory=None)
+    collection, subdirectory, *_ = (*parts[parts.index(CATALOGUE_ROOT_NAME) + 1 :], None, None)
+    return _Directory(os.fspath(root), in_catalogue=True, collection=collection, subdirectory=subdirectory)
+
+
+def _scan_directory(directory: _Directory, stat: bool) -> tuple[list[ScannedFile], list[_Directory]]:  # noqa: FBT001
+    """Lists one directory, returning its JSON files and its subdirectories."""
+    files: list[ScannedFile] = []
+    subdirectories: list[_Directory] = []
+    try:
+        with os.scandir(directory.path) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    subdirectories.append(directory.child(entry.path, entry.name))
+                    continue
+                if not entry.name.endswith(".json"):
+                    continue
+                mtime_ns = size = None
+                if stat:
+                    try:
+                        result = entry.stat()
+                    except FileNotFoundError:
+                        continue
+                    mtime_ns, size = result.st_mtime_ns, result.st_size
+                files.append(
+                    ScannedFile(
+                        path=Path(entry.path),
+                        collection=directory.collection,
+                        subdirectory=directory.subdirectory,
+                        is_catalog=entry.name == CATALOG_FILE_NAME,
+                        mtime_ns=mtime_ns,
+                        size=size,
+                    )
+                )
+    except (FileNotFoundError, NotADirectoryError):
+        # Removed while the tree was being walked.
+        pass
+    return files, subdirectories
+
+
+def scan_catalogue(root: Path, *, workers: int = DEFAULT_WORKERS, stat: bool = True) -> Generator[ScannedFile]:
+    """Finds all JSON files under a directory, listing directories in parallel.
+
+    Symbolic links to directories are not followed. Directories removed during the scan are skipped.
+
+    Args:
+        root: Directory to scan: the `catalogue` directory, a collection or any directory containing them.
+        workers: Number of directories listed concurrently.
+        stat: Whether to record modification time and size of every file.
+
+    Yields:
+        The files, in no particular order, each as soon as its directory has been listed.
+
+    """
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="wfc-scan") as executor:
+        pending: set[Future[tuple[list[ScannedFile], list[_Directory]]]] = {
+            executor.submit(_scan_directory, _root_directory(root), stat)
+        }
+        try:
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    files, subdirectories = future.result()
+                    pending.update(executor.submit(_scan_directory, child, stat) for child in subdirectories)
+                    yield from files
+        finally:
+            # The caller may stop iterating early, listings not started yet are not needed.
+            executor.shutdown(wait=True, cancel_futures=True)
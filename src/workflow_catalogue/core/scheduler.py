@@ -0,0 +1,459 @@
+"""Rate-limit-aware request scheduling for platform calls.
+
+Every request is tagged with an endpoint family (e.g. `catalogue`, `ades`, `workspace`). Each family gets its own token
+bucket rate limit and concurrency limit, both adapted with AIMD: successful responses slowly ramp them up, while a
+`429`/`503` pauses the whole family for the duration advertised in `Retry-After` and cuts the request rate to a fraction
+of what was observed just before the throttling. Throughput therefore converges on what the platform can sustain instead
+of surfacing throttling as failures.
+
+Examples:
+    ```python
+    from workflow_catalogue.core.scheduler import EndpointPolicy, RequestScheduler
+
+    scheduler = RequestScheduler(policies={"catalogue": EndpointPolicy(rate=50)})
+    resp = scheduler.request("catalogue", "GET", "https://example.org/collections")
+    print(scheduler.format_stats())
+    ```
+
+"""
+
+from __future__ import annotations
+
+import contextlib
+import email.utils
+import math
+import random
+import threading
+import time
+from collections import deque
+from datetime import UTC, datetime
+from http import HTTPStatus
+from typing import TYPE_CHECKING, Any
+
+import requests
+from pydantic import BaseModel, Field
+
+from workflow_catalogue.utils.logging import get_logger
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Generator
+
+_logger = get_logger(__name__)
+
+_MIN_RATE_WINDOW = 0.05
+
+RETRYABLE_STATUS_CODES = frozenset({HTTPStatus.TOO_MANY_REQUESTS, HTTPStatus.SERVICE_UNAVAILABLE})
+
+
+class EndpointPolicy(BaseModel):
+    """Scheduling policy for an endpoint family."""
+
+    rate: float | None = Field(default=None, gt=0, description="Maximum requests per second, `None` for unlimited")
+    min_rate: float = Field(default=0.1, gt=0, description="Lower bound for the adaptive request rate")
+    rate_increase: float = Field(
+        default=0.05, ge=0, description="Requests per second added to the rate after each success"
+    )
+    burst: int = Field(default=10, ge=1, description="Token bucket capacity")
+    initial_concurrency: int = Field(default=4, ge=1, description="Concurrency limit before any feedback is received")
+    min_concurrency: int = Field(default=1, ge=1, description="Lower bound for the adaptive concurrency limit")
+    max_concurrency: int = Field(default=32, ge=1, description="Upper bound for the adaptive concurrency limit")
+    backoff_factor: float = Field(default=0.5, gt=0, lt=1, description="Multiplier applied to the limit on throttling")
+    max_retries: int = Field(default=5, ge=0, description="Retries for throttled or failed requests")
+    base_delay: float = Field(default=0.5, ge=0, description="Base delay for exponential backoff without `Retry-After`")
+    max_delay: float = Field(default=60.0, ge=0, description="Cap for any single retry delay")
+
+
+class FamilyStats(BaseModel):
+    """Point-in-time metrics of an endpoint family."""
+
+    queued: int = 0
+    in_flight: int = 0
+    concurrency_limit: float = 0
+    rate_limit: float | None = None
+    completed: int = 0
+    throttled: int = 0
+    retried: int = 0
+    failed: int = 0
+
+
+class TokenBucket:
+    """Thread-safe token bucket rate limiter."""
+
+    def __init__(
+        self,
+        rate: float,
+        capacity: int,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        """Initializes a full bucket.
+
+        Args:
+            rate: Tokens added per second.
+            capacity: Maximum number of tokens (burst size).
+            clock: Monotonic clock, injectable for tests.
+            sleep: Sleep function, injectable for tests.
+
+        """
+        self._rate = rate
+        self._capacity = float(capacity)
+        self._tokens = float(capacity)
+        self._clock = clock
+        self._sleep = sleep
+        self._updated = clock()
+        self._paused_until = 0.0
+        self._lock = threading.Lock()
+
+    def try_acquire(self) -> float:
+        """Takes a token if one is available.
+
+        Returns:
+            `0` if a token was taken, otherwise the number of seconds until one becomes available.
+
+        """
+        with self._lock:
+            now = self._clock()
+            if now < self._paused_until:
+                return self._paused_until - now
+            if math.isinf(self._rate):
+                return 0.0
+            self._tokens = min(self._capacity, self._tokens + (now - self._updated) * self._rate)
+            self._updated = now
+            if self._tokens >= 1:
+                self._tokens -= 1
+                return 0.0
+            return (1 - self._tokens) / self._rate
+
+    @property
+    def rate(self) -> float:
+        """Returns the current refill rate."""
+        return self._rate
+
+    def set_rate(self, rate: float) -> None:
+        """Changes the refill rate, keeping the tokens accumulated so far.
+
+        Args:
+            rate: New tokens added per second.
+
+        """
+        with self._lock:
+            now = self._clock()
+            if math.isinf(self._rate):
+                self._tokens = self._capacity
+            else:
+                self._tokens = min(self._capacity, self._tokens + (now - self._updated) * self._rate)
+            self._updated = now
+            self._rate = rate
+
+    def acquire(self) -> None:
+        """Blocks until a token is taken."""
+        while wait := self.try_acquire():
+            self._sleep(wait)
+
+    def pause(self, seconds: float) -> None:
+        """Stops handing out tokens for the given number of seconds.
+
+        Args:
+            seconds: Pause duration.
+
+        """
+        with self._lock:
+            self._paused_until = max(self._paused_until, self._clock() + seconds)
+            self._tokens = 0.0
+
+
+class AdaptiveConcurrencyLimiter:
+    """AIMD concurrency limiter.
+
+    The limit grows by roughly one slot per "round trip" worth of successful requests and is multiplied by
+    `backoff_factor` whenever the server signals overload.
+
+    """
+
+    def __init__(self, initial: int, minimum: int, maximum: int, backoff_factor: float) -> None:
+        """Initializes the limiter.
+
+        Args:
+            initial: Initial concurrency limit.
+            minimum: Lower bound for the limit.
+            maximum: Upper bound for the limit.
+            backoff_factor: Multiplier applied to the limit on overload.
+
+        """
+        self.minimum = float(minimum)
+        self.maximum = float(maximum)
+        self.limit = float(min(max(initial, minimum), maximum))
+        self.in_flight = 0
+        self._backoff_factor = backoff_factor
+        self._cond = threading.Condition()
+
+    def acquire(self) -> None:
+        """Blocks until a concurrency slot is free."""
+        with self._cond:
+            while self.in_flight >= math.floor(self.limit):
+                self._cond.wait()
+            self.in_flight += 1
+
+    def release(self, *, overloaded: bool, succeeded: bool = True) -> None:
+        """Frees a slot and adapts the limit to the outcome of the request.
+
+        Args:
+            overloaded: Whether the server signalled overload (throttling or unavailability).
+            succeeded: Whether the request succeeded. Failed requests leave the limit unchanged.
+
+        """
+        with self._cond:
+            self.in_flight -= 1
+            if overloaded:
+                self.limit = max(self.minimum, self.limit * self._backoff_factor)
+            elif succeeded:
+                self.limit = min(self.maximum, self.limit + 1 / self.limit)
+            self._cond.notify_all()
+
+
+def parse_retry_after(value: str | None, now: datetime | None = None) -> float | None:
+    """Parses a `Retry-After` header value.
+
+    Args:
+        value: Header value, either delay-seconds or an HTTP-date.
+        now: Reference time for HTTP-dates, defaults to the current UTC time.
+
+    Returns:
+        Delay in seconds, or `None` if the header is missing or malformed.
+
+    """
+    if not value:
+        return None
+    value = value.strip()
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=UTC)
+    return max(0.0, (retry_at - (now or datetime.now(tz=UTC))).total_seconds())
+
+
+class _Family:
+    def __init__(self, policy: EndpointPolicy, clock: Callable[[], float], sleep: Callable[[float], None]) -> None:
+        self.policy = policy
+        self.max_rate = policy.rate or math.inf
+        self.bucket = TokenBucket(self.max_rate, policy.burst, clock=clock, sleep=sleep)
+        self.limiter = AdaptiveConcurrencyLimiter(
+            policy.initial_concurrency, policy.min_concurrency, policy.max_concurrency, policy.backoff_factor
+        )
+        self.stats = FamilyStats(concurrency_limit=self.limiter.limit)
+        self.lock = threading.Lock()
+        self._clock = clock
+        self._recent: deque[float] = deque()
+        self._congested_until = 0.0
+
+    def on_start(self) -> None:
+        with self.lock:
+            now = self._clock()
+            self._recent.append(now)
+            while self._recent[0] < now - 1:
+                self._recent.popleft()
+
+    def on_success(self) -> None:
+        rate = self.bucket.rate
+        if not math.isinf(rate) and rate < self.max_rate:
+            self.bucket.set_rate(min(self.max_rate, rate + self.policy.rate_increase))
+
+    def on_congestion(self, delay: float) -> bool:
+        """Pauses the family and, once per congestion episode, cuts the request rate.
+
+        Returns:
+            Whether this was the first overload signal of a new congestion episode.
+
+        """
+        self.bucket.pause(delay)
+        with self.lock:
+            now = self._clock()
+            if now < self._congested_until:
+                return False
+            self._congested_until = now + max(delay, 1.0)
+            window = [t for t in self._recent if t >= now - 1]
+            span = max(now - window[0], _MIN_RATE_WINDOW) if window else 1.0
+            observed = len(window) / min(span, 1.0)
+        rate = min(self.bucket.rate, max(observed, 1)) * self.policy.backoff_factor
+        self.bucket.set_rate(max(self.policy.min_rate, rate))
+        return True
+
+
+class RequestScheduler:
+    """Central scheduler for all platform HTTP calls.
+
+    Unknown families are created on first use with the default policy.
+
+    """
+
+    def __init__(
+        self,
+        session: requests.Session | None = None,
+        policies: dict[str, EndpointPolicy] | None = None,
+        default_policy: EndpointPolicy | None = None,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        """Initializes the scheduler.
+
+        Args:
+            session: HTTP session used to send requests.
+            policies: Per-family policies.
+            default_policy: Policy for families not listed in `policies`.
+            clock: Monotonic clock, injectable for tests.
+            sleep: Sleep function, injectable for tests.
+
+        """
+        self.session = session or requests.Session()
+        self._policies = dict(policies or {})
+        self._default_policy = default_policy or EndpointPolicy()
+        self._clock = clock
+        self._sleep = sleep
+        self._families: dict[str, _Family] = {}
+        self._lock = threading.Lock()
+        self._rng = random.Random()  # noqa: S311
+
+    def request(self, family: str, method: str, url: str, **kwargs: Any) -> requests.Response:
+        """Sends a request, waiting for rate and concurrency limits and retrying throttled responses.
+
+        Args:
+            family: Endpoint family the request belongs to.
+            method: HTTP method.
+            url: Request URL.
+            **kwargs: Keyword arguments forwarded to `requests.Session.request`.
+
+        Returns:
+            The final response. Throttled responses are only returned once retries are exhausted.
+
+        Raises:
+            requests.RequestException: If the request keeps failing at the transport level.
+
+        """
+        fam = self._family(family)
+        policy = fam.policy
+        attempt = 0
+        while True:
+            with self._slot(fam) as outcome:
+                try:
+                    resp = self.session.request(method, url, **kwargs)
+                except (requests.ConnectionError, requests.Timeout):
+                    if attempt >= policy.max_retries:
+                        self._bump(fam, "failed")
+                        raise
+                    delay = self._backoff(policy, attempt)
+                else:
+                    if resp.status_code not in RETRYABLE_STATUS_CODES:
+                        if resp.status_code >= HTTPStatus.INTERNAL_SERVER_ERROR:
+                            # Not retried, but a failing backend must not ramp the limits up either.
+                            self._bump(fam, "failed")
+                            return resp
+                        fam.on_success()
+                        outcome["succeeded"] = True
+                        self._bump(fam, "completed")
+                        return resp
+                    self._bump(fam, "throttled")
+                    if attempt >= policy.max_retries:
+                        self._bump(fam, "failed")
+                        return resp
+                    retry_after = parse_retry_after(resp.headers.get("Retry-After"))
+                    if retry_after is None:
+                        delay = self._backoff(policy, attempt)
+                    else:
+                        delay = min(policy.max_delay, retry_after)
+                outcome["overloaded"] = fam.on_congestion(delay)
+
+            self._bump(fam, "retried")
+            _logger.debug("Retrying %s %s in %.2fs (attempt %d)", method, url, delay, attempt + 1)
+            self._sleep(delay)
+            attempt += 1
+
+    def stats(self) -> dict[str, FamilyStats]:
+        """Returns a snapshot of metrics for every family seen so far."""
+        with self._lock:
+            families = dict(self._families)
+        snapshot = {}
+        for name, fam in families.items():
+            with fam.lock:
+                fam.stats.concurrency_limit = round(fam.limiter.limit, 2)
+                fam.stats.rate_limit = None if math.isinf(fam.bucket.rate) else round(fam.bucket.rate, 2)
+                snapshot[name] = fam.stats.model_copy()
+        return snapshot
+
+    def format_stats(self) -> str:
+        """Returns a single-line, human-readable summary of the current metrics."""
+        return " | ".join(
+            f"{name}: queued={s.queued} in_flight={s.in_flight} limit={s.concurrency_limit:g} "
+            f"rate={'-' if s.rate_limit is None else f'{s.rate_limit:g}/s'} "
+            f"done={s.completed} throttled={s.throttled} retried={s.retried} failed={s.failed}"
+            for name, s in sorted(self.stats().items())
+        )
+
+    @contextlib.contextmanager
+    def monitor(self, interval: float, emit: Callable[[str], None]) -> Generator[None]:
+        """Periodically emits the metrics summary while the block runs.
+
+        Args:
+            interval: Seconds between reports.
+            emit: Callback receiving the formatted summary.
+
+        Returns:
+            A context manager reporting metrics in a background thread.
+
+        """
+        stop = threading.Event()
+
+        def report() -> None:
+            while not stop.wait(interval):
+                emit(self.format_stats())
+
+        thread = threading.Thread(target=report, name="scheduler-monitor", daemon=True)
+        thread.start()
+        try:
+            yield
+        finally:
+            stop.set()
+            thread.join()
+
+    def _family(self, name: str) -> _Family:
+        with self._lock:
+            fam = self._families.get(name)
+            if fam is None:
+                policy = self._policies.get(name, self._default_policy)
+                fam = self._families[name] = _Family(policy, self._clock, self._sleep)
+            return fam
+
+    @contextlib.contextmanager
+    def _slot(self, fam: _Family) -> Generator[dict[str, bool]]:
+        self._bump(fam, "queued")
+        try:
+            fam.limiter.acquire()
+            try:
+                fam.bucket.acquire()
+            except BaseException:
+                fam.limiter.release(overloaded=False, succeeded=False)
+                raise
+        finally:
+            self._bump(fam, "queued", -1)
+        fam.on_start()
+        self._bump(fam, "in_flight")
+        outcome = {"overloaded": False, "succeeded": False}
+        try:
+            yield outcome
+        finally:
+            self._bump(fam, "in_flight", -1)
+            fam.limiter.release(overloaded=outcome["overloaded"], succeeded=outcome["succeeded"])
+
+    def _backoff(self, policy: EndpointPolicy, attempt: int) -> float:
+        return min(policy.max_delay, policy.base_delay * 2.0**attempt) * self._rng.uniform(0.5, 1.0)
+
+    @staticmethod
+    def _bump(fam: _Family, counter: str, value: int = 1) -> None:
+        with fam.lock:
+            current: int = getattr(fam.stats, counter)
+            setattr(fam.stats, counter, current + value)
@@ -1,23 +1,28 @@
 """Application settings.
 
+Settings are read from the environment (and `.env`) and validated once - `current_settings` caches the instance and
+the models are immutable, so derived URLs are computed on first access and reused afterwards. Call
+`current_settings.cache_clear()` after changing the environment to reload them.
+
 Examples:
     ```python
     import logging
 
-    from src.core.settings import current_settings
+    from workflow_catalogue.core.settings import current_settings
 
 
     # log current environment
-    logging.info(current_settings.env)  # INFO:dev
+    logging.info(current_settings().environment)  # INFO:dev
     ```
 
 """
 
 from __future__ import annotations
 
+from functools import cache, cached_property
 from urllib.parse import urljoin
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 from workflow_catalogue import consts
@@ -26,33 +31,35 @@ from workflow_catalogue import consts
 class OAuth2Settings(BaseModel):
     """OAuth2 settings."""
 
+    model_config = ConfigDict(frozen=True)
+
     base_url: str
     realm: str
     username: str
     password: str
     client_id: str
 
-    @property
+    @cached_property
     def oid_url(self) -> str:
         """Returns the OpenID URL."""
         return urljoin(self.base_url, f"/keycloak/realms/{self.realm}/protocol/openid-connect")
 
-    @property
+    @cached_property
     def token_url(self) -> str:
         """Returns the token URL."""
         return self.oid_url + "/token"
 
-    @property
+    @cached_property
     def auth_url(self) -> str:
         """Returns the auth URL."""
         return self.oid_url + "/auth"
 
-    @property
+    @cached_property
     def introspect_url(self) -> str:
         """Returns the introspect URL."""
         return self.token_url + "/introspect"
 
-    @property
+    @cached_property
     def certs_url(self) -> str:
         """Returns the certs URL."""
         return self.oid_url + "/certs"
@@ -62,36 +69,44 @@ class EODHSettings(OAuth2Settings):
     """EO Data Hub settings."""
 
     ades_endpoint_path: str
-    stac_api_endpoint_path: str
+    stac_api_endpoint_path: str | None = None
     workspace_services_endpoint_path: str
-    tmp_s3_credentials_endpoint_path: str
+    tmp_s3_credentials_endpoint_path: str | None = None
+    workspace_name: str | None = None
+
+    @cached_property
+    def workspace(self) -> str:
+        """Returns the workspace used for sessions and publishing - `workspace_name` or the user's own workspace."""
+        return self.workspace_name or self.username
 
-    @property
+    @cached_property
     def workspace_tokens_url(self) -> str:
         """Returns the URL for retrieving workspace tokens."""
         return urljoin(self.base_url, f"{self.workspace_services_endpoint_path}/{self.username}/me/tokens")
 
-    @property
+    @cached_property
     def workspace_session_tokens_url(self) -> str:
         """Returns the URL for retrieving workspace session tokens."""
         return urljoin(self.base_url, f"{self.workspace_services_endpoint_path}/{self.username}/me/sessions")
 
-    @property
+    @cached_property
     def ades_url(self) -> str:
         """Returns the ADES URL."""
         return urljoin(self.base_url, self.ades_endpoint_path)
 
-    @property
+    @cached_property
     def tmp_s3_credentials_url(self) -> str:
         """Returns the URL for retrieving temporary S3 credentials."""
-        return urljoin(self.base_url, self.tmp_s3_credentials_endpoint_path)
+        return urljoin(
+            self.base_url, _required(self.tmp_s3_credentials_endpoint_path, "tmp_s3_credentials_endpoint_path")
+        )
 
-    @property
+    @cached_property
     def stac_url(self) -> str:
         """Returns the STAC URL."""
-        return urljoin(self.base_url, self.stac_api_endpoint_path)
+        return urljoin(self.base_url, _required(self.stac_api_endpoint_path, "stac_api_endpoint_path"))
 
-    @property
+    @cached_property
     def workspace_services_url(self) -> str:
         """Returns the Workspace Services URL."""
         return urljoin(self.base_url, self.workspace_services_endpoint_path)
@@ -102,18 +117,30 @@ class Settings(BaseSettings):
 
     environment: str = "local"
     eodh: EODHSettings
+    wf_catalogue_api_url: str | None = None
 
     model_config = SettingsConfigDict(
         env_file=consts.directories.ROOT_DIR / ".env",
         env_file_encoding="utf-8",
         env_nested_delimiter="__",
         extra="ignore",
+        frozen=True,
     )
 
 
+def _required(value: str | None, name: str) -> str:
+    if value is None:
+        msg = f"EODH setting '{name}' is not configured"
+        raise ValueError(msg)
+    return value
+
+
+@cache
 def current_settings() -> Settings:
     """Instantiate current application settings.
 
+    The settings are loaded and validated on the first call only.
+
     Returns:
         Current application settings.
 
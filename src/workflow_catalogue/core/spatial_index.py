@@ -0,0 +1,396 @@
+"""Spatial-temporal index of workflow extents.
+
+Workflow records describe where and when they apply with `properties.extent` (`spatial.bbox` and
+`temporal.interval`, as in OGC API - Records / STAC) and, optionally, a GeoJSON `geometry`. `SpatialIndex` packs those
+extents into a static Sort-Tile-Recursive (STR) tree stored as flat NumPy arrays, so a query walks a few levels of
+vectorized box tests instead of a Python loop over every record.
+
+Indexing rules:
+
+* every `spatial.bbox` of a record is an entry; when there is none, the bounds of `geometry` are used instead,
+* a bbox crossing the antimeridian (`minX > maxX`) is split into two entries,
+* every `temporal.interval` is combined with every bbox; open interval ends (`null`) are unbounded,
+* a record without a spatial or temporal extent is unbounded in that dimension and matches any query on it.
+
+Only workflows are indexed; notebooks do not carry an extent.
+
+"""
+
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from typing import TYPE_CHECKING, Any, Literal
+
+import numpy as np
+
+from workflow_catalogue.utils.serialization import loads
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+    from pathlib import Path
+
+    from numpy.typing import NDArray
+
+DEFAULT_NODE_CAPACITY = 32
+"""Default number of children per tree node."""
+
+Predicate = Literal["intersects", "contains"]
+"""`intersects` matches extents overlapping the query, `contains` only extents covering the whole query."""
+
+BBox = tuple[float, float, float, float]
+"""A 2D bounding box: `(minX, minY, maxX, maxY)`."""
+
+_UNBOUNDED_BBOX: BBox = (-math.inf, -math.inf, math.inf, math.inf)
+_UNBOUNDED_INTERVAL = (-math.inf, math.inf)
+_EMPTY_BBOX: BBox = (math.inf, math.inf, -math.inf, -math.inf)
+_EMPTY_INTERVAL = (math.inf, -math.inf)
+_BBOX_2D = 4
+_BBOX_3D = 6
+_MIN_X, _MIN_Y, _MAX_X, _MAX_Y, _MIN_T, _MAX_T = range(6)
+
+
+def parse_datetime(value: str) -> float:
+    """Parses an ISO 8601 date or datetime into a POSIX timestamp. Naive values are taken as UTC.
+
+    Args:
+        value: The date or datetime, e.g. `2024-01-01` or `2024-01-01T12:00:00Z`.
+
+    Returns:
+        Seconds since the epoch.
+
+    Raises:
+        ValueError: If the value is not ISO 8601.
+
+    """
+    parsed = datetime.fromisoformat(value)
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=UTC)
+    return parsed.timestamp()
+
+
+def parse_interval(value: str) -> tuple[float, float]:
+    """Parses a STAC API `datetime` query: a single instant, `start/end`, `../end` or `start/..`.
+
+    Args:
+        value: The query value.
+
+    Returns:
+        The interval as POSIX timestamps, infinite for open ends.
+
+    Raises:
+        ValueError: If the value is malformed or the interval ends before it starts.
+
+    """
+    start, sep, end = value.partition("/")
+    if not sep:
+        instant = parse_datetime(value)
+        return instant, instant
+    interval = (
+        parse_datetime(start) if start not in {"", ".."} else -math.inf,
+        parse_datetime(end) if end not in {"", ".."} else math.inf,
+    )
+    if interval[0] > interval[1]:
+        msg = f"Interval '{value}' ends before it starts"
+        raise ValueError(msg)
+    return interval
+
+
+def parse_bbox(value: str) -> BBox:
+    """Parses a `minX,minY,maxX,maxY` query. 3D boxes are reduced to 2D.
+
+    Args:
+        value: The comma-separated coordinates.
+
+    Returns:
+        The bounding box.
+
+    Raises:
+        ValueError: If the value does not have 4 or 6 numbers or its minimum Y is greater than its maximum Y.
+
+    """
+    coords = [float(c) for c in value.split(",")]
+    if len(coords) not in {_BBOX_2D, _BBOX_3D}:
+        msg = f"Bounding box must have 4 or 6 numbers, got {len(coords)}"
+        raise ValueError(msg)
+    bbox = _to_2d(coords)
+    if bbox[1] > bbox[3]:
+        msg = f"Bounding box '{value}' has minY greater than maxY"
+        raise ValueError(msg)
+    return bbox
+
+
+def _to_2d(coords: list[float]) -> BBox:
+    if len(coords) == _BBOX_3D:
+        return coords[0], coords[1], coords[3], coords[4]
+    return coords[0], coords[1], coords[2], coords[3]
+
+
+def _split_antimeridian(bbox: BBox) -> list[BBox]:
+    min_x, min_y, max_x, max_y = bbox
+    if min_x <= max_x:
+        return [bbox]
+    return [(min_x, min_y, 180.0, max_y), (-180.0, min_y, max_x, max_y)]
+
+
+def _iter_positions(coordinates: Any) -> Iterator[list[float]]:
+    if coordinates and isinstance(coordinates[0], int | float):
+        yield coordinates
+        return
+    for child in coordinates or []:
+        yield from _iter_positions(child)
+
+
+def geometry_bounds(geometry: dict[str, Any] | None) -> BBox | None:
+    """Computes the bounds of a GeoJSON geometry.
+
+    Args:
+        geometry: The geometry, including `GeometryCollection`.
+
+    Returns:
+        The bounds or `None` if the geometry is empty or missing.
+
+    """
+    if not geometry:
+        return None
+    if geometry.get("type") == "GeometryCollection":
+        parts = [b for g in geometry.get("geometries") or [] if (b := geometry_bounds(g)) is not None]
+        if not parts:
+            return None
+        return (
+            min(b[0] for b in parts),
+            min(b[1] for b in parts),
+            max(b[2] for b in parts),
+            max(b[3] for b in parts),
+        )
+    positions = list(_iter_positions(geometry.get("coordinates")))
+    if not positions:
+        return None
+    xs = [p[0] for p in positions]
+    ys = [p[1] for p in positions]
+    return min(xs), min(ys), max(xs), max(ys)
+
+
+def record_extents(document: dict[str, Any]) -> list[tuple[float, float, float, float, float, float]]:
+    """Extracts the index entries of a record.
+
+    Args:
+        document: The record document.
+
+    Returns:
+        Entries as `(minX, minY, maxX, maxY, start, end)`.
+
+    Raises:
+        ValueError: If a bbox or an interval is malformed.
+
+    """
+    properties = document.get("properties") or {}
+    extent = properties.get("extent") or {}
+    spatial = extent.get("spatial") or {}
+    temporal = extent.get("temporal") or {}
+
+    bboxes: list[BBox] = []
+    for coords in spatial.get("bbox") or []:
+        if len(coords) not in {_BBOX_2D, _BBOX_3D}:
+            msg = f"Bounding box must have 4 or 6 numbers, got {len(coords)}"
+            raise ValueError(msg)
+        bboxes.extend(_split_antimeridian(_to_2d([float(c) for c in coords])))
+    if not bboxes:
+        bounds = geometry_bounds(document.get("geometry"))
+        bboxes = [bounds if bounds is not None else _UNBOUNDED_BBOX]
+
+    intervals = [
+        (
+            parse_datetime(start) if start else -math.inf,
+            parse_datetime(end) if end else math.inf,
+        )
+        for start, end in temporal.get("interval") or []
+    ] or [_UNBOUNDED_INTERVAL]
+
+    return [(*bbox, *interval) for bbox in bboxes for interval in intervals]
+
+
+def _match(bounds: NDArray[np.float64], query: NDArray[np.float64], predicate: Predicate) -> NDArray[np.bool_]:
+    """Vectorized test of `(n, 6)` bounds against a `(6,)` query."""
+    matched: NDArray[np.bool_]
+    if predicate == "contains":
+        matched = (
+            (bounds[:, _MIN_X] <= query[_MIN_X])
+            & (bounds[:, _MIN_Y] <= query[_MIN_Y])
+            & (bounds[:, _MAX_X] >= query[_MAX_X])
+            & (bounds[:, _MAX_Y] >= query[_MAX_Y])
+            & (bounds[:, _MIN_T] <= query[_MIN_T])
+            & (bounds[:, _MAX_T] >= query[_MAX_T])
+        )
+    else:
+        matched = (
+            (bounds[:, _MIN_X] <= query[_MAX_X])
+            & (bounds[:, _MAX_X] >= query[_MIN_X])
+            & (bounds[:, _MIN_Y] <= query[_MAX_Y])
+            & (bounds[:, _MAX_Y] >= query[_MIN_Y])
+            & (bounds[:, _MIN_T] <= query[_MAX_T])
+            & (bounds[:, _MAX_T] >= query[_MIN_T])
+        )
+    return matched
+
+
+def _pack(bounds: NDArray[np.float64], capacity: int) -> NDArray[np.float64]:
+    """Computes the bounds of consecutive groups of `capacity` boxes."""
+    starts = np.arange(0, len(bounds), capacity)
+    return np.hstack([
+        np.minimum.reduceat(bounds[:, [_MIN_X, _MIN_Y]], starts),
+        np.maximum.reduceat(bounds[:, [_MAX_X, _MAX_Y]], starts),
+        np.minimum.reduceat(bounds[:, [_MIN_T]], starts),
+        np.maximum.reduceat(bounds[:, [_MAX_T]], starts),
+    ])
+
+
+def _str_order(bounds: NDArray[np.float64], capacity: int) -> NDArray[np.intp]:
+    """Sort-Tile-Recursive order: vertical slices by X center, each sorted by Y center."""
+    finite = np.nan_to_num(bounds[:, :4], posinf=180.0, neginf=-180.0)
+    cx = (finite[:, _MIN_X] + finite[:, _MAX_X]) / 2
+    cy = (finite[:, _MIN_Y] + finite[:, _MAX_Y]) / 2
+    n_leaves = math.ceil(len(bounds) / capacity)
+    slice_size = capacity * math.ceil(math.sqrt(n_leaves))
+    by_x = np.argsort(cx, kind="stable")
+    slices = np.arange(len(bounds)) // slice_size
+    return by_x[np.lexsort((cy[by_x], slices))]
+
+
+@dataclass(frozen=True, slots=True)
+class SpatialIndex:
+    """Static packed STR tree over record extents.
+
+    `levels[0]` holds the entry bounds in tree order and every following level the bounds of groups of `capacity`
+    nodes of the level below, up to a root level of at most `capacity` nodes.
+    """
+
+    record_ids: tuple[str, ...]
+    entry_records: NDArray[np.intp]
+    levels: tuple[NDArray[np.float64], ...]
+    capacity: int
+
+    @classmethod
+    def build(
+        cls,
+        extents: Iterable[tuple[str, list[tuple[float, float, float, float, float, float]]]],
+        capacity: int = DEFAULT_NODE_CAPACITY,
+    ) -> SpatialIndex:
+        """Builds the index.
+
+        Args:
+            extents: `(record ID, entries)` pairs, see `record_extents`.
+            capacity: Number of children per node.
+
+        Returns:
+            The index.
+
+        """
+        record_ids: list[str] = []
+        owners: list[int] = []
+        rows: list[tuple[float, ...]] = []
+        for record_id, entries in extents:
+            owners.extend([len(record_ids)] * len(entries))
+            rows.extend(entries)
+            record_ids.append(record_id)
+
+        bounds = np.asarray(rows, dtype=np.float64).reshape(-1, 6)
+        order = _str_order(bounds, capacity) if len(bounds) else np.empty(0, dtype=np.intp)
+        levels = [bounds[order]]
+        while len(levels[-1]) > capacity:
+            levels.append(_pack(levels[-1], capacity))
+        return cls(
+            record_ids=tuple(record_ids),
+            entry_records=np.asarray(owners, dtype=np.intp)[order],
+            levels=tuple(levels),
+            capacity=capacity,
+        )
+
+    @classmethod
+    def from_documents(cls, documents: Iterable[dict[str, Any]], capacity: int = DEFAULT_NODE_CAPACITY) -> SpatialIndex:
+        """Builds the index from record documents, skipping non-workflow records.
+
+        Args:
+            documents: Record documents.
+            capacity: Number of children per node.
+
+        Returns:
+            The index.
+
+        """
+        return cls.build(
+            (
+                (document["id"], record_extents(document))
+                for document in documents
+                if (document.get("properties") or {}).get("type") == "workflow"
+            ),
+            capacity,
+        )
+
+    @classmethod
+    def from_files(cls, files: Iterable[Path], capacity: int = DEFAULT_NODE_CAPACITY) -> SpatialIndex:
+        """Builds the index from record files, skipping `catalog.json` files and non-workflow records.
+
+        Args:
+            files: Record files.
+            capacity: Number of children per node.
+
+        Returns:
+            The index.
+
+        """
+        return cls.from_documents((loads(f.read_bytes()) for f in files if f.name != "catalog.json"), capacity)
+
+    def __len__(self) -> int:
+        """Returns the number of indexed records."""
+        return len(self.record_ids)
+
+    def _query(self, box: BBox, interval: tuple[float, float], predicate: Predicate, *, bounded_only: bool) -> set[int]:
+        """Walks the tree from the root and returns the indices of the matching records."""
+        query = np.array([*box, *interval], dtype=np.float64)
+        # A node's bounds cover all its entries, so both predicates also hold for the ancestors of a match.
+        candidates = np.flatnonzero(_match(self.levels[-1], query, predicate))
+        children = np.arange(self.capacity)
+        for level in reversed(self.levels[:-1]):
+            expanded = (candidates[:, None] * self.capacity + children).ravel()
+            expanded = expanded[expanded < len(level)]
+            candidates = expanded[_match(level[expanded], query, predicate)]
+        if bounded_only:
+            candidates = candidates[np.isfinite(self.levels[0][candidates, :_MIN_T]).all(axis=1)]
+        return set(self.entry_records[candidates].tolist())
+
+    def search(
+        self,
+        bbox: BBox | None = None,
+        interval: tuple[float, float] | None = None,
+        *,
+        predicate: Predicate = "intersects",
+        bounded_only: bool = False,
+    ) -> list[str]:
+        """Finds the records whose extent matches a bounding box and time interval.
+
+        Args:
+            bbox: The area of interest. A box crossing the antimeridian is split in two. Unbounded when `None`.
+            interval: The time range as POSIX timestamps, see `parse_interval`. Unbounded when `None`.
+            predicate: How extents are compared with the query.
+            bounded_only: Skip records without a spatial extent, which otherwise match any area.
+
+        Returns:
+            Sorted IDs of the matching records.
+
+        """
+        if not self.record_ids:
+            return []
+        # Without an area or a time range, they must not restrict matches: any extent overlaps the unbounded range and
+        # contains the empty one.
+        if bbox is not None:
+            boxes = _split_antimeridian(bbox)
+        else:
+            boxes = [_UNBOUNDED_BBOX if predicate == "intersects" else _EMPTY_BBOX]
+        if interval is None:
+            interval = _UNBOUNDED_INTERVAL if predicate == "intersects" else _EMPTY_INTERVAL
+        matches = [self._query(box, interval, predicate, bounded_only=bounded_only) for box in boxes]
+        # With `contains`, both halves of a box crossing the antimeridian must be covered by the same record.
+        records = set.intersection(*matches) if predicate == "contains" else set.union(*matches)
+        return sorted(self.record_ids[i] for i in records)
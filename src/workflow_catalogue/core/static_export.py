@@ -0,0 +1,314 @@
+"""Static export of the catalogue as precomputed OGC API - Records responses.
+
+The catalogue is rendered into a tree of JSON documents that any static file host (CDN, object store) can serve:
+
+```text
+collections/index.json                   GET /collections
+collections/{id}/index.json              GET /collections/{id}
+collections/{id}/items/index.json        GET /collections/{id}/items (first page)
+collections/{id}/items/page-{n}.json     further pages, linked via `next`/`prev`
+```
+
+Documents are serialized in canonical form, so the same catalogue always renders to the same bytes. The export is
+incremental: the content hash of every written document is kept in a manifest next to the tree and only documents
+whose hash changed are rewritten. Documents that are no longer produced (e.g. trailing pages after records were
+removed) are deleted.
+
+"""
+
+from __future__ import annotations
+
+import hashlib
+from typing import TYPE_CHECKING, Any
+
+from pydantic import BaseModel, Field
+
+from workflow_catalogue.utils.serialization import canonical_dumps, format_json, loads
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+    from pathlib import Path
+
+MANIFEST_NAME = ".static-manifest.json"
+"""Name of the manifest file holding content hashes of the exported documents."""
+
+DEFAULT_PAGE_SIZE = 100
+"""Default number of records per items page."""
+
+JSON_MEDIA_TYPE = "application/json"
+GEOJSON_MEDIA_TYPE = "application/geo+json"
+
+_CATALOG_FILE = "catalog.json"
+_INDEX_FILE = "index.json"
+_EXCLUDED_COLLECTION_RELS = {"self", "root", "parent", "item", "child"}
+
+
+class ExportResult(BaseModel):
+    """Outcome of a static export."""
+
+    written: list[str] = Field(default_factory=list, description="Documents created or rewritten")
+    unchanged: int = Field(default=0, description="Number of documents left untouched")
+    removed: list[str] = Field(default_factory=list, description="Stale documents deleted from the tree")
+
+
+class StaticLayout:
+    """Maps OGC API - Records resources onto static file paths and URLs."""
+
+    def __init__(self, base_url: str = "") -> None:
+        """Initializes the layout.
+
+        Args:
+            base_url: URL the tree is served from. Links are root-relative when empty.
+
+        """
+        self.base_url = base_url.rstrip("/")
+
+    def url(self, path: str) -> str:
+        """Returns the public URL of a document.
+
+        Args:
+            path: Document path relative to the export root.
+
+        Returns:
+            The URL.
+
+        """
+        return f"{self.base_url}/{path}"
+
+    @staticmethod
+    def collections() -> str:
+        """Returns the path of the collections document."""
+        return f"collections/{_INDEX_FILE}"
+
+    @staticmethod
+    def collection(collection_id: str) -> str:
+        """Returns the path of a collection document.
+
+        Args:
+            collection_id: The collection ID.
+
+        Returns:
+            The document path.
+
+        """
+        return f"collections/{collection_id}/{_INDEX_FILE}"
+
+    @staticmethod
+    def items(collection_id: str, page: int = 1) -> str:
+        """Returns the path of an items page.
+
+        Args:
+            collection_id: The collection ID.
+            page: 1-based page number.
+
+        Returns:
+            The document path.
+
+        """
+        name = _INDEX_FILE if page == 1 else f"page-{page}.json"
+        return f"collections/{collection_id}/items/{name}"
+
+
+def _link(href: str, rel: str, media_type: str, title: str | None = None) -> dict[str, str]:
+    link = {"href": href, "rel": rel, "type": media_type}
+    if title:
+        link["title"] = title
+    return link
+
+
+def _load_json(file_path: Path) -> Any:
+    return loads(file_path.read_bytes())
+
+
+def discover_collections(catalogue_path: Path) -> list[Path]:
+    """Finds collection directories, i.e. directories directly containing a `catalog.json`.
+
+    Args:
+        catalogue_path: Catalogue root directory.
+
+    Returns:
+        Collection directories ordered by name.
+
+    """
+    return sorted(catalog.parent for catalog in catalogue_path.rglob(_CATALOG_FILE))
+
+
+def load_collection_records(collection_dir: Path) -> list[dict[str, Any]]:
+    """Loads all records of a collection.
+
+    Args:
+        collection_dir: Collection directory.
+
+    Returns:
+        Record documents ordered by ID.
+
+    """
+    records = [_load_json(path) for path in collection_dir.rglob("*.json") if path.name != _CATALOG_FILE]
+    return sorted(records, key=lambda record: str(record.get("id", "")))
+
+
+def render_collection(catalog: dict[str, Any], layout: StaticLayout) -> dict[str, Any]:
+    """Renders the `/collections/{id}` response from a `catalog.json` document.
+
+    Navigation links of the source file are replaced with links into the static tree.
+
+    Args:
+        catalog: The `catalog.json` document.
+        layout: The static layout.
+
+    Returns:
+        The collection document.
+
+    """
+    collection_id = catalog["id"]
+    title = catalog.get("title")
+    links = [link for link in catalog.get("links", []) if link.get("rel") not in _EXCLUDED_COLLECTION_RELS]
+    links += [
+        _link(layout.url(layout.collection(collection_id)), "self", JSON_MEDIA_TYPE, title),
+        _link(layout.url(layout.collections()), "parent", JSON_MEDIA_TYPE, "Collections"),
+        _link(layout.url(layout.items(collection_id)), "items", GEOJSON_MEDIA_TYPE, "Records"),
+    ]
+    return {**catalog, "links": links}
+
+
+def render_items_pages(
+    collection_id: str, records: list[dict[str, Any]], layout: StaticLayout, page_size: int = DEFAULT_PAGE_SIZE
+) -> Iterator[tuple[str, dict[str, Any]]]:
+    """Renders the paginated `/collections/{id}/items` responses.
+
+    Args:
+        collection_id: The collection ID.
+        records: Record documents in page order.
+        layout: The static layout.
+        page_size: Maximum number of records per page.
+
+    Yields:
+        Document path and items page. A collection without records yields a single empty page.
+
+    """
+    n_pages = max(1, -(-len(records) // page_size))
+    for page in range(1, n_pages + 1):
+        features = records[(page - 1) * page_size : page * page_size]
+        links = [
+            _link(layout.url(layout.items(collection_id, page)), "self", GEOJSON_MEDIA_TYPE),
+            _link(layout.url(layout.collection(collection_id)), "collection", JSON_MEDIA_TYPE),
+        ]
+        if page > 1:
+            links.append(_link(layout.url(layout.items(collection_id, page - 1)), "prev", GEOJSON_MEDIA_TYPE))
+        if page < n_pages:
+            links.append(_link(layout.url(layout.items(collection_id, page + 1)), "next", GEOJSON_MEDIA_TYPE))
+        yield (
+            layout.items(collection_id, page),
+            {
+                "type": "FeatureCollection",
+                "numberMatched": len(records),
+                "numberReturned": len(features),
+                "features": features,
+                "links": links,
+            },
+        )
+
+
+def render_static_tree(
+    catalogue_path: Path, layout: StaticLayout, page_size: int = DEFAULT_PAGE_SIZE
+) -> Iterator[tuple[str, dict[str, Any]]]:
+    """Renders every document of the static tree.
+
+    Records are loaded one collection at a time, so memory use is bounded by the largest collection.
+
+    Args:
+        catalogue_path: Catalogue root directory.
+        layout: The static layout.
+        page_size: Maximum number of records per items page.
+
+    Yields:
+        Document path and document.
+
+    """
+    collections = []
+    for collection_dir in discover_collections(catalogue_path):
+        collection = render_collection(_load_json(collection_dir / _CATALOG_FILE), layout)
+        collections.append(collection)
+        yield layout.collection(collection["id"]), collection
+        yield from render_items_pages(collection["id"], load_collection_records(collection_dir), layout, page_size)
+
+    yield (
+        layout.collections(),
+        {
+            "collections": collections,
+            "links": [_link(layout.url(layout.collections()), "self", JSON_MEDIA_TYPE, "Collections")],
+        },
+    )
+
+
+def _read_manifest(output_dir: Path) -> dict[str, str]:
+    manifest = output_dir / MANIFEST_NAME
+    if not manifest.exists():
+        return {}
+    try:
+        data = _load_json(manifest)
+    except ValueError:
+        return {}
+    return data if isinstance(data, dict) else {}
+
+
+def _remove(output_dir: Path, path: str) -> bool:
+    """Deletes a stale document and any directories left empty by it.
+
+    Paths come from the manifest on disk - anything resolving outside the output directory is left alone.
+
+    """
+    root = output_dir.resolve()
+    target = (root / path).resolve()
+    if target == root or not target.is_relative_to(root):
+        return False
+    target.unlink(missing_ok=True)
+    for directory in target.parents:
+        if directory == root or not directory.is_relative_to(root) or any(directory.iterdir()):
+            break
+        directory.rmdir()
+    return True
+
+
+def export_static(
+    catalogue_path: Path,
+    output_dir: Path,
+    *,
+    base_url: str = "",
+    page_size: int = DEFAULT_PAGE_SIZE,
+) -> ExportResult:
+    """Exports the catalogue as a static OGC API - Records tree, rewriting only documents that changed.
+
+    Args:
+        catalogue_path: Catalogue root directory.
+        output_dir: Root of the static tree.
+        base_url: URL the tree is served from.
+        page_size: Maximum number of records per items page.
+
+    Returns:
+        The export result.
+
+    """
+    result = ExportResult()
+    previous = _read_manifest(output_dir)
+    current: dict[str, str] = {}
+
+    for path, document in render_static_tree(catalogue_path, StaticLayout(base_url), page_size):
+        content = canonical_dumps(document)
+        digest = hashlib.sha256(content).hexdigest()
+        current[path] = digest
+        target = output_dir / path
+        if previous.get(path) == digest and target.exists():
+            result.unchanged += 1
+            continue
+        target.parent.mkdir(parents=True, exist_ok=True)
+        target.write_bytes(content)
+        result.written.append(path)
+
+    for path in sorted(previous.keys() - current.keys()):
+        if _remove(output_dir, path):
+            result.removed.append(path)
+
+    output_dir.mkdir(parents=True, exist_ok=True)
+    (output_dir / MANIFEST_NAME).write_text(format_json(current, indent=2), encoding="utf-8")
+    return result
@@ -0,0 +1,432 @@
+"""Catalogue record validation.
+
+Every file is validated in isolation and produces a `FileResult` with structured error locations and separate parse and
+validation timings, so results can be aggregated into a `ValidationReport` and rendered as JSON, JUnit XML or SARIF.
+
+Record geometries are checked on packed NumPy arrays (`workflow_catalogue.core.geometry`) instead of point by point
+with pydantic. Geometries the array checks cannot accept are still validated by pydantic, so verdicts and errors do
+not change. Geometry problems the schema accepts (coordinates out of range, ring winding, positions outside the
+spatial extent) are reported as warnings.
+
+Validation can run in a pool of worker processes. At most a few files per worker are in flight at any time, which lets
+`validate_files` stop submitting work as soon as the error budget is exhausted instead of draining the whole catalogue.
+
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import multiprocessing
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from pathlib import Path  # noqa: TC003
+from typing import TYPE_CHECKING, Any, Literal
+from xml.etree import ElementTree  # noqa: S405 - only used to build the JUnit report, never to parse input
+
+from pydantic import BaseModel, Field, ValidationError
+
+from workflow_catalogue.core.geometry import extent_bboxes, geometry_warnings, pack_geometry
+from workflow_catalogue.schemas.catalogue import EodhCatalogue
+from workflow_catalogue.schemas.notebook import EodhNotebookRecord
+from workflow_catalogue.schemas.workflow import EodhWorkflowRecord
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+    from multiprocessing.context import BaseContext
+
+ReportFormat = Literal["json", "junit", "sarif"]
+"""Supported report formats."""
+
+REPORT_FORMATS: tuple[ReportFormat, ...] = ("json", "junit", "sarif")
+"""Supported report formats."""
+
+SARIF_SCHEMA = "https://json.schemastore.org/sarif-2.1.0.json"
+_IN_FLIGHT_PER_WORKER = 4
+
+
+class ValidationIssue(BaseModel):
+    """A single validation problem within a file."""
+
+    loc: list[str | int] = Field(default_factory=list, description="Location of the problem within the JSON document")
+    msg: str
+    type: str = Field(description="Machine-readable error type, e.g. `missing` or `json_invalid`")
+
+    @property
+    def json_path(self) -> str:
+        """The location formatted as a dotted path, e.g. `properties.contacts[0].name`."""
+        path = "$"
+        for part in self.loc:
+            path += f"[{part}]" if isinstance(part, int) else f".{part}"
+        return path
+
+
+class FileResult(BaseModel):
+    """Outcome of validating a single file."""
+
+    path: Path
+    record_type: str | None = None
+    sha256: str | None = Field(default=None, description="SHA-256 of the file content, unset if it could not be read")
+    parse_ms: float = 0.0
+    validate_ms: float = 0.0
+    errors: list[ValidationIssue] = Field(default_factory=list)
+    warnings: list[ValidationIssue] = Field(default_factory=list, description="Problems that do not fail validation")
+
+    @property
+    def passed(self) -> bool:
+        """Whether the file passed validation."""
+        return not self.errors
+
+    @property
+    def total_ms(self) -> float:
+        """Total time spent on the file in milliseconds."""
+        return self.parse_ms + self.validate_ms
+
+
+class ValidationReport(BaseModel):
+    """Aggregated validation results."""
+
+    files: list[FileResult] = Field(default_factory=list)
+    total_ms: float = 0.0
+    stopped_early: bool = Field(default=False, description="Whether validation stopped after reaching the error limit")
+
+    @property
+    def failed(self) -> list[FileResult]:
+        """Results of files that failed validation."""
+        return [result for result in self.files if not result.passed]
+
+    def slowest(self, n: int = 10) -> list[FileResult]:
+        """Returns the files that took the longest to parse and validate.
+
+        Args:
+            n: Number of files to return.
+
+        Returns:
+            Up to `n` results ordered from the slowest.
+
+        """
+        return sorted(self.files, key=lambda result: result.total_ms, reverse=True)[:n]
+
+
+def _check_geometry(data: dict[str, Any], warnings: list[ValidationIssue]) -> dict[str, Any]:
+    """Validate the record geometry on packed arrays.
+
+    Args:
+        data: The parsed record.
+        warnings: Receives the geometry warnings.
+
+    Returns:
+        The record without its geometry when the geometry is valid, so that pydantic does not validate it again.
+        Otherwise the record unchanged.
+
+    """
+    packed = pack_geometry(data.get("geometry"))
+    if packed is None:
+        return data
+    warnings.extend(
+        ValidationIssue(loc=["geometry"], msg=warning.msg, type=warning.type)
+        for warning in geometry_warnings(packed, extent_bboxes(data))
+    )
+    return {**data, "geometry": None}
+
+
+def _validate_data(file_path: Path, data: Any, warnings: list[ValidationIssue]) -> str:
+    """Validate parsed JSON against the schema matching the record type.
+
+    Args:
+        file_path: Path to the file the data was read from.
+        data: The parsed document.
+        warnings: Receives problems that do not fail validation.
+
+    Returns:
+        The detected record type.
+
+    Raises:
+        ValueError: If the record type is unknown or filename/ID mismatch.
+        ValidationError: If the document does not match the schema.
+
+    """
+    if file_path.name == "catalog.json":
+        EodhCatalogue.model_validate(data)
+        return "catalog"
+
+    record_id = data.get("id")
+    if record_id and record_id != file_path.stem:
+        msg = f"Filename '{file_path.stem}' does not match record id '{record_id}'"
+        raise ValueError(msg)
+
+    record_type = data.get("properties", {}).get("type")
+    if record_type in {"workflow", "notebook"}:
+        data = _check_geometry(data, warnings)
+    if record_type == "workflow":
+        EodhWorkflowRecord.model_validate(data)
+    elif record_type == "notebook":
+        EodhNotebookRecord.model_validate(data)
+    else:
+        msg = f"Unknown or missing record type: {record_type}"
+        raise ValueError(msg)
+    return str(record_type)
+
+
+def validate_file(file_path: Path) -> FileResult:
+    """Parse and validate a single catalogue file.
+
+    Args:
+        file_path: Path to the JSON file to validate.
+
+    Returns:
+        The validation result. Exceptions raised by parsing or validation are converted into issues.
+
+    """
+    result = FileResult(path=file_path)
+    start = time.perf_counter()
+    try:
+        content = file_path.read_bytes()
+        result.sha256 = hashlib.sha256(content).hexdigest()
+        data = json.loads(content.decode("utf-8"))
+    except json.JSONDecodeError as exc:
+        result.parse_ms = (time.perf_counter() - start) * 1000
+        result.errors.append(
+            ValidationIssue(msg=f"{exc.msg} at line {exc.lineno}, column {exc.colno}", type="json_invalid")
+        )
+        return result
+    except UnicodeDecodeError as exc:
+        result.parse_ms = (time.perf_counter() - start) * 1000
+        result.errors.append(
+            ValidationIssue(msg=f"not valid UTF-8: {exc.reason} at byte {exc.start}", type="json_invalid")
+        )
+        return result
+    except OSError as exc:
+        result.parse_ms = (time.perf_counter() - start) * 1000
+        result.errors.append(ValidationIssue(msg=str(exc), type="io_error"))
+        return result
+    parsed = time.perf_counter()
+    result.parse_ms = (parsed - start) * 1000
+
+    try:
+        result.record_type = _validate_data(file_path, data, result.warnings)
+    except ValidationError as exc:
+        result.errors.extend(
+            ValidationIssue(loc=list(error["loc"]), msg=error["msg"], type=error["type"])
+            for error in exc.errors(include_url=False)
+        )
+    except (ValueError, AttributeError) as exc:
+        result.errors.append(ValidationIssue(msg=str(exc), type="value_error"))
+    result.validate_ms = (time.perf_counter() - parsed) * 1000
+    return result
+
+
+def _worker_context() -> BaseContext | None:
+    """Start method for validation workers.
+
+    Files are often produced by the threaded `scan_catalogue` while workers are being started, and forking a
+    multi-threaded process can deadlock the child. Workers are forked from a single-threaded server instead, with this
+    module preloaded so they do not import the schemas again.
+
+    """
+    if "forkserver" not in multiprocessing.get_all_start_methods():
+        return None
+    context = multiprocessing.get_context("forkserver")
+    context.set_forkserver_preload([__name__])
+    return context
+
+
+def validate_files(files: Iterable[Path], *, workers: int = 1, max_errors: int | None = None) -> Iterator[FileResult]:
+    """Validate files, optionally in parallel, stopping once too many files failed.
+
+    Args:
+        files: Paths of the JSON files to validate.
+        workers: Number of worker processes. Files are validated in the current process when set to 1.
+        max_errors: Stop after this many files failed. Validates everything when `None`.
+
+    Yields:
+        File results in completion order.
+
+    """
+    failures = 0
+    if workers <= 1:
+        for file_path in files:
+            result = validate_file(file_path)
+            yield result
+            failures += not result.passed
+            if max_errors is not None and failures >= max_errors:
+                return
+        return
+
+    pending = iter(files)
+    with ProcessPoolExecutor(max_workers=workers, mp_context=_worker_context()) as executor:
+        in_flight: set[Future[FileResult]] = set()
+
+        def fill() -> None:
+            while len(in_flight) < workers * _IN_FLIGHT_PER_WORKER:
+                file_path = next(pending, None)
+                if file_path is None:
+                    return
+                in_flight.add(executor.submit(validate_file, file_path))
+
+        fill()
+        while in_flight:
+            done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+            for future in done:
+                in_flight.discard(future)
+                result = future.result()
+                yield result
+                failures += not result.passed
+                if max_errors is not None and failures >= max_errors:
+                    executor.shutdown(wait=False, cancel_futures=True)
+                    return
+            fill()
+
+
+def run_validation(files: Iterable[Path], *, workers: int = 1, max_errors: int | None = None) -> ValidationReport:
+    """Validate files and aggregate the results into a report.
+
+    Args:
+        files: Paths of the JSON files to validate.
+        workers: Number of worker processes.
+        max_errors: Stop after this many files failed.
+
+    Returns:
+        The report, with file results ordered by path.
+
+    """
+    start = time.perf_counter()
+    pending = iter(files)
+    taken = 0
+
+    def take() -> Iterator[Path]:
+        nonlocal taken
+        for path in pending:
+            taken += 1
+            yield path
+
+    results = list(validate_files(take(), workers=workers, max_errors=max_errors))
+    return ValidationReport(
+        files=sorted(results, key=lambda result: result.path),
+        total_ms=(time.perf_counter() - start) * 1000,
+        # Reaching the error limit on the last file is not stopping early, leaving files unvalidated is.
+        stopped_early=len(results) < taken or next(pending, None) is not None,
+    )
+
+
+def render_json(report: ValidationReport) -> str:
+    """Renders a report as JSON.
+
+    Args:
+        report: The report to render.
+
+    Returns:
+        The JSON document.
+
+    """
+    return json.dumps(
+        {
+            "summary": {
+                "files": len(report.files),
+                "failed": len(report.failed),
+                "total_ms": round(report.total_ms, 3),
+                "stopped_early": report.stopped_early,
+            },
+            "slowest": [{"path": r.path.as_posix(), "total_ms": round(r.total_ms, 3)} for r in report.slowest()],
+            "files": [
+                {
+                    "path": result.path.as_posix(),
+                    "record_type": result.record_type,
+                    "passed": result.passed,
+                    "parse_ms": round(result.parse_ms, 3),
+                    "validate_ms": round(result.validate_ms, 3),
+                    "errors": [{**issue.model_dump(), "path": issue.json_path} for issue in result.errors],
+                    "warnings": [{**issue.model_dump(), "path": issue.json_path} for issue in result.warnings],
+                }
+                for result in report.files
+            ],
+        },
+        indent=2,
+    )
+
+
+def render_junit(report: ValidationReport) -> str:
+    """Renders a report as JUnit XML, one test case per file.
+
+    Args:
+        report: The report to render.
+
+    Returns:
+        The XML document.
+
+    """
+    suite = ElementTree.Element(
+        "testsuite",
+        name="catalogue-validation",
+        tests=str(len(report.files)),
+        failures=str(len(report.failed)),
+        errors="0",
+        time=f"{report.total_ms / 1000:.3f}",
+    )
+    for result in report.files:
+        case = ElementTree.SubElement(
+            suite,
+            "testcase",
+            classname=result.record_type or "unknown",
+            name=result.path.as_posix(),
+            time=f"{result.total_ms / 1000:.3f}",
+        )
+        if result.errors:
+            failure = ElementTree.SubElement(case, "failure", message=result.errors[0].msg, type=result.errors[0].type)
+            failure.text = "\n".join(f"{issue.json_path}: {issue.msg}" for issue in result.errors)
+    ElementTree.indent(suite)
+    return ElementTree.tostring(suite, encoding="unicode", xml_declaration=True)
+
+
+def render_sarif(report: ValidationReport) -> str:
+    """Renders a report as SARIF 2.1.0, one result per validation issue, warnings at the `warning` level.
+
+    Args:
+        report: The report to render.
+
+    Returns:
+        The SARIF document.
+
+    """
+    rule_ids = sorted({issue.type for result in report.files for issue in [*result.errors, *result.warnings]})
+    rule_index = {rule_id: index for index, rule_id in enumerate(rule_ids)}
+    results = [
+        {
+            "ruleId": issue.type,
+            "ruleIndex": rule_index[issue.type],
+            "level": level,
+            "message": {"text": issue.msg},
+            "locations": [
+                {
+                    "physicalLocation": {"artifactLocation": {"uri": result.path.as_posix()}},
+                    "logicalLocations": [{"fullyQualifiedName": issue.json_path, "kind": "member"}],
+                }
+            ],
+        }
+        for result in report.files
+        for level, issues in (("error", result.errors), ("warning", result.warnings))
+        for issue in issues
+    ]
+    return json.dumps(
+        {
+            "$schema": SARIF_SCHEMA,
+            "version": "2.1.0",
+            "runs": [
+                {
+                    "tool": {
+                        "driver": {
+                            "name": "wfc",
+                            "informationUri": "https://github.com/EO-DataHub/workflow-catalogue",
+                            "rules": [{"id": rule_id, "name": rule_id} for rule_id in rule_ids],
+                        }
+                    },
+                    "results": results,
+                }
+            ],
+        },
+        indent=2,
+    )
+
+
+RENDERERS = {"json": render_json, "junit": render_junit, "sarif": render_sarif}
+"""Report renderers by format."""
@@ -0,0 +1,327 @@
+"""File system watching for the catalogue directory.
+
+Two backends are available:
+
+* `InotifyWatcher` - uses the Linux inotify API through `ctypes`, so changes are reported as soon as the editor closes
+  the file,
+* `PollingWatcher` - a portable fallback that periodically compares file modification times and sizes.
+
+`create_watcher` picks inotify when it is available and falls back to polling otherwise. `watch_changes` turns a watcher
+into a stream of debounced batches of changed paths - editors often save through a temporary file and a rename, which
+would otherwise trigger several re-validations for a single save.
+
+"""
+
+from __future__ import annotations
+
+import ctypes
+import ctypes.util
+import os
+import select
+import struct
+import sys
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING, Protocol
+
+from workflow_catalogue.core.scan import CATALOG_FILE_NAME, scan_catalogue
+from workflow_catalogue.utils.logging import get_logger
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+_logger = get_logger(__name__)
+
+_IN_CLOSE_WRITE = 0x00000008
+_IN_MOVED_FROM = 0x00000040
+_IN_MOVED_TO = 0x00000080
+_IN_CREATE = 0x00000100
+_IN_DELETE = 0x00000200
+_IN_DELETE_SELF = 0x00000400
+_IN_Q_OVERFLOW = 0x00004000
+_IN_IGNORED = 0x00008000
+_IN_ISDIR = 0x40000000
+_IN_NONBLOCK = os.O_NONBLOCK
+_IN_CLOEXEC = os.O_CLOEXEC
+_WATCH_MASK = _IN_CLOSE_WRITE | _IN_MOVED_FROM | _IN_MOVED_TO | _IN_CREATE | _IN_DELETE | _IN_DELETE_SELF
+_EVENT_HEADER = struct.Struct("iIII")
+_READ_SIZE = 64 * 1024
+
+
+class Watcher(Protocol):
+    """A source of file system changes."""
+
+    def poll(self, timeout: float | None) -> set[Path]:
+        """Waits for changes.
+
+        Args:
+            timeout: Maximum time to wait in seconds. `None` waits indefinitely.
+
+        Returns:
+            Paths of JSON files that were created, modified or removed. Empty when the timeout expired.
+
+        """
+        ...
+
+    def close(self) -> None:
+        """Releases resources held by the watcher."""
+        ...
+
+
+def is_json(path: Path) -> bool:
+    """Checks whether a path points at a JSON document.
+
+    Args:
+        path: The path to check.
+
+    Returns:
+        Whether the path has a `.json` suffix.
+
+    """
+    return path.suffix == ".json"
+
+
+def scan_json_files(root: Path) -> dict[Path, tuple[int, int]]:
+    """Collects modification time and size of all JSON files under a directory.
+
+    Args:
+        root: Directory to scan.
+
+    Returns:
+        Mapping of file path to `(mtime_ns, size)`.
+
+    """
+    return {
+        file.path: (file.mtime_ns, file.size)
+        for file in scan_catalogue(root)
+        if file.mtime_ns is not None and file.size is not None
+    }
+
+
+class PollingWatcher:
+    """Detects changes by periodically comparing file modification times and sizes."""
+
+    def __init__(self, root: Path, interval: float = 0.5) -> None:
+        """Initializes the watcher and takes the initial snapshot.
+
+        Args:
+            root: Directory to watch.
+            interval: Time between scans in seconds.
+
+        """
+        self.root = root
+        self.interval = interval
+        self._snapshot = scan_json_files(root)
+
+    def poll(self, timeout: float | None) -> set[Path]:
+        """Scans the directory until a change is found or the timeout expires.
+
+        Args:
+            timeout: Maximum time to wait in seconds. `None` waits indefinitely.
+
+        Returns:
+            Paths of JSON files that were created, modified or removed.
+
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            current = scan_json_files(self.root)
+            changed = {
+                path for path in current.keys() | self._snapshot.keys() if current.get(path) != self._snapshot.get(path)
+            }
+            self._snapshot = current
+            if changed:
+                return changed
+            if deadline is not None and time.monotonic() >= deadline:
+                return set()
+            wait = self.interval if deadline is None else min(self.interval, max(deadline - time.monotonic(), 0.0))
+            time.sleep(wait)
+
+    def close(self) -> None:
+        """Nothing to release for the polling watcher."""
+
+
+class InotifyWatcher:
+    """Watches a directory tree through the Linux inotify API."""
+
+    def __init__(self, root: Path) -> None:
+        """Initializes the watcher and registers watches for every directory under `root`.
+
+        Args:
+            root: Directory to watch.
+
+        Raises:
+            OSError: If inotify is not available on this platform.
+
+        """
+        if not sys.platform.startswith("linux"):
+            msg = f"inotify is not available on {sys.platform}"
+            raise OSError(msg)
+        libc_name = ctypes.util.find_library("c") or "libc.so.6"
+        self._libc = ctypes.CDLL(libc_name, use_errno=True)
+        self._libc.inotify_add_watch.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32]
+        fd = self._libc.inotify_init1(_IN_NONBLOCK | _IN_CLOEXEC)
+        if fd < 0:
+            errno = ctypes.get_errno()
+            raise OSError(errno, os.strerror(errno))
+        self._fd: int = fd
+        self.root = root
+        self._dirs: dict[int, Path] = {}
+        self._add_tree(root)
+
+    def _add_watch(self, directory: Path) -> None:
+        wd = self._libc.inotify_add_watch(self._fd, os.fsencode(directory), _WATCH_MASK)
+        if wd < 0:
+            errno = ctypes.get_errno()
+            raise OSError(errno, os.strerror(errno), str(directory))
+        self._dirs[wd] = directory
+
+    def _add_tree(self, root: Path) -> set[Path]:
+        """Watches a directory and all its subdirectories, returning the JSON files already inside."""
+        found: set[Path] = set()
+        stack = [root]
+        while stack:
+            directory = stack.pop()
+            try:
+                self._add_watch(directory)
+                entries = list(os.scandir(directory))
+            except (FileNotFoundError, NotADirectoryError):
+                continue
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(Path(entry.path))
+                elif entry.name.endswith(".json"):
+                    found.add(Path(entry.path))
+        return found
+
+    def poll(self, timeout: float | None) -> set[Path]:
+        """Waits for inotify events.
+
+        Args:
+            timeout: Maximum time to wait in seconds. `None` waits indefinitely.
+
+        Returns:
+            Paths of JSON files that were created, modified or removed.
+
+        """
+        readable, _, _ = select.select([self._fd], [], [], timeout)
+        if not readable:
+            return set()
+        try:
+            buffer = os.read(self._fd, _READ_SIZE)
+        except BlockingIOError:
+            return set()
+        return self._parse(buffer)
+
+    def _parse(self, buffer: bytes) -> set[Path]:
+        changed: set[Path] = set()
+        offset = 0
+        while offset + _EVENT_HEADER.size <= len(buffer):
+            wd, mask, _cookie, length = _EVENT_HEADER.unpack_from(buffer, offset)
+            offset += _EVENT_HEADER.size
+            name = os.fsdecode(buffer[offset : offset + length].rstrip(b"\0"))
+            offset += length
+
+            if mask & _IN_Q_OVERFLOW:
+                _logger.warning("inotify event queue overflowed, rescanning %s", self.root)
+                return set(scan_json_files(self.root))
+            if mask & _IN_IGNORED:
+                self._dirs.pop(wd, None)
+                continue
+            directory = self._dirs.get(wd)
+            if directory is None or not name:
+                continue
+
+            path = directory / name
+            if mask & _IN_ISDIR:
+                if mask & (_IN_CREATE | _IN_MOVED_TO):
+                    changed |= self._add_tree(path)
+                elif mask & (_IN_MOVED_FROM | _IN_DELETE):
+                    self._forget_tree(path)
+                    changed.add(path)
+            elif is_json(path):
+                changed.add(path)
+        return changed
+
+    def _forget_tree(self, directory: Path) -> None:
+        """Stops tracking a directory that was moved away, its watch descriptors would report stale paths."""
+        for wd, path in list(self._dirs.items()):
+            if path == directory or directory in path.parents:
+                del self._dirs[wd]
+
+    def close(self) -> None:
+        """Closes the inotify file descriptor."""
+        if self._fd >= 0:
+            os.close(self._fd)
+            self._fd = -1
+
+    def __del__(self) -> None:
+        """Closes the inotify file descriptor when the watcher is garbage collected."""
+        fd = getattr(self, "_fd", -1)
+        if fd >= 0:
+            os.close(fd)
+
+
+def create_watcher(root: Path, *, polling: bool = False, interval: float = 0.5) -> Watcher:
+    """Creates the best available watcher for a directory.
+
+    Args:
+        root: Directory to watch.
+        polling: Force the polling backend.
+        interval: Polling interval in seconds, used only by the polling backend.
+
+    Returns:
+        An inotify watcher when available, a polling watcher otherwise.
+
+    """
+    if not polling:
+        try:
+            return InotifyWatcher(root)
+        except OSError as exc:
+            _logger.warning("inotify unavailable (%s), falling back to polling every %.2fs", exc, interval)
+    return PollingWatcher(root, interval=interval)
+
+
+def watch_changes(watcher: Watcher, debounce: float = 0.05) -> Iterator[set[Path]]:
+    """Yields debounced batches of changed JSON files.
+
+    After the first change is observed, events are collected until no new event arrives for `debounce` seconds.
+
+    Args:
+        watcher: The change source.
+        debounce: Quiet period in seconds that closes a batch.
+
+    Yields:
+        Non-empty sets of changed paths.
+
+    """
+    while True:
+        batch = watcher.poll(None)
+        while batch and (more := watcher.poll(debounce)):
+            batch |= more
+        if batch:
+            yield batch
+
+
+def affected_files(changed: set[Path]) -> tuple[list[Path], list[Path]]:
+    """Expands a set of changed files to the files that need re-validation.
+
+    A changed `catalog.json` affects every record of its collection, i.e. all JSON files below its directory.
+
+    Args:
+        changed: Paths of changed files.
+
+    Returns:
+        A tuple of sorted existing files to validate and sorted paths (files or directories) that no longer exist.
+
+    """
+    to_validate: set[Path] = set()
+    removed: set[Path] = set()
+    for path in changed:
+        if not path.exists():
+            removed.add(path)
+            continue
+        if path.name == CATALOG_FILE_NAME:
+            to_validate |= set(scan_json_files(path.parent))
+        to_validate.add(path)
+    return sorted(to_validate), sorted(removed)
@@ -0,0 +1,224 @@
+"""Profiling hooks for CLI and CD runs.
+
+`profile` wraps a run with one of three profilers and, when the run ends (also on errors and `sys.exit`), writes a
+profile artifact and logs a top-N summary:
+
+* `cprofile` - deterministic function profile. Artifact: a `.prof` file for `pstats`/snakeviz. Summary: the functions
+  with the highest cumulative and own time. On Python 3.12+ it covers all threads.
+* `tracemalloc` - allocation profile. Artifact: a `.tracemalloc` snapshot (`tracemalloc.Snapshot.load`). Summary: peak
+  traced memory and the lines holding the most memory at the end of the run.
+* `sampling` - wall-clock sampling of the stacks of all threads. Low overhead, and time spent waiting on DNS, TLS or
+  the server shows up in socket and SSL frames. Artifact: a `.folded` file (one `caller;callee count` line per stack)
+  for flame graph tools such as speedscope. Summary: the functions most often on top of the stack and on the stack.
+
+The `wfc` group enables it with `--profile`, or with the `WFC_PROFILE` environment variable so CI can turn it on
+without changing the command. Artifacts go to `--profile-dir` / `WFC_PROFILE_DIR`, `profiles` by default.
+
+"""
+
+from __future__ import annotations
+
+import contextlib
+import cProfile
+import io
+import os
+import pstats
+import sys
+import threading
+import time
+import tracemalloc
+from collections import Counter
+from pathlib import Path
+from typing import TYPE_CHECKING, Literal
+
+from workflow_catalogue.utils.logging import get_logger
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+    from types import CodeType, FrameType
+
+_logger = get_logger(__name__)
+
+Profiler = Literal["cprofile", "tracemalloc", "sampling"]
+"""Available profilers."""
+
+PROFILERS: tuple[Profiler, ...] = ("cprofile", "tracemalloc", "sampling")
+
+PROFILE_ENV = "WFC_PROFILE"
+"""Environment variable selecting the profiler."""
+
+PROFILE_DIR_ENV = "WFC_PROFILE_DIR"
+"""Environment variable overriding the artifact directory."""
+
+DEFAULT_PROFILE_DIR = Path("profiles")
+"""Default artifact directory, relative to the working directory."""
+
+DEFAULT_TOP = 20
+"""Default number of entries in the summary."""
+
+DEFAULT_SAMPLING_INTERVAL = 0.005
+"""Seconds between two samples of the sampling profiler."""
+
+_TRACEMALLOC_FRAMES = 10
+
+
+def _label(code: CodeType) -> str:
+    path = Path(code.co_filename)
+    return f"{code.co_qualname} ({'/'.join(path.parts[-2:])}:{code.co_firstlineno})"
+
+
+class SamplingProfiler:
+    """Samples the stacks of all other threads at a fixed interval from a background thread."""
+
+    def __init__(self, interval: float = DEFAULT_SAMPLING_INTERVAL) -> None:
+        """Initializes a stopped profiler.
+
+        Args:
+            interval: Seconds between two samples.
+
+        """
+        self.interval = interval
+        self.samples = 0
+        self.stacks: Counter[tuple[str, ...]] = Counter()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="wfc-sampling-profiler", daemon=True)
+
+    def _run(self) -> None:
+        own = threading.get_ident()
+        while not self._stop.wait(self.interval):
+            for ident, frame in sys._current_frames().items():  # noqa: SLF001
+                if ident == own:
+                    continue
+                stack: list[str] = []
+                current: FrameType | None = frame
+                while current is not None:
+                    stack.append(_label(current.f_code))
+                    current = current.f_back
+                self.stacks[tuple(reversed(stack))] += 1
+            self.samples += 1
+
+    def start(self) -> None:
+        """Starts sampling."""
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stops sampling and waits for the sampling thread."""
+        self._stop.set()
+        self._thread.join()
+
+    def folded(self) -> str:
+        """Returns the stacks in folded format: `outer;inner;leaf count` per line."""
+        return "".join(f"{';'.join(stack)} {count}\n" for stack, count in self.stacks.most_common())
+
+    def top(self, n: int = DEFAULT_TOP) -> tuple[list[tuple[str, int]], list[tuple[str, int]]]:
+        """Returns the hottest functions.
+
+        Args:
+            n: Number of functions.
+
+        Returns:
+            Functions by samples on top of the stack (own time) and by samples on the stack (cumulative time).
+
+        """
+        own: Counter[str] = Counter()
+        cumulative: Counter[str] = Counter()
+        for stack, count in self.stacks.items():
+            own[stack[-1]] += count
+            for function in set(stack):
+                cumulative[function] += count
+        return own.most_common(n), cumulative.most_common(n)
+
+
+def _format_counts(title: str, counts: list[tuple[str, int]], total: int) -> str:
+    lines = [title]
+    lines.extend(f"{count:>8} {count / max(total, 1):6.1%}  {function}" for function, count in counts)
+    return "\n".join(lines)
+
+
+def _cprofile_summary(profiler: cProfile.Profile, top: int) -> str:
+    stream = io.StringIO()
+    stats = pstats.Stats(profiler, stream=stream).strip_dirs()
+    stats.sort_stats(pstats.SortKey.CUMULATIVE).print_stats(top)
+    stats.sort_stats(pstats.SortKey.TIME).print_stats(top)
+    return stream.getvalue()
+
+
+def _tracemalloc_summary(snapshot: tracemalloc.Snapshot, peak: int, top: int) -> str:
+    statistics = snapshot.statistics("lineno")
+    lines = [
+        f"Peak traced memory: {peak / 1e6:.1f} MB, held at the end: {sum(s.size for s in statistics) / 1e6:.1f} MB"
+    ]
+    lines.extend(f"{stat.size / 1e6:8.2f} MB {stat.count:>8} blocks  {stat.traceback}" for stat in statistics[:top])
+    return "\n".join(lines)
+
+
+def _artifact_path(output_dir: Path, name: str, suffix: str) -> Path:
+    output_dir.mkdir(parents=True, exist_ok=True)
+    return output_dir / f"{name}-{time.strftime('%Y%m%dT%H%M%S')}-{os.getpid()}{suffix}"
+
+
+def default_profile_dir() -> Path:
+    """Returns the artifact directory: `$WFC_PROFILE_DIR` or `DEFAULT_PROFILE_DIR`."""
+    return Path(os.environ.get(PROFILE_DIR_ENV) or DEFAULT_PROFILE_DIR)
+
+
+@contextlib.contextmanager
+def profile(
+    profiler: Profiler | None,
+    name: str = "wfc",
+    output_dir: Path | None = None,
+    top: int = DEFAULT_TOP,
+) -> Iterator[None]:
+    """Profiles the enclosed block and writes the artifact and summary when it exits.
+
+    Args:
+        profiler: The profiler to use. Nothing is profiled when `None`.
+        name: Prefix of the artifact file names, e.g. the command name.
+        output_dir: Artifact directory. Defaults to `default_profile_dir()`.
+        top: Number of entries in the summary.
+
+    Yields:
+        Nothing.
+
+    """
+    if profiler is None:
+        yield
+        return
+    output_dir = output_dir or default_profile_dir()
+    start = time.perf_counter()
+    if profiler == "cprofile":
+        cprofiler = cProfile.Profile()
+        cprofiler.enable()
+    elif profiler == "tracemalloc":
+        tracemalloc.start(_TRACEMALLOC_FRAMES)
+    else:
+        sampler = SamplingProfiler()
+        sampler.start()
+    try:
+        yield
+    finally:
+        elapsed = time.perf_counter() - start
+        if profiler == "cprofile":
+            cprofiler.disable()
+            artifact = _artifact_path(output_dir, name, ".prof")
+            cprofiler.dump_stats(artifact)
+            summary = _cprofile_summary(cprofiler, top)
+        elif profiler == "tracemalloc":
+            snapshot = tracemalloc.take_snapshot()
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            artifact = _artifact_path(output_dir, name, ".tracemalloc")
+            snapshot.dump(str(artifact))
+            summary = _tracemalloc_summary(snapshot, peak, top)
+        else:
+            sampler.stop()
+            artifact = _artifact_path(output_dir, name, ".folded")
+            artifact.write_text(sampler.folded(), encoding="utf-8")
+            own, cumulative = sampler.top(top)
+            total = sampler.stacks.total()
+            summary = "\n\n".join([
+                _format_counts(f"Top {top} functions by own samples ({total} thread samples):", own, total),
+                _format_counts(f"Top {top} functions by cumulative samples:", cumulative, total),
+            ])
+        artifact.with_suffix(".txt").write_text(summary, encoding="utf-8")
+        _logger.info("PROFILE: %s run took %.2fs, artifact written to %s\n%s", profiler, elapsed, artifact, summary)
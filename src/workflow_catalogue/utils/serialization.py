@@ -1,30 +1,195 @@
-"""Serialization utils."""
+"""Serialization utils.
+
+Two output flavours are provided:
+
+* a fast path (`dumps`/`loads`) backed by [orjson](https://github.com/ijl/orjson) when it is installed, with a
+  transparent fallback to the standard library `json` module,
+* a canonical form (`canonical_dumps`, `content_hash`, `format_json`) with sorted keys and shortest round-trip float
+  formatting, suitable for hashing and diffing records. Canonical output is always produced by the standard library
+  encoder so that it is byte-for-byte identical whether orjson is installed or not.
+
+Pydantic models are serialized by alias (e.g. `conformsTo`, `application:type`) and only with the fields that were
+explicitly set, so a record loaded from JSON serializes back to the same document.
+
+"""
 
 from __future__ import annotations
 
+import hashlib
+import importlib
+import json
 from datetime import date, datetime
+from enum import Enum
 from json import JSONEncoder
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
+
+from pydantic import AnyUrl, BaseModel
+
+if TYPE_CHECKING:
+    from types import ModuleType
+
+
+def _import_orjson() -> ModuleType | None:
+    try:
+        return importlib.import_module("orjson")
+    except ImportError:  # pragma: no cover
+        return None
+
+
+orjson = _import_orjson()
+HAS_ORJSON = orjson is not None
+"""Whether the orjson fast path is available."""
+
+
+def to_jsonable(o: Any) -> Any:
+    """Converts objects unsupported by JSON encoders into JSON-compatible values.
+
+    Args:
+        o: Object to be converted.
+
+    Returns:
+        A JSON-compatible representation of the object.
+
+    Raises:
+        TypeError: If the object type is not supported.
+
+    """
+    if isinstance(o, BaseModel):
+        return model_to_jsonable(o)
+
+    if isinstance(o, date | datetime):
+        return o.isoformat()
+
+    if isinstance(o, Path):
+        return o.as_posix()
+
+    if isinstance(o, AnyUrl):
+        return str(o)
+
+    if isinstance(o, Enum):
+        return o.value
+
+    msg = f"Object of type {type(o).__name__} is not JSON serializable"
+    raise TypeError(msg)
+
+
+def model_to_jsonable(model: BaseModel) -> dict[str, Any]:
+    """Dumps a pydantic model into JSON-compatible Python objects, preserving field aliases.
+
+    Args:
+        model: The model to dump.
+
+    Returns:
+        The model as a dictionary keyed by field aliases, without unset fields.
+
+    """
+    return model.model_dump(mode="json", by_alias=True, exclude_unset=True)
 
 
 class JsonEncoder(JSONEncoder):
     """Custom JSON encoder that handles datatypes that are not out-of-the-box supported by the `json` package."""
 
-    def default(self, o: Any) -> str:
+    @staticmethod
+    def default(o: Any) -> Any:
         """Default JSON encoding logic.
 
         Args:
             o: Object to be serialized.
 
         Returns:
-            A string representation of the object.
+            A JSON-compatible representation of the object.
 
         """
-        if isinstance(o, date | datetime):
-            return o.isoformat()
+        return to_jsonable(o)
+
+
+def dumps(obj: Any, *, indent: bool = False) -> bytes:
+    """Serializes an object to JSON using the fastest available backend.
+
+    Args:
+        obj: Object to be serialized.
+        indent: Whether to pretty-print the output with 2 space indentation.
+
+    Returns:
+        UTF-8 encoded JSON.
+
+    """
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if indent else 0)
+        result: bytes = orjson.dumps(obj, default=to_jsonable, option=option)
+        return result
+    return json.dumps(
+        obj,
+        default=to_jsonable,
+        ensure_ascii=False,
+        indent=2 if indent else None,
+        separators=None if indent else (",", ":"),
+    ).encode("utf-8")
+
+
+def loads(data: bytes | str) -> Any:
+    """Deserializes JSON using the fastest available backend.
+
+    Args:
+        data: JSON document.
+
+    Returns:
+        The deserialized object.
+
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def canonical_dumps(obj: Any, indent: int | None = None) -> bytes:
+    """Serializes an object to canonical JSON.
+
+    Keys are sorted, floats use the shortest representation that round-trips, non-ASCII characters are kept as-is and
+    NaN/Infinity are rejected.
+
+    Args:
+        obj: Object to be serialized.
+        indent: Optional indentation. Compact separators are used when omitted.
+
+    Returns:
+        UTF-8 encoded canonical JSON.
+
+    """
+    return json.dumps(
+        obj,
+        default=to_jsonable,
+        sort_keys=True,
+        ensure_ascii=False,
+        allow_nan=False,
+        indent=indent,
+        separators=(",", ": ") if indent is not None else (",", ":"),
+    ).encode("utf-8")
+
+
+def content_hash(obj: Any) -> str:
+    """Computes the SHA-256 hex digest of the canonical JSON form of an object.
+
+    Args:
+        obj: Object to hash.
+
+    Returns:
+        Hex digest.
+
+    """
+    return hashlib.sha256(canonical_dumps(obj)).hexdigest()
+
+
+def format_json(obj: Any, indent: int = 4) -> str:
+    """Formats an object as a canonical, human-readable JSON document with a trailing newline.
+
+    Args:
+        obj: Object to format.
+        indent: Indentation width.
 
-        if isinstance(o, Path):
-            return o.as_posix()
+    Returns:
+        The formatted document.
 
-        return super().default(o)  # type: ignore[no-any-return]
+    """
+    return canonical_dumps(obj, indent=indent).decode("utf-8") + "\n"
@@ -1,11 +1,13 @@
 from __future__ import annotations
 
+import logging
 import pathlib
 import typing
 
 import pytest
 
 from workflow_catalogue import consts
+from workflow_catalogue.core.settings import current_settings
 
 if typing.TYPE_CHECKING:
     from _pytest.config import Config
@@ -14,6 +16,23 @@ if typing.TYPE_CHECKING:
 MARKERS = ["unit", "integration", "e2e"]
 
 
+@pytest.fixture(autouse=True)
+def _clear_settings_cache() -> typing.Iterator[None]:
+    """Settings are cached per process - make sure every test sees its own environment."""
+    current_settings.cache_clear()
+    yield
+    current_settings.cache_clear()
+
+
+@pytest.fixture
+def caplog(caplog: pytest.LogCaptureFixture, monkeypatch: pytest.MonkeyPatch) -> pytest.LogCaptureFixture:
+    """Package loggers do not propagate - let their records reach the handler `caplog` installs on the root logger."""
+    for name, logger in logging.Logger.manager.loggerDict.items():
+        if name.startswith("workflow_catalogue") and isinstance(logger, logging.Logger):
+            monkeypatch.setattr(logger, "propagate", True)
+    return caplog
+
+
 def pytest_collection_modifyitems(config: Config, items: list[Function]) -> None:  # noqa: ARG001
     rootdir = pathlib.Path(consts.directories.ROOT_DIR)
     for item in items:
@@ -0,0 +1,41 @@
+from __future__ import annotations
+
+import json
+import subprocess  # noqa: S404
+import sys
+from typing import TYPE_CHECKING
+
+from workflow_catalogue.consts import directories
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+WORKFLOWS_DIR = directories.CATALOGUE_DIR / "eodh-workflows-notebooks" / "workflows"
+
+
+def test_register_dry_run_records_requests(tmp_path: Path) -> None:
+    output = tmp_path / "requests.jsonl"
+    files = sorted(WORKFLOWS_DIR.glob("*.json"))
+
+    result = subprocess.run(  # noqa: S603
+        [
+            sys.executable,
+            "-m",
+            "workflow_catalogue.cli.entrypoint",
+            "catalogue",
+            "register",
+            *map(str, files),
+            "--dry-run",
+            "--dry-run-output",
+            output,
+        ],
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+
+    assert result.returncode == 0, result.stderr
+    recorded = [json.loads(line) for line in output.read_text(encoding="utf-8").splitlines()]
+    registrations = [r for r in recorded if r["method"] == "POST" and "/register" in r["url"]]
+    assert {r["body"]["id"] for r in registrations} == {f.stem for f in files}
+    assert all(r["headers"].get("Authorization", "***") == "***" for r in recorded)
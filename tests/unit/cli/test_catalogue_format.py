@@ -0,0 +1,55 @@
+"""Tests for catalogue formatting CLI."""
+
+from __future__ import annotations
+
+import json
+from typing import TYPE_CHECKING
+
+from click.testing import CliRunner
+
+from workflow_catalogue.cli.catalogue.format import format_catalogue
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+def test_format_catalogue_rewrites_files(tmp_path: Path) -> None:
+    """Rewrites files in canonical form and leaves content unchanged."""
+    record = tmp_path / "workflows" / "rec.json"
+    record.parent.mkdir()
+    record.write_text(json.dumps({"id": "rec", "conformsTo": ["x"]}), encoding="utf-8")
+
+    result = CliRunner().invoke(format_catalogue, ["--catalogue-path", str(tmp_path)])
+
+    assert result.exit_code == 0
+    assert record.read_text(encoding="utf-8") == '{\n    "conformsTo": [\n        "x"\n    ],\n    "id": "rec"\n}\n'
+
+
+def test_format_catalogue_check(tmp_path: Path) -> None:
+    """Check mode reports unformatted files without touching them."""
+    record = tmp_path / "rec.json"
+    original = json.dumps({"id": "rec", "a": 1})
+    record.write_text(original, encoding="utf-8")
+    runner = CliRunner()
+
+    result = runner.invoke(format_catalogue, ["--catalogue-path", str(tmp_path), "--check"])
+    assert result.exit_code == 1
+    assert record.read_text(encoding="utf-8") == original
+
+    assert runner.invoke(format_catalogue, ["--catalogue-path", str(tmp_path)]).exit_code == 0
+    assert runner.invoke(format_catalogue, ["--catalogue-path", str(tmp_path), "--check"]).exit_code == 0
+
+
+def test_format_catalogue_invalid_json(tmp_path: Path) -> None:
+    """Fails for files that are not valid JSON."""
+    (tmp_path / "broken.json").write_text("{", encoding="utf-8")
+    result = CliRunner().invoke(format_catalogue, ["--catalogue-path", str(tmp_path)])
+    assert result.exit_code == 1
+
+
+def test_format_catalogue_invalid_utf8(tmp_path: Path) -> None:
+    """Reports files that are not UTF-8 like other invalid files."""
+    (tmp_path / "binary.json").write_bytes(b'{"id": "\xff"}')
+    result = CliRunner().invoke(format_catalogue, ["--catalogue-path", str(tmp_path)])
+    assert result.exit_code == 1
+    assert result.exception is None or isinstance(result.exception, SystemExit)
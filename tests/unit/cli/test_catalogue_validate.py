@@ -3,16 +3,22 @@
 from __future__ import annotations
 
 import json
-from typing import TYPE_CHECKING
+import shutil
+from typing import TYPE_CHECKING, Any
 
+import click
 from click.testing import CliRunner
 
+from workflow_catalogue.cli.catalogue import validate
 from workflow_catalogue.cli.catalogue.validate import validate_catalogue
 from workflow_catalogue.consts import directories
 
 if TYPE_CHECKING:
+    from collections.abc import Iterator
     from pathlib import Path
 
+    import pytest
+
 CATALOGUE_DIR = directories.CATALOGUE_DIR
 TEST_DATA_DIR = directories.TESTS_DIR / "test_data"
 
@@ -102,3 +108,74 @@ def test_validate_catalogue_unknown_record_type(tmp_path: Path) -> None:
     runner = CliRunner()
     result = runner.invoke(validate_catalogue, ["--catalogue-path", str(tmp_path)])
     assert result.exit_code == 1
+
+
+def test_validate_catalogue_watch_rejects_changed_files() -> None:
+    """--watch cannot be combined with --changed-files."""
+    runner = CliRunner()
+    result = runner.invoke(
+        validate_catalogue,
+        ["--catalogue-path", str(CATALOGUE_DIR), "--watch", "--changed-files", "a.json"],
+    )
+    assert result.exit_code == click.UsageError.exit_code
+
+
+class _NullWatcher:
+    def close(self) -> None:
+        pass
+
+
+def test_watch_revalidates_changed_files_and_dependents(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, caplog: pytest.LogCaptureFixture
+) -> None:
+    """Watch mode re-validates touched files, whole collections on catalog.json changes and drops removed files."""
+    collection = tmp_path / "collection"
+    shutil.copytree(TEST_DATA_DIR, collection)
+    broken = collection / "workflows" / "broken.json"
+    broken.write_text("{", encoding="utf-8")
+    workflow = collection / "workflows" / "echo.json"
+    data = json.loads(workflow.read_text(encoding="utf-8"))
+    n_files = len(list(collection.rglob("*.json")))
+
+    def changes(watcher: Any) -> Iterator[set[Path]]:  # noqa: ARG001
+        workflow.write_text(json.dumps({**data, "id": "other"}), encoding="utf-8")
+        yield {workflow}
+        workflow.write_text(json.dumps(data), encoding="utf-8")
+        broken.unlink()
+        yield {collection / "catalog.json", broken}
+
+    monkeypatch.setattr(validate, "create_watcher", lambda *_, **__: _NullWatcher())
+    monkeypatch.setattr(validate, "watch_changes", changes)
+    runner = CliRunner()
+    result = runner.invoke(validate_catalogue, ["--catalogue-path", str(collection), "--watch"])
+
+    assert result.exit_code == 0
+    assert "1 file(s) failing. Watching" in caplog.text
+    assert "Re-validated 1 file(s)" in caplog.text
+    assert "2 file(s) failing." in caplog.text
+    assert f"Re-validated {n_files - 1} file(s)" in caplog.text
+    assert caplog.text.rstrip().endswith("0 file(s) failing.")
+
+
+def test_validate_catalogue_report(tmp_path: Path) -> None:
+    """Writes a machine-readable report and stops early with --fail-fast."""
+    for i in range(3):
+        (tmp_path / f"bad-{i}.json").write_text("{", encoding="utf-8")
+    report_path = tmp_path / "report.json"
+    runner = CliRunner()
+    result = runner.invoke(
+        validate_catalogue,
+        ["--catalogue-path", str(tmp_path), "--report", "json", "--report-output", str(report_path), "--fail-fast"],
+    )
+    assert result.exit_code == 1
+    report = json.loads(report_path.read_text(encoding="utf-8"))
+    assert report["summary"]["files"] == 1
+    assert report["summary"]["stopped_early"] is True
+
+
+def test_validate_catalogue_report_stdout() -> None:
+    """Prints the report to stdout when no output file is given."""
+    runner = CliRunner()
+    result = runner.invoke(validate_catalogue, ["--catalogue-path", str(TEST_DATA_DIR), "--report", "sarif"])
+    assert result.exit_code == 0
+    assert json.loads(result.stdout)["version"] == "2.1.0"
@@ -0,0 +1,72 @@
+"""Tests for the CLI entrypoint."""
+
+from __future__ import annotations
+
+import json
+import os
+import subprocess  # noqa: S404
+import sys
+
+import click
+import pytest
+from click.testing import CliRunner
+
+from workflow_catalogue.cli.entrypoint import catalogue, cli, daemon, notebook, workflow
+from workflow_catalogue.cli.lazy import LazyGroup
+from workflow_catalogue.consts import directories
+
+HEAVY_MODULES = ("pydantic", "pydantic_settings", "geojson_pydantic", "requests", "workflow_catalogue.schemas")
+IMPORT_TIME_BUDGET_S = 0.5
+
+_HELP_PROBE = """
+import json, sys, time
+start = time.perf_counter()
+from workflow_catalogue.cli.entrypoint import cli
+elapsed = time.perf_counter() - start
+try:
+    cli(["--help"])
+except SystemExit:
+    pass
+print(json.dumps({"elapsed": elapsed, "modules": sorted(sys.modules)}))
+"""
+
+
+def test_help_does_not_import_heavy_modules() -> None:
+    """`wfc --help` imports neither pydantic nor the schemas and starts quickly."""
+    result = subprocess.run(  # noqa: S603
+        [sys.executable, "-c", _HELP_PROBE],
+        capture_output=True,
+        text=True,
+        check=True,
+        env={**os.environ, "PYTHONPATH": str(directories.SRC_DIR)},
+    )
+    probe = json.loads(result.stdout.splitlines()[-1])
+
+    loaded = [m for m in probe["modules"] if any(m == h or m.startswith(f"{h}.") for h in HEAVY_MODULES)]
+    assert loaded == []
+    assert probe["elapsed"] < IMPORT_TIME_BUDGET_S
+
+
+@pytest.mark.parametrize("group", [workflow, catalogue, daemon, notebook], ids=lambda g: g.name)
+def test_lazy_subcommands_resolve(group: LazyGroup) -> None:
+    """Every lazily registered subcommand imports to a click command."""
+    ctx = click.Context(group)
+    for name in group.list_commands(ctx):
+        command = group.get_command(ctx, name)
+        assert isinstance(command, click.Command)
+        assert command.name == name
+
+
+def test_group_help_lists_lazy_subcommands() -> None:
+    """Group help lists subcommands that have not been imported yet."""
+    result = CliRunner().invoke(cli, ["catalogue", "--help"])
+    assert result.exit_code == 0
+    assert "format" in result.output
+    assert "validate" in result.output
+
+
+def test_lazy_group_rejects_non_commands() -> None:
+    """A lazy import path that does not point at a click command is reported."""
+    group = LazyGroup(name="broken", lazy_subcommands={"bad": "workflow_catalogue.cli.lazy:LazyGroup"})
+    with pytest.raises(TypeError, match="is not a click command"):
+        group.get_command(click.Context(group), "bad")
@@ -0,0 +1,90 @@
+from __future__ import annotations
+
+import io
+from http import HTTPStatus
+from unittest.mock import patch
+
+import pytest
+import requests
+
+from workflow_catalogue.client import PlatformClient, PlatformEndpoints, TokenError
+from workflow_catalogue.core.mock_platform import MockPlatform, MockPlatformAdapter, RequestRecorder, mock_environment
+from workflow_catalogue.core.settings import Settings
+
+_BASE = "https://mock.invalid"
+
+
+@pytest.fixture
+def settings() -> Settings:
+    with patch.dict("os.environ", mock_environment(_BASE)):
+        return Settings()
+
+
+@pytest.fixture
+def recorder() -> RequestRecorder:
+    return RequestRecorder()
+
+
+@pytest.fixture
+def client(settings: Settings, recorder: RequestRecorder) -> PlatformClient:
+    session = requests.Session()
+    session.mount("https://", MockPlatformAdapter(MockPlatform(), recorder))
+    return PlatformClient(settings, session=session)
+
+
+def test_endpoints_from_settings(settings: Settings) -> None:
+    endpoints = PlatformEndpoints.from_settings(settings)
+    assert endpoints.token_url == f"{_BASE}/keycloak/realms/eodh/protocol/openid-connect/token"
+    assert endpoints.workspace_sessions_url == f"{_BASE}/api/workspaces/mock-workspace/me/sessions"
+    assert endpoints.processes_url == f"{_BASE}/api/ades/mock-workspace/processes"
+    assert endpoints.data_loader_url == f"{_BASE}/api/workspaces/mock-workspace/data-loader"
+    assert endpoints.harvest_url == f"{_BASE}/workspaces/mock-workspace/harvest"
+    assert endpoints.record_url("rec") == f"{_BASE}/api/wf-catalogue/v1.0/register/rec"
+
+
+def test_endpoints_require_catalogue_api_url(settings: Settings) -> None:
+    with pytest.raises(ValueError, match="WF_CATALOGUE_API_URL"):
+        PlatformEndpoints.from_settings(settings.model_copy(update={"wf_catalogue_api_url": None}))
+
+
+def test_client_cd_flow(client: PlatformClient, recorder: RequestRecorder) -> None:
+    token = client.keycloak_token()
+    workspace_token = client.workspace_token(token)
+
+    assert client.get_collection("col", token).status_code == HTTPStatus.NOT_FOUND
+    assert client.create_collection({"id": "col"}, token).status_code == HTTPStatus.CREATED
+    assert client.register_record({"id": "rec"}, "col", token).status_code == HTTPStatus.CREATED
+    assert client.delete_record("rec", token).status_code == HTTPStatus.NO_CONTENT
+
+    cwl = client.fetch(f"{_BASE}/cwl/rec.cwl")
+    assert cwl.ok
+    assert client.unregister_process("rec", workspace_token).status_code == HTTPStatus.NOT_FOUND
+    assert client.register_process(cwl.content, workspace_token).ok
+    assert client.upload_access_policy({"workflows": {"rec": {"access": "public"}}}, workspace_token).ok
+    assert client.trigger_harvest(workspace_token).ok
+
+    register = next(entry for entry in recorder.requests if entry["url"].endswith("/register?catalogue_id=col"))
+    assert register["headers"]["Content-Type"] == "application/json"
+    assert client.scheduler.stats()["catalogue"].completed == 4  # noqa: PLR2004
+
+
+def _login_page() -> requests.Response:
+    """A successful response without a token, as returned by a misconfigured proxy."""
+    response = requests.Response()
+    response.status_code = HTTPStatus.OK
+    response.raw = io.BytesIO(b"<html>Sign in</html>")
+    response.url = f"{_BASE}/login"
+    return response
+
+
+def test_client_rejects_responses_without_token(client: PlatformClient) -> None:
+    with (
+        patch.object(client.scheduler, "request", return_value=_login_page()),
+        pytest.raises(TokenError, match="access_token"),
+    ):
+        client.keycloak_token()
+    with (
+        patch.object(client.scheduler, "request", return_value=_login_page()),
+        pytest.raises(TokenError, match="'access'"),
+    ):
+        client.workspace_token("token")
@@ -0,0 +1,118 @@
+from __future__ import annotations
+
+import csv
+import json
+from datetime import UTC, datetime
+from typing import TYPE_CHECKING
+
+import pytest
+from click.testing import CliRunner
+
+from workflow_catalogue.cli.catalogue.export import export_catalogue
+from workflow_catalogue.consts import directories
+from workflow_catalogue.core.columnar_export import (
+    COLLECTION_COLUMN,
+    ColumnType,
+    coerce,
+    export_columnar,
+    input_parameter_columns,
+    record_columns,
+)
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+_FILES = sorted(directories.CATALOGUE_DIR.rglob("*.json"))
+_RECORDS = [path for path in _FILES if path.name != "catalog.json"]
+
+
+def _input_parameter_count() -> int:
+    documents = [json.loads(path.read_text(encoding="utf-8")) for path in _RECORDS]
+    return sum(len(document["properties"].get("inputParameters") or {}) for document in documents)
+
+
+def test_record_columns_follow_models() -> None:
+    columns = {column.name: column.type for column in record_columns()}
+
+    assert next(iter(columns)) == COLLECTION_COLUMN
+    assert columns["properties.created"] == ColumnType("timestamp")
+    assert columns["properties.keywords"] == ColumnType("list", item=ColumnType("string"))
+    assert columns["properties.extent.spatial.bbox"].item == ColumnType("list", item=ColumnType("float64"))
+    assert columns["geometry"] == ColumnType("json")
+    assert "properties.inputParameters" not in columns
+    # Workflow and notebook links are merged into one struct.
+    assert columns["links"].item is not None
+    assert [name for name, _ in columns["links"].item.fields] == ["href", "rel", "type", "title", "jupyter:kernel"]
+
+    parameters = {column.name: column.type.kind for column in input_parameter_columns()}
+    assert list(parameters)[:4] == [COLLECTION_COLUMN, "record_id", "name", "label"]
+    assert parameters["default"] == "json"
+    assert parameters["required"] == "boolean"
+
+
+def test_coerce() -> None:
+    assert coerce("2024-01-01T00:00:00", ColumnType("timestamp")) == datetime(2024, 1, 1, tzinfo=UTC)
+    assert coerce("yesterday", ColumnType("timestamp")) is None
+    assert coerce(1, ColumnType("float64")) == pytest.approx(1.0)
+    assert coerce(value=True, type_=ColumnType("float64")) is None
+    assert coerce(2**63, ColumnType("int64")) is None
+    assert coerce("a", ColumnType("boolean")) is None
+    assert coerce(["a", 1], ColumnType("list", item=ColumnType("string"))) == ["a", None]
+    assert coerce({"b": 1, "a": [2]}, ColumnType("json")) == '{"a":[2],"b":1}'
+    struct = ColumnType("struct", fields=(("name", ColumnType("string")), ("missing", ColumnType("string"))))
+    assert coerce({"name": "x", "extra": 1}, struct) == {"name": "x", "missing": None}
+
+
+def test_export_csv(tmp_path: Path) -> None:
+    result = export_columnar(_FILES, tmp_path, "csv", batch_size=2)
+
+    assert result.records == len(_RECORDS)
+    assert result.input_parameters == _input_parameter_count()
+    with (tmp_path / "records.csv").open(encoding="utf-8", newline="") as f:
+        rows = list(csv.DictReader(f))
+    assert len(rows) == len(_RECORDS)
+    clip = next(row for row in rows if row["id"] == "clip-workflow")
+    assert json.loads(clip["properties.keywords"]) == ["clip", "bbox", "subset"]
+    assert clip["properties.created"] == "2026-03-01T00:00:00+00:00"
+    assert clip["properties.application:container"] == "true"
+    assert clip[COLLECTION_COLUMN] == "eodh-workflows-notebooks"
+    with (tmp_path / "input_parameters.csv").open(encoding="utf-8", newline="") as f:
+        parameters = [row for row in csv.DictReader(f) if row["record_id"] == "clip-workflow"]
+    assert {row["name"] for row in parameters} == {"stac_item", "bbox"}
+
+
+@pytest.mark.parametrize("export_format", ["parquet", "arrow"])
+def test_export_arrow_formats(tmp_path: Path, export_format: str) -> None:
+    pa = pytest.importorskip("pyarrow")
+    parquet = pytest.importorskip("pyarrow.parquet")
+
+    export_columnar(_FILES, tmp_path, export_format, batch_size=2)  # type: ignore[arg-type]
+
+    if export_format == "parquet":
+        assert parquet.ParquetFile(tmp_path / "records.parquet").num_row_groups == len(_RECORDS) // 2
+        records = parquet.read_table(tmp_path / "records.parquet")
+        parameters = parquet.read_table(tmp_path / "input_parameters.parquet")
+    else:
+        allocated = pa.total_allocated_bytes()
+        with pa.memory_map(str(tmp_path / "records.arrow")) as source:
+            records = pa.ipc.open_file(source).read_all()
+            # Uncompressed IPC files are read without copying the buffers.
+            assert pa.total_allocated_bytes() == allocated
+        parameters = pa.ipc.open_file(tmp_path / "input_parameters.arrow").read_all()
+
+    assert records.num_rows == len(_RECORDS)
+    assert records.schema.field("properties.contacts").type.value_type.field("roles").type == pa.list_(pa.string())
+    clip = records.filter(pa.compute.equal(records["id"], "clip-workflow")).to_pylist()[0]
+    assert clip["properties.keywords"] == ["clip", "bbox", "subset"]
+    assert clip["properties.created"] == datetime(2026, 3, 1, tzinfo=UTC)
+    assert parameters.num_rows == _input_parameter_count()
+
+
+def test_export_catalogue_cli(tmp_path: Path) -> None:
+    result = CliRunner().invoke(
+        export_catalogue,
+        ["--catalogue-path", str(directories.CATALOGUE_DIR), "--output-dir", str(tmp_path), "--format", "csv"],
+    )
+
+    assert result.exit_code == 0, result.output
+    assert sorted(path.name for path in tmp_path.iterdir()) == ["input_parameters.csv", "records.csv"]
@@ -0,0 +1,173 @@
+from __future__ import annotations
+
+from collections import Counter
+
+import pytest
+import requests
+import yaml
+
+from workflow_catalogue.core.cwl import CwlError, CwlResolver, iter_references
+
+_BASE = "https://example.invalid/cwl/"
+
+_DOCUMENTS = {
+    "clip.cwl": """
+cwlVersion: v1.0
+class: Workflow
+$namespaces: {s: https://schema.org/}
+inputs: {aoi: string}
+outputs: []
+steps:
+  clip:
+    run: tools/clip.cwl
+    in: {aoi: aoi}
+    out: []
+  stats:
+    run: tools/suite.cwl#stats
+    in: []
+    out: []
+  inline:
+    run:
+      class: CommandLineTool
+      requirements:
+        - $import: requirements.yml
+      baseCommand: [python, -c]
+      arguments: [{$include: scripts/run.py}]
+      inputs: []
+      outputs: []
+    in: []
+    out: []
+""",
+    "ndvi.cwl": """
+cwlVersion: v1.0
+class: Workflow
+id: ndvi
+inputs: []
+outputs: []
+steps:
+  - id: clip
+    run: ./tools/clip.cwl
+    in: []
+    out: []
+""",
+    "tools/clip.cwl": """
+cwlVersion: v1.0
+class: CommandLineTool
+baseCommand: clip
+inputs: []
+outputs: []
+""",
+    "tools/suite.cwl": """
+cwlVersion: v1.0
+$graph:
+  - id: main
+    class: Workflow
+    inputs: []
+    outputs: []
+    steps: {s: {run: "#stats", in: [], out: []}}
+  - id: stats
+    class: CommandLineTool
+    baseCommand: stats
+    inputs: []
+    outputs: []
+""",
+    "requirements.yml": "class: DockerRequirement\ndockerPull: eodh/clip:1.0\n",
+    "scripts/run.py": "print('hello')\n",
+    "standalone.cwl": "cwlVersion: v1.0\nclass: CommandLineTool\ninputs: []\noutputs: []\n",
+    "cycle-a.cwl": "class: Workflow\nsteps: {b: {run: cycle-b.cwl}}\n",
+    "cycle-b.cwl": "class: Workflow\nsteps: {a: {run: cycle-a.cwl}}\n",
+    "broken.cwl": "class: Workflow\nsteps: {x: {run: missing.cwl}}\n",
+}
+
+
+class _Fetcher:
+    def __init__(self) -> None:
+        self.calls: Counter[str] = Counter()
+
+    def __call__(self, url: str) -> bytes:
+        self.calls[url] += 1
+        name = url.removeprefix(_BASE)
+        if name == "latin-1.cwl":
+            return "class: CommandLineTool\nlabel: Température\n".encode("latin-1")
+        if name not in _DOCUMENTS:
+            msg = f"404 for {url}"
+            raise requests.HTTPError(msg)
+        return _DOCUMENTS[name].encode()
+
+
+@pytest.fixture
+def fetcher() -> _Fetcher:
+    return _Fetcher()
+
+
+@pytest.fixture
+def resolver(fetcher: _Fetcher) -> CwlResolver:
+    return CwlResolver(fetcher, workers=4)
+
+
+def test_iter_references() -> None:
+    document = yaml.safe_load(_DOCUMENTS["clip.cwl"])
+    assert sorted(iter_references(document, f"{_BASE}clip.cwl")) == [
+        ("import", f"{_BASE}requirements.yml"),
+        ("include", f"{_BASE}scripts/run.py"),
+        ("run", f"{_BASE}tools/clip.cwl"),
+        ("run", f"{_BASE}tools/suite.cwl#stats"),
+    ]
+
+
+def test_resolve_fetches_shared_documents_once(resolver: CwlResolver, fetcher: _Fetcher) -> None:
+    resolver.resolve([f"{_BASE}clip.cwl", f"{_BASE}ndvi.cwl", f"{_BASE}clip.cwl"])
+    resolver.pack(f"{_BASE}clip.cwl")
+    resolver.pack(f"{_BASE}ndvi.cwl")
+
+    assert resolver.cached_documents == 6  # noqa: PLR2004
+    assert set(fetcher.calls.values()) == {1}
+
+
+def test_pack(resolver: CwlResolver) -> None:
+    packed = resolver.pack(f"{_BASE}clip.cwl")
+
+    assert packed["cwlVersion"] == "v1.0"
+    assert packed["$namespaces"] == {"s": "https://schema.org/"}
+    graph = {entry["id"]: entry for entry in packed["$graph"]}
+    assert list(graph) == ["clip", "clip-2", "main", "stats"]
+    root = graph["clip"]
+    assert "cwlVersion" not in root
+    assert root["steps"]["clip"]["run"] == "#clip-2"
+    assert root["steps"]["stats"]["run"] == "#stats"
+    inline = root["steps"]["inline"]["run"]
+    assert inline["requirements"] == [{"class": "DockerRequirement", "dockerPull": "eodh/clip:1.0"}]
+    assert inline["arguments"] == ["print('hello')\n"]
+    assert graph["clip-2"]["baseCommand"] == "clip"
+    assert graph["main"]["steps"]["s"]["run"] == "#stats"
+
+
+def test_pack_bytes(resolver: CwlResolver) -> None:
+    url = f"{_BASE}standalone.cwl"
+    assert resolver.pack_bytes(url) == _DOCUMENTS["standalone.cwl"].encode()
+
+    packed = yaml.safe_load(resolver.pack_bytes(f"{_BASE}ndvi.cwl"))
+    assert [entry["id"] for entry in packed["$graph"]] == ["ndvi", "clip"]
+    assert packed["$graph"][0]["steps"][0]["run"] == "#clip"
+
+
+def test_pack_cycle(resolver: CwlResolver) -> None:
+    packed = resolver.pack(f"{_BASE}cycle-a.cwl")
+    assert [entry["steps"] for entry in packed["$graph"]] == [
+        {"b": {"run": "#cycle-b"}},
+        {"a": {"run": "#cycle-a"}},
+    ]
+
+
+def test_missing_dependency(resolver: CwlResolver, fetcher: _Fetcher) -> None:
+    for _ in range(2):
+        with pytest.raises(CwlError, match=r"Could not fetch .*missing\.cwl"):
+            resolver.pack_bytes(f"{_BASE}broken.cwl")
+    assert fetcher.calls[f"{_BASE}missing.cwl"] == 1
+
+
+def test_document_not_utf8(resolver: CwlResolver, fetcher: _Fetcher) -> None:
+    for _ in range(2):
+        with pytest.raises(CwlError, match=r"Could not decode .*latin-1\.cwl"):
+            resolver.pack_bytes(f"{_BASE}latin-1.cwl")
+    assert fetcher.calls[f"{_BASE}latin-1.cwl"] == 1
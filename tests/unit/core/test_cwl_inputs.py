@@ -0,0 +1,180 @@
+from __future__ import annotations
+
+import json
+from collections import Counter
+from typing import TYPE_CHECKING, Any
+
+import pytest
+import requests
+from click.testing import CliRunner
+
+from workflow_catalogue.cli.workflow.check_cwl import check_workflow_cwl
+from workflow_catalogue.consts import directories
+from workflow_catalogue.core.cwl import CwlError, CwlResolver
+from workflow_catalogue.core.cwl_inputs import (
+    CwlInput,
+    CwlInputsCache,
+    InputMismatch,
+    check_catalogue,
+    compare_inputs,
+    parse_inputs,
+    parse_type,
+)
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+_CLIP_RECORD = directories.CATALOGUE_DIR / "eodh-workflows-notebooks" / "workflows" / "clip-workflow.json"
+_CWL_URL = "https://example.invalid/clip.cwl"
+_CWL = """
+cwlVersion: v1.0
+$graph:
+  - class: Workflow
+    id: clip
+    inputs:
+      stac_item: {type: string}
+      bbox: string
+      crs:
+        type: string?
+      scale:
+        type: float
+        default: 1.5
+    outputs: []
+    steps: []
+  - class: CommandLineTool
+    id: clip-tool
+    inputs: []
+    outputs: []
+"""
+
+
+class _Fetcher:
+    def __init__(self, documents: dict[str, str]) -> None:
+        self.documents = documents
+        self.calls: Counter[str] = Counter()
+
+    def __call__(self, url: str) -> bytes:
+        self.calls[url] += 1
+        if url not in self.documents:
+            msg = f"404 for {url}"
+            raise requests.HTTPError(msg)
+        return self.documents[url].encode()
+
+
+def _record(tmp_path: Path, record_id: str, parameters: dict[str, Any], href: str = _CWL_URL) -> Path:
+    document = json.loads(_CLIP_RECORD.read_text(encoding="utf-8"))
+    document["id"] = record_id
+    document["properties"]["inputParameters"] = parameters
+    for link in document["links"]:
+        if link["rel"] == "application":
+            link["href"] = href
+    path = tmp_path / f"{record_id}.json"
+    path.write_text(json.dumps(document), encoding="utf-8")
+    return path
+
+
+def test_parse_type() -> None:
+    assert parse_type("string?") == (("string",), True)
+    assert parse_type(["null", "File", "Directory"]) == (("File", "Directory"), True)
+    assert parse_type({"type": "array", "items": ["float", "int"]}) == (("float[]", "int[]"), False)
+    assert parse_type({"type": "enum", "symbols": ["a"]}) == (("enum",), False)
+    assert parse_type(None) == (("Any",), False)
+
+
+def test_parse_inputs() -> None:
+    document = {
+        "class": "CommandLineTool",
+        "inputs": [{"id": "#main/aoi", "type": "string"}, {"id": "level", "type": "int", "default": 3}],
+    }
+    assert parse_inputs(document) == {
+        "aoi": CwlInput("aoi", ("string",), optional=False),
+        "level": CwlInput("level", ("int",), optional=False, default=3),
+    }
+    assert not parse_inputs(document)["level"].required
+
+
+@pytest.mark.parametrize(
+    "document",
+    [
+        {"class": "CommandLineTool", "inputs": ["aoi"]},
+        {"class": "CommandLineTool", "inputs": "aoi"},
+        {"$graph": ["main"]},
+    ],
+)
+def test_parse_inputs_malformed(document: dict[str, Any]) -> None:
+    with pytest.raises(CwlError):
+        parse_inputs(document)
+
+
+def test_compare_inputs() -> None:
+    inputs = {
+        "aoi": CwlInput("aoi", ("string",)),
+        "scale": CwlInput("scale", ("float",), default=1.0),
+        "mask": CwlInput("mask", ("File",)),
+    }
+    parameters = {
+        "aoi": {"type": "bbox", "required": False},
+        "scale": {"type": "text", "default": 2.0},
+        "extra": {"type": "number"},
+    }
+    assert compare_inputs("wf", _CWL_URL, parameters, inputs) == [
+        InputMismatch("wf", _CWL_URL, "aoi", "optional in the record but required by the CWL"),
+        InputMismatch("wf", _CWL_URL, "scale", "type 'text' does not match CWL type float"),
+        InputMismatch("wf", _CWL_URL, "scale", "default 2.0 differs from the CWL default 1.0"),
+        InputMismatch("wf", _CWL_URL, "extra", "not an input of the CWL"),
+        InputMismatch("wf", _CWL_URL, "mask", "required by the CWL but missing from inputParameters"),
+    ]
+
+
+def test_check_catalogue_shares_parsed_cwl(tmp_path: Path) -> None:
+    fetcher = _Fetcher({_CWL_URL: _CWL})
+    cache = CwlInputsCache(CwlResolver(fetcher))
+    good = {"stac_item": {"type": "raster"}, "bbox": {"type": "bbox"}}
+    files = [
+        _record(tmp_path, "clip-a", good),
+        _record(tmp_path, "clip-b", {**good, "scale": {"type": "number", "default": 1.5}}),
+        _record(tmp_path, "clip-c", {"stac_item": {"type": "boolean"}, "bbox": {"type": "bbox"}}),
+        _record(tmp_path, "clip-d", good, href="https://example.invalid/missing.cwl"),
+        tmp_path / "catalog.json",
+    ]
+    files[-1].write_text("{}", encoding="utf-8")
+
+    checked, mismatches = check_catalogue(files, cache)
+
+    assert checked == 4  # noqa: PLR2004
+    assert [(m.record_id, m.parameter) for m in mismatches] == [("clip-c", "stac_item"), ("clip-d", "")]
+    assert "could not load CWL" in mismatches[1].message
+    assert fetcher.calls[_CWL_URL] == 1
+    assert (len(cache), cache.hits, cache.misses) == (1, 2, 1)
+
+
+def test_check_catalogue_reports_broken_records(tmp_path: Path) -> None:
+    broken_cwl = "https://example.invalid/broken.cwl"
+    cache = CwlInputsCache(CwlResolver(_Fetcher({broken_cwl: "class: Workflow\ninputs: [aoi]\n"})))
+    truncated = tmp_path / "truncated.json"
+    truncated.write_text('{"id": "clip', encoding="utf-8")
+    files = [truncated, _record(tmp_path, "clip-broken", {}, href=broken_cwl)]
+
+    checked, mismatches = check_catalogue(files, cache)
+
+    assert checked == 1
+    assert [(m.record_id, m.href) for m in mismatches] == [(truncated.as_posix(), ""), ("clip-broken", broken_cwl)]
+    assert "could not load record" in mismatches[0].message
+    assert "could not load CWL" in mismatches[1].message
+
+
+def test_check_cwl_cli(tmp_path: Path, caplog: pytest.LogCaptureFixture) -> None:
+    collection_dir = tmp_path / "catalogue" / "col" / "workflows"
+    collection_dir.mkdir(parents=True)
+    cwl = tmp_path / "clip.cwl"
+    cwl.write_text(_CWL, encoding="utf-8")
+    _record(collection_dir, "clip-local", {"bbox": {"type": "bbox"}}, href=cwl.as_uri())
+
+    result = CliRunner().invoke(
+        check_workflow_cwl, ["--workflow-definition-path", str(collection_dir / "clip-local.json")]
+    )
+
+    assert result.exit_code == 1
+    assert "FAIL: clip-local.stac_item - required by the CWL but missing from inputParameters" in caplog.text
+    assert {r.levelname for r in caplog.records if r.message.startswith("FAIL:")} == {"ERROR"}
+    assert "Checked 1 workflow(s) against 1 CWL document(s)" in caplog.text
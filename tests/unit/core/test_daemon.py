@@ -0,0 +1,168 @@
+from __future__ import annotations
+
+import json
+import shutil
+import socket
+import tempfile
+import threading
+from pathlib import Path
+from typing import TYPE_CHECKING
+from unittest.mock import patch
+
+import pytest
+from click.testing import CliRunner
+
+from workflow_catalogue.cli.daemon.check import check_files
+from workflow_catalogue.cli.daemon.status import daemon_status
+from workflow_catalogue.consts import directories
+from workflow_catalogue.core.daemon import (
+    DaemonUnavailableError,
+    ValidationDaemon,
+    format_issue,
+    send_request,
+    validate_paths,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+_WORKFLOWS_DIR = directories.CATALOGUE_DIR / "eodh-workflows-notebooks" / "workflows"
+
+
+@pytest.fixture
+def socket_path() -> Iterator[Path]:
+    # Unix socket paths are limited to ~100 characters, too short for pytest's tmp_path.
+    directory = Path(tempfile.mkdtemp(prefix="wfc-"))
+    yield directory / "daemon.sock"
+    shutil.rmtree(directory)
+
+
+@pytest.fixture
+def daemon(socket_path: Path) -> Iterator[ValidationDaemon]:
+    server = ValidationDaemon(socket_path)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+    thread.join()
+
+
+@pytest.fixture
+def record(tmp_path: Path) -> Path:
+    target = tmp_path / "clip-workflow.json"
+    shutil.copy(_WORKFLOWS_DIR / "clip-workflow.json", target)
+    return target
+
+
+def test_validate_through_daemon(daemon: ValidationDaemon, socket_path: Path, record: Path) -> None:
+    results, from_daemon = validate_paths([record], socket_path)
+    assert from_daemon
+    assert results[0]["path"] == record.as_posix()
+    assert results[0]["errors"] == []
+
+    validate_paths([record], socket_path)
+    assert (daemon.hits, daemon.misses) == (1, 1)
+
+    document = json.loads(record.read_text(encoding="utf-8"))
+    del document["properties"]["title"]
+    record.write_text(json.dumps(document), encoding="utf-8")
+    results, _ = validate_paths([record], socket_path)
+    assert daemon.misses == 2  # noqa: PLR2004
+    assert format_issue(results[0]["errors"][0]) == "$.properties.title: Field required [missing]"
+
+
+def test_status_and_unknown_op(daemon: ValidationDaemon, socket_path: Path) -> None:
+    status = send_request(socket_path, {"op": "status"})
+    assert status["ok"]
+    assert status["cached_files"] == 0
+    assert send_request(socket_path, {"op": "nope"}) == {"ok": False, "error": "Unknown op: nope"}
+    assert daemon.requests == 2  # noqa: PLR2004
+
+
+def test_second_daemon_is_rejected(daemon: ValidationDaemon, socket_path: Path) -> None:
+    with pytest.raises(RuntimeError, match="already listening"):
+        ValidationDaemon(socket_path)
+    assert daemon.socket_path.exists()
+
+
+def test_stale_socket_is_replaced(socket_path: Path) -> None:
+    stale = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    stale.bind(str(socket_path))
+    stale.close()
+
+    with ValidationDaemon(socket_path) as server:
+        assert server.socket_path.exists()
+    assert not socket_path.exists()
+
+
+def test_fallback_without_daemon(socket_path: Path, record: Path) -> None:
+    with pytest.raises(DaemonUnavailableError):
+        send_request(socket_path, {"op": "status"})
+    results, from_daemon = validate_paths([record], socket_path)
+    assert not from_daemon
+    assert results[0]["errors"] == []
+
+
+@pytest.mark.parametrize("reply", [b"not json\n", None])
+def test_fallback_on_broken_daemon(
+    socket_path: Path, record: Path, reply: bytes | None, caplog: pytest.LogCaptureFixture
+) -> None:
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as server:
+        server.bind(str(socket_path))
+        server.listen()
+
+        def answer() -> None:
+            connection, _ = server.accept()
+            with connection:
+                connection.recv(65536)
+                if reply is not None:
+                    connection.sendall(reply)
+                    return
+                connection.recv(1)  # Stall until the client gives up.
+
+        thread = threading.Thread(target=answer, daemon=True)
+        thread.start()
+        results, from_daemon = validate_paths([record], socket_path, timeout=0.2)
+        thread.join()
+
+    assert not from_daemon
+    assert results[0]["errors"] == []
+    assert "validating in process" in caplog.text
+
+
+def test_check_cli(
+    daemon: ValidationDaemon, socket_path: Path, tmp_path: Path, caplog: pytest.LogCaptureFixture
+) -> None:
+    broken = tmp_path / "broken.json"
+    broken.write_text("{", encoding="utf-8")
+    files = [*map(str, sorted(_WORKFLOWS_DIR.glob("*.json"))), str(broken), "README.md"]
+
+    result = CliRunner().invoke(check_files, [*files, "--socket", str(socket_path)])
+
+    assert result.exit_code == 1
+    assert "by the daemon" in caplog.text
+    assert f"FAIL: {broken.absolute().as_posix()}" in caplog.text
+    assert "1 file(s) failed validation." in caplog.text
+    assert daemon.misses == len(files) - 1
+
+
+def test_check_cli_expands_catalog(socket_path: Path, tmp_path: Path, caplog: pytest.LogCaptureFixture) -> None:
+    collection = tmp_path / "collection"
+    shutil.copytree(_WORKFLOWS_DIR.parent, collection)
+    records = sorted(p for p in collection.rglob("*.json") if p.name != "catalog.json")
+
+    result = CliRunner().invoke(check_files, [str(collection / "catalog.json"), "--socket", str(socket_path)])
+
+    assert result.exit_code == 0
+    assert f"Validated {len(records) + 1} file(s)" in caplog.text
+    assert all(f"PASS: {r.as_posix()}" in caplog.text for r in records)
+
+
+def test_status_cli_hung_daemon(socket_path: Path, caplog: pytest.LogCaptureFixture) -> None:
+    with patch("workflow_catalogue.cli.daemon.status.send_request", side_effect=TimeoutError("timed out")):
+        result = CliRunner().invoke(daemon_status, ["--socket", str(socket_path)])
+
+    assert result.exit_code == 1
+    assert isinstance(result.exception, SystemExit)
+    assert "is not responding: timed out" in caplog.text
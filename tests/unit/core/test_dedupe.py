@@ -0,0 +1,110 @@
+from __future__ import annotations
+
+import json
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+import pytest
+from click.testing import CliRunner
+
+from workflow_catalogue.cli.catalogue.dedupe import dedupe_catalogue
+from workflow_catalogue.consts import directories
+from workflow_catalogue.core.dedupe import (
+    candidate_pairs,
+    estimate_similarity,
+    find_near_duplicates,
+    lsh_params,
+    minhash_signatures,
+    record_tokens,
+    shingle_hashes,
+)
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+_DESCRIPTION = (
+    "This workflow calculates the normalized difference vegetation index of the selected assets using the red and "
+    "near infrared bands of Sentinel-2 imagery"
+)
+
+
+def _record(record_id: str, title: str, description: str = _DESCRIPTION, keywords: list[Any] | None = None) -> Any:
+    properties = {"title": title, "description": description, "keywords": keywords or ["sentinel-2", "remote sensing"]}
+    return {"id": record_id, "properties": properties}
+
+
+def test_record_tokens() -> None:
+    document = _record("ndvi", "NDVI Calculation", "Calculates NDVI.", ["Remote Sensing ", 3])
+    assert record_tokens(document) == ["ndvi", "calculation", "calculates", "ndvi", "remote sensing"]
+    assert record_tokens({"id": "empty"}) == []
+
+
+def test_shingle_hashes() -> None:
+    hashes, counts = shingle_hashes([["a", "b", "c"], [], ["a"], ["b", "c", "a"]], shingle_size=2)
+
+    assert counts.tolist() == [2, 0, 1, 2]
+    assert hashes.max() < 2**32
+    # "b c" occurs in the first and last record, "a b" only in the first.
+    assert hashes[1] == hashes[3]
+    assert hashes[0] not in hashes[3:]
+
+
+def test_minhash_estimates_jaccard() -> None:
+    first = [f"w{i}" for i in range(100)]
+    second = [f"w{i}" for i in range(25, 125)]
+    hashes, counts = shingle_hashes([first, second, first])
+    signatures = minhash_signatures(hashes, counts, num_perm=512)
+
+    similarity = estimate_similarity(signatures, np.array([[0, 1], [0, 2]]))
+
+    assert signatures.shape == (3, 512)
+    assert abs(similarity[0] - 75 / 125) < 0.08  # noqa: PLR2004
+    assert similarity[1] == pytest.approx(1.0)
+
+
+def test_lsh_params() -> None:
+    for threshold in (0.3, 0.5, 0.7, 0.9):
+        bands, rows = lsh_params(threshold, 128)
+        assert bands * rows <= 128  # noqa: PLR2004
+        # The S-curve rises steepest around (1 / bands) ** (1 / rows).
+        assert abs((1 / bands) ** (1 / rows) - threshold) < 0.1  # noqa: PLR2004
+
+
+def test_candidate_pairs_link_buckets_linearly() -> None:
+    signatures = np.array([[1, 2, 3, 4]] * 5 + [[5, 6, 7, 8], [5, 6, 0, 0]], dtype=np.uint32)
+
+    pairs = candidate_pairs(signatures, bands=2, rows=2)
+
+    assert pairs.tolist() == [[0, 1], [0, 2], [0, 3], [0, 4], [5, 6]]
+
+
+def test_find_near_duplicates() -> None:
+    documents = [
+        _record("ndvi", "NDVI Calculation"),
+        _record("ndvi-copy", "NDVI Calculation"),
+        _record("ndwi", "NDWI Calculation", _DESCRIPTION.replace("vegetation", "water")),
+        _record("clip", "Clip Asset", "This workflow clips the main asset to the provided bounding box.", ["clip"]),
+        {"id": "empty", "properties": {}},
+    ]
+
+    [cluster] = find_near_duplicates(documents, threshold=0.7)
+
+    assert cluster.record_ids == ("ndvi", "ndvi-copy", "ndwi")
+    assert cluster.pairs[0][:2] == ("ndvi", "ndvi-copy")
+    assert cluster.similarity == pytest.approx(1.0)
+    assert all(pair.similarity >= 0.7 for pair in cluster.pairs)  # noqa: PLR2004
+    assert find_near_duplicates(documents, threshold=0.99)[0].record_ids == ("ndvi", "ndvi-copy")
+    assert find_near_duplicates(documents[3:]) == []
+
+
+def test_dedupe_catalogue(tmp_path: Path) -> None:
+    output = tmp_path / "clusters.json"
+    result = CliRunner().invoke(
+        dedupe_catalogue, ["--catalogue-path", str(directories.CATALOGUE_DIR), "--output", str(output)]
+    )
+
+    assert result.exit_code == 0, result.output
+    assert result.output.split()[1:] == ["ndvi_notebook", "ndwi_notebook"]
+    [cluster] = json.loads(output.read_text(encoding="utf-8"))
+    assert cluster["record_ids"] == ["ndvi_notebook", "ndwi_notebook"]
+    assert cluster["pairs"][0]["similarity"] == cluster["similarity"]
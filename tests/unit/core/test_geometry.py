@@ -0,0 +1,198 @@
+from __future__ import annotations
+
+import copy
+import json
+import random
+import warnings
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+import pytest
+from geojson_pydantic.geometries import Geometry
+from pydantic import TypeAdapter, ValidationError
+
+from workflow_catalogue.consts import directories
+from workflow_catalogue.core.geometry import extent_bboxes, geometry_warnings, pack_geometry
+from workflow_catalogue.core.validation import render_sarif, run_validation, validate_file
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+_GEOMETRY: TypeAdapter[Geometry] = TypeAdapter(Geometry)
+_WORKFLOW = directories.CATALOGUE_DIR / "eodh-workflows-notebooks" / "workflows" / "clip-workflow.json"
+_SQUARE = [[0, 0], [1, 0], [1, 1], [0, 1], [0, 0]]
+_HOLE = [[0.2, 0.2], [0.2, 0.8], [0.8, 0.8], [0.8, 0.2], [0.2, 0.2]]
+
+
+def _accepted_by_pydantic(geometry: Any) -> bool:
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        try:
+            _GEOMETRY.validate_python(geometry)
+        except (ValidationError, ValueError):
+            return False
+    return True
+
+
+@pytest.mark.parametrize(
+    "geometry",
+    [
+        {"type": "Point", "coordinates": [1, 2]},
+        {"type": "Point", "coordinates": [1.5, 2, 3], "bbox": [1.5, 2, 3, 1.5, 2, 3]},
+        {"type": "MultiPoint", "coordinates": []},
+        {"type": "LineString", "coordinates": [[0, 0], [1, 1]]},
+        {"type": "MultiLineString", "coordinates": [[[0, 0], [1, 1]], [[2, 2], [3, 3], [4, 4]]]},
+        {"type": "Polygon", "coordinates": [_SQUARE, _HOLE]},
+        {"type": "Polygon", "coordinates": []},
+        {"type": "MultiPolygon", "coordinates": [[_SQUARE], [], [_SQUARE, _HOLE]]},
+        {
+            "type": "GeometryCollection",
+            "geometries": [{"type": "Point", "coordinates": [0, 0]}, {"type": "Polygon", "coordinates": [_SQUARE]}],
+        },
+    ],
+)
+def test_pack_geometry_accepts_valid(geometry: dict[str, Any]) -> None:
+    assert _accepted_by_pydantic(geometry)
+    assert pack_geometry(geometry) is not None
+
+
+@pytest.mark.parametrize(
+    "geometry",
+    [
+        None,
+        {"type": "Curve", "coordinates": [0, 0]},
+        {"type": "Point", "coordinates": [0]},
+        {"type": "Point", "coordinates": [0, None]},
+        {"type": "LineString", "coordinates": [[0, 0]]},
+        {"type": "Polygon", "coordinates": [_SQUARE[:-1]]},
+        {"type": "Polygon", "coordinates": [[[0, 0], [1, 0], [0, 0]]]},
+        {"type": "Polygon", "coordinates": [_SQUARE], "bbox": [0, 1, 1, 0]},
+        {
+            "type": "GeometryCollection",
+            "geometries": [{"type": "Point", "coordinates": [0, 0]}, {"type": "Point", "coordinates": [0, 0, 0]}],
+        },
+        # Accepted by pydantic but left to it: mixed dimensions, numeric strings, non-finite coordinates.
+        {"type": "MultiPoint", "coordinates": [[0, 0], [1, 1, 1]]},
+        {"type": "Point", "coordinates": ["1.5", 2]},
+        {"type": "Point", "coordinates": [float("nan"), 2]},
+    ],
+)
+def test_pack_geometry_leaves_others_to_pydantic(geometry: Any) -> None:
+    assert pack_geometry(geometry) is None
+
+
+def _random_geometry(rng: random.Random, depth: int = 0) -> dict[str, Any]:
+    dims = rng.choice([2, 3])
+
+    def position() -> list[float]:
+        return [rng.uniform(-200, 200) for _ in range(dims)]
+
+    def ring() -> list[list[float]]:
+        positions = [position() for _ in range(rng.randint(3, 5))]
+        return [*positions, list(positions[0])]
+
+    kind = rng.choice(
+        ["Point", "MultiPoint", "LineString", "Polygon", "MultiPolygon", "GeometryCollection"][: 6 - depth]
+    )
+    if kind == "GeometryCollection":
+        return {"type": kind, "geometries": [_random_geometry(rng, depth + 1) for _ in range(rng.randint(0, 3))]}
+    coordinates: Any = {
+        "Point": position,
+        "MultiPoint": lambda: [position() for _ in range(rng.randint(0, 3))],
+        "LineString": lambda: [position() for _ in range(rng.randint(2, 4))],
+        "Polygon": lambda: [ring() for _ in range(rng.randint(0, 2))],
+        "MultiPolygon": lambda: [[ring() for _ in range(rng.randint(0, 2))] for _ in range(rng.randint(0, 2))],
+    }[kind]()
+    return {"type": kind, "coordinates": coordinates}
+
+
+def _mutate(geometry: dict[str, Any], rng: random.Random) -> None:
+    lists: list[list[Any]] = []
+
+    def collect(node: Any) -> None:
+        if isinstance(node, list):
+            lists.append(node)
+        for child in node.values() if isinstance(node, dict) else node if isinstance(node, list) else []:
+            collect(child)
+
+    collect(geometry)
+    target = rng.choice(lists) if lists else []
+    value = copy.deepcopy(rng.choice([None, "1", True, [], [1], [0.0, 1.0], [0.0, 1.0, 2.0], float("inf")]))
+    if target and rng.random() < 0.5:  # noqa: PLR2004
+        target[rng.randrange(len(target))] = value
+    elif target and rng.random() < 0.5:  # noqa: PLR2004
+        target.pop()
+    else:
+        target.append(value)
+
+
+def test_pack_geometry_never_accepts_what_pydantic_rejects() -> None:
+    rng = random.Random(7)  # noqa: S311
+    packed = 0
+    for _ in range(2000):
+        geometry = _random_geometry(rng)
+        for _ in range(rng.randint(0, 2)):
+            _mutate(geometry, rng)
+        if pack_geometry(geometry) is not None:
+            packed += 1
+            assert _accepted_by_pydantic(geometry), geometry
+    assert packed > 500  # noqa: PLR2004
+
+
+def test_geometry_warnings() -> None:
+    clockwise = _SQUARE[::-1]
+    packed = pack_geometry({"type": "MultiPolygon", "coordinates": [[_SQUARE, _HOLE], [clockwise, _HOLE[::-1]]]})
+    assert packed is not None
+    assert packed.exterior.tolist() == [True, False, True, False]
+
+    [winding] = geometry_warnings(packed)
+    assert winding.type == "geometry_winding"
+    assert winding.msg.startswith("1 clockwise exterior ring(s) and 1 counterclockwise hole(s)")
+
+    line = pack_geometry({"type": "LineString", "coordinates": [[179, 0], [-179, 0], [181, 95]]})
+    assert line is not None
+    crossing = np.array([[170.0, -10.0, -170.0, 10.0]])
+    assert [(w.type, w.msg) for w in geometry_warnings(line, crossing)] == [
+        ("geometry_bounds", "1 position(s) outside longitude [-180, 180] or latitude [-90, 90]"),
+        ("geometry_extent", "1 position(s) outside properties.extent.spatial.bbox"),
+    ]
+
+
+def test_extent_bboxes() -> None:
+    document = {"properties": {"extent": {"spatial": {"bbox": [[0, 1, 2, 3], [0, 1, -5, 2, 3, 5]]}}}}
+    assert extent_bboxes(document).tolist() == [[0, 1, 2, 3], [0, 1, 2, 3]]  # type: ignore[union-attr]
+    assert extent_bboxes({"properties": {}}) is None
+    assert extent_bboxes({"properties": {"extent": {"spatial": {"bbox": [[0, 3, 2, 1]]}}}}) is None
+
+
+def _write_record(directory: Path, geometry: Any, bbox: list[float] | None = None) -> Path:
+    document = json.loads(_WORKFLOW.read_text(encoding="utf-8"))
+    document["geometry"] = geometry
+    if bbox is not None:
+        document["properties"]["extent"] = {"spatial": {"bbox": [bbox]}}
+    path = directory / _WORKFLOW.name
+    path.write_text(json.dumps(document), encoding="utf-8")
+    return path
+
+
+def test_validate_file_uses_packed_geometry(tmp_path: Path) -> None:
+    angles = np.linspace(0, 2 * np.pi, 10_000, endpoint=False)
+    ring = np.column_stack([np.cos(angles), np.sin(angles)]).tolist()
+    polygon = {"type": "Polygon", "coordinates": [[*ring, ring[0]]]}
+
+    result = validate_file(_write_record(tmp_path, polygon, bbox=[-1, -1, 1, 1]))
+    assert result.passed
+    assert result.warnings == []
+
+    result = validate_file(_write_record(tmp_path, polygon, bbox=[0, 0, 1, 1]))
+    assert result.passed
+    assert [issue.type for issue in result.warnings] == ["geometry_extent"]
+    sarif = json.loads(render_sarif(run_validation([result.path])))
+    assert [r["level"] for r in sarif["runs"][0]["results"]] == ["warning"]
+
+
+def test_validate_file_reports_pydantic_errors_for_invalid_geometry(tmp_path: Path) -> None:
+    result = validate_file(_write_record(tmp_path, {"type": "Polygon", "coordinates": [[*_SQUARE[:-1], [0, 1]]]}))
+    assert not result.passed
+    assert any("same start and end coordinates" in issue.msg for issue in result.errors)
+    assert result.errors[0].loc[:2] == ["geometry", "Polygon"]
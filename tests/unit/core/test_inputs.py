@@ -0,0 +1,188 @@
+from __future__ import annotations
+
+import json
+import re
+from typing import TYPE_CHECKING, Any
+
+import pytest
+from click.testing import CliRunner
+
+from workflow_catalogue.cli.workflow.check_inputs import check_workflow_inputs
+from workflow_catalogue.consts import directories
+from workflow_catalogue.core.inputs import InputError, InputValidator, ValidatorCache, check_job, load_validators
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+_CLIP_WORKFLOW = directories.CATALOGUE_DIR / "eodh-workflows-notebooks" / "workflows" / "clip-workflow.json"
+
+_PARAMETERS: dict[str, Any] = {
+    "stac_item": {"label": "Item", "type": "raster", "description": "Item", "required": True},
+    "bbox": {"label": "AOI", "type": "bbox", "description": "AOI"},
+    "cloud_cover": {"label": "Cloud", "type": "number", "description": "Cloud", "min": 0, "max": 100},
+    "mask": {"label": "Mask", "type": "boolean", "description": "Mask"},
+    "band": {"label": "Band", "type": "text", "description": "Band", "pattern": r"B\d{2}"},
+    "index": {"label": "Index", "type": "text", "description": "Index", "enum": ["ndvi", "evi"]},
+    "start": {"label": "Start", "type": "date", "description": "Start", "required": True, "default": "2024-01-01"},
+}
+
+
+@pytest.fixture
+def validator() -> InputValidator:
+    return InputValidator.compile(_PARAMETERS)
+
+
+def test_validator_accepts_valid_inputs(validator: InputValidator) -> None:
+    inputs = {
+        "stac_item": "https://example.com/item.json",
+        "bbox": [-1.5, 50.0, 0.5, 51.0],
+        "cloud_cover": 20,
+        "mask": True,
+        "band": "B04",
+        "index": "ndvi",
+        "start": "2024-06-01T00:00:00Z",
+    }
+    assert validator.validate(inputs) == []
+    assert validator.validate({"stac_item": "item", "start": "2024-06-01"}) == []
+
+
+@pytest.mark.parametrize(
+    ("name", "value", "message"),
+    [
+        ("stac_item", "", "non-empty string"),
+        ("bbox", [0, 0, 1], "4 or 6 numbers"),
+        ("bbox", [1, 0, 0, 1], "minimums"),
+        ("bbox", [0, 0, True, 1], "4 or 6 numbers"),
+        ("cloud_cover", 101, "<= 100"),
+        ("cloud_cover", -1, ">= 0"),
+        ("cloud_cover", True, "number"),
+        ("mask", "yes", "boolean"),
+        ("band", "B4", "pattern"),
+        ("index", "ndwi", "one of"),
+        ("start", "01/06/2024", "ISO 8601"),
+        ("unknown", 1, "not a parameter"),
+    ],
+)
+def test_validator_rejects_invalid_inputs(validator: InputValidator, name: str, value: Any, message: str) -> None:
+    errors = validator.validate({"stac_item": "item", name: value})
+    assert len(errors) == 1
+    assert errors[0].parameter == name
+    assert message in errors[0].message
+
+
+def test_validator_reports_missing_required(validator: InputValidator) -> None:
+    assert validator.validate({}) == [InputError("stac_item", "is required")]
+
+
+def test_validator_tolerates_unknown_types() -> None:
+    validator = InputValidator.compile({"source": {"type": "string", "pattern": "s[12]", "enum": ["s1", "s2", 3]}})
+    assert validator.validate({"source": "s1"}) == []
+    assert validator.validate({"source": 3}) == []
+    assert validator.validate({"source": "s3"})[0].message.startswith("must be one of")
+    assert validator.json_schema()["properties"]["source"] == {"pattern": "s[12]", "enum": [3, "s1", "s2"]}
+
+
+def test_validator_checks_unhashable_enum_values() -> None:
+    validator = InputValidator.compile({
+        "index": {"type": "text", "enum": ["ndvi", "evi"]},
+        "bands": {"type": "band-list", "enum": [["B04", "B08"], {"preset": "rgb"}]},
+    })
+    assert validator.validate({"index": "ndvi", "bands": ["B04", "B08"]}) == []
+    assert validator.validate({"bands": {"preset": "rgb"}}) == []
+    assert validator.validate({"index": ["ndvi"]})[0].message.startswith("must be one of")
+    assert validator.validate({"bands": ["B02"]})[0].message.startswith("must be one of")
+
+
+def test_validator_rejects_bad_pattern() -> None:
+    with pytest.raises(re.error):
+        InputValidator.compile({"band": {**_PARAMETERS["band"], "pattern": "B("}})
+
+
+def test_json_schema(validator: InputValidator) -> None:
+    schema = validator.json_schema()
+    assert schema["required"] == ["stac_item"]
+    assert not schema["additionalProperties"]
+    assert schema["properties"]["cloud_cover"] == {"type": "number", "minimum": 0, "maximum": 100}
+    assert schema["properties"]["index"]["enum"] == ["evi", "ndvi"]
+    assert {"format": "date"} in schema["properties"]["start"]["anyOf"]
+
+
+def test_cache_is_keyed_by_id_and_hash() -> None:
+    cache = ValidatorCache(maxsize=2)
+    first = cache.get("a", "h1", _PARAMETERS)
+    assert cache.get("a", "h1", None) is first
+    assert cache.get("a", "h2", _PARAMETERS) is not first
+    cache.get("b", "h1", _PARAMETERS)
+    assert (cache.hits, cache.misses, len(cache)) == (1, 3, 2)
+    assert cache.get("a", "h1", _PARAMETERS) is not first
+
+
+def test_check_job() -> None:
+    validators = load_validators([_CLIP_WORKFLOW])
+    assert list(validators) == ["clip-workflow"]
+
+    job = {"inputs": {"stac_item": "https://example.com/item.json", "bbox": [0, 0, 1, 1]}}
+    assert check_job(job, validators, "clip-workflow") == []
+    assert check_job({**job, "workflow": "clip-workflow"}, validators) == []
+    assert check_job(job, validators)[0].parameter == "workflow"
+    assert check_job({"inputs": []}, validators, "clip-workflow")[0].parameter == "inputs"
+    assert check_job([], validators)[0].message == "job must be a JSON object"
+
+
+def test_load_validators_skips_bad_records(tmp_path: Path, caplog: pytest.LogCaptureFixture) -> None:
+    document = json.loads(_CLIP_WORKFLOW.read_text(encoding="utf-8"))
+    broken = {
+        "truncated": "{",
+        "bad-pattern": {
+            **document,
+            "id": "bad-pattern",
+            "properties": {**document["properties"], "inputParameters": {"band": {"type": "text", "pattern": "B("}}},
+        },
+        "list-parameters": {
+            **document,
+            "id": "list-parameters",
+            "properties": {**document["properties"], "inputParameters": [{"type": "text"}]},
+        },
+        "list-parameter": {
+            **document,
+            "id": "list-parameter",
+            "properties": {**document["properties"], "inputParameters": {"band": ["text"]}},
+        },
+    }
+    files = [_CLIP_WORKFLOW]
+    for name, content in broken.items():
+        files.append(tmp_path / f"{name}.json")
+        files[-1].write_text(content if isinstance(content, str) else json.dumps(content), encoding="utf-8")
+
+    assert list(load_validators(files)) == ["clip-workflow"]
+    assert caplog.text.count("SKIP:") == len(broken)
+
+
+def test_check_inputs_cli_bulk(tmp_path: Path, caplog: pytest.LogCaptureFixture) -> None:
+    jobs = tmp_path / "jobs.jsonl"
+    valid = {"workflow": "clip-workflow", "inputs": {"stac_item": "item", "bbox": [0, 0, 1, 1]}}
+    invalid = {"workflow": "clip-workflow", "inputs": {"bbox": "0,0,1,1"}}
+    jobs.write_text(f"{json.dumps(valid)}\n\n{json.dumps(invalid)}\n{{\n", encoding="utf-8")
+
+    result = CliRunner().invoke(
+        check_workflow_inputs, ["--catalogue-path", str(directories.CATALOGUE_DIR), "--jobs", str(jobs)]
+    )
+
+    assert result.exit_code == 1
+    assert f"FAIL: {jobs.as_posix()}:3 - bbox: must be a list of 4 or 6 numbers" in caplog.text
+    assert f"FAIL: {jobs.as_posix()}:4 - invalid JSON" in caplog.text
+    assert "1 valid, 2 invalid" in caplog.text
+
+
+def test_check_inputs_cli_single(tmp_path: Path, caplog: pytest.LogCaptureFixture) -> None:
+    payload = tmp_path / "job.json"
+    payload.write_text(json.dumps({"inputs": {"stac_item": "item"}}), encoding="utf-8")
+
+    result = CliRunner().invoke(
+        check_workflow_inputs,
+        ["--workflow-definition-path", str(_CLIP_WORKFLOW), "--inputs", str(payload), "--show-schema"],
+    )
+
+    assert result.exit_code == 0, result.output
+    assert '"clip-workflow"' in result.output
+    assert "1 valid, 0 invalid" in caplog.text
@@ -0,0 +1,70 @@
+from __future__ import annotations
+
+import copy
+import json
+from datetime import UTC, datetime, timedelta, timezone
+from typing import Any
+
+from workflow_catalogue.consts import directories
+from workflow_catalogue.core.interning import Interner
+from workflow_catalogue.schemas.workflow import EodhWorkflowRecord
+from workflow_catalogue.utils.serialization import model_to_jsonable
+
+_RECORD = directories.CATALOGUE_DIR / "eodh-workflows-notebooks" / "workflows" / "clip-workflow.json"
+
+
+def _documents() -> tuple[dict[str, Any], dict[str, Any]]:
+    first = json.loads(_RECORD.read_text(encoding="utf-8"))
+    second = copy.deepcopy(first)
+    second["id"] = "clip-workflow-2"
+    second["properties"]["title"] = "Another title"
+    return first, second
+
+
+def test_intern_json_shares_identical_sub_objects() -> None:
+    first, second = _documents()
+    interner = Interner()
+    a = interner.intern_json(copy.deepcopy(first))
+    b = interner.intern_json(copy.deepcopy(second))
+
+    assert a == first
+    assert b == second
+    assert a is not b
+    assert a["conformsTo"] is b["conformsTo"]
+    assert a["properties"]["contacts"] is b["properties"]["contacts"]
+    assert a["links"][0] is b["links"][0]
+    assert a["properties"] is not b["properties"]
+    assert interner.hits > 0
+
+
+def test_intern_json_keeps_distinct_values_apart() -> None:
+    interner = Interner()
+    values = interner.intern_json({"a": [1], "b": [1.0], "c": [True], "d": [0.0], "e": [-0.0], "f": ["1"]})
+    assert len({id(v) for v in values.values()}) == len(values)
+    assert str(values["e"][0]) == "-0.0"
+
+
+def test_intern_model_shares_contacts_and_links() -> None:
+    first, second = _documents()
+    interner = Interner()
+    a = interner.intern_model(EodhWorkflowRecord.model_validate(first))
+    b = interner.intern_model(EodhWorkflowRecord.model_validate(second))
+
+    assert a.properties.contacts is not None
+    assert b.properties.contacts is not None
+    assert a.properties.contacts[0] is b.properties.contacts[0]
+    assert a.links is not None
+    assert b.links is not None
+    assert a.links[0] is b.links[0]
+    assert a.conforms_to is b.conforms_to
+    assert model_to_jsonable(a) == model_to_jsonable(EodhWorkflowRecord.model_validate(first))
+    assert model_to_jsonable(b) == model_to_jsonable(EodhWorkflowRecord.model_validate(second))
+
+
+def test_intern_model_respects_time_zones() -> None:
+    interner = Interner()
+    utc = datetime(2026, 1, 1, tzinfo=UTC)
+    shifted = utc.astimezone(timezone(timedelta(hours=1)))
+    values = interner.intern_json({"a": [utc], "b": [shifted]})
+    assert values["a"] is not values["b"]
+    assert values["b"][0].utcoffset() == timedelta(hours=1)
@@ -0,0 +1,115 @@
+from __future__ import annotations
+
+import json
+import shutil
+from typing import TYPE_CHECKING
+from unittest.mock import MagicMock
+
+from click.testing import CliRunner
+
+from workflow_catalogue.cli.catalogue.validate import validate_catalogue
+from workflow_catalogue.consts import directories
+from workflow_catalogue.core.manifest import MANIFEST_KEY_ENV, ValidationManifest, load_manifest
+from workflow_catalogue.core.registration import CatalogueRegistrar, RegistrationResult, load_record
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    import pytest
+
+_KEY = "test-key"
+_COLLECTION = "eodh-workflows-notebooks"
+
+
+def _write_manifest(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> tuple[Path, Path]:
+    catalogue = tmp_path / "catalogue"
+    shutil.copytree(directories.CATALOGUE_DIR / _COLLECTION, catalogue / _COLLECTION)
+    manifest_path = tmp_path / "manifest.json"
+    monkeypatch.setenv(MANIFEST_KEY_ENV, _KEY)
+    result = CliRunner().invoke(
+        validate_catalogue, ["--catalogue-path", str(catalogue), "--manifest-output", str(manifest_path)]
+    )
+    assert result.exit_code == 0, result.output
+    return catalogue / _COLLECTION, manifest_path
+
+
+def test_validate_writes_signed_manifest(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    collection_dir, manifest_path = _write_manifest(tmp_path, monkeypatch)
+
+    manifest = load_manifest(manifest_path, _KEY)
+
+    assert manifest is not None
+    assert len(manifest.files) == len(list(collection_dir.rglob("*.json")))
+    assert all(entry.passed for entry in manifest.files.values())
+    assert {entry.record_type for entry in manifest.files.values()} == {"catalog", "workflow", "notebook"}
+
+
+def test_validate_manifest_requires_key(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.delenv(MANIFEST_KEY_ENV, raising=False)
+    result = CliRunner().invoke(
+        validate_catalogue,
+        ["--catalogue-path", str(directories.CATALOGUE_DIR), "--manifest-output", str(tmp_path / "manifest.json")],
+    )
+    assert result.exit_code == 2  # noqa: PLR2004
+    assert MANIFEST_KEY_ENV in result.output
+
+
+def test_load_manifest_rejects_untrusted(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, caplog: pytest.LogCaptureFixture
+) -> None:
+    _, manifest_path = _write_manifest(tmp_path, monkeypatch)
+
+    assert load_manifest(tmp_path / "missing.json", _KEY) is None
+    assert load_manifest(manifest_path, None) is None
+    assert load_manifest(manifest_path, "other-key") is None
+    assert "invalid signature" in caplog.text
+
+    document = json.loads(manifest_path.read_text(encoding="utf-8"))
+    next(iter(document["files"].values()))["passed"] = False
+    tampered = tmp_path / "tampered.json"
+    tampered.write_text(json.dumps(document), encoding="utf-8")
+    assert load_manifest(tampered, _KEY) is None
+
+    stale = ValidationManifest.model_validate_json(manifest_path.read_bytes())
+    stale.schema_fingerprint = "0" * 64
+    stale.sign(_KEY)
+    stale.write(tampered)
+    assert load_manifest(tampered, _KEY) is None
+    assert "written for other schemas" in caplog.text
+
+
+def test_load_record_skips_validation_of_trusted_files(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    collection_dir, manifest_path = _write_manifest(tmp_path, monkeypatch)
+    manifest = load_manifest(manifest_path, _KEY)
+    workflow = collection_dir / "workflows" / "clip-workflow.json"
+
+    validated = load_record(workflow)
+    trusted = load_record(workflow, manifest=manifest)
+
+    assert trusted.record is None
+    assert validated.record is not None
+    assert (trusted.id, trusted.is_workflow, trusted.cwl_hrefs) == (
+        validated.id,
+        validated.is_workflow,
+        validated.cwl_hrefs,
+    )
+    assert trusted.document == validated.document
+
+    workflow.write_text(workflow.read_text(encoding="utf-8") + "\n", encoding="utf-8")
+    assert load_record(workflow, manifest=manifest).record is not None
+
+
+def test_registrar_load_uses_manifest(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, caplog: pytest.LogCaptureFixture
+) -> None:
+    collection_dir, manifest_path = _write_manifest(tmp_path, monkeypatch)
+    files = sorted(collection_dir.rglob("*.json"))
+    files[-1].write_text(files[-1].read_text(encoding="utf-8") + "\n", encoding="utf-8")
+    registrar = CatalogueRegistrar(MagicMock(), manifest=load_manifest(manifest_path, _KEY))
+
+    result = RegistrationResult()
+    records = registrar.load(files, result)
+
+    assert result.ok
+    assert [record.record is None for record in records].count(False) == 1
+    assert f"Trusted {len(records) - 1} of {len(records)} record(s)" in caplog.text
@@ -0,0 +1,111 @@
+from __future__ import annotations
+
+import json
+from http import HTTPStatus
+
+import requests
+
+from workflow_catalogue.core.mock_platform import (
+    MockPlatform,
+    MockPlatformAdapter,
+    MockPlatformConfig,
+    MockPlatformServer,
+    RequestRecorder,
+)
+
+_API = "https://mock.invalid/api/wf-catalogue/v1.0"
+
+
+def _session(platform: MockPlatform, recorder: RequestRecorder | None = None) -> requests.Session:
+    session = requests.Session()
+    session.mount("https://", MockPlatformAdapter(platform, recorder))
+    return session
+
+
+def test_register_flow() -> None:
+    platform = MockPlatform()
+    session = _session(platform)
+
+    assert session.get(f"{_API}/collections/col", timeout=1).status_code == HTTPStatus.NOT_FOUND
+    assert session.post(f"{_API}/collections", json={"id": "col"}, timeout=1).status_code == HTTPStatus.CREATED
+    assert session.post(f"{_API}/collections", json={"id": "col"}, timeout=1).status_code == HTTPStatus.CONFLICT
+
+    resp = session.post(f"{_API}/register", json={"id": "rec"}, params={"catalogue_id": "col"}, timeout=1)
+    assert resp.status_code == HTTPStatus.CREATED
+    resp = session.post(f"{_API}/register", json={"id": "rec"}, params={"catalogue_id": "col"}, timeout=1)
+    assert resp.status_code == HTTPStatus.CONFLICT
+
+    assert session.delete(f"{_API}/register/rec", timeout=1).status_code == HTTPStatus.NO_CONTENT
+    assert session.delete(f"{_API}/register/rec", timeout=1).status_code == HTTPStatus.NOT_FOUND
+
+
+def test_register_into_unknown_collection() -> None:
+    session = _session(MockPlatform())
+    resp = session.post(f"{_API}/register", json={"id": "rec"}, params={"catalogue_id": "missing"}, timeout=1)
+    assert resp.status_code == HTTPStatus.NOT_FOUND
+
+
+def test_ades_process_lifecycle() -> None:
+    platform = MockPlatform()
+    session = _session(platform)
+    ades = "https://mock.invalid/api/ades/ws/processes"
+
+    cwl = session.get("https://example.invalid/repo/my-process.cwl", timeout=1)
+    assert cwl.status_code == HTTPStatus.OK
+    assert session.post(ades, data=cwl.content, timeout=1).status_code == HTTPStatus.CREATED
+    assert platform.processes == {"my-process"}
+    assert session.delete(f"{ades}/my-process", timeout=1).status_code == HTTPStatus.NO_CONTENT
+
+
+def test_unrouted_request() -> None:
+    platform = MockPlatform()
+    assert _session(platform).get("https://mock.invalid/unknown", timeout=1).status_code == HTTPStatus.NOT_FOUND
+    assert platform.stats["unrouted"] == 1
+
+
+def test_error_injection() -> None:
+    platform = MockPlatform(MockPlatformConfig(error_rate=1.0, seed=0))
+    resp = _session(platform).get(f"{_API}/collections/col", timeout=1)
+    assert resp.status_code == HTTPStatus.SERVICE_UNAVAILABLE
+    assert platform.stats["catalogue:503"] == 1
+
+
+def test_rate_limit_returns_retry_after() -> None:
+    platform = MockPlatform(MockPlatformConfig(rate_limit=0.5, burst=2))
+    session = _session(platform)
+    statuses = [session.get(f"{_API}/collections/col", timeout=1) for _ in range(3)]
+    assert [r.status_code for r in statuses] == [HTTPStatus.NOT_FOUND, HTTPStatus.NOT_FOUND, 429]
+    assert int(statuses[-1].headers["Retry-After"]) >= 1
+
+
+def test_rate_limit_is_per_endpoint_family() -> None:
+    platform = MockPlatform(MockPlatformConfig(rate_limit=0.5, burst=1))
+    session = _session(platform)
+    assert session.get(f"{_API}/collections/col", timeout=1).status_code == HTTPStatus.NOT_FOUND
+    assert session.post("https://mock.invalid/api/workspaces/ws/harvest", timeout=1).status_code == HTTPStatus.OK
+
+
+def test_recorder_redacts_credentials() -> None:
+    recorder = RequestRecorder()
+    session = _session(MockPlatform(), recorder)
+    session.post(
+        "https://mock.invalid/keycloak/realms/eodh/protocol/openid-connect/token",
+        data={"username": "user", "password": "secret"},
+        headers={"Authorization": "Bearer secret"},
+        timeout=1,
+    )
+
+    (entry,) = recorder.requests
+    assert entry["headers"]["Authorization"] == "***"
+    assert entry["body"] == {"username": "user", "password": "***"}
+    assert "secret" not in json.dumps(entry)
+
+
+def test_server_round_trip() -> None:
+    with MockPlatformServer() as server:
+        resp = requests.post(f"{server.base_url}/api/wf-catalogue/v1.0/collections", json={"id": "col"}, timeout=5)
+        assert resp.status_code == HTTPStatus.CREATED
+        stats = requests.get(f"{server.base_url}/_mock/stats", timeout=5).json()
+
+    assert stats["collections"] == ["col"]
+    assert stats["stats"]["catalogue:201"] == 1
@@ -0,0 +1,204 @@
+from __future__ import annotations
+
+import io
+import json
+from typing import TYPE_CHECKING, Any
+
+import pytest
+import requests
+from click.testing import CliRunner
+
+from workflow_catalogue.cli.notebook.inspect import inspect_notebook_artifacts
+from workflow_catalogue.consts import directories
+from workflow_catalogue.core.notebooks import (
+    ArtifactCache,
+    KernelExpectation,
+    NotebookError,
+    NotebookMetadata,
+    env_python_version,
+    expected_kernels,
+    inspect_notebooks,
+    read_notebook_metadata,
+)
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+_NDVI_NOTEBOOK = directories.CATALOGUE_DIR / "eodh-workflows-notebooks" / "notebooks" / "ndvi_notebook.json"
+
+
+def _notebook(kernel: str = "python3", version: str = "3.11.4", outputs: int = 3) -> dict[str, Any]:
+    cell = {
+        "cell_type": "code",
+        "source": ['print("{[\\"]}")\n', "x = '\\\\'"],
+        "outputs": [{"text": ['ünïcødé ] } " \\ ' * 50] * outputs}],
+    }
+    return {
+        "cells": [cell] * outputs,
+        "metadata": {
+            "kernelspec": {"name": kernel, "display_name": "Python 3", "language": "python"},
+            "language_info": {"name": "python", "version": version},
+        },
+        "nbformat": 4,
+        "nbformat_minor": 5,
+    }
+
+
+def _write_record(directory: Path, record_id: str, href: str, kernel: dict[str, Any]) -> Path:
+    document = json.loads(_NDVI_NOTEBOOK.read_text(encoding="utf-8"))
+    document["id"] = record_id
+    for link in document["links"]:
+        if link["rel"] == "application":
+            link["href"] = href
+            link["jupyter:kernel"] = kernel
+    path = directory / f"{record_id}.json"
+    path.write_text(json.dumps(document), encoding="utf-8")
+    return path
+
+
+class _Adapter(requests.adapters.BaseAdapter):
+    def __init__(self, files: dict[str, bytes]) -> None:
+        super().__init__()
+        self.files = files
+        self.requests: list[str] = []
+
+    def send(self, request: requests.PreparedRequest, **_kwargs: Any) -> requests.Response:  # type: ignore[override]
+        assert request.url is not None
+        self.requests.append(request.url)
+        response = requests.Response()
+        response.status_code = 200 if request.url in self.files else 404
+        response.raw = io.BytesIO(self.files.get(request.url, b""))
+        response.url = request.url
+        response.request = request
+        return response
+
+    def close(self) -> None:
+        pass
+
+
+@pytest.mark.parametrize("chunk_size", [1, 7, 64 * 1024])
+@pytest.mark.parametrize("indent", [None, 1])
+def test_read_notebook_metadata(chunk_size: int, indent: int | None) -> None:
+    notebook = _notebook()
+    raw = json.dumps(notebook, indent=indent, ensure_ascii=False).encode()
+
+    found = read_notebook_metadata(io.BytesIO(raw), chunk_size)
+
+    assert found == {key: notebook[key] for key in ("metadata", "nbformat", "nbformat_minor")}
+
+
+def test_read_notebook_metadata_stops_early() -> None:
+    raw = b'{"metadata": {"a": 1}, "nbformat": 4, "nbformat_minor": 5, "cells": [' + b"x" * 100
+    assert read_notebook_metadata(io.BytesIO(raw), 16)["nbformat"] == 4  # noqa: PLR2004
+    for broken in (b"[]", b'{"cells": [1, 2', b'{"metadata": {"a": }}'):
+        with pytest.raises(ValueError, match=r"notebook|Expecting"):
+            read_notebook_metadata(io.BytesIO(broken))
+
+
+def test_notebook_metadata_from_file(tmp_path: Path) -> None:
+    path = tmp_path / "nb.ipynb"
+    path.write_text(json.dumps(_notebook(version="3.10.12")), encoding="utf-8")
+    assert NotebookMetadata.from_file(path) == NotebookMetadata("python3", "3.10", 4)
+
+    path.write_text("{", encoding="utf-8")
+    with pytest.raises(NotebookError, match="Invalid notebook"):
+        NotebookMetadata.from_file(path)
+
+
+def test_env_python_version(tmp_path: Path) -> None:
+    path = tmp_path / "environment.yml"
+    path.write_text("name: eodh\ndependencies:\n  - python=3.12\n  - numpy\n", encoding="utf-8")
+    assert env_python_version(path) == "3.12"
+    path.write_text("numpy==2.0\n", encoding="utf-8")
+    assert env_python_version(path) is None
+
+
+def test_expected_kernels() -> None:
+    document = json.loads(_NDVI_NOTEBOOK.read_text(encoding="utf-8"))
+    [expectation] = expected_kernels(document)
+    assert expectation.record_id == "ndvi_notebook"
+    assert expectation.href.endswith(".ipynb")
+    assert (expectation.kernel_name, expectation.python_version) == ("python3", 3.11)
+
+    document["links"] = [{"rel": "application", "href": "nb.ipynb"}]
+    document["properties"]["jupyter_kernel_info"] = {"name": "ir", "python_version": 3.9}
+    assert expected_kernels(document) == [KernelExpectation("ndvi_notebook", "nb.ipynb", "ir", 3.9)]
+
+    document["links"][0]["jupyter:kernel"] = "python3"
+    document["properties"]["jupyter_kernel_info"] = ["ir"]
+    assert expected_kernels(document) == [KernelExpectation("ndvi_notebook", "nb.ipynb")]
+
+
+def test_artifact_cache(tmp_path: Path) -> None:
+    url = "https://example.invalid/nb.ipynb"
+    adapter = _Adapter({url: b"{}"})
+    session = requests.Session()
+    session.mount("https://", adapter)
+    cache = ArtifactCache(tmp_path / "cache", session)
+
+    path = cache.fetch(url)
+    assert cache.fetch(url) == path
+    assert path.read_bytes() == b"{}"
+    assert path.suffix == ".ipynb"
+    assert adapter.requests == [url]
+    assert (cache.downloads, cache.hits, cache.downloaded_bytes) == (1, 1, 2)
+
+    ArtifactCache(tmp_path / "cache", session, refresh=True).fetch(url)
+    assert len(adapter.requests) == 2  # noqa: PLR2004
+    with pytest.raises(requests.HTTPError):
+        cache.fetch("https://example.invalid/missing.ipynb")
+    assert [p.name for p in (tmp_path / "cache").iterdir()] == [path.name]
+
+
+def test_inspect_notebooks(tmp_path: Path) -> None:
+    good = tmp_path / "good.ipynb"
+    good.write_text(json.dumps(_notebook()), encoding="utf-8")
+    old = tmp_path / "old.ipynb"
+    old.write_text(json.dumps(_notebook(kernel="conda-env", version="3.9.1")), encoding="utf-8")
+    env = tmp_path / "environment.yml"
+    env.write_text("dependencies:\n  - python=3.10\n", encoding="utf-8")
+    py310 = tmp_path / "py310.ipynb"
+    py310.write_text(json.dumps(_notebook(version="3.10.2")), encoding="utf-8")
+    kernel = {"name": "python3", "pythonVersion": 3.11}
+    files = [
+        _write_record(tmp_path, "good", good.as_uri(), kernel),
+        _write_record(tmp_path, "old", old.as_uri(), kernel),
+        _write_record(tmp_path, "env", good.as_uri(), {**kernel, "envFile": env.as_uri()}),
+        _write_record(tmp_path, "missing", (tmp_path / "missing.ipynb").as_uri(), kernel),
+        _write_record(tmp_path, "py310", py310.as_uri(), {"name": "python3", "pythonVersion": 3.10}),
+        tmp_path / "truncated.json",
+    ]
+    files[-1].write_text('{"id": "nb', encoding="utf-8")
+
+    inspections = inspect_notebooks(files, ArtifactCache(tmp_path / "cache"), workers=2)
+
+    assert [(i.expectation.record_id, i.ok) for i in inspections] == [
+        ("good", True),
+        ("old", False),
+        ("env", False),
+        ("missing", False),
+        ("py310", True),
+        (files[-1].as_posix(), False),
+    ]
+    assert inspections[1].problems == [
+        "kernel 'conda-env' does not match the record kernel 'python3'",
+        "Python 3.9 does not match the record version 3.11",
+    ]
+    assert inspections[2].problems == ["environment pins Python 3.10, the record declares 3.11"]
+    assert inspections[3].problems[0].startswith("could not fetch")
+    assert inspections[5].problems[0].startswith("could not load record")
+
+
+def test_inspect_cli(tmp_path: Path, caplog: pytest.LogCaptureFixture) -> None:
+    notebook = tmp_path / "nb.ipynb"
+    notebook.write_text(json.dumps(_notebook(version="3.12.0")), encoding="utf-8")
+    record = _write_record(tmp_path, "nb", notebook.as_uri(), {"name": "python3", "pythonVersion": 3.11})
+
+    result = CliRunner().invoke(
+        inspect_notebook_artifacts,
+        ["--notebook-definition-path", str(record), "--cache-dir", str(tmp_path / "cache")],
+    )
+
+    assert result.exit_code == 1
+    assert "FAIL: nb - Python 3.12 does not match the record version 3.11" in caplog.text
+    assert "Inspected 1 notebook(s)" in caplog.text
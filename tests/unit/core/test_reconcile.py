@@ -0,0 +1,147 @@
+from __future__ import annotations
+
+import copy
+import json
+import shutil
+from typing import TYPE_CHECKING, Any
+from unittest.mock import patch
+
+import pytest
+import requests
+from click.testing import CliRunner
+
+from workflow_catalogue.cli.catalogue.reconcile import reconcile_catalogue
+from workflow_catalogue.client import PlatformClient
+from workflow_catalogue.consts import directories
+from workflow_catalogue.core.mock_platform import MockPlatform, MockPlatformAdapter, RequestRecorder, mock_environment
+from workflow_catalogue.core.reconcile import (
+    build_local_index,
+    iter_remote_items,
+    reconcile_collection,
+    reconcile_collections,
+)
+from workflow_catalogue.core.registration import CatalogueRegistrar, RegistrationOptions
+from workflow_catalogue.core.settings import Settings
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+_BASE = "https://mock.invalid"
+_COLLECTION = "eodh-workflows-notebooks"
+_PAGE_SIZE = 2
+_N_REMOTE = 53
+
+
+@pytest.fixture
+def catalogue_path(tmp_path: Path) -> Path:
+    target = tmp_path / "catalogue"
+    shutil.copytree(directories.CATALOGUE_DIR, target)
+    return target
+
+
+@pytest.fixture
+def platform() -> MockPlatform:
+    return MockPlatform()
+
+
+@pytest.fixture
+def client(platform: MockPlatform) -> PlatformClient:
+    with patch.dict("os.environ", mock_environment(_BASE)):
+        settings = Settings()
+    session = requests.Session()
+    session.mount("https://", MockPlatformAdapter(platform, RequestRecorder()))
+    return PlatformClient(settings, session=session)
+
+
+def _publish(platform: MockPlatform, collection_id: str, documents: list[dict[str, Any]]) -> None:
+    platform.collections[collection_id] = {"id": collection_id}
+    for document in documents:
+        platform.records[document["id"]] = document
+        platform.record_collections[document["id"]] = collection_id
+
+
+def test_iter_remote_items_reads_every_page(client: PlatformClient, platform: MockPlatform) -> None:
+    _publish(platform, "col", [{"id": f"rec-{i:03d}"} for i in range(_N_REMOTE)])
+    token = client.keycloak_token()
+    items = list(iter_remote_items(client, "col", token, page_size=_PAGE_SIZE, workers=3))
+    assert sorted(item["id"] for item in items) == [f"rec-{i:03d}" for i in range(_N_REMOTE)]
+
+
+def test_reconcile_collection(client: PlatformClient, platform: MockPlatform, catalogue_path: Path) -> None:
+    files = sorted(p for p in (catalogue_path / _COLLECTION).rglob("*.json") if p.name != "catalog.json")
+    documents = {p.stem: json.loads(p.read_text(encoding="utf-8")) for p in files}
+    _publish(platform, _COLLECTION, [*copy.deepcopy(list(documents.values())), {"id": "orphan"}])
+
+    changed, missing, *_ = files
+    document = documents[changed.stem]
+    document["properties"]["title"] = "Changed locally"
+    changed.write_text(json.dumps(document), encoding="utf-8")
+    del platform.records[missing.stem]
+    del platform.record_collections[missing.stem]
+
+    index = build_local_index(catalogue_path.rglob("*.json"))
+    token = client.keycloak_token()
+    plan = reconcile_collection(client, _COLLECTION, index[_COLLECTION], token, page_size=_PAGE_SIZE, workers=3)
+
+    assert plan.delete == ["orphan"]
+    assert plan.upsert == sorted([changed, missing])
+    assert plan.unchanged == len(files) - 2
+    assert plan.remote_total == len(files)
+    assert not plan.in_sync
+
+
+def test_build_local_index_skips_unreadable_files(catalogue_path: Path, caplog: pytest.LogCaptureFixture) -> None:
+    workflows = catalogue_path / _COLLECTION / "workflows"
+    (workflows / "truncated.json").write_text("{", encoding="utf-8")
+    (workflows / "binary.json").write_bytes(b"\xff")
+    (workflows / "list.json").write_text("[]", encoding="utf-8")
+
+    index = build_local_index(catalogue_path.rglob("*.json"))
+
+    assert not {"truncated", "binary", "list"} & set(index[_COLLECTION])
+    assert caplog.text.count("cannot be read as a record") == 3  # noqa: PLR2004
+
+
+def test_reconcile_record_moved_between_collections(
+    client: PlatformClient, platform: MockPlatform, catalogue_path: Path
+) -> None:
+    files = sorted(p for p in (catalogue_path / _COLLECTION).rglob("*.json") if p.name != "catalog.json")
+    _publish(platform, _COLLECTION, [json.loads(p.read_text(encoding="utf-8")) for p in files])
+    moved = files[0]
+    target = catalogue_path / "other-collection" / "workflows" / moved.name
+    target.parent.mkdir(parents=True)
+    moved.rename(target)
+
+    token = client.keycloak_token()
+    plans = reconcile_collections(client, build_local_index(catalogue_path.rglob("*.json")), token)
+
+    assert [plan.collection_id for plan in plans] == [_COLLECTION, "other-collection"]
+    assert plans[0].delete == []
+    assert plans[1].upsert == [target]
+
+    registrar = CatalogueRegistrar(client, RegistrationOptions(skip_ades=True, skip_publish=True))
+    result = registrar.run(
+        [path for plan in plans for path in plan.upsert], [record_id for plan in plans for record_id in plan.delete]
+    )
+    assert result.ok
+    assert platform.record_collections[moved.stem] == "other-collection"
+
+
+def test_reconcile_missing_collection(client: PlatformClient, catalogue_path: Path) -> None:
+    index = build_local_index(catalogue_path.rglob("*.json"))
+    plan = reconcile_collection(client, _COLLECTION, index[_COLLECTION], client.keycloak_token())
+    assert plan.upsert == sorted(entry.path for entry in index[_COLLECTION].values())
+    assert plan.delete == []
+
+
+def test_reconcile_cli_dry_run_apply(catalogue_path: Path, tmp_path: Path) -> None:
+    output = tmp_path / "plan.json"
+    with patch.dict("os.environ", {}):
+        result = CliRunner().invoke(
+            reconcile_catalogue,
+            ["--catalogue-path", str(catalogue_path), "--output", str(output), "--dry-run", "--apply", "--skip-ades"],
+        )
+    assert result.exit_code == 0, result.output
+    plans = json.loads(output.read_text(encoding="utf-8"))
+    assert [plan["collection_id"] for plan in plans] == [_COLLECTION]
+    assert len(plans[0]["upsert"]) == len([p for p in catalogue_path.rglob("*.json") if p.name != "catalog.json"])
@@ -0,0 +1,57 @@
+from __future__ import annotations
+
+import dataclasses
+import json
+from pathlib import Path
+
+import pytest
+
+from workflow_catalogue.consts import directories
+from workflow_catalogue.core.record_view import RecordView, collection_id_from_path, load_record_views
+from workflow_catalogue.utils.serialization import content_hash
+
+_COLLECTION = "eodh-workflows-notebooks"
+_COLLECTION_DIR = directories.CATALOGUE_DIR / _COLLECTION
+
+
+def test_collection_id_from_path() -> None:
+    assert collection_id_from_path(Path("catalogue/col/workflows/foo.json")) == "col"
+    assert collection_id_from_path(Path("/abs/catalogue/col/notebooks/bar.json")) == "col"
+    assert collection_id_from_path(Path("elsewhere/foo.json")) is None
+
+
+def test_record_view_from_file() -> None:
+    path = _COLLECTION_DIR / "workflows" / "clip-workflow.json"
+    document = json.loads(path.read_text(encoding="utf-8"))
+    view = RecordView.from_file(path)
+
+    assert view.id == "clip-workflow"
+    assert view.is_workflow
+    assert view.collection == _COLLECTION
+    assert view.title == document["properties"]["title"]
+    assert view.keywords == tuple(document["properties"]["keywords"])
+    assert view.applicable_collections == tuple(document["properties"]["applicableCollections"])
+    assert view.cwl_hrefs == ("https://raw.githubusercontent.com/geodowd/ndvi/refs/heads/clip/clip.cwl",)
+    assert view.content_hash == content_hash(document)
+
+
+def test_record_view_is_frozen_and_slotted() -> None:
+    view = RecordView.from_document({"id": "rec"})
+    assert not hasattr(view, "__dict__")
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        view.id = "other"  # type: ignore[misc]
+    assert view.keywords == ()
+    assert view.type is None
+
+
+def test_record_view_requires_id() -> None:
+    with pytest.raises(ValueError, match="string 'id'"):
+        RecordView.from_document({"properties": {}})
+    with pytest.raises(TypeError, match="JSON object"):
+        RecordView.from_document([])
+
+
+def test_load_record_views_skips_catalog() -> None:
+    files = sorted(_COLLECTION_DIR.rglob("*.json"))
+    views = list(load_record_views(files))
+    assert [view.id for view in views] == [f.stem for f in files if f.name != "catalog.json"]
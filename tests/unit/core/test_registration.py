@@ -0,0 +1,208 @@
+from __future__ import annotations
+
+import json
+import shutil
+from http import HTTPStatus
+from typing import TYPE_CHECKING, Any
+from unittest.mock import patch
+
+import pytest
+import requests
+from click.testing import CliRunner
+from pydantic import ValidationError
+
+from workflow_catalogue.cli.catalogue.register import register_catalogue
+from workflow_catalogue.client import PlatformClient, TokenError
+from workflow_catalogue.consts import directories
+from workflow_catalogue.core.mock_platform import MockPlatform, MockPlatformAdapter, RequestRecorder, mock_environment
+from workflow_catalogue.core.registration import (
+    CatalogueRegistrar,
+    RegistrationOptions,
+    load_record,
+)
+from workflow_catalogue.core.settings import Settings
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+_BASE = "https://mock.invalid"
+_COLLECTION = "eodh-workflows-notebooks"
+_SOURCE_DIR = directories.CATALOGUE_DIR / _COLLECTION
+
+
+@pytest.fixture
+def collection_dir(tmp_path: Path) -> Path:
+    target = tmp_path / "catalogue" / _COLLECTION
+    shutil.copytree(_SOURCE_DIR, target)
+    return target
+
+
+@pytest.fixture
+def platform() -> MockPlatform:
+    return MockPlatform()
+
+
+@pytest.fixture
+def client(platform: MockPlatform) -> PlatformClient:
+    with patch.dict("os.environ", mock_environment(_BASE)):
+        settings = Settings()
+    session = requests.Session()
+    session.mount("https://", MockPlatformAdapter(platform, RequestRecorder()))
+    return PlatformClient(settings, session=session)
+
+
+def test_load_record(collection_dir: Path) -> None:
+    workflow = load_record(collection_dir / "workflows" / "clip-workflow.json")
+    assert workflow.id == "clip-workflow"
+    assert workflow.collection_id == _COLLECTION
+    assert workflow.is_workflow
+    assert workflow.cwl_hrefs
+    assert workflow.document["id"] == "clip-workflow"
+
+    notebook = load_record(next((collection_dir / "notebooks").glob("*.json")))
+    assert not notebook.is_workflow
+    assert notebook.cwl_hrefs == []
+
+
+def test_load_record_rejects_invalid(tmp_path: Path) -> None:
+    collection_dir = tmp_path / "catalogue" / "col"
+    collection_dir.mkdir(parents=True)
+    unknown = collection_dir / "unknown.json"
+    unknown.write_text(json.dumps({"id": "unknown", "properties": {"type": "dataset"}}), encoding="utf-8")
+    with pytest.raises(ValueError, match="Unknown or missing record type"):
+        load_record(unknown)
+
+    invalid = collection_dir / "invalid.json"
+    invalid.write_text(json.dumps({"id": "invalid", "properties": {"type": "workflow"}}), encoding="utf-8")
+    with pytest.raises(ValidationError):
+        load_record(invalid)
+
+    not_an_object = collection_dir / "list.json"
+    not_an_object.write_text("[]", encoding="utf-8")
+    with pytest.raises(ValueError, match="JSON object, got list"):
+        load_record(not_an_object)
+    not_an_object.write_text(json.dumps({"id": "list", "properties": ["a"]}), encoding="utf-8")
+    with pytest.raises(ValueError, match="properties must be a JSON object"):
+        load_record(not_an_object)
+
+    outside = tmp_path / "clip-workflow.json"
+    shutil.copy(_SOURCE_DIR / "workflows" / "clip-workflow.json", outside)
+    with pytest.raises(ValueError, match="collection-id"):
+        load_record(outside)
+
+
+def test_registrar_run(client: PlatformClient, platform: MockPlatform, collection_dir: Path) -> None:
+    files = sorted(collection_dir.rglob("*.json"))
+    broken = collection_dir / "workflows" / "broken.json"
+    broken.write_text("{", encoding="utf-8")
+    platform.records["stale-record"] = {"id": "stale-record"}
+
+    registrar = CatalogueRegistrar(client, RegistrationOptions(workers=4))
+    with patch("workflow_catalogue.core.registration.load_record", wraps=load_record) as loader:
+        result = registrar.run([*files, broken], ["stale-record"])
+
+    record_files = [f for f in files if f.name != "catalog.json"]
+    assert loader.call_count == len(record_files) + 1
+    assert sorted(result.registered) == sorted(f.stem for f in record_files)
+    assert result.deleted == ["stale-record"]
+    assert result.errors == [f"load:{broken}"]
+    assert _COLLECTION in platform.collections
+    assert set(platform.records) == {f.stem for f in record_files}
+    assert platform.processes
+
+
+def test_registrar_shards_by_collection(client: PlatformClient, platform: MockPlatform, collection_dir: Path) -> None:
+    broken_dir = collection_dir.parent / "broken-collection"
+    shutil.copytree(collection_dir, broken_dir)
+    for path in broken_dir.rglob("*.json"):
+        if path.name != "catalog.json":
+            path.rename(path.with_name(f"broken-{path.name}"))
+    for path in broken_dir.rglob("broken-*.json"):
+        document = json.loads(path.read_text(encoding="utf-8"))
+        document["id"] = path.stem
+        path.write_text(json.dumps(document), encoding="utf-8")
+
+    create_collection = client.create_collection
+
+    def failing_create(payload: dict[str, Any], token: str) -> requests.Response:
+        if payload["id"] == "broken-collection":
+            response = requests.Response()
+            response.status_code = HTTPStatus.INTERNAL_SERVER_ERROR
+            return response
+        return create_collection(payload, token)
+
+    files = sorted(collection_dir.parent.rglob("*.json"))
+    registrar = CatalogueRegistrar(client, RegistrationOptions(skip_ades=True, skip_publish=True, collection_workers=2))
+    with patch.object(client, "create_collection", side_effect=failing_create):
+        result = registrar.run(files, [])
+
+    assert set(result.shards) == {_COLLECTION, "broken-collection"}
+    assert result.shards[_COLLECTION].ok
+    assert result.errors == ["collection:broken-collection"]
+    assert result.shards["broken-collection"].registered == []
+    assert set(result.registered) == {f.stem for f in files if f.parent.parent == collection_dir}
+    assert set(platform.records) == set(result.registered)
+
+
+def test_registrar_isolates_broken_collections(
+    client: PlatformClient, platform: MockPlatform, collection_dir: Path
+) -> None:
+    broken_dir = collection_dir.parent / "broken-collection"
+    broken_dir.mkdir()
+    (broken_dir / "catalog.json").write_text("{", encoding="utf-8")
+    workflow = json.loads((collection_dir / "workflows" / "clip-workflow.json").read_text(encoding="utf-8"))
+    workflow["id"] = "broken-clip-workflow"
+    (broken_dir / "broken-clip-workflow.json").write_text(json.dumps(workflow), encoding="utf-8")
+
+    files = sorted(collection_dir.parent.rglob("*.json"))
+    registrar = CatalogueRegistrar(client, RegistrationOptions(skip_ades=True, skip_publish=True, collection_workers=2))
+    result = registrar.run(files, [])
+
+    assert result.errors == ["shard:broken-collection"]
+    assert result.shards[_COLLECTION].ok
+    assert "broken-clip-workflow" not in platform.records
+
+
+def test_registrar_run_without_tokens(client: PlatformClient, platform: MockPlatform, collection_dir: Path) -> None:
+    files = sorted(collection_dir.rglob("*.json"))
+    registrar = CatalogueRegistrar(client)
+
+    with patch.object(client, "workspace_token", side_effect=TokenError("no token")):
+        token, workspace_token = registrar.authenticate()
+    assert token
+    assert workspace_token is None
+
+    with patch.object(client, "keycloak_token", side_effect=TokenError("no token")):
+        result = registrar.run(files, [])
+    assert result.errors == ["auth:keycloak"]
+    assert not platform.records
+
+
+def test_registrar_run_nothing_to_do(client: PlatformClient, platform: MockPlatform) -> None:
+    result = CatalogueRegistrar(client).run([], [])
+    assert result.ok
+    assert not platform.stats
+
+
+def test_register_cli_dry_run(collection_dir: Path, tmp_path: Path) -> None:
+    output = tmp_path / "requests.jsonl"
+    files = sorted((collection_dir / "workflows").glob("*.json"))
+
+    with patch.dict("os.environ", {}):
+        result = CliRunner().invoke(
+            register_catalogue,
+            [*map(str, files), "--skip-ades", "--dry-run", "--dry-run-output", str(output)],
+        )
+
+    assert result.exit_code == 0, result.output
+    recorded = [json.loads(line) for line in output.read_text(encoding="utf-8").splitlines()]
+    assert {r["body"]["id"] for r in recorded if r["method"] == "POST" and "/register" in r["url"]} == {
+        f.stem for f in files
+    }
+    assert not any("/processes" in r["url"] for r in recorded)
+
+
+def test_register_cli_rejects_bad_rate_limit() -> None:
+    result = CliRunner().invoke(register_catalogue, ["--rate-limit", "nope=1"])
+    assert result.exit_code != 0
+    assert "--rate-limit" in result.output
@@ -0,0 +1,65 @@
+"""Tests for parallel catalogue scanning."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from workflow_catalogue.consts import directories
+from workflow_catalogue.core.record_view import collection_id_from_path
+from workflow_catalogue.core.scan import ScannedFile, scan_catalogue
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+def _write(path: Path, content: str = "{}") -> Path:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(content, encoding="utf-8")
+    return path
+
+
+def test_scan_catalogue_classifies_files(tmp_path: Path) -> None:
+    catalogue = tmp_path / "catalogue"
+    catalog = _write(catalogue / "col" / "catalog.json", '{"id": "col"}')
+    record = _write(catalogue / "col" / "workflows" / "shard-1" / "a.json")
+    _write(catalogue / "col" / "workflows" / "README.md")
+    outside = _write(tmp_path / "other.json")
+    (catalogue / "col" / "link").symlink_to(catalogue / "col" / "workflows", target_is_directory=True)
+
+    files = {file.path: file for file in scan_catalogue(tmp_path, workers=2)}
+
+    assert set(files) == {catalog, record, outside}
+    assert files[catalog] == ScannedFile(
+        catalog, "col", None, is_catalog=True, mtime_ns=files[catalog].mtime_ns, size=13
+    )
+    assert files[catalog].mtime_ns == catalog.stat().st_mtime_ns
+    assert files[record].is_record
+    assert (files[record].collection, files[record].subdirectory) == ("col", "workflows")
+    assert (files[outside].collection, files[outside].subdirectory) == (None, None)
+
+
+def test_scan_catalogue_below_collection(tmp_path: Path) -> None:
+    record = _write(tmp_path / "catalogue" / "col" / "notebooks" / "a.json")
+
+    [file] = scan_catalogue(tmp_path / "catalogue" / "col" / "notebooks", stat=False)
+
+    assert file == ScannedFile(record, "col", "notebooks", is_catalog=False)
+
+
+def test_scan_catalogue_matches_rglob() -> None:
+    files = list(scan_catalogue(directories.CATALOGUE_DIR))
+
+    assert sorted(file.path for file in files) == sorted(directories.CATALOGUE_DIR.rglob("*.json"))
+    assert all(file.collection == collection_id_from_path(file.path) for file in files)
+    assert sum(file.is_catalog for file in files) == 1
+
+
+def test_scan_catalogue_stops_early(tmp_path: Path) -> None:
+    for i in range(20):
+        _write(tmp_path / f"dir-{i}" / "a.json")
+
+    files = scan_catalogue(tmp_path, workers=1)
+    next(files)
+    files.close()
+
+    assert list(scan_catalogue(tmp_path / "missing")) == []
@@ -0,0 +1,199 @@
+from __future__ import annotations
+
+from datetime import UTC, datetime
+from http import HTTPStatus
+from typing import Any
+
+import pytest
+import requests
+from requests import PreparedRequest, Response
+from requests.adapters import BaseAdapter
+
+from workflow_catalogue.core.scheduler import (
+    AdaptiveConcurrencyLimiter,
+    EndpointPolicy,
+    RequestScheduler,
+    TokenBucket,
+    parse_retry_after,
+)
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.now += seconds
+
+
+class ScriptedAdapter(BaseAdapter):
+    """Answers requests with a predefined sequence of (status, headers) pairs, then 200."""
+
+    def __init__(self, script: list[tuple[int, dict[str, str]]]) -> None:
+        super().__init__()
+        self.script = list(script)
+        self.calls = 0
+
+    def send(self, request: PreparedRequest, *args: Any, **kwargs: Any) -> Response:  # noqa: ARG002
+        self.calls += 1
+        status, headers = self.script.pop(0) if self.script else (HTTPStatus.OK, {})
+        response = Response()
+        response.status_code = status
+        response.headers.update(headers)
+        response._content = b"{}"  # noqa: SLF001
+        response.request = request
+        return response
+
+    def close(self) -> None:
+        pass
+
+
+def _scheduler(adapter: BaseAdapter, clock: FakeClock, **policy: Any) -> RequestScheduler:
+    session = requests.Session()
+    session.mount("https://", adapter)
+    return RequestScheduler(session, default_policy=EndpointPolicy(**policy), clock=clock, sleep=clock.sleep)
+
+
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    [
+        ("3", 3.0),
+        (" 1.5 ", 1.5),
+        ("-2", 0.0),
+        ("Wed, 21 Oct 2026 07:28:10 GMT", 10.0),
+        ("not a date", None),
+        (None, None),
+        ("", None),
+    ],
+)
+def test_parse_retry_after(value: str | None, expected: float | None) -> None:
+    now = datetime(2026, 10, 21, 7, 28, 0, tzinfo=UTC)
+    assert parse_retry_after(value, now=now) == expected
+
+
+def test_token_bucket_allows_burst_then_waits() -> None:
+    clock = FakeClock()
+    bucket = TokenBucket(rate=2, capacity=2, clock=clock, sleep=clock.sleep)
+
+    assert bucket.try_acquire() == 0
+    assert bucket.try_acquire() == 0
+    assert bucket.try_acquire() == pytest.approx(0.5)
+
+    bucket.acquire()
+    assert clock.now == pytest.approx(0.5)
+
+
+def test_token_bucket_pause() -> None:
+    clock = FakeClock()
+    bucket = TokenBucket(rate=100, capacity=10, clock=clock, sleep=clock.sleep)
+    bucket.pause(3)
+    assert bucket.try_acquire() == pytest.approx(3)
+    clock.now = 3.5
+    assert bucket.try_acquire() == 0
+
+
+def test_token_bucket_set_rate() -> None:
+    clock = FakeClock()
+    bucket = TokenBucket(rate=float("inf"), capacity=1, clock=clock, sleep=clock.sleep)
+    bucket.set_rate(4)
+    assert bucket.try_acquire() == 0
+    assert bucket.try_acquire() == pytest.approx(0.25)
+
+
+def test_concurrency_limiter_aimd() -> None:
+    limiter = AdaptiveConcurrencyLimiter(initial=4, minimum=1, maximum=5, backoff_factor=0.5)
+
+    limiter.acquire()
+    limiter.release(overloaded=True)
+    assert limiter.limit == 2  # noqa: PLR2004
+
+    for _ in range(20):
+        limiter.acquire()
+        limiter.release(overloaded=False)
+    assert 2 < limiter.limit <= 5  # noqa: PLR2004
+
+    for _ in range(10):
+        limiter.acquire()
+        limiter.release(overloaded=True)
+    assert limiter.limit == 1
+
+
+def test_scheduler_honours_retry_after() -> None:
+    clock = FakeClock()
+    adapter = ScriptedAdapter([(HTTPStatus.TOO_MANY_REQUESTS, {"Retry-After": "7"})])
+    scheduler = _scheduler(adapter, clock)
+
+    resp = scheduler.request("catalogue", "GET", "https://example.invalid/collections")
+
+    assert resp.status_code == HTTPStatus.OK
+    assert adapter.calls == 2  # noqa: PLR2004
+    assert clock.now >= 7  # noqa: PLR2004
+    stats = scheduler.stats()["catalogue"]
+    assert (stats.completed, stats.throttled, stats.retried, stats.failed) == (1, 1, 1, 0)
+    assert stats.rate_limit is not None
+
+
+def test_scheduler_backs_off_without_retry_after() -> None:
+    clock = FakeClock()
+    adapter = ScriptedAdapter([(HTTPStatus.SERVICE_UNAVAILABLE, {}), (HTTPStatus.SERVICE_UNAVAILABLE, {})])
+    scheduler = _scheduler(adapter, clock, base_delay=1.0)
+
+    assert scheduler.request("ades", "POST", "https://example.invalid/processes").status_code == HTTPStatus.OK
+    assert adapter.calls == 3  # noqa: PLR2004
+    assert clock.now >= 0.5 + 1.0
+
+
+def test_scheduler_gives_up_after_max_retries() -> None:
+    clock = FakeClock()
+    adapter = ScriptedAdapter([(HTTPStatus.TOO_MANY_REQUESTS, {"Retry-After": "1"})] * 5)
+    scheduler = _scheduler(adapter, clock, max_retries=2)
+
+    resp = scheduler.request("catalogue", "GET", "https://example.invalid/collections")
+
+    assert resp.status_code == HTTPStatus.TOO_MANY_REQUESTS
+    assert adapter.calls == 3  # noqa: PLR2004
+    assert scheduler.stats()["catalogue"].failed == 1
+
+
+def test_scheduler_does_not_retry_other_errors() -> None:
+    clock = FakeClock()
+    adapter = ScriptedAdapter([(HTTPStatus.BAD_REQUEST, {})])
+    scheduler = _scheduler(adapter, clock)
+
+    assert scheduler.request("catalogue", "GET", "https://example.invalid/x").status_code == HTTPStatus.BAD_REQUEST
+    assert adapter.calls == 1
+
+
+def test_scheduler_server_errors_do_not_grow_limits() -> None:
+    clock = FakeClock()
+    adapter = ScriptedAdapter([(HTTPStatus.INTERNAL_SERVER_ERROR, {}), (HTTPStatus.BAD_GATEWAY, {})])
+    scheduler = _scheduler(adapter, clock)
+
+    for _ in range(2):
+        assert scheduler.request("catalogue", "GET", "https://example.invalid/x").status_code >= 500  # noqa: PLR2004
+    stats = scheduler.stats()["catalogue"]
+    assert (stats.completed, stats.retried, stats.failed) == (0, 0, 2)
+    assert stats.concurrency_limit == 4  # noqa: PLR2004
+
+    scheduler.request("catalogue", "GET", "https://example.invalid/x")
+    assert scheduler.stats()["catalogue"].concurrency_limit > 4  # noqa: PLR2004
+
+
+def test_scheduler_applies_family_policies() -> None:
+    clock = FakeClock()
+    session = requests.Session()
+    session.mount("https://", ScriptedAdapter([]))
+    scheduler = RequestScheduler(
+        session, policies={"ades": EndpointPolicy(rate=1, burst=1)}, clock=clock, sleep=clock.sleep
+    )
+
+    for _ in range(3):
+        scheduler.request("ades", "GET", "https://example.invalid/processes")
+    assert clock.now == pytest.approx(2)
+
+    scheduler.request("catalogue", "GET", "https://example.invalid/collections")
+    assert clock.now == pytest.approx(2)
+    assert "ades" in scheduler.format_stats()
@@ -2,8 +2,14 @@ from __future__ import annotations
 
 from unittest.mock import patch
 
+import pytest
+from pydantic import ValidationError
+
+from workflow_catalogue.core.mock_platform import mock_environment
 from workflow_catalogue.core.settings import current_settings
 
+MOCK_ENV = mock_environment("https://mock.invalid")
+
 
 @patch.dict(
     "os.environ",
@@ -58,3 +64,26 @@ def test_settings() -> None:
     )
     assert settings.eodh.certs_url == "https://test.eodatahub.org.uk/keycloak/realms/eodh/protocol/openid-connect/certs"
     assert settings.eodh.oid_url == "https://test.eodatahub.org.uk/keycloak/realms/eodh/protocol/openid-connect"
+
+
+@patch.dict("os.environ", MOCK_ENV)
+def test_settings_cached_and_frozen() -> None:
+    settings = current_settings()
+    assert current_settings() is settings
+    assert settings.eodh.ades_url is settings.eodh.ades_url
+
+    with pytest.raises(ValidationError, match="frozen"):
+        settings.eodh.base_url = "https://other.example.com/"
+
+    current_settings.cache_clear()
+    assert current_settings() is not settings
+
+
+@patch.dict("os.environ", MOCK_ENV)
+def test_settings_workspace_and_optional_paths() -> None:
+    settings = current_settings()
+    assert settings.wf_catalogue_api_url == "https://mock.invalid/api/wf-catalogue/v1.0"
+    assert settings.eodh.workspace == "mock-workspace"
+    assert settings.eodh.workspace_session_tokens_url == "https://mock.invalid/api/workspaces/mock-user/me/sessions"
+    with pytest.raises(ValueError, match="stac_api_endpoint_path"):
+        _ = settings.eodh.stac_url
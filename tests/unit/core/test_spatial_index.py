@@ -0,0 +1,162 @@
+from __future__ import annotations
+
+import json
+import math
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+import pytest
+from click.testing import CliRunner
+
+from workflow_catalogue.cli.catalogue.search import search_catalogue
+from workflow_catalogue.consts import directories
+from workflow_catalogue.core.spatial_index import (
+    SpatialIndex,
+    geometry_bounds,
+    parse_bbox,
+    parse_datetime,
+    parse_interval,
+    record_extents,
+)
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+_DAY = 86400
+
+
+def _workflow(
+    record_id: str,
+    bbox: list[list[float]] | None = None,
+    interval: list[list[str | None]] | None = None,
+    geometry: dict[str, Any] | None = None,
+) -> dict[str, Any]:
+    extent: dict[str, Any] = {}
+    if bbox is not None:
+        extent["spatial"] = {"bbox": bbox}
+    if interval is not None:
+        extent["temporal"] = {"interval": interval}
+    return {"id": record_id, "geometry": geometry, "properties": {"type": "workflow", "extent": extent}}
+
+
+_DOCUMENTS = [
+    _workflow("uk", [[-8.0, 49.0, 2.0, 61.0]], [["2020-01-01T00:00:00Z", "2022-12-31T00:00:00Z"]]),
+    _workflow("france", [[-5.0, 41.0, 10.0, 51.0]], [["2023-01-01T00:00:00Z", None]]),
+    _workflow("pacific", [[170.0, -20.0, -170.0, 0.0]]),
+    _workflow("kenya", geometry={"type": "Polygon", "coordinates": [[[34, -5], [42, -5], [42, 5], [34, -5]]]}),
+    _workflow("anywhere"),
+    {"id": "notebook", "properties": {"type": "notebook"}},
+]
+
+
+@pytest.fixture
+def index() -> SpatialIndex:
+    return SpatialIndex.from_documents(_DOCUMENTS, capacity=2)
+
+
+def test_parsers() -> None:
+    assert parse_bbox("1,2,3,4") == (1, 2, 3, 4)
+    assert parse_bbox("1,2,0,3,4,100") == (1, 2, 3, 4)
+    assert parse_datetime("1970-01-02") == _DAY
+    assert parse_interval("../1970-01-02") == (-math.inf, _DAY)
+    assert parse_interval("1970-01-02T00:00:00+01:00/..") == (_DAY - 3600, math.inf)
+    assert parse_interval("1970-01-02") == (_DAY, _DAY)
+    for value in ("1,2,3", "0,4,1,3"):
+        with pytest.raises(ValueError, match="Bounding box"):
+            parse_bbox(value)
+    with pytest.raises(ValueError, match="ends before"):
+        parse_interval("2024-01-02/2024-01-01")
+
+
+def test_record_extents() -> None:
+    assert record_extents(_DOCUMENTS[2]) == [
+        (170.0, -20.0, 180.0, 0.0, -math.inf, math.inf),
+        (-180.0, -20.0, -170.0, 0.0, -math.inf, math.inf),
+    ]
+    assert record_extents(_DOCUMENTS[4]) == [(-math.inf, -math.inf, math.inf, math.inf, -math.inf, math.inf)]
+    assert geometry_bounds({
+        "type": "GeometryCollection",
+        "geometries": [{"type": "Point", "coordinates": [1, 2]}, _DOCUMENTS[3]["geometry"]],
+    }) == (1, -5, 42, 5)
+    with pytest.raises(ValueError, match="4 or 6"):
+        record_extents(_workflow("bad", [[1, 2, 3]]))
+
+
+def test_search(index: SpatialIndex) -> None:
+    assert len(index) == len(_DOCUMENTS) - 1
+    assert index.search() == ["anywhere", "france", "kenya", "pacific", "uk"]
+    assert index.search((0.0, 50.0, 1.0, 50.5)) == ["anywhere", "france", "uk"]
+    assert index.search((0.0, 50.0, 1.0, 50.5), bounded_only=True) == ["france", "uk"]
+    assert index.search((0.0, 50.0, 1.0, 50.5), parse_interval("2024-01-01")) == ["anywhere", "france"]
+    assert index.search((0.0, 50.0, 1.0, 50.5), parse_interval("../2019-12-31")) == ["anywhere"]
+    assert index.search((175.0, -10.0, -175.0, -5.0), bounded_only=True) == ["pacific"]
+    assert index.search((-179.0, -10.0, -175.0, -5.0), bounded_only=True) == ["pacific"]
+    assert index.search((36.0, 0.0, 37.0, 1.0), bounded_only=True) == ["kenya"]
+    assert index.search((-6.0, 48.0, 3.0, 52.0), predicate="contains", bounded_only=True) == []
+    assert index.search((-4.0, 49.5, 1.0, 50.5), predicate="contains", bounded_only=True) == ["france", "uk"]
+    assert index.search((175.0, -10.0, -175.0, -5.0), predicate="contains") == ["anywhere", "pacific"]
+    assert index.search(predicate="contains") == index.search()
+    assert index.search(predicate="contains", bounded_only=True) == index.search(bounded_only=True)
+    assert SpatialIndex.from_documents([]).search() == []
+
+
+@pytest.mark.parametrize("capacity", [2, 4, 16])
+def test_search_matches_brute_force(capacity: int) -> None:
+    rng = np.random.default_rng(capacity)
+    documents = []
+    for i in range(500):
+        x, y = rng.uniform(-180, 170), rng.uniform(-90, 80)
+        start = int(rng.integers(2000, 2020))
+        documents.append(
+            _workflow(
+                f"wf-{i}",
+                [[x, y, x + rng.uniform(0, 10), y + rng.uniform(0, 10)]],
+                [[f"{start}-01-01", f"{start + int(rng.integers(0, 5))}-01-01"]],
+            )
+        )
+    index = SpatialIndex.from_documents(documents, capacity=capacity)
+    assert len(index.levels) > 1
+
+    for _ in range(50):
+        x, y = rng.uniform(-180, 170), rng.uniform(-90, 80)
+        query = (x, y, x + rng.uniform(0, 20), y + rng.uniform(0, 20))
+        t0 = parse_datetime(f"{rng.integers(2000, 2025)}-06-01")
+        for predicate in ("intersects", "contains"):
+            expected = sorted(
+                d["id"]
+                for d in documents
+                for e in record_extents(d)
+                if (
+                    e[0] <= query[2] and e[2] >= query[0] and e[1] <= query[3] and e[3] >= query[1]
+                    if predicate == "intersects"
+                    else e[0] <= query[0] and e[1] <= query[1] and e[2] >= query[2] and e[3] >= query[3]
+                )
+                and e[4] <= t0 <= e[5]
+            )
+            assert index.search(query, (t0, t0), predicate=predicate) == expected
+
+
+def test_search_cli(tmp_path: Path) -> None:
+    collection_dir = tmp_path / "catalogue" / "col"
+    collection_dir.mkdir(parents=True)
+    for document in _DOCUMENTS:
+        (collection_dir / f"{document['id']}.json").write_text(json.dumps(document), encoding="utf-8")
+
+    result = CliRunner().invoke(
+        search_catalogue,
+        ["--catalogue-path", str(tmp_path), "--bbox", "0,50,1,50.5", "--datetime", "2021-01-01/..", "--bounded-only"],
+    )
+    assert result.exit_code == 0, result.output
+    assert result.output.splitlines() == ["france", "uk"]
+
+    result = CliRunner().invoke(search_catalogue, ["--catalogue-path", str(tmp_path), "--datetime", "yesterday"])
+    assert result.exit_code != 0
+    assert "--datetime" in result.output
+
+
+def test_search_cli_real_catalogue() -> None:
+    result = CliRunner().invoke(
+        search_catalogue, ["--catalogue-path", str(directories.CATALOGUE_DIR), "--bbox", "0,0,1,1"]
+    )
+    assert result.exit_code == 0, result.output
+    assert "clip-workflow" in result.output.splitlines()
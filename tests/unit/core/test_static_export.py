@@ -0,0 +1,114 @@
+from __future__ import annotations
+
+import json
+import shutil
+from typing import TYPE_CHECKING, Any
+
+import pytest
+from click.testing import CliRunner
+
+from workflow_catalogue.cli.catalogue.export_static import export_static_catalogue
+from workflow_catalogue.consts import directories
+from workflow_catalogue.core.static_export import MANIFEST_NAME, export_static
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+_COLLECTION = "eodh-workflows-notebooks"
+_BASE_URL = "https://cdn.example.com/catalogue/"
+_PAGE_SIZE = 2
+
+
+@pytest.fixture
+def catalogue_path(tmp_path: Path) -> Path:
+    target = tmp_path / "catalogue"
+    shutil.copytree(directories.CATALOGUE_DIR, target)
+    return target
+
+
+def _read(path: Path) -> Any:
+    return json.loads(path.read_text(encoding="utf-8"))
+
+
+def _links(document: dict[str, Any]) -> dict[str, str]:
+    return {link["rel"]: link["href"] for link in document["links"]}
+
+
+def test_export_static_tree(catalogue_path: Path, tmp_path: Path) -> None:
+    output = tmp_path / "static"
+    export_static(catalogue_path, output, base_url=_BASE_URL, page_size=_PAGE_SIZE)
+
+    collections = _read(output / "collections" / "index.json")
+    assert [c["id"] for c in collections["collections"]] == [_COLLECTION]
+    assert _links(collections)["self"] == "https://cdn.example.com/catalogue/collections/index.json"
+
+    collection = _read(output / "collections" / _COLLECTION / "index.json")
+    links = _links(collection)
+    assert links["self"] == f"https://cdn.example.com/catalogue/collections/{_COLLECTION}/index.json"
+    assert links["items"] == f"https://cdn.example.com/catalogue/collections/{_COLLECTION}/items/index.json"
+    assert not any(link["rel"] == "item" for link in collection["links"])
+
+    record_ids = sorted(p.stem for p in (catalogue_path / _COLLECTION).rglob("*.json") if p.name != "catalog.json")
+    items_dir = output / "collections" / _COLLECTION / "items"
+    seen = []
+    page = _read(items_dir / "index.json")
+    while True:
+        assert page["numberMatched"] == len(record_ids)
+        assert page["numberReturned"] == len(page["features"]) <= _PAGE_SIZE
+        seen += [feature["id"] for feature in page["features"]]
+        next_href = _links(page).get("next")
+        if next_href is None:
+            break
+        page = _read(items_dir / next_href.rsplit("/", 1)[1])
+    assert seen == record_ids
+
+
+def test_export_static_is_incremental(catalogue_path: Path, tmp_path: Path) -> None:
+    output = tmp_path / "static"
+    first = export_static(catalogue_path, output, page_size=_PAGE_SIZE)
+    assert first.written
+    assert (output / MANIFEST_NAME).exists()
+
+    second = export_static(catalogue_path, output, page_size=_PAGE_SIZE)
+    assert second.written == []
+    assert second.unchanged == len(first.written)
+
+    records = sorted((catalogue_path / _COLLECTION / "workflows").glob("*.json"))
+    last = records[-1]
+    record = _read(last)
+    record["properties"]["title"] = "Changed title"
+    last.write_text(json.dumps(record), encoding="utf-8")
+    third = export_static(catalogue_path, output, page_size=_PAGE_SIZE)
+    assert len(third.written) == 1
+    assert third.written[0].startswith(f"collections/{_COLLECTION}/items/")
+
+    for path in records:
+        path.unlink()
+    fourth = export_static(catalogue_path, output, page_size=_PAGE_SIZE)
+    assert fourth.removed
+    assert all(not (output / path).exists() for path in fourth.removed)
+
+
+def test_export_static_removes_only_inside_output(catalogue_path: Path, tmp_path: Path) -> None:
+    output = tmp_path / "static"
+    export_static(catalogue_path, output, page_size=_PAGE_SIZE)
+    outside = tmp_path / "outside.json"
+    outside.write_text("{}", encoding="utf-8")
+    manifest = _read(output / MANIFEST_NAME)
+    manifest.update({"../outside.json": "0", outside.as_posix(): "0"})
+    (output / MANIFEST_NAME).write_text(json.dumps(manifest), encoding="utf-8")
+
+    result = export_static(catalogue_path, output, page_size=_PAGE_SIZE)
+
+    assert result.removed == []
+    assert outside.exists()
+
+
+def test_export_static_cli(catalogue_path: Path, tmp_path: Path) -> None:
+    output = tmp_path / "static"
+    result = CliRunner().invoke(
+        export_static_catalogue,
+        ["--catalogue-path", str(catalogue_path), "--output-dir", str(output), "--page-size", "3"],
+    )
+    assert result.exit_code == 0, result.output
+    assert _links(_read(output / "collections" / "index.json"))["self"] == "/collections/index.json"
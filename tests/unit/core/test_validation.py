@@ -0,0 +1,132 @@
+"""Tests for catalogue record validation and reports."""
+
+from __future__ import annotations
+
+import json
+import shutil
+from typing import TYPE_CHECKING
+from xml.etree import ElementTree  # noqa: S405 - parses the report rendered by the test itself
+
+import pytest
+
+from workflow_catalogue.consts import directories
+from workflow_catalogue.core.validation import (
+    ValidationIssue,
+    render_json,
+    render_junit,
+    render_sarif,
+    run_validation,
+    validate_file,
+    validate_files,
+)
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+TEST_DATA_DIR = directories.TESTS_DIR / "test_data"
+MAX_ERRORS = 2
+SLOWEST = 3
+
+
+@pytest.fixture
+def broken_catalogue(tmp_path: Path) -> Path:
+    shutil.copytree(TEST_DATA_DIR, tmp_path, dirs_exist_ok=True)
+    data = json.loads((TEST_DATA_DIR / "workflows" / "echo.json").read_text(encoding="utf-8"))
+    del data["properties"]["title"]
+    data["properties"]["contacts"][0]["links"] = "not-a-list"
+    (tmp_path / "workflows" / "echo.json").write_text(json.dumps(data), encoding="utf-8")
+    (tmp_path / "workflows" / "garbage.json").write_text('{"id": ', encoding="utf-8")
+    return tmp_path
+
+
+def test_validate_file_passes() -> None:
+    result = validate_file(TEST_DATA_DIR / "workflows" / "echo.json")
+    assert result.passed
+    assert result.record_type == "workflow"
+    assert result.parse_ms > 0
+    assert result.validate_ms > 0
+
+
+def test_validate_file_structured_errors(broken_catalogue: Path) -> None:
+    result = validate_file(broken_catalogue / "workflows" / "echo.json")
+    assert not result.passed
+    paths = {issue.json_path: issue.type for issue in result.errors}
+    assert paths["$.properties.title"] == "missing"
+    assert "$.properties.contacts[0].links" in paths
+
+
+def test_validate_file_invalid_json(broken_catalogue: Path) -> None:
+    result = validate_file(broken_catalogue / "workflows" / "garbage.json")
+    assert [issue.type for issue in result.errors] == ["json_invalid"]
+    assert "line 1" in result.errors[0].msg
+
+
+def test_validate_file_invalid_utf8(tmp_path: Path) -> None:
+    path = tmp_path / "binary.json"
+    path.write_bytes(b'{"id": "\xff"}')
+    result = validate_file(path)
+    assert [issue.type for issue in result.errors] == ["json_invalid"]
+    assert "UTF-8" in result.errors[0].msg
+
+
+def test_json_path() -> None:
+    assert ValidationIssue(loc=["properties", "contacts", 0, "name"], msg="", type="").json_path == (
+        "$.properties.contacts[0].name"
+    )
+    assert ValidationIssue(msg="", type="").json_path == "$"
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_validate_files_stops_at_max_errors(tmp_path: Path, workers: int) -> None:
+    files = []
+    for i in range(50):
+        path = tmp_path / f"bad-{i}.json"
+        path.write_text("{", encoding="utf-8")
+        files.append(path)
+
+    results = list(validate_files(files, workers=workers, max_errors=MAX_ERRORS))
+
+    assert len(results) == MAX_ERRORS
+    assert all(not result.passed for result in results)
+
+
+def test_run_validation_report(broken_catalogue: Path) -> None:
+    files = sorted(broken_catalogue.rglob("*.json"))
+    report = run_validation(files, workers=2)
+
+    assert [result.path for result in report.files] == files
+    assert {result.path.name for result in report.failed} == {"echo.json", "garbage.json"}
+    assert not report.stopped_early
+    slowest = report.slowest(SLOWEST)
+    assert len(slowest) == SLOWEST
+    assert slowest[0].total_ms >= slowest[-1].total_ms
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_run_validation_limit_reached_on_last_file(broken_catalogue: Path, workers: int) -> None:
+    files = sorted(broken_catalogue.rglob("*.json"))
+    failing = [path for path in files if path.name in {"echo.json", "garbage.json"}]
+
+    assert not run_validation(failing, workers=workers, max_errors=len(failing)).stopped_early
+    assert run_validation(files, workers=workers, max_errors=1).stopped_early
+
+
+def test_renderers(broken_catalogue: Path) -> None:
+    report = run_validation(sorted(broken_catalogue.rglob("*.json")), max_errors=1)
+    assert report.stopped_early
+
+    rendered = json.loads(render_json(report))
+    assert rendered["summary"]["failed"] == 1
+    assert rendered["summary"]["stopped_early"] is True
+    assert rendered["files"][-1]["errors"][0]["path"].startswith("$")
+
+    suite = ElementTree.fromstring(render_junit(report))  # noqa: S314
+    assert suite.get("failures") == "1"
+    assert len(suite.findall("testcase/failure")) == 1
+
+    sarif = json.loads(render_sarif(report))
+    results = sarif["runs"][0]["results"]
+    rules = [rule["id"] for rule in sarif["runs"][0]["tool"]["driver"]["rules"]]
+    assert results
+    assert all(rules[result["ruleIndex"]] == result["ruleId"] for result in results)
+    assert results[0]["locations"][0]["physicalLocation"]["artifactLocation"]["uri"].endswith(".json")
@@ -0,0 +1,117 @@
+"""Tests for catalogue directory watching."""
+
+from __future__ import annotations
+
+import os
+import sys
+from typing import TYPE_CHECKING
+
+import pytest
+
+from workflow_catalogue.core.watch import (
+    InotifyWatcher,
+    PollingWatcher,
+    Watcher,
+    affected_files,
+    create_watcher,
+    watch_changes,
+)
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+@pytest.fixture
+def collection(tmp_path: Path) -> Path:
+    root = tmp_path / "collection"
+    (root / "workflows").mkdir(parents=True)
+    (root / "catalog.json").write_text("{}", encoding="utf-8")
+    (root / "workflows" / "a.json").write_text("{}", encoding="utf-8")
+    (root / "workflows" / "b.json").write_text("{}", encoding="utf-8")
+    (root / "README.md").write_text("", encoding="utf-8")
+    return root
+
+
+def _bump_mtime(path: Path) -> None:
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+def test_affected_files_record(collection: Path) -> None:
+    record = collection / "workflows" / "a.json"
+    assert affected_files({record}) == ([record], [])
+
+
+def test_affected_files_catalog_expands_to_collection(collection: Path) -> None:
+    to_validate, removed = affected_files({collection / "catalog.json", collection / "gone.json"})
+    assert to_validate == sorted([
+        collection / "catalog.json",
+        collection / "workflows" / "a.json",
+        collection / "workflows" / "b.json",
+    ])
+    assert removed == [collection / "gone.json"]
+
+
+def test_polling_watcher_detects_changes(collection: Path) -> None:
+    watcher = PollingWatcher(collection, interval=0.01)
+    assert watcher.poll(0) == set()
+
+    _bump_mtime(collection / "workflows" / "a.json")
+    (collection / "workflows" / "b.json").unlink()
+    (collection / "workflows" / "c.json").write_text("{}", encoding="utf-8")
+    (collection / "README.md").write_text("changed", encoding="utf-8")
+
+    assert watcher.poll(1) == {
+        collection / "workflows" / "a.json",
+        collection / "workflows" / "b.json",
+        collection / "workflows" / "c.json",
+    }
+    assert watcher.poll(0.02) == set()
+
+
+@pytest.mark.skipif(not sys.platform.startswith("linux"), reason="inotify is Linux only")
+def test_inotify_watcher_detects_changes(collection: Path) -> None:
+    watcher = InotifyWatcher(collection)
+    try:
+        assert watcher.poll(0) == set()
+        (collection / "workflows" / "a.json").write_text('{"id": "a"}', encoding="utf-8")
+        (collection / "README.md").write_text("changed", encoding="utf-8")
+        assert watcher.poll(1) == {collection / "workflows" / "a.json"}
+
+        new_dir = collection / "notebooks"
+        new_dir.mkdir()
+        assert watcher.poll(1) == set()
+        (new_dir / "n.json").write_text("{}", encoding="utf-8")
+        assert watcher.poll(1) == {new_dir / "n.json"}
+    finally:
+        watcher.close()
+
+
+def test_create_watcher_polling_fallback(collection: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    def unavailable(_root: Path) -> Watcher:
+        msg = "unavailable"
+        raise OSError(msg)
+
+    monkeypatch.setattr("workflow_catalogue.core.watch.InotifyWatcher", unavailable)
+    assert isinstance(create_watcher(collection), PollingWatcher)
+    assert isinstance(create_watcher(collection, polling=True), PollingWatcher)
+
+
+class _ScriptedWatcher:
+    def __init__(self, batches: list[set[Path]]) -> None:
+        self.batches = batches
+
+    def poll(self, _timeout: float | None) -> set[Path]:
+        if not self.batches:
+            raise StopIteration
+        return self.batches.pop(0)
+
+    def close(self) -> None:
+        pass
+
+
+def test_watch_changes_debounces(tmp_path: Path) -> None:
+    a, b, c = tmp_path / "a.json", tmp_path / "b.json", tmp_path / "c.json"
+    changes = watch_changes(_ScriptedWatcher([{a}, {b}, set(), {c}, set()]))
+    assert next(changes) == {a, b}
+    assert next(changes) == {c}
@@ -0,0 +1,93 @@
+from __future__ import annotations
+
+import pstats
+import time
+import tracemalloc
+from typing import TYPE_CHECKING
+
+import pytest
+from click.testing import CliRunner
+
+from workflow_catalogue.cli.entrypoint import cli
+from workflow_catalogue.utils.profiling import PROFILE_DIR_ENV, PROFILE_ENV, SamplingProfiler, profile
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+def _busy(seconds: float) -> list[bytes]:
+    blocks = []
+    end = time.perf_counter() + seconds
+    while time.perf_counter() < end:
+        blocks.append(bytes(1024))
+    return blocks
+
+
+def test_profile_disabled(tmp_path: Path) -> None:
+    with profile(None, output_dir=tmp_path):
+        _busy(0.01)
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_cprofile(tmp_path: Path, caplog: pytest.LogCaptureFixture) -> None:
+    with profile("cprofile", "run", tmp_path, top=5):
+        _busy(0.05)
+
+    [artifact] = tmp_path.glob("run-*.prof")
+    assert any(function == "_busy" for _, _, function in pstats.Stats(str(artifact)).stats)  # type: ignore[attr-defined]
+    assert "_busy" in artifact.with_suffix(".txt").read_text(encoding="utf-8")
+    assert "PROFILE: cprofile run took" in caplog.text
+
+
+def test_tracemalloc(tmp_path: Path) -> None:
+    with profile("tracemalloc", "run", tmp_path):
+        blocks = _busy(0.02)
+
+    [artifact] = tmp_path.glob("run-*.tracemalloc")
+    assert blocks
+    assert tracemalloc.Snapshot.load(str(artifact)).statistics("lineno")
+    assert not tracemalloc.is_tracing()
+    assert artifact.with_suffix(".txt").read_text(encoding="utf-8").startswith("Peak traced memory")
+
+
+def test_profile_written_on_error(tmp_path: Path) -> None:
+    def fail() -> None:
+        with profile("sampling", "run", tmp_path):
+            _busy(0.02)
+            raise SystemExit(1)
+
+    with pytest.raises(SystemExit):
+        fail()
+
+    assert len(list(tmp_path.glob("run-*.folded"))) == 1
+
+
+def test_sampling_profiler() -> None:
+    sampler = SamplingProfiler(interval=0.001)
+    sampler.start()
+    _busy(0.1)
+    sampler.stop()
+
+    own, _ = sampler.top(3)
+    assert sampler.samples > 0
+    assert len(own) <= 3  # noqa: PLR2004
+    assert any(function.startswith("_busy") for function, _ in sampler.top(100)[1])
+    line = sampler.folded().splitlines()[0]
+    stack, count = line.rsplit(" ", 1)
+    assert ";" in stack
+    assert int(count) > 0
+
+
+def test_cli_profile_from_env(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv(PROFILE_ENV, "cprofile")
+    monkeypatch.setenv(PROFILE_DIR_ENV, str(tmp_path))
+
+    result = CliRunner().invoke(cli, ["notebook", "inspect"])
+
+    assert result.exit_code == 2  # noqa: PLR2004
+    assert len(list(tmp_path.glob("wfc-notebook-*.prof"))) == 1
+
+
+def test_cli_profile_rejects_unknown_profiler() -> None:
+    result = CliRunner().invoke(cli, ["--profile", "perf", "notebook", "--help"])
+    assert result.exit_code == 2  # noqa: PLR2004
@@ -5,8 +5,22 @@ from datetime import UTC, date, datetime
 from pathlib import Path
 
 import pytest
+from pydantic import AnyUrl
 
-from workflow_catalogue.utils.serialization import JsonEncoder
+from workflow_catalogue.consts import directories
+from workflow_catalogue.schemas.common import Rel
+from workflow_catalogue.schemas.workflow import EodhWorkflowRecord
+from workflow_catalogue.utils import serialization
+from workflow_catalogue.utils.serialization import (
+    JsonEncoder,
+    canonical_dumps,
+    content_hash,
+    dumps,
+    format_json,
+    loads,
+)
+
+WORKFLOW_PATH = directories.CATALOGUE_DIR / "eodh-workflows-notebooks" / "workflows" / "clip-workflow.json"
 
 
 def test_date_serialization() -> None:
@@ -30,3 +44,62 @@ def test_path_serialization() -> None:
 def test_unsupported_type_serialization() -> None:
     with pytest.raises(TypeError):
         json.dumps({"key": complex(1, 2)}, cls=JsonEncoder)
+
+
+def test_anyurl_and_enum_serialization() -> None:
+    payload = {"href": AnyUrl("https://eodatahub.org.uk/"), "rel": Rel.self}
+    assert json.dumps(payload, cls=JsonEncoder) == '{"href": "https://eodatahub.org.uk/", "rel": "self"}'
+
+
+@pytest.mark.parametrize("fast", [True, False], ids=["orjson", "stdlib"])
+def test_dumps_round_trip(fast: bool, monkeypatch: pytest.MonkeyPatch) -> None:  # noqa: FBT001
+    if not fast:
+        monkeypatch.setattr(serialization, "orjson", None)
+    payload = {
+        "created": datetime(2023, 4, 10, 15, 30, 45, tzinfo=UTC),
+        "path": Path("/tmp/file.json"),  # noqa: S108
+        "rel": Rel.parent,
+        "value": 0.1,
+        "title": "Zürich",
+    }
+    assert loads(dumps(payload)) == {
+        "created": "2023-04-10T15:30:45+00:00",
+        "path": "/tmp/file.json",  # noqa: S108
+        "rel": "parent",
+        "value": 0.1,
+        "title": "Zürich",
+    }
+
+
+def test_dumps_model_preserves_aliases() -> None:
+    record = EodhWorkflowRecord.model_validate(json.loads(WORKFLOW_PATH.read_text(encoding="utf-8")))
+    dumped = loads(dumps(record))
+    assert "conformsTo" in dumped
+    assert dumped["properties"]["applicableCollections"] == record.properties.applicable_collections
+
+
+def test_canonical_dumps_sorted_and_compact() -> None:
+    assert (
+        canonical_dumps({"b": 1, "a": {"d": 1.5e-7, "c": [3.0, 1e16]}}) == b'{"a":{"c":[3.0,1e+16],"d":1.5e-07},"b":1}'
+    )
+
+
+def test_canonical_dumps_independent_of_backend(monkeypatch: pytest.MonkeyPatch) -> None:
+    payload = json.loads(WORKFLOW_PATH.read_text(encoding="utf-8"))
+    with_orjson = canonical_dumps(payload)
+    monkeypatch.setattr(serialization, "orjson", None)
+    assert canonical_dumps(payload) == with_orjson
+
+
+def test_canonical_dumps_rejects_nan() -> None:
+    with pytest.raises(ValueError, match="Out of range float values"):
+        canonical_dumps({"value": float("nan")})
+
+
+def test_content_hash_ignores_key_order() -> None:
+    assert content_hash({"a": 1, "b": [1, 2]}) == content_hash({"b": [1, 2], "a": 1})
+    assert content_hash({"a": 1}) != content_hash({"a": 2})
+
+
+def test_format_json() -> None:
+    assert format_json({"b": 1, "a": "x"}) == '{\n    "a": "x",\n    "b": 1\n}\n'